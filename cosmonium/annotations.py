@@ -20,8 +20,8 @@
 from __future__ import print_function
 from __future__ import absolute_import
 
-from panda3d.core import LPoint3d, LQuaternion, LColor, LVector3, LVector3d
-from panda3d.core import GeomVertexFormat, GeomVertexData, GeomVertexWriter, GeomVertexRewriter, InternalName
+from panda3d.core import LPoint3d, LQuaternion, LColor
+from panda3d.core import GeomVertexFormat, GeomVertexData, GeomVertexWriter, InternalName
 from panda3d.core import Geom, GeomNode, GeomLines
 from panda3d.core import NodePath
 
@@ -33,30 +33,29 @@ from .shaders import BasicShader, FlatLightingModel, LargeObjectVertexControl
 from .appearances import ModelAppearance
 from .mesh import load_panda_model
 from .utils import srgb_to_linear
+from .geometry import write_vertex_data
 from . import settings
 
 from math import sin, cos, atan2, pi
+import numpy
 
 class AnnotationLabel(ObjectLabel):
-    def update_instance(self, camera_pos, camera_rot):
+    def get_position_and_scale(self, camera_rot):
         position = self.parent.project(0, self.context.observer.camera_global_pos, self.context.observer.infinity)
         if position != None:
-            self.instance.setPos(*position)
             scale = abs(self.context.observer.pixel_size * self.parent.get_label_size() * self.context.observer.infinity)
         else:
             scale = 0.0
-        if scale < 1e-7:
-            print("Label too far", self.get_name())
-            scale = 1e-7
-        self.instance.setScale(scale)
-        self.look_at.set_pos(LVector3(*(camera_rot.xform(LVector3d.forward()))))
-        self.label_instance.look_at(self.look_at, LVector3(), LVector3(*(camera_rot.xform(LVector3d.up()))))
+        return (position, scale)
 
 class BackgroundLabel(AnnotationLabel):
     def create_instance(self):
         AnnotationLabel.create_instance(self)
         self.instance.setBin('background', self.parent.background_level)
 
+    def get_labels_set(self):
+        return self.context.background_labelset
+
 class Orbit(VisibleObject):
     ignore_light = True
     default_shown = False
@@ -114,10 +113,13 @@ class Orbit(VisibleObject):
         if self.instance:
             self.instance.setColor(srgb_to_linear(self.color * self.fade))
 
+    def calc_points(self, epoch, step):
+        #All the points of the orbit are computed in one batched call
+        times = epoch + step * numpy.arange(self.nbOfPoints)
+        return self.orbit.get_positions_at(times) - tuple(self.body.parent.get_local_position())
+
     def create_instance(self):
         self.vertexData = GeomVertexData('vertexData', GeomVertexFormat.getV3(), Geom.UHStatic)
-        self.vertexWriter = GeomVertexWriter(self.vertexData, 'vertex')
-        delta = self.body.parent.get_local_position()
         if self.orbit.is_periodic():
             epoch = self.context.time.time_full - self.orbit.period / 2
             step = self.orbit.period / (self.nbOfPoints - 1)
@@ -125,10 +127,6 @@ class Orbit(VisibleObject):
             #TODO: Properly calculate orbit start and end time
             epoch = self.orbit.get_time_of_perihelion() - self.orbit.period * 5.0
             step = self.orbit.period * 10.0 / (self.nbOfPoints - 1)
-        for i in range(self.nbOfPoints):
-            time = epoch + step * i
-            pos = self.orbit.get_position_at(time) - delta
-            self.vertexWriter.addData3f(*pos)
         self.lines = GeomLines(Geom.UHStatic)
         for i in range(self.nbOfPoints-1):
             self.lines.addVertex(i)
@@ -137,6 +135,7 @@ class Orbit(VisibleObject):
             self.lines.addVertex(self.nbOfPoints-1)
             self.lines.addVertex(0)
         self.geom = Geom(self.vertexData)
+        write_vertex_data(self.geom, [(InternalName.get_vertex(), self.calc_points(epoch, step))])
         self.geom.addPrimitive(self.lines)
         self.node = GeomNode(self.body.get_ascii_name() + '-orbit')
         self.node.addGeom(self.geom)
@@ -156,10 +155,7 @@ class Orbit(VisibleObject):
 
     def update_geom(self):
         geom = self.node.modify_geom(0)
-        vdata = geom.modify_vertex_data()
-        vwriter = GeomVertexRewriter(vdata, InternalName.get_vertex())
         #TODO: refactor with above code !!!
-        delta = self.body.parent.get_local_position()
         if self.orbit.is_periodic():
             epoch = self.context.time.time_full - self.orbit.period
             step = self.orbit.period / (self.nbOfPoints - 1)
@@ -167,10 +163,7 @@ class Orbit(VisibleObject):
             #TODO: Properly calculate orbit start and end time
             epoch = self.orbit.get_time_of_perihelion() - self.orbit.period * 5.0
             step = self.orbit.period * 10.0 / (self.nbOfPoints - 1)
-        for i in range(self.nbOfPoints):
-            time = epoch + step * i
-            pos = self.orbit.get_position_at(time) - delta
-            vwriter.setData3f(*pos)
+        write_vertex_data(geom, [(InternalName.get_vertex(), self.calc_points(epoch, step))])
 
     def check_visibility(self, pixel_size):
         if self.parent.parent.visible and self.parent.shown and self.orbit:
@@ -359,9 +352,83 @@ class Grid(VisibleObject):
         if self.instance:
             self.instance.setQuat(LQuaternion(*self.orientation))
 
-class Asterism(VisibleObject):
+class AnnotationLines(VisibleObject):
+    #The lines are either created as a separate node or packed in the lines set of the scene with the other
+    #annotations of the same kind
+    lines_set_name = None
+    thickness = 1.0
+    background_level = None
+
+    def get_lines_set(self):
+        if settings.merge_annotation_lines and self.lines_set_name is not None:
+            return getattr(self.context, self.lines_set_name)
+        else:
+            return None
+
+    def calc_lines(self):
+        return ([], [])
+
+    def create_instance(self):
+        (vertices, indices) = self.calc_lines()
+        self.vertexData = GeomVertexData('vertexData', GeomVertexFormat.getV3c4(), Geom.UHStatic)
+        self.vertexWriter = GeomVertexWriter(self.vertexData, 'vertex')
+        self.colorwriter = GeomVertexWriter(self.vertexData, 'color')
+        for position in vertices:
+            self.vertexWriter.addData3f(*position)
+            self.colorwriter.addData4(srgb_to_linear(self.color))
+        self.lines = GeomLines(Geom.UHStatic)
+        for i in range(0, len(indices), 2):
+            self.lines.addVertex(indices[i])
+            self.lines.addVertex(indices[i + 1])
+            self.lines.closePrimitive()
+        self.geom = Geom(self.vertexData)
+        self.geom.addPrimitive(self.lines)
+        self.node = GeomNode(self.get_ascii_name())
+        self.node.addGeom(self.geom)
+        self.instance = NodePath(self.node)
+        self.instance.setRenderModeThickness(self.thickness)
+        self.instance.reparentTo(self.context.annotation)
+        self.instance.setBin('background', self.background_level)
+        self.instance.set_depth_write(False)
+
+    def do_show(self):
+        lines_set = self.get_lines_set()
+        if lines_set is None:
+            VisibleObject.do_show(self)
+            return
+        if not lines_set.has_object(self):
+            (vertices, indices) = self.calc_lines()
+            lines_set.add_object(self, self.color, vertices, indices)
+        lines_set.show_object(self)
+
+    def do_hide(self):
+        lines_set = self.get_lines_set()
+        if lines_set is None:
+            VisibleObject.do_hide(self)
+        else:
+            lines_set.hide_object(self)
+
+    def remove_instance(self):
+        VisibleObject.remove_instance(self)
+        lines_set = self.get_lines_set()
+        if lines_set is not None:
+            lines_set.remove_object(self)
+
+    def set_color(self, color):
+        self.color = color
+        lines_set = self.get_lines_set()
+        if lines_set is not None:
+            lines_set.set_object_color(self, color)
+        elif self.instance:
+            self.instance.setColor(srgb_to_linear(color))
+
+class Asterism(AnnotationLines):
+    lines_set_name = 'asterisms_set'
+    thickness = settings.asterism_thickness
+    background_level = settings.asterisms_depth
+
     def __init__(self, name):
-        VisibleObject.__init__(self, name)
+        AnnotationLines.__init__(self, name)
         self.visible = True
         self.color = bodyClasses.get_orbit_color('constellation')
         self.position = LPoint3d(0, 0, 0)
@@ -386,14 +453,12 @@ class Asterism(VisibleObject):
             decl /= len(self.segments[0])
             self.position = InfinitePosition(right_asc=ra, right_asc_unit=units.Rad, declination=decl, declination_unit=units.Rad)
 
-    def create_instance(self):
-        self.vertexData = GeomVertexData('vertexData', GeomVertexFormat.getV3c4(), Geom.UHStatic)
-        self.vertexWriter = GeomVertexWriter(self.vertexData, 'vertex')
-        self.colorwriter = GeomVertexWriter(self.vertexData, 'color')
+    def calc_lines(self):
+        vertices = []
+        indices = []
         #TODO: Ugly hack to calculate star position from the sun...
         old_cam_pos = self.context.observer.camera_global_pos
         self.context.observer.camera_global_pos = LPoint3d()
-        center = LPoint3d()
         for segment in self.segments:
             if len(segment) < 2: continue
             for star in segment:
@@ -401,28 +466,13 @@ class Asterism(VisibleObject):
                 star.update(0, 0)
                 star.update_obs(self.context.observer)
                 position, distance, scale_factor = self.calc_scene_params(star.rel_position, star._position, star.distance_to_obs, star.vector_to_obs)
-                self.vertexWriter.addData3f(*position)
-                self.colorwriter.addData4(srgb_to_linear(self.color))
-        self.context.observer.camera_global_pos = old_cam_pos
-        self.lines = GeomLines(Geom.UHStatic)
-        index = 0
-        for segment in self.segments:
-            if len(segment) < 2: continue
+                vertices.append(tuple(position))
+            index = len(vertices) - len(segment)
             for i in range(len(segment)-1):
-                self.lines.addVertex(index)
-                self.lines.addVertex(index+1)
-                self.lines.closePrimitive()
-                index += 1
-            index += 1
-        self.geom = Geom(self.vertexData)
-        self.geom.addPrimitive(self.lines)
-        self.node = GeomNode("asterism")
-        self.node.addGeom(self.geom)
-        self.instance = NodePath(self.node)
-        self.instance.setRenderModeThickness(settings.asterism_thickness)
-        self.instance.reparentTo(self.context.annotation)
-        self.instance.setBin('background', settings.asterisms_depth)
-        self.instance.set_depth_write(False)
+                indices.append(index + i)
+                indices.append(index + i + 1)
+        self.context.observer.camera_global_pos = old_cam_pos
+        return (vertices, indices)
 
 class NamedAsterism(LabelledObject):
     ignore_light = True
@@ -458,11 +508,15 @@ class NamedAsterism(LabelledObject):
     def get_label_size(self):
         return settings.constellations_label_size
         
-class Boundary(VisibleObject):
+class Boundary(AnnotationLines):
     ignore_light = True
     default_shown = True
+    lines_set_name = 'boundaries_set'
+    thickness = settings.boundary_thickness
+    background_level = settings.boundaries_depth
+
     def __init__(self, name, points = [], color = None):
-        VisibleObject.__init__(self, name)
+        AnnotationLines.__init__(self, name)
         self.visible = True
         if color is None:
             color = bodyClasses.get_orbit_color('boundary')
@@ -475,30 +529,16 @@ class Boundary(VisibleObject):
     def set_points_list(self, points):
         self.points = points
 
-    def create_instance(self):
-        self.vertexData = GeomVertexData('vertexData', GeomVertexFormat.getV3c4(), Geom.UHStatic)
-        self.vertexWriter = GeomVertexWriter(self.vertexData, 'vertex')
-        self.colorwriter = GeomVertexWriter(self.vertexData, 'color')
+    def calc_lines(self):
+        vertices = []
+        indices = []
         for point in self.points:
             position = point.project(0, self.context.observer.camera_global_pos, self.context.observer.infinity)
-            self.vertexWriter.addData3f(*position)
-            self.colorwriter.addData4(srgb_to_linear(self.color))
-        self.lines = GeomLines(Geom.UHStatic)
-        index = 0
+            vertices.append(tuple(position))
         for i in range(len(self.points)-1):
-            self.lines.addVertex(index)
-            self.lines.addVertex(index+1)
-            self.lines.closePrimitive()
-            index += 1
-        self.geom = Geom(self.vertexData)
-        self.geom.addPrimitive(self.lines)
-        self.node = GeomNode("boundary")
-        self.node.addGeom(self.geom)
-        self.instance = NodePath(self.node)
-        self.instance.setRenderModeThickness(settings.boundary_thickness)
-        self.instance.reparentTo(self.context.annotation)
-        self.instance.setBin('background', settings.boundaries_depth)
-        self.instance.set_depth_write(False)
+            indices.append(i)
+            indices.append(i + 1)
+        return (vertices, indices)
 
 class Constellation(LabelledObject):
     ignore_light = True
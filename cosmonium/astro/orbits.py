@@ -20,16 +20,18 @@
 from __future__ import print_function
 from __future__ import absolute_import
 
-from panda3d.core import LPoint3d, LVector3d, LQuaterniond
+from panda3d.core import LPoint3d, LVector3d, LQuaterniond, LMatrix3d
 
 from ..parameters import ParametersGroup, UserParameter, AutoUserParameter
 
 from . import units
-from .frame import J2000EclipticReferenceFrame, J2000EquatorialReferenceFrame
+from .frame import J2000EclipticReferenceFrame, J2000EquatorialReferenceFrame, CelestialReferenceFrame
 from .kepler import kepler_pos
+from .pyastro.npkepler import kepler_elliptic_positions
 from .astro import calc_orientation
 
 from math import pi, asin, atan2
+import numpy
 
 class Orbit(object):
     dynamic = False
@@ -39,13 +41,19 @@ class Orbit(object):
         self.frame = frame
         self.origin = LPoint3d()
         self.body = None
+        self.invalidate()
+
+    def invalidate(self):
+        #Position in the frame of the last evaluated time, only used by the dynamic orbits
+        self.memo_time = None
+        self.memo_position = None
 
     def get_user_parameters(self):
         group = ParametersGroup(_('Orbit'))
         return group
 
     def update_user_parameters(self):
-        pass
+        self.invalidate()
 
     def set_frame(self, frame):
         self.frame = frame
@@ -75,11 +83,20 @@ class Orbit(object):
         return None
 
     def get_position_at(self, time):
-        return self.frame.get_local_position(self.get_frame_rotation_at(time).xform(self.get_frame_position_at(time)))
+        if not self.dynamic:
+            return self.frame.get_local_position(self.get_frame_rotation_at(time).xform(self.get_frame_position_at(time)))
+        if time != self.memo_time:
+            self.memo_position = self.get_frame_rotation_at(time).xform(self.get_frame_position_at(time))
+            self.memo_time = time
+        return self.frame.get_local_position(self.memo_position)
 
     def get_rotation_at(self, time):
         return self.frame.get_abs_orientation(self.get_frame_rotation_at(time))
 
+    def get_positions_at(self, times):
+        #Returns the positions at the given times as an array of shape (n, 3)
+        return numpy.array([tuple(self.get_position_at(time)) for time in times])
+
     def project(self, time, center, radius):
         return None
 
@@ -243,6 +260,7 @@ class EllipticalOrbit(Orbit):
         return group
 
     def update_user_parameters(self):
+        Orbit.update_user_parameters(self)
         self.update_rotation()
 
     def is_periodic(self):
@@ -267,6 +285,33 @@ class EllipticalOrbit(Orbit):
     def get_frame_rotation_at(self, time):
         return self.rotation
 
+class EllipticalOrbitsGroup(object):
+    #Propagates a group of elliptical orbits sharing the same frame center with a single vectorized Kepler solver
+    static_frames = (J2000EclipticReferenceFrame, J2000EquatorialReferenceFrame, CelestialReferenceFrame)
+
+    @classmethod
+    def supports(cls, orbit):
+        return isinstance(orbit, EllipticalOrbit) and orbit.eccentricity < 1.0 and isinstance(orbit.frame, cls.static_frames)
+
+    def __init__(self, orbits):
+        self.orbits = orbits
+        self.pericenter_distance = numpy.array([orbit.pericenter_distance for orbit in orbits])
+        self.eccentricity = numpy.array([orbit.eccentricity for orbit in orbits])
+        self.mean_motion = numpy.array([orbit.mean_motion for orbit in orbits])
+        self.mean_anomaly = numpy.array([orbit.mean_anomaly for orbit in orbits])
+        self.epoch = numpy.array([orbit.epoch for orbit in orbits])
+        #The positions are in the plane of the orbit, only the first two rows of the rotations are needed
+        self.axes = numpy.empty((len(orbits), 2, 3))
+        matrix = LMatrix3d()
+        for (i, orbit) in enumerate(orbits):
+            (orbit.rotation * orbit.frame.get_orientation()).extract_to_matrix(matrix)
+            self.axes[i] = (tuple(matrix.get_row(0)), tuple(matrix.get_row(1)))
+
+    def get_positions_at(self, time, center):
+        mean_anomaly = (time - self.epoch) * self.mean_motion + self.mean_anomaly
+        positions = kepler_elliptic_positions(self.pericenter_distance, self.eccentricity, mean_anomaly)
+        return positions[:, 0:1] * self.axes[:, 0] + positions[:, 1:2] * self.axes[:, 1] + tuple(center)
+
 class FuncOrbit(Orbit):
     dynamic = True
     def __init__(self, period, semi_major_axis, eccentricity, frame):
@@ -276,6 +321,7 @@ class FuncOrbit(Orbit):
         self.frame = frame
         self.origin = LPoint3d()
         self.body = None
+        self.invalidate()
 
     def get_period(self):
         return self.period
@@ -286,6 +332,17 @@ class FuncOrbit(Orbit):
     def get_apparent_radius(self):
         return self.max_distance
 
+    def get_frame_positions_at(self, times):
+        return numpy.array([tuple(self.get_frame_position_at(time)) for time in times])
+
+    def get_positions_at(self, times):
+        #The rotation of the function orbits is constant, the positions are transformed all at once
+        rotation = self.get_frame_rotation_at(times[0]) * self.frame.get_orientation()
+        matrix = LMatrix3d()
+        rotation.extract_to_matrix(matrix)
+        matrix = numpy.array([tuple(matrix.get_row(i)) for i in range(3)])
+        return self.get_frame_positions_at(times).dot(matrix) + tuple(self.frame.get_center())
+
 def create_elliptical_orbit(semi_major_axis=None,
                             semi_major_axis_units=units.AU,
                             pericenter_distance=None,
@@ -0,0 +1,48 @@
+#
+#This file is part of Cosmonium.
+#
+#Copyright (C) 2018-2019 Laurent Deru.
+#
+#Cosmonium is free software: you can redistribute it and/or modify
+#it under the terms of the GNU General Public License as published by
+#the Free Software Foundation, either version 3 of the License, or
+#(at your option) any later version.
+#
+#Cosmonium is distributed in the hope that it will be useful,
+#but WITHOUT ANY WARRANTY without even the implied warranty of
+#MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#GNU General Public License for more details.
+#
+#You should have received a copy of the GNU General Public License
+#along with Cosmonium.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+from __future__ import print_function
+from __future__ import absolute_import
+
+import numpy
+
+THRESH = 1.0e-12
+
+MAX_ITERATIONS = 20
+
+def kepler_elliptic(ecc, mean_anom):
+    #Solves Kepler's equation for arrays of elliptical orbits with a Newton iteration
+    mean_anom = numpy.remainder(mean_anom + numpy.pi, 2 * numpy.pi) - numpy.pi
+    #Starting from pi avoids the divergence of the iteration for the highly eccentric orbits
+    ecc_anom = numpy.where(ecc < 0.8, mean_anom, numpy.copysign(numpy.pi, mean_anom))
+    active = numpy.arange(len(ecc_anom))
+    for i in range(MAX_ITERATIONS):
+        e = ecc[active]
+        curr = ecc_anom[active]
+        delta = (curr - e * numpy.sin(curr) - mean_anom[active]) / (1.0 - e * numpy.cos(curr))
+        ecc_anom[active] = curr - delta
+        active = active[numpy.abs(delta) > THRESH]
+        if len(active) == 0: break
+    return ecc_anom
+
+def kepler_elliptic_positions(pericenter, ecc, mean_anom):
+    #Returns the positions in the plane of the orbits as an array of shape (n, 2)
+    ecc_anom = kepler_elliptic(ecc, mean_anom)
+    a = pericenter / (1.0 - ecc)
+    return numpy.column_stack((a * (numpy.cos(ecc_anom) - ecc), a * numpy.sqrt(1 - ecc * ecc) * numpy.sin(ecc_anom)))
@@ -0,0 +1,66 @@
+#
+#This file is part of Cosmonium.
+#
+#Copyright (C) 2018-2019 Laurent Deru.
+#
+#Cosmonium is free software: you can redistribute it and/or modify
+#it under the terms of the GNU General Public License as published by
+#the Free Software Foundation, either version 3 of the License, or
+#(at your option) any later version.
+#
+#Cosmonium is distributed in the hope that it will be useful,
+#but WITHOUT ANY WARRANTY without even the implied warranty of
+#MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#GNU General Public License for more details.
+#
+#You should have received a copy of the GNU General Public License
+#along with Cosmonium.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+from __future__ import print_function
+from __future__ import absolute_import
+
+from panda3d.core import LPoint3d
+
+from .vsop_data import elp82_fundamentals, elp82_lon_dist_terms, elp82_lat_terms
+
+import numpy
+
+J2000 = 2451545.0
+CENTURY = 36525.0
+
+fundamentals = numpy.array(elp82_fundamentals)
+lon_dist_terms = numpy.array(elp82_lon_dist_terms, dtype=float)
+lat_terms = numpy.array(elp82_lat_terms, dtype=float)
+
+def sum_terms(terms, fund, e, func, amplitudes):
+    #The arguments are linear combinations of D, M, Mp and F, the terms depending on M are scaled by e^|M|
+    args = fund[:, 1:].dot(terms[:, :4].T)
+    return (amplitudes * func(args) * e[:, numpy.newaxis] ** numpy.abs(terms[:, 1])).sum(axis=1)
+
+def elp82_truncated_positions(jd):
+    jd = numpy.asarray(jd, dtype=float)
+    shape = jd.shape
+    t = (jd.ravel() - J2000) / CENTURY
+    #Lp, D, M, Mp and F
+    fund = numpy.radians(numpy.mod((t[:, numpy.newaxis] ** numpy.arange(5)).dot(fundamentals.T), 360.0))
+    (lp, mp, f) = (fund[:, 0], fund[:, 3], fund[:, 4])
+    a1 = numpy.radians(numpy.mod(119.75 + 131.849 * t, 360.0))
+    a2 = numpy.radians(numpy.mod(53.09 + 479264.290 * t, 360.0))
+    a3 = numpy.radians(numpy.mod(313.45 + 481266.484 * t, 360.0))
+    e = 1. - .002516 * t - .0000074 * t * t
+    sl = sum_terms(lon_dist_terms, fund, e, numpy.sin, lon_dist_terms[:, 4])
+    sr = sum_terms(lon_dist_terms, fund, e, numpy.cos, lon_dist_terms[:, 5])
+    sb = sum_terms(lat_terms, fund, e, numpy.sin, lat_terms[:, 4])
+    sl += 3958. * numpy.sin(a1) + 1962. * numpy.sin(lp - f) + 318. * numpy.sin(a2)
+    sb += -2235. * numpy.sin(lp) + 382. * numpy.sin(a3) + 175. * numpy.sin(a1 - f) + \
+           175. * numpy.sin(a1 + f) + 127. * numpy.sin(lp - mp) - 115. * numpy.sin(lp + mp)
+    lon = lp + numpy.radians(sl * 1.e-6)
+    lat = numpy.radians(sb * 1.e-6)
+    r = 385000.56 + sr / 1000.
+    xy = numpy.cos(lat) * r
+    positions = numpy.column_stack((numpy.cos(lon) * xy, numpy.sin(lon) * xy, numpy.sin(lat) * r))
+    return positions.reshape(shape + (3,))
+
+def elp82_truncated_pos(jd):
+    return LPoint3d(*elp82_truncated_positions(jd).tolist())
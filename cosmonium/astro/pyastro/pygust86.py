@@ -0,0 +1,328 @@
+#
+#This file is part of Cosmonium.
+#
+#Copyright (C) 2018-2019 Laurent Deru.
+#
+#Cosmonium is free software: you can redistribute it and/or modify
+#it under the terms of the GNU General Public License as published by
+#the Free Software Foundation, either version 3 of the License, or
+#(at your option) any later version.
+#
+#Cosmonium is distributed in the hope that it will be useful,
+#but WITHOUT ANY WARRANTY without even the implied warranty of
+#MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#GNU General Public License for more details.
+#
+#You should have received a copy of the GNU General Public License
+#along with Cosmonium.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+from __future__ import print_function
+from __future__ import absolute_import
+
+from panda3d.core import LPoint3d
+
+import numpy
+
+#Origin of the theory, 1980 Jan 1
+T0 = 2444239.5
+DEG2RAD = numpy.pi / 180.0
+
+#Mean motions and longitudes of the satellites, in the order Miranda, Ariel, Umbriel, Titania and Oberon
+fqn = numpy.array([4445190.550e-06, 2492952.519e-06, 1516148.111e-06, 721718.509e-06, 466692.120e-06])
+fqe = numpy.array([20.082, 6.217, 2.865, 2.078, 0.386]) * DEG2RAD
+fqi = numpy.array([-20.309, -6.288, -2.836, -1.843, -0.259]) * DEG2RAD
+phn = numpy.array([-238051.e-06, 3098046.e-06, 2285402.e-06, 856359.e-06, -915592.e-06])
+phe = numpy.array([0.611392, 2.408974, 2.067774, 0.735131, 0.426767])
+phi = numpy.array([5.702313, 0.395757, 0.589326, 1.746237, 4.206896])
+
+gms = numpy.array([4.4, 86.1, 84.0, 230.0, 200.0])
+gmsu = 5794554.5
+gmu = gmsu - gms.sum()
+seconds_per_day = 24. * 60. * 60.
+
+#Uranicentric to J2000 transformation
+trans = numpy.array([[0.9753206898, -0.2207422915,  0.0047321138],
+                     [0.0619432123,  0.2529905682, -0.9654837185],
+                     [0.2119259083,  0.9419493686,  0.2604204221]])
+
+#The terms are given as (amplitude, multipliers of the 5 mean longitudes, index of the added ae or -1)
+#The extra terms of Z are given as (amplitude, multipliers of the 5 mean longitudes)
+satellites = [
+    #Ariel
+    {'rn': (2492542.57e-06, [
+        (   2.55e-06, (1, -3,  2,  0,  0), -1),
+        ( -42.16e-06, (0,  1, -1,  0,  0), -1),
+        (-102.56e-06, (0,  2, -2,  0,  0), -1)]),
+     'rl': (3098046.41e-06, 2492952.52e-06, [
+        (-1860.50e-06, (1,  -3,  2,  0,  0), -1),
+        (  219.99e-06, (2,  -6,  4,  0,  0), -1),
+        (   23.10e-06, (3,  -9,  6,  0,  0), -1),
+        (    4.30e-06, (4, -12,  8,  0,  0), -1),
+        (  -90.11e-06, (0,   1, -1,  0,  0), -1),
+        (  -91.07e-06, (0,   2, -2,  0,  0), -1),
+        (  -42.75e-06, (0,   3, -3,  0,  0), -1),
+        (  -16.49e-06, (0,   2,  0, -2,  0), -1)]),
+     'ae': (-3.35e-6, 1187.63e-6, 861.59e-6, 71.50e-6, 55.59e-6),
+     'ai': (-121.75e-6, 358.25e-06, 290.08e-06, 97.78e-06, 33.97e-06),
+     'z': [
+        (-84.60e-06, (0, -1, 2, 0, 0)),
+        ( 91.81e-06, (0, -2, 3, 0, 0)),
+        ( 20.03e-06, (0, -1, 0, 2, 0)),
+        ( 89.77e-06, (0,  1, 0, 0, 0))],
+    },
+    #Umbriel
+    {'rn': (1515954.90e-06, [
+        (   9.74e-06, (0, 0, 1, -2, 0), 2),
+        (-106.00e-06, (0, 1, -1, 0, 0), -1),
+        (  54.16e-06, (0, 2, -2, 0, 0), -1),
+        ( -23.59e-06, (0, 0, 1, -1, 0), -1),
+        ( -70.70e-06, (0, 0, 2, -2, 0), -1),
+        ( -36.28e-06, (0, 0, 3, -3, 0), -1)]),
+     'rl': (2285401.69e-06, 1516148.11e-06, [
+        ( 660.57e-06, (1,  -3,  2,  0,  0), -1),
+        ( -76.51e-06, (2,  -6,  4,  0,  0), -1),
+        (  -8.96e-06, (3,  -9,  6,  0,  0), -1),
+        (  -2.53e-06, (4, -12,  8,  0,  0), -1),
+        ( -52.91e-06, (0,   0,  1, -4,  3), -1),
+        (  -7.34e-06, (0,   0,  1, -2,  0), 4),
+        (  -1.83e-06, (0,   0,  1, -2,  0), 3),
+        ( 147.91e-06, (0,   0,  1, -2,  0), 2),
+        (  -7.77e-06, (0,   0,  1, -2,  0), 1),
+        (  97.76e-06, (0,   1, -1,  0,  0), -1),
+        (  73.13e-06, (0,   2, -2,  0,  0), -1),
+        (  34.71e-06, (0,   3, -3,  0,  0), -1),
+        (  18.89e-06, (0,   4, -4,  0,  0), -1),
+        ( -67.89e-06, (0,   0,  1, -1,  0), -1),
+        ( -82.86e-06, (0,   0,  2, -2,  0), -1),
+        ( -33.81e-06, (0,   0,  3, -3,  0), -1),
+        ( -15.79e-06, (0,   0,  4, -4,  0), -1),
+        ( -10.21e-06, (0,   0,  1,  0, -1), -1),
+        ( -17.08e-06, (0,   0,  2,  0, -2), -1)]),
+     'ae': (-0.21e-6, -227.95e-6, 3904.69e-6, 309.17e-6, 221.92e-6),
+     'ai': (-10.86e-6, -81.51e-06, 1113.36e-06, 350.14e-06, 106.50e-06),
+     'z': [
+        (  29.34e-6, (0,  1,  0, 0, 0)),
+        (  26.20e-6, (0,  0,  1, 0, 0)),
+        (  51.19e-6, (0, -1,  2, 0, 0)),
+        (-103.86e-6, (0, -2,  3, 0, 0)),
+        ( -27.16e-6, (0, -3,  4, 0, 0)),
+        ( -16.22e-6, (0,  0,  0, 1, 0)),
+        ( 549.23e-6, (0,  0, -1, 2, 0)),
+        (  34.70e-6, (0,  0, -2, 3, 0)),
+        (  12.81e-6, (0,  0, -3, 4, 0)),
+        (  21.81e-6, (0,  0, -1, 0, 2)),
+        (  46.25e-6, (0,  0,  1, 0, 0))],
+    },
+    #Titania
+    {'rn': (721663.16e-06, [
+        ( -2.64e-06, (0, 0, 1, -2,  0), 2),
+        ( -2.16e-06, (0, 0, 0,  2, -3), 4),
+        (  6.45e-06, (0, 0, 0,  2, -3), 3),
+        ( -1.11e-06, (0, 0, 0,  2, -3), 2),
+        (-62.23e-06, (0, 1, 0, -1,  0), -1),
+        (-56.13e-06, (0, 0, 1, -1,  0), -1),
+        (-39.94e-06, (0, 0, 0,  1, -1), -1),
+        (-91.85e-06, (0, 0, 0,  2, -2), -1),
+        (-58.31e-06, (0, 0, 0,  3, -3), -1),
+        (-38.60e-06, (0, 0, 0,  4, -4), -1),
+        (-26.18e-06, (0, 0, 0,  5, -5), -1),
+        (-18.06e-06, (0, 0, 0,  6, -6), -1)]),
+     'rl': (856358.79e-06, 721718.51e-06, [
+        (  20.61e-06, (0, 0, 1, -4,  3), -1),
+        (  -2.07e-06, (0, 0, 1, -2,  0), 4),
+        (  -2.88e-06, (0, 0, 1, -2,  0), 3),
+        ( -40.79e-06, (0, 0, 1, -2,  0), 2),
+        (   2.11e-06, (0, 0, 1, -2,  0), 1),
+        ( -51.83e-06, (0, 0, 0,  2, -3), 4),
+        ( 159.87e-06, (0, 0, 0,  2, -3), 3),
+        ( -35.05e-06, (0, 0, 0,  2, -3), 2),
+        (  -1.56e-06, (0, 0, 0,  3, -4), 4),
+        (  40.54e-06, (0, 1, 0, -1,  0), -1),
+        (  46.17e-06, (0, 0, 1, -1,  0), -1),
+        (-317.76e-06, (0, 0, 0,  1, -1), -1),
+        (-305.59e-06, (0, 0, 0,  2, -2), -1),
+        (-148.36e-06, (0, 0, 0,  3, -3), -1),
+        ( -82.92e-06, (0, 0, 0,  4, -4), -1),
+        ( -49.98e-06, (0, 0, 0,  5, -5), -1),
+        ( -31.56e-06, (0, 0, 0,  6, -6), -1),
+        ( -20.56e-06, (0, 0, 0,  7, -7), -1),
+        ( -13.69e-06, (0, 0, 0,  8, -8), -1)]),
+     'ae': (-0.02e-6, -1.29e-6, -324.51e-6, 932.81e-6, 1120.89e-6),
+     'ai': (-1.43e-6, -1.06e-06, -140.13e-06, 685.72e-06, 378.32e-06),
+     'z': [
+        (  33.86e-6, (0,  1,  0,  0, 0)),
+        (  17.46e-6, (0,  0,  0,  1, 0)),
+        (  16.58e-6, (0, -1,  0,  2, 0)),
+        (  28.89e-6, (0,  0,  1,  0, 0)),
+        ( -35.86e-6, (0,  0, -1,  2, 0)),
+        ( -17.86e-6, (0,  0,  0,  1, 0)),
+        ( -32.10e-6, (0,  0,  0,  0, 1)),
+        (-177.83e-6, (0,  0,  0, -1, 2)),
+        ( 793.43e-6, (0,  0,  0, -2, 3)),
+        (  99.48e-6, (0,  0,  0, -3, 4)),
+        (  44.83e-6, (0,  0,  0, -4, 5)),
+        (  25.13e-6, (0,  0,  0, -5, 6)),
+        (  15.43e-6, (0,  0,  0, -6, 7))],
+    },
+    #Oberon
+    {'rn': (466580.54e-06, [
+        (  2.08e-06, (0, 0, 0, 2, -3), 4),
+        ( -6.22e-06, (0, 0, 0, 2, -3), 3),
+        (  1.07e-06, (0, 0, 0, 2, -3), 2),
+        (-43.10e-06, (0, 1, 0, 0, -1), -1),
+        (-38.94e-06, (0, 0, 1, 0, -1), -1),
+        (-80.11e-06, (0, 0, 0, 1, -1), -1),
+        ( 59.06e-06, (0, 0, 0, 2, -2), -1),
+        ( 37.49e-06, (0, 0, 0, 3, -3), -1),
+        ( 24.82e-06, (0, 0, 0, 4, -4), -1),
+        ( 16.84e-06, (0, 0, 0, 5, -5), -1)]),
+     'rl': (-915591.80e-06, 466692.12e-06, [
+        (  -7.82e-06, (0, 0, 1, -4,  3), -1),
+        (  51.29e-06, (0, 0, 0,  2, -3), 4),
+        (-158.24e-06, (0, 0, 0,  2, -3), 3),
+        (  34.51e-06, (0, 0, 0,  2, -3), 2),
+        (  47.51e-06, (0, 1, 0,  0, -1), -1),
+        (  38.96e-06, (0, 0, 1,  0, -1), -1),
+        ( 359.73e-06, (0, 0, 0,  1, -1), -1),
+        ( 282.78e-06, (0, 0, 0,  2, -2), -1),
+        ( 138.60e-06, (0, 0, 0,  3, -3), -1),
+        (  78.03e-06, (0, 0, 0,  4, -4), -1),
+        (  47.29e-06, (0, 0, 0,  5, -5), -1),
+        (  30.00e-06, (0, 0, 0,  6, -6), -1),
+        (  19.62e-06, (0, 0, 0,  7, -7), -1),
+        (  13.11e-06, (0, 0, 0,  8, -8), -1)]),
+     'ae': (0.00e-6, -0.35e-6, 74.53e-6, -758.68e-6, 1397.34e-6),
+     'ai': (-0.44e-6, -0.31e-06, 36.89e-06, -596.33e-06, 451.69e-06),
+     'z': [
+        (  39.00e-6, (0,  1, 0,  0, 0)),
+        (  17.66e-6, (0, -1, 0,  0, 2)),
+        (  32.42e-6, (0,  0, 1,  0, 0)),
+        (  79.75e-6, (0,  0, 0,  1, 0)),
+        (  75.66e-6, (0,  0, 0,  0, 1)),
+        ( 134.04e-6, (0,  0, 0, -1, 2)),
+        (-987.26e-6, (0,  0, 0, -2, 3)),
+        (-126.09e-6, (0,  0, 0, -3, 4)),
+        ( -57.42e-6, (0,  0, 0, -4, 5)),
+        ( -32.41e-6, (0,  0, 0, -5, 6)),
+        ( -19.99e-6, (0,  0, 0, -6, 7)),
+        ( -12.94e-6, (0,  0, 0, -7, 8))],
+    },
+    #Miranda
+    {'rn': (4443522.67e-06, [
+        ( -34.92e-06, (1, -3, 2, 0, 0), -1),
+        (   8.47e-06, (2, -6, 4, 0, 0), -1),
+        (   1.31e-06, (3, -9, 6, 0, 0), -1),
+        ( -52.28e-06, (1, -1, 0, 0, 0), -1),
+        (-136.65e-06, (2, -2, 0, 0, 0), -1)]),
+     'rl': (-238051.58e-06, 4445190.55e-06, [
+        (25472.17e-06, (1,  -3, 2, 0, 0), -1),
+        (-3088.31e-06, (2,  -6, 4, 0, 0), -1),
+        ( -318.10e-06, (3,  -9, 6, 0, 0), -1),
+        (  -37.49e-06, (4, -12, 8, 0, 0), -1),
+        (  -57.85e-06, (1,  -1, 0, 0, 0), -1),
+        (  -62.32e-06, (2,  -2, 0, 0, 0), -1),
+        (  -27.95e-06, (3,  -3, 0, 0, 0), -1)]),
+     'ae': (1312.38e-6, 71.81e-6, 69.77e-6, 6.75e-6, 6.27e-6),
+     'ai': (37871.71e-06, 27.01e-06, 30.76e-06, 12.18e-06, 5.37e-06),
+     'z': [
+        (-123.31e-6, (-1, 2, 0, 0, 0)),
+        (  39.52e-6, (-2, 3, 0, 0, 0)),
+        ( 194.10e-6, ( 1, 0, 0, 0, 0))],
+    },
+]
+
+class Gust86Series(object):
+    def __init__(self, sat):
+        data = satellites[sat]
+        (self.rn, rn_terms) = data['rn']
+        (self.rl, self.rl_rate, rl_terms) = data['rl']
+        self.rn_terms = self.make_terms(rn_terms)
+        self.rl_terms = self.make_terms(rl_terms)
+        self.ae_series = numpy.array(data['ae'])
+        self.ai_series = numpy.array(data['ai'])
+        self.z_amplitudes = numpy.array([term[0] for term in data['z']])
+        self.z_multipliers = numpy.array([term[1] for term in data['z']], dtype=float).T
+        self.rmu = gmu + gms[sat]
+
+    def make_terms(self, terms):
+        amplitudes = numpy.array([term[0] for term in terms])
+        multipliers = numpy.array([term[1] for term in terms], dtype=float).T
+        ae_multipliers = numpy.zeros((5, len(terms)))
+        for (i, term) in enumerate(terms):
+            if term[2] >= 0:
+                ae_multipliers[term[2], i] = 1.0
+        return (amplitudes, multipliers, ae_multipliers)
+
+    def sum_terms(self, terms, an, ae, func):
+        (amplitudes, multipliers, ae_multipliers) = terms
+        return func(an.dot(multipliers) + ae.dot(ae_multipliers)).dot(amplitudes)
+
+    def elements(self, days, an, ae, ai):
+        #Returns the mean motion, mean longitude, k, h, q and p elements
+        rn = self.rn + self.sum_terms(self.rn_terms, an, ae, numpy.cos)
+        rl = self.rl + self.rl_rate * days + self.sum_terms(self.rl_terms, an, ae, numpy.sin)
+        phases = an.dot(self.z_multipliers)
+        k = numpy.cos(ae).dot(self.ae_series) + numpy.cos(phases).dot(self.z_amplitudes)
+        h = numpy.sin(ae).dot(self.ae_series) + numpy.sin(phases).dot(self.z_amplitudes)
+        q = numpy.cos(ai).dot(self.ai_series)
+        p = numpy.sin(ai).dot(self.ai_series)
+        return (rn, rl, k, h, q, p)
+
+    def positions(self, days, an, ae, ai):
+        (rn, rl, rk, rh, rq, rp) = self.elements(days, an, ae, ai)
+        #Kepler's 3rd law gives the semimajor axis from the mean motion
+        ra = numpy.cbrt(self.rmu * seconds_per_day * seconds_per_day / (rn * rn))
+        phi = numpy.sqrt(1.0 - rk * rk - rh * rh)
+        rki = numpy.sqrt(1.0 - rq * rq - rp * rp)
+        psi = 1.0 / (1.0 + phi)
+        f = keplkh(rl, rk, rh)
+        sf = numpy.sin(f)
+        cf = numpy.cos(f)
+        rlmf = -rk * sf + rh * cf
+        #Position in the plane of the orbit
+        x1 = ra * (cf - psi * rh * rlmf - rk)
+        y1 = ra * (sf + psi * rk * rlmf - rh)
+        #Rotation to the plane of Uranus' equator
+        xu = numpy.column_stack(((1.0 - 2 * rp * rp) * x1 + 2 * rp * rq * y1,
+                                 2 * rp * rq * x1 + (1.0 - 2 * rq * rq) * y1,
+                                 -2 * rp * rki * x1 + 2 * rq * rki * y1))
+        return xu.dot(trans)
+
+def keplkh(rl, rk, rh):
+    #Solve Kepler's equation in longitude, the eccentricities are small and Newton's method converges quickly
+    f = rl
+    for i in range(8):
+        sf = numpy.sin(f)
+        cf = numpy.cos(f)
+        f = f - (f - rk * sf + rh * cf - rl) / (1.0 - rk * cf - rh * sf)
+    return f
+
+satellites_series = {}
+
+def get_satellite_series(sat):
+    series = satellites_series.get(sat)
+    if series is None:
+        series = Gust86Series(sat)
+        satellites_series[sat] = series
+    return series
+
+def gust86_positions(jd, sat):
+    #jd and sat can be scalars or arrays, they are broadcasted against each other
+    (jd, sat) = numpy.broadcast_arrays(numpy.asarray(jd, dtype=float), numpy.asarray(sat, dtype=int))
+    shape = jd.shape
+    jd = jd.ravel()
+    sat = sat.ravel()
+    days = jd - T0
+    years = days / 365.25
+    an = numpy.outer(days, fqn) + phn
+    ae = numpy.outer(years, fqe) + phe
+    ai = numpy.outer(years, fqi) + phi
+    positions = numpy.empty((len(jd), 3))
+    for sat_id in numpy.unique(sat):
+        mask = sat == sat_id
+        positions[mask] = get_satellite_series(sat_id).positions(days[mask], an[mask], ae[mask], ai[mask])
+    return positions.reshape(shape + (3,))
+
+def gust86_sat_pos(jd, sat):
+    return LPoint3d(*gust86_positions(jd, sat).tolist())
@@ -0,0 +1,307 @@
+#
+#This file is part of Cosmonium.
+#
+#Copyright (C) 2018-2019 Laurent Deru.
+#
+#Cosmonium is free software: you can redistribute it and/or modify
+#it under the terms of the GNU General Public License as published by
+#the Free Software Foundation, either version 3 of the License, or
+#(at your option) any later version.
+#
+#Cosmonium is distributed in the hope that it will be useful,
+#but WITHOUT ANY WARRANTY without even the implied warranty of
+#MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#GNU General Public License for more details.
+#
+#You should have received a copy of the GNU General Public License
+#along with Cosmonium.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+from __future__ import print_function
+from __future__ import absolute_import
+
+from panda3d.core import LPoint3d
+
+import numpy
+
+J2000 = 2451545.0
+J1900 = J2000 - 36525.0
+DEG2RAD = numpy.pi / 180.0
+COEFF2RAD = numpy.pi / 180.e+5
+PER = 13.469942 * DEG2RAD
+JRADIUS_IN_KM = 71418.0
+
+#Mean distance of the satellites in Jupiter radii
+r0 = [5.90569, 9.39657, 14.98832, 26.36273]
+
+def linear(a, b, t):
+    return a * DEG2RAD + b * DEG2RAD * t
+
+def cubic(a, b, c, d, t):
+    return a * DEG2RAD + t * (b * DEG2RAD + t * (c * DEG2RAD + d * DEG2RAD * t))
+
+def rotate(angle, x, y):
+    sin_angle = numpy.sin(angle)
+    cos_angle = numpy.cos(angle)
+    return (cos_angle * x - sin_angle * y, sin_angle * x + cos_angle * y)
+
+class JupiterArguments(object):
+    #Fundamental arguments of the theory, each one is an array with one value per time
+    def __init__(self, jd):
+        t = jd - 2443000.5
+        precess_time = (jd - 2433282.423) / 36525.
+        self.precession = linear(1.3966626, .0003088, precess_time) * precess_time
+        dt = (jd - J2000) / 36525.
+        #Mean longitudes of the satellites
+        self.l1 = linear(106.07719, 203.488955790, t)
+        self.l2 = linear(175.73161, 101.374724735, t)
+        self.l3 = linear(120.55883,  50.317609209, t)
+        self.l4 = linear( 84.44459,  21.571071177, t)
+        #Longitudes of the perijoves
+        self.pi1 = linear( 97.0881, 0.16138586, t)
+        self.pi2 = linear(154.8663, 0.04726307, t)
+        self.pi3 = linear(188.1840, 0.00712734, t)
+        self.pi4 = linear(335.2868, 0.00184000, t)
+        #Longitudes of the ascending nodes on Jupiter's equatorial plane
+        self.ome1 = linear(312.3346, -0.13279386, t)
+        self.ome2 = linear(100.4411, -0.03263064, t)
+        self.ome3 = linear(119.1942, -0.00717703, t)
+        self.ome4 = linear(322.6168, -0.00175934, t)
+        #Longitude of Jupiter's ascending node and inclination of its orbit
+        self.asc_node = cubic(100.464407, 1.0209774, .00040315, 4.04e-7, dt)
+        self.incl_orbit = cubic(1.303267, -.0054965, 4.66e-6, -2.e-9, dt)
+        #Principal inequality in the longitude of Jupiter
+        gam = 0.33033 * DEG2RAD * numpy.sin(linear(163.679, 0.0010512, t)) + \
+              0.03439 * DEG2RAD * numpy.sin(linear(34.486, -0.0161731, t))
+        #Phase of free libration
+        self.libration = linear(199.6766, 0.17379190, t)
+        #Longitude of the node of the equator of Jupiter on the ecliptic
+        self.psi = linear(316.5182, -2.08e-6, t)
+        #Mean anomalies of Jupiter and Saturn
+        self.g = linear(30.23756, 0.0830925701, t) + gam
+        self.g_prime = linear(31.97853, 0.0334597339, t)
+        self.twice_per_plus_g = 2. * self.g + 2. * PER
+        #Inclination of Jupiter's axis to its orbital plane
+        self.incl = linear(3.120262, .0006, (jd - J1900) / 36525.)
+
+    def select(self, mask):
+        selected = JupiterArguments.__new__(JupiterArguments)
+        for (name, value) in self.__dict__.items():
+            setattr(selected, name, value[mask])
+        return selected
+
+def io_coords(a):
+    (l1, l2, l3) = (a.l1, a.l2, a.l3)
+    (pi1, pi2, pi3, pi4) = (a.pi1, a.pi2, a.pi3, a.pi4)
+    (psi, g, libration, twice_per_plus_g) = (a.psi, a.g, a.libration, a.twice_per_plus_g)
+    del1 = COEFF2RAD * (47259. * numpy.sin(2. * (l1 - l2))
+                        -3478. * numpy.sin(pi3 - pi4)
+                        +1081. * numpy.sin(l2 - 2. * l3 + pi3)
+                        + 738. * numpy.sin(libration)
+                        + 713. * numpy.sin(l2 - l3 - l3 + pi2)
+                        - 674. * numpy.sin(pi1 + pi3 - twice_per_plus_g)
+                        + 666. * numpy.sin(l2 - 2. * l3 + pi4)
+                        + 445. * numpy.sin(l1 - pi3)
+                        - 354. * numpy.sin(l1 - l2)
+                        - 317. * numpy.sin(2. * psi - 2. * PER)
+                        + 265. * numpy.sin(l1 - pi4)
+                        - 186. * numpy.sin(g)
+                        + 162. * numpy.sin(pi2 - pi3)
+                        + 158. * numpy.sin(4. * (l1 - l2))
+                        - 155. * numpy.sin(l1 - l3))
+    lon = l1 + del1
+    tan_lat = (6393.e-7 * numpy.sin(lon - a.ome1)
+              + 1825.e-7 * numpy.sin(lon - a.ome2)
+              +  329.e-7 * numpy.sin(lon - a.ome3)
+              +  311.e-7 * numpy.sin(lon - psi)
+              +   93.e-7 * numpy.sin(lon - a.ome4))
+    rad = (-41339.e-7 * numpy.cos(2. * (l1 - l2))
+           -  387.e-7 * numpy.cos(l1 - pi1)
+           -  214.e-7 * numpy.cos(l1 - pi4)
+           +  170.e-7 * numpy.cos(l1 - l2)
+           -  131.e-7 * numpy.cos(4. * (l1 - l2))
+           +  106.e-7 * numpy.cos(l1 - l3))
+    return (lon, tan_lat, rad)
+
+def europa_coords(a):
+    (l1, l2, l3) = (a.l1, a.l2, a.l3)
+    (pi1, pi2, pi3, pi4) = (a.pi1, a.pi2, a.pi3, a.pi4)
+    (ome2, ome3, ome4) = (a.ome2, a.ome3, a.ome4)
+    (psi, g, libration, twice_per_plus_g) = (a.psi, a.g, a.libration, a.twice_per_plus_g)
+    del2 = COEFF2RAD * (106476. * numpy.sin(2. * (l2 - l3))
+                        +4256. * numpy.sin(l1 - l2 - l2 + pi3)
+                        +3581. * numpy.sin(l2 - pi3)
+                        +2395. * numpy.sin(l1 - l2 - l2 + pi4)
+                        +1984. * numpy.sin(l2 - pi4)
+                        -1778. * numpy.sin(libration)
+                        +1654. * numpy.sin(l2 - pi2)
+                        +1334. * numpy.sin(l2 - l3 - l3 + pi2)
+                        +1294. * numpy.sin(pi3 - pi4)
+                        -1142. * numpy.sin(l2 - l3)
+                        -1057. * numpy.sin(g)
+                        - 775. * numpy.sin(2. * (psi - PER))
+                        + 524. * numpy.sin(2. * (l1 - l2))
+                        - 460. * numpy.sin(l1 - l3)
+                        + 316. * numpy.sin(psi + ome3 - twice_per_plus_g)
+                        - 203. * numpy.sin(pi1 + pi3 - twice_per_plus_g)
+                        + 146. * numpy.sin(psi - ome3)
+                        - 145. * numpy.sin(g + g)
+                        + 125. * numpy.sin(psi - ome4)
+                        - 115. * numpy.sin(l1 - 2. * l3 + pi3)
+                        -  94. * numpy.sin(2. * (l2 - ome2)))
+    lon = l2 + del2
+    tan_lat = (81004.e-7 * numpy.sin(lon - ome2)
+               +4512.e-7 * numpy.sin(lon - ome3)
+               -3284.e-7 * numpy.sin(lon - psi)
+               +1160.e-7 * numpy.sin(lon - ome4)
+               + 272.e-7 * numpy.sin(l1 - 2. * l3 + 1.0146 * del2 + ome2)
+               - 144.e-7 * numpy.sin(lon - a.ome1)
+               + 143.e-7 * numpy.sin(lon + psi - twice_per_plus_g))
+    rad = (93848.e-7 * numpy.cos(l1 - l2)
+           -3116.e-7 * numpy.cos(l2 - pi3)
+           -1744.e-7 * numpy.cos(l2 - pi4)
+           -1442.e-7 * numpy.cos(l2 - pi2)
+           + 553.e-7 * numpy.cos(l2 - l3)
+           + 523.e-7 * numpy.cos(l1 - l3)
+           - 290.e-7 * numpy.cos(2. * (l1 - l2))
+           + 164.e-7 * numpy.cos(2. * (l2 - ome2))
+           + 107.e-7 * numpy.cos(l1 - 2. * l3 + pi3)
+           - 102.e-7 * numpy.cos(l2 - pi1)
+           -  91.e-7 * numpy.cos(2. * (l1 - l3)))
+    return (lon, tan_lat, rad)
+
+def ganymede_coords(a):
+    (l1, l2, l3, l4) = (a.l1, a.l2, a.l3, a.l4)
+    (pi1, pi2, pi3, pi4) = (a.pi1, a.pi2, a.pi3, a.pi4)
+    (ome3, ome4) = (a.ome3, a.ome4)
+    (psi, g, g_prime, libration, twice_per_plus_g) = (a.psi, a.g, a.g_prime, a.libration, a.twice_per_plus_g)
+    del3 = COEFF2RAD * (16490. * numpy.sin(l3 - pi3)
+                        +9081. * numpy.sin(l3 - pi4)
+                        -6907. * numpy.sin(l2 - l3)
+                        +3784. * numpy.sin(pi3 - pi4)
+                        +1846. * numpy.sin(2. * (l3 - l4))
+                        -1340. * numpy.sin(g)
+                        -1014. * numpy.sin(2. * (psi - PER))
+                        + 704. * numpy.sin(l2 - l3 - l3 + pi3)
+                        - 620. * numpy.sin(l2 - l3 - l3 + pi2)
+                        - 541. * numpy.sin(l3 - l4)
+                        + 381. * numpy.sin(l2 - l3 - l3 + pi4)
+                        + 235. * numpy.sin(psi - ome3)
+                        + 198. * numpy.sin(psi - ome4)
+                        + 176. * numpy.sin(libration)
+                        + 130. * numpy.sin(3. * (l3 - l4))
+                        + 125. * numpy.sin(l1 - l3)
+                        - 119. * numpy.sin(5. * g_prime - 2. * g + 52.225 * DEG2RAD)
+                        + 109. * numpy.sin(l1 - l2)
+                        - 100. * numpy.sin(3. * l3 - 7. * l4 + 4. * pi4)
+                        +  91. * numpy.sin(ome3 - ome4)
+                        +  80. * numpy.sin(3. * l3 - 7. * l4 + pi3 + 3. * pi4)
+                        -  75. * numpy.sin(2. * l2 - 3. * l3 + pi3)
+                        +  72. * numpy.sin(pi1 + pi3 - twice_per_plus_g)
+                        +  69. * numpy.sin(pi4 - PER)
+                        -  58. * numpy.sin(2. * l3 - 3. * l4 + pi4)
+                        -  57. * numpy.sin(l3 - 2. * l4 + pi4)
+                        +  56. * numpy.sin(l3 + pi3 - twice_per_plus_g)
+                        -  52. * numpy.sin(l2 - 2. * l3 + pi1)
+                        -  50. * numpy.sin(pi2 - pi3))
+    lon = l3 + del3
+    tan_lat = (32402.e-7 * numpy.sin(lon - ome3)
+              -16911.e-7 * numpy.sin(lon - psi)
+               +6847.e-7 * numpy.sin(lon - ome4)
+               -2797.e-7 * numpy.sin(lon - a.ome2)
+               + 321.e-7 * numpy.sin(lon + psi - twice_per_plus_g)
+               +  51.e-7 * numpy.sin(lon - psi + g)
+               -  45.e-7 * numpy.sin(lon - psi - g)
+               -  45.e-7 * numpy.sin(lon - psi - 2. * PER))
+    rad = (-14388.e-7 * numpy.cos(l3 - pi3)
+            -7919.e-7 * numpy.cos(l3 - pi4)
+            +6342.e-7 * numpy.cos(l2 - l3)
+            -1761.e-7 * numpy.cos(2. * (l3 - l4))
+            + 294.e-7 * numpy.cos(l3 - l4)
+            - 156.e-7 * numpy.cos(3. * (l3 - l4))
+            + 156.e-7 * numpy.cos(l1 - l3)
+            - 153.e-7 * numpy.cos(l1 - l2)
+            -  70.e-7 * numpy.cos(2. * l2 - 3. * l3 + pi3))
+    return (lon, tan_lat, rad)
+
+def callisto_coords(a):
+    (l1, l2, l3, l4) = (a.l1, a.l2, a.l3, a.l4)
+    (pi3, pi4) = (a.pi3, a.pi4)
+    (ome3, ome4) = (a.ome3, a.ome4)
+    (psi, g, g_prime, twice_per_plus_g) = (a.psi, a.g, a.g_prime, a.twice_per_plus_g)
+    del4 = COEFF2RAD * (84287. * numpy.sin(l4 - pi4)
+                       + 3431. * numpy.sin(pi4 - pi3)
+                       - 3305. * numpy.sin(2. * (psi - PER))
+                       - 3211. * numpy.sin(g)
+                       - 1862. * numpy.sin(l4 - pi3)
+                       + 1186. * numpy.sin(psi - ome4)
+                       +  623. * numpy.sin(l4 + pi4 - twice_per_plus_g)
+                       +  387. * numpy.sin(2. * (l4 - pi4))
+                       -  284. * numpy.sin(5. * g_prime - 2. * g + 52.225 * DEG2RAD)
+                       -  234. * numpy.sin(2. * (psi - pi4))
+                       -  223. * numpy.sin(l3 - l4)
+                       -  208. * numpy.sin(l4 - PER)
+                       +  178. * numpy.sin(psi + ome4 - 2. * pi4)
+                       +  134. * numpy.sin(pi4 - PER)
+                       +  125. * numpy.sin(2. * l4 - twice_per_plus_g)
+                       -  117. * numpy.sin(2. * g)
+                       -  112. * numpy.sin(2. * (l3 - l4)))
+    lon = l4 + del4
+    tan_lat = (- 76579.e-7 * numpy.sin(lon - psi)
+               + 44134.e-7 * numpy.sin(lon - ome4)
+               -  5112.e-7 * numpy.sin(lon - ome3)
+               +   773.e-7 * numpy.sin(lon + psi - twice_per_plus_g)
+               +   104.e-7 * numpy.sin(lon - psi + g)
+               -   102.e-7 * numpy.sin(lon - psi - g)
+               +    88.e-7 * numpy.sin(lon + psi - twice_per_plus_g - g)
+               -    38.e-7 * numpy.sin(lon + psi - twice_per_plus_g + g))
+    rad = (-73546.e-7 * numpy.cos(l4 - pi4)
+            +1621.e-7 * numpy.cos(l4 - pi3)
+            + 974.e-7 * numpy.cos(l3 - l4)
+            - 543.e-7 * numpy.cos(l4 + pi4 - twice_per_plus_g)
+            - 271.e-7 * numpy.cos(2. * (l4 - pi4))
+            + 182.e-7 * numpy.cos(l4 - PER)
+            + 177.e-7 * numpy.cos(2. * (l3 - l4))
+            - 167.e-7 * numpy.cos(2. * l4 - psi - ome4)
+            + 167.e-7 * numpy.cos(psi - ome4)
+            - 155.e-7 * numpy.cos(2. * l4 - twice_per_plus_g)
+            + 142.e-7 * numpy.cos(2. * (l4 - psi))
+            + 105.e-7 * numpy.cos(l1 - l4)
+            +  92.e-7 * numpy.cos(l2 - l4)
+            -  89.e-7 * numpy.cos(l4 - PER - g)
+            -  62.e-7 * numpy.cos(l4 + pi4 - twice_per_plus_g - g)
+            +  48.e-7 * numpy.cos(2. * (l4 - ome4)))
+    return (lon, tan_lat, rad)
+
+satellites_coords = [io_coords, europa_coords, ganymede_coords, callisto_coords]
+
+def satellite_positions(sat, a):
+    (lon, tan_lat, rad) = satellites_coords[sat](a)
+    #Coordinates relative to Jupiter's equator
+    csc_lat = numpy.sqrt(1. + tan_lat * tan_lat)
+    r = r0[sat] * (1. + rad)
+    x = r * numpy.cos(lon - a.psi) / csc_lat
+    y = r * numpy.sin(lon - a.psi) / csc_lat
+    z = r * tan_lat / csc_lat
+    #Rotate to the plane of Jupiter's orbit, then to its ascending node, to the ecliptic and to the vernal equinox
+    (y, z) = rotate(a.incl, y, z)
+    (x, y) = rotate(a.psi + a.precession - a.asc_node, x, y)
+    (y, z) = rotate(a.incl_orbit, y, z)
+    (x, y) = rotate(a.asc_node, x, y)
+    return numpy.column_stack((x, y, z)) * JRADIUS_IN_KM
+
+def lieske_e5_positions(jd, sat):
+    #jd and sat can be scalars or arrays, they are broadcasted against each other
+    (jd, sat) = numpy.broadcast_arrays(numpy.asarray(jd, dtype=float), numpy.asarray(sat, dtype=int))
+    shape = jd.shape
+    jd = jd.ravel()
+    sat = sat.ravel()
+    args = JupiterArguments(jd)
+    positions = numpy.empty((len(jd), 3))
+    for sat_id in numpy.unique(sat):
+        mask = sat == sat_id
+        positions[mask] = satellite_positions(sat_id, args.select(mask))
+    return positions.reshape(shape + (3,))
+
+def lieske_e5_sat_pos(jd, sat):
+    return LPoint3d(*lieske_e5_positions(jd, sat).tolist())
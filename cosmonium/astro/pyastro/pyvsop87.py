@@ -0,0 +1,81 @@
+#
+#This file is part of Cosmonium.
+#
+#Copyright (C) 2018-2019 Laurent Deru.
+#
+#Cosmonium is free software: you can redistribute it and/or modify
+#it under the terms of the GNU General Public License as published by
+#the Free Software Foundation, either version 3 of the License, or
+#(at your option) any later version.
+#
+#Cosmonium is distributed in the hope that it will be useful,
+#but WITHOUT ANY WARRANTY without even the implied warranty of
+#MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#GNU General Public License for more details.
+#
+#You should have received a copy of the GNU General Public License
+#along with Cosmonium.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+from __future__ import print_function
+from __future__ import absolute_import
+
+from panda3d.core import LPoint3d
+
+from .vsop_data import vsop87_index, vsop87_terms
+
+import numpy
+
+J2000 = 2451545.0
+CENTURY = 36525.0
+AU_IN_KM = 1.495978707e+8
+
+class VSOP87Series(object):
+    #Terms of the 3 coordinates of a planet, each coordinate is a sum of 6 series multiplied by the powers of time
+    def __init__(self, planet):
+        first = (planet - 1) * 18
+        index = vsop87_index[first:first + 19]
+        terms = numpy.array(vsop87_terms[index[0]:index[-1]])
+        self.amplitudes = terms[:, 0] * 1e-8
+        self.phases = terms[:, 1]
+        self.frequencies = terms[:, 2]
+        #Matrix summing the terms of each series
+        self.series = numpy.zeros((len(terms), 18))
+        self.series[numpy.arange(len(terms)), numpy.repeat(numpy.arange(18), numpy.diff(index))] = 1.0
+
+    def evaluate(self, t):
+        #Returns the longitude, latitude and distance for each time in julian millennia
+        terms = self.amplitudes * numpy.cos(self.phases + numpy.outer(t, self.frequencies))
+        sums = terms.dot(self.series).reshape(-1, 3, 6)
+        powers = t[:, numpy.newaxis] ** numpy.arange(6)
+        return (sums * powers[:, numpy.newaxis, :]).sum(axis=2)
+
+planets_series = {}
+
+def get_planet_series(planet):
+    series = planets_series.get(planet)
+    if series is None:
+        series = VSOP87Series(planet)
+        planets_series[planet] = series
+    return series
+
+def vsop87_positions(jd, planet):
+    #jd and planet can be scalars or arrays, they are broadcasted against each other
+    (jd, planet) = numpy.broadcast_arrays(numpy.asarray(jd, dtype=float), numpy.asarray(planet, dtype=int))
+    shape = jd.shape
+    jd = jd.ravel()
+    planet = planet.ravel()
+    t = (jd - J2000) / CENTURY / 10.0
+    positions = numpy.zeros((len(jd), 3))
+    for planet_id in numpy.unique(planet):
+        #The Sun is at the origin
+        if planet_id == 0: continue
+        mask = planet == planet_id
+        (lon, lat, r) = get_planet_series(planet_id).evaluate(t[mask]).T
+        r = r * AU_IN_KM
+        xy = numpy.cos(lat) * r
+        positions[mask] = numpy.column_stack((numpy.cos(lon) * xy, numpy.sin(lon) * xy, numpy.sin(lat) * r))
+    return positions.reshape(shape + (3,))
+
+def vsop87_pos(jd, planet):
+    return LPoint3d(*vsop87_positions(jd, planet).tolist())
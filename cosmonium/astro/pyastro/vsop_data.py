@@ -0,0 +1,2594 @@
+#
+#This file is part of Cosmonium.
+#
+#Copyright (C) 2018-2020 Laurent Deru.
+#
+#Cosmonium is free software: you can redistribute it and/or modify
+#it under the terms of the GNU General Public License as published by
+#the Free Software Foundation, either version 3 of the License, or
+#(at your option) any later version.
+#
+#Cosmonium is distributed in the hope that it will be useful,
+#but WITHOUT ANY WARRANTY; without even the implied warranty of
+#MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#GNU General Public License for more details.
+#
+#You should have received a copy of the GNU General Public License
+#along with Cosmonium.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+#Generated from source/vsop_data.cpp by source/vsop_data_to_py.py, do not edit
+
+#Index of the first term of each series, ordered by planet, coordinate and power of time
+vsop87_index = [0, 38, 54, 64, 72, 78, 79, 93, 104, 113, 120, 122, 122, 135, 143, 150, 155, 155, 155, 179, 191, 199, 202, 205, 206, 215, 219, 223, 227, 228, 228, 240, 243, 246, 247, 248, 248, 312, 346, 366, 373, 376, 377, 382, 384, 384, 384, 384, 384, 424, 434, 440, 442, 443, 443, 512, 558, 591, 603, 611, 613, 629, 638, 645, 649, 652, 652, 697, 724, 735, 741, 745, 745, 809, 870, 927, 966, 985, 990, 1016, 1038, 1052, 1061, 1067, 1068, 1114, 1157, 1193, 1221, 1236, 1243, 1333, 1412, 1475, 1523, 1550, 1562, 1596, 1628, 1657, 1678, 1690, 1692, 1736, 1774, 1806, 1834, 1857, 1875, 1966, 2023, 2058, 2076, 2080, 2080, 2108, 2128, 2139, 2143, 2144, 2144, 2203, 2238, 2256, 2266, 2268, 2268, 2306, 2324, 2331, 2335, 2336, 2336, 2353, 2366, 2372, 2376, 2377, 2377, 2409, 2424, 2429, 2430, 2430, 2430]
+
+#Amplitude (in 1e-8 unit), phase and frequency of the VSOP87 terms
+vsop87_terms = [
+    (440250710.0, 0.0, 0.0),
+    (40989415.0, 1.483020342, 26087.903141574),
+    (5046294.0, 4.477854895, 52175.806283148),
+    (855347.0, 1.165203224, 78263.709424723),
+    (165590.0, 4.119691632, 104351.612566297),
+    (34562.0, 0.779307658, 130439.515707871),
+    (7583.0, 3.713484005, 156527.418849445),
+    (3560.0, 1.512026694, 1109.378552093),
+    (1803.0, 4.103331784, 5661.332049152),
+    (1726.0, 0.358322399, 182615.321991019),
+    (1590.0, 2.995104178, 25028.521211385),
+    (1365.0, 4.599183187, 27197.281693668),
+    (1017.0, 0.88031439, 31749.235190726),
+    (714.0, 1.541448653, 24978.524589481),
+    (644.0, 5.302661108, 21535.949644515),
+    (451.0, 6.049892753, 51116.424352959),
+    (404.0, 3.28228847, 208703.225132594),
+    (352.0, 5.241562971, 20426.571092422),
+    (345.0, 2.792119015, 15874.617595363),
+    (343.0, 5.765318853, 955.599741609),
+    (339.0, 5.86327765, 25558.21217648),
+    (325.0, 1.336743348, 53285.184835242),
+    (273.0, 2.49451164, 529.690965095),
+    (264.0, 3.91705094, 57837.138332301),
+    (260.0, 0.987324282, 4551.953497059),
+    (239.0, 0.113439534, 1059.381930189),
+    (235.0, 0.266721189, 11322.664098304),
+    (217.0, 0.659872073, 13521.751441591),
+    (209.0, 2.09178234, 47623.85278609),
+    (183.0, 2.628786708, 27043.502883183),
+    (182.0, 2.434135025, 25661.304950698),
+    (176.0, 4.536368299, 51066.427731055),
+    (173.0, 2.452001642, 24498.83024629),
+    (142.0, 3.360039488, 37410.567239879),
+    (138.0, 0.290984478, 10213.285546211),
+    (125.0, 3.720798044, 39609.654583166),
+    (118.0, 2.781497864, 77204.327494533),
+    (106.0, 4.205721163, 19804.827291583),
+    (2608814706223.0, 0.0, 0.0),
+    (1126008.0, 6.21703971, 26087.903141574),
+    (303471.0, 3.055654724, 52175.806283148),
+    (80538.0, 6.104547434, 78263.709424723),
+    (21245.0, 2.835319345, 104351.612566297),
+    (5592.0, 5.826756733, 130439.515707871),
+    (1472.0, 2.518454584, 156527.418849445),
+    (388.0, 5.480392259, 182615.321991019),
+    (352.0, 3.052380944, 1109.378552093),
+    (103.0, 2.148791738, 208703.225132594),
+    (94.0, 6.117911639, 27197.281693668),
+    (91.0, 0.000454817, 24978.524589481),
+    (52.0, 5.621075541, 5661.332049152),
+    (44.0, 4.573485005, 25028.521211385),
+    (28.0, 3.04195431, 51066.427731055),
+    (27.0, 5.092101388, 234791.128274168),
+    (53050.0, 0.0, 0.0),
+    (16904.0, 4.690723006, 26087.903141574),
+    (7397.0, 1.347356247, 52175.806283148),
+    (3018.0, 4.456435397, 78263.709424723),
+    (1107.0, 1.262265376, 104351.612566297),
+    (378.0, 4.319980559, 130439.515707871),
+    (123.0, 1.068685411, 156527.418849445),
+    (39.0, 4.080116102, 182615.321991019),
+    (15.0, 4.633430858, 1109.378552093),
+    (12.0, 0.791876464, 208703.225132594),
+    (188.0, 0.034668301, 52175.806283148),
+    (142.0, 3.125054526, 26087.903141574),
+    (97.0, 3.003781719, 78263.709424723),
+    (44.0, 6.018679658, 104351.612566297),
+    (35.0, 0.0, 0.0),
+    (18.0, 2.77538374, 130439.515707871),
+    (7.0, 5.818086657, 156527.418849445),
+    (3.0, 2.570143645, 182615.321991019),
+    (114.0, 3.141592654, 0.0),
+    (3.0, 2.028480076, 26087.903141574),
+    (2.0, 1.417318038, 78263.709424723),
+    (2.0, 4.501376438, 52175.806283148),
+    (1.0, 4.499701811, 104351.612566297),
+    (1.0, 1.26591777, 130439.515707871),
+    (1.0, 3.141592654, 0.0),
+    (11737529.0, 1.983574988, 26087.903141574),
+    (2388077.0, 5.037389597, 52175.806283148),
+    (1222840.0, 3.141592654, 0.0),
+    (543252.0, 1.79644364, 78263.709424723),
+    (129779.0, 4.83232504, 104351.612566297),
+    (31867.0, 1.580884957, 130439.515707871),
+    (7963.0, 4.609721263, 156527.418849445),
+    (2014.0, 1.353241647, 182615.321991019),
+    (514.0, 4.378354093, 208703.225132594),
+    (209.0, 2.020202942, 24978.524589481),
+    (208.0, 4.917725641, 27197.281693668),
+    (132.0, 1.119084923, 234791.128274168),
+    (121.0, 1.812717521, 53285.184835242),
+    (100.0, 5.656847342, 20426.571092422),
+    (429151.0, 3.501697804, 26087.903141574),
+    (146234.0, 3.141592654, 0.0),
+    (22675.0, 0.015153669, 52175.806283148),
+    (10895.0, 0.48540174, 78263.709424723),
+    (6353.0, 3.4294392, 104351.612566297),
+    (2496.0, 0.160512107, 130439.515707871),
+    (860.0, 3.184524336, 156527.418849445),
+    (278.0, 6.210207742, 182615.321991019),
+    (86.0, 2.952443918, 208703.225132594),
+    (28.0, 0.290689389, 27197.281693668),
+    (26.0, 5.977089627, 234791.128274168),
+    (11831.0, 4.790655858, 26087.903141574),
+    (1914.0, 0.0, 0.0),
+    (1045.0, 1.212165405, 52175.806283148),
+    (266.0, 4.434183365, 78263.709424723),
+    (170.0, 1.622556387, 104351.612566297),
+    (96.0, 4.80023692, 130439.515707871),
+    (45.0, 1.607582678, 156527.418849445),
+    (18.0, 4.669046554, 182615.321991019),
+    (7.0, 1.434048889, 208703.225132594),
+    (235.0, 0.353875246, 26087.903141574),
+    (161.0, 0.0, 0.0),
+    (19.0, 4.362754603, 52175.806283148),
+    (6.0, 2.507153814, 78263.709424723),
+    (5.0, 6.142578176, 104351.612566297),
+    (3.0, 3.124975527, 130439.515707871),
+    (2.0, 6.266424121, 156527.418849445),
+    (4.0, 1.745799321, 26087.903141574),
+    (1.0, 3.141592654, 0.0),
+    (39528272.0, 0.0, 0.0),
+    (7834132.0, 6.192337226, 26087.903141574),
+    (795526.0, 2.959896901, 52175.806283148),
+    (121282.0, 6.010641538, 78263.709424723),
+    (21922.0, 2.77820094, 104351.612566297),
+    (4354.0, 5.828945433, 130439.515707871),
+    (918.0, 2.596505626, 156527.418849445),
+    (290.0, 1.42441937, 25028.521211385),
+    (260.0, 3.028177535, 27197.281693668),
+    (202.0, 5.647250404, 182615.321991019),
+    (201.0, 5.592277242, 31749.235190726),
+    (142.0, 6.252642026, 24978.524589481),
+    (100.0, 3.734356087, 21535.949644515),
+    (217348.0, 4.656171587, 26087.903141574),
+    (44142.0, 1.42385544, 52175.806283148),
+    (10094.0, 4.474663263, 78263.709424723),
+    (2433.0, 1.242260834, 104351.612566297),
+    (1624.0, 0.0, 0.0),
+    (604.0, 4.293031166, 130439.515707871),
+    (153.0, 1.060607798, 156527.418849445),
+    (39.0, 4.111367514, 182615.321991019),
+    (3118.0, 3.082318403, 26087.903141574),
+    (1245.0, 6.151833174, 52175.806283148),
+    (425.0, 2.92583353, 78263.709424723),
+    (136.0, 5.979839258, 104351.612566297),
+    (42.0, 2.749369806, 130439.515707871),
+    (22.0, 3.141592654, 0.0),
+    (13.0, 5.801431622, 156527.418849445),
+    (33.0, 1.679716354, 26087.903141574),
+    (24.0, 4.63403169, 52175.806283148),
+    (12.0, 1.389837815, 78263.709424723),
+    (5.0, 4.439153869, 104351.612566297),
+    (2.0, 1.207338803, 130439.515707871),
+    (317614667.0, 0.0, 0.0),
+    (1353968.0, 5.593133196, 10213.285546211),
+    (89892.0, 5.306500485, 20426.571092422),
+    (5477.0, 4.416306525, 7860.419392439),
+    (3456.0, 2.699644708, 11790.629088659),
+    (2372.0, 2.993775396, 3930.20969622),
+    (1664.0, 4.25018935, 1577.343542448),
+    (1438.0, 4.15745044, 9683.594581116),
+    (1317.0, 5.186682191, 26.2983198),
+    (1201.0, 6.153571153, 30639.856638633),
+    (769.0, 0.816296159, 9437.762934887),
+    (761.0, 1.950147021, 529.690965095),
+    (708.0, 1.064667072, 775.522611324),
+    (585.0, 3.998398848, 191.448266112),
+    (500.0, 4.123402101, 15720.838784878),
+    (429.0, 3.586428598, 19367.189162233),
+    (327.0, 5.677365837, 5507.553238667),
+    (326.0, 4.590564731, 10404.733812323),
+    (232.0, 3.162510571, 9153.903616022),
+    (180.0, 4.653379156, 1109.378552093),
+    (155.0, 5.570438889, 19651.048481098),
+    (128.0, 4.226044937, 20.775395492),
+    (128.0, 0.962098227, 5661.332049152),
+    (106.0, 1.537211913, 801.820931124),
+    (1021352943053.0, 0.0, 0.0),
+    (95708.0, 2.46424449, 10213.285546211),
+    (14445.0, 0.516245647, 20426.571092422),
+    (213.0, 1.795479294, 30639.856638633),
+    (174.0, 2.655358794, 26.2983198),
+    (152.0, 6.106352824, 1577.343542448),
+    (82.0, 5.702341337, 191.448266112),
+    (70.0, 2.68136035, 9437.762934887),
+    (52.0, 3.600130877, 775.522611324),
+    (38.0, 1.03379038, 529.690965095),
+    (30.0, 1.250563224, 5507.553238667),
+    (25.0, 6.106647929, 10404.733812323),
+    (54127.0, 0.0, 0.0),
+    (3891.0, 0.3451436, 10213.285546211),
+    (1338.0, 2.020112861, 20426.571092422),
+    (24.0, 2.04592119, 26.2983198),
+    (19.0, 3.535273715, 30639.856638633),
+    (10.0, 3.971302211, 775.522611324),
+    (7.0, 1.519625934, 1577.343542448),
+    (6.0, 0.999267579, 191.448266112),
+    (136.0, 4.80389021, 10213.285546211),
+    (78.0, 3.668763716, 20426.571092422),
+    (26.0, 0.0, 0.0),
+    (114.0, 3.141592654, 0.0),
+    (3.0, 5.205141702, 20426.571092422),
+    (2.0, 2.510995917, 10213.285546211),
+    (1.0, 3.141592654, 0.0),
+    (5923638.0, 0.267027758, 10213.285546211),
+    (40108.0, 1.147371781, 20426.571092422),
+    (32815.0, 3.141592654, 0.0),
+    (1011.0, 1.08946123, 30639.856638633),
+    (149.0, 6.253902961, 18073.70493865),
+    (138.0, 0.860201465, 1577.343542448),
+    (130.0, 3.671524837, 9437.762934887),
+    (120.0, 3.704688128, 2352.866153772),
+    (108.0, 4.539036776, 22003.91463487),
+    (513348.0, 1.803643108, 10213.285546211),
+    (4380.0, 3.386157116, 20426.571092422),
+    (199.0, 0.0, 0.0),
+    (197.0, 2.530011975, 30639.856638633),
+    (22378.0, 3.385091439, 10213.285546211),
+    (282.0, 0.0, 0.0),
+    (173.0, 5.255637669, 20426.571092422),
+    (27.0, 3.870408916, 30639.856638633),
+    (647.0, 4.991665653, 10213.285546211),
+    (20.0, 3.141592654, 0.0),
+    (6.0, 0.77376924, 20426.571092422),
+    (3.0, 5.44493763, 30639.856638633),
+    (14.0, 0.315371902, 10213.285546211),
+    (72334821.0, 0.0, 0.0),
+    (489824.0, 4.021518323, 10213.285546211),
+    (1658.0, 4.90206728, 20426.571092422),
+    (1632.0, 2.845488519, 7860.419392439),
+    (1378.0, 1.128465906, 11790.629088659),
+    (498.0, 2.586821877, 9683.594581116),
+    (374.0, 1.423148371, 3930.20969622),
+    (264.0, 5.529381859, 9437.762934887),
+    (237.0, 2.55135904, 15720.838784878),
+    (222.0, 2.013467768, 19367.189162233),
+    (126.0, 2.727698336, 1577.343542448),
+    (119.0, 3.019753653, 10404.733812323),
+    (34551.0, 0.891987106, 10213.285546211),
+    (234.0, 1.772249427, 20426.571092422),
+    (234.0, 3.141592654, 0.0),
+    (1407.0, 5.063663952, 10213.285546211),
+    (16.0, 5.47321688, 20426.571092422),
+    (13.0, 0.0, 0.0),
+    (50.0, 3.222635545, 10213.285546211),
+    (1.0, 0.922296978, 10213.285546211),
+    (175347046.0, 0.0, 0.0),
+    (3341656.0, 4.669256804, 6283.075849991),
+    (34894.0, 4.626102418, 12566.151699983),
+    (3497.0, 2.74411801, 5753.384884897),
+    (3418.0, 2.828865796, 3.523118349),
+    (3136.0, 3.627670418, 77713.771468121),
+    (2676.0, 4.418083514, 7860.419392439),
+    (2343.0, 6.135162376, 3930.20969622),
+    (1324.0, 0.742463564, 11506.769769794),
+    (1273.0, 2.037096558, 529.690965095),
+    (1199.0, 1.109629443, 1577.343542448),
+    (990.0, 5.232681296, 5884.926846583),
+    (902.0, 2.045054435, 26.2983198),
+    (857.0, 3.50849157, 398.149003408),
+    (780.0, 1.178826521, 5223.693919802),
+    (753.0, 2.533390538, 5507.553238667),
+    (505.0, 4.582925631, 18849.227549974),
+    (492.0, 4.205066399, 775.522611324),
+    (357.0, 2.919541169, 0.067310303),
+    (317.0, 5.849019522, 11790.629088659),
+    (284.0, 1.898690342, 796.298006816),
+    (271.0, 0.314886076, 10977.078804699),
+    (243.0, 0.344811409, 5486.777843175),
+    (206.0, 4.806466061, 2544.314419883),
+    (205.0, 1.869478137, 5573.142801433),
+    (202.0, 2.457677955, 6069.776754553),
+    (156.0, 0.833060738, 213.299095438),
+    (132.0, 3.411182756, 2942.463423292),
+    (126.0, 1.083026302, 20.775395492),
+    (115.0, 0.645449117, 0.980321068),
+    (103.0, 0.635998467, 4694.002954708),
+    (102.0, 0.975692218, 15720.838784878),
+    (102.0, 4.266798214, 7.113547001),
+    (99.0, 6.209929403, 2146.165416475),
+    (98.0, 0.681012723, 155.420399434),
+    (86.0, 5.983226313, 161000.685737674),
+    (85.0, 1.29870743, 6275.962302991),
+    (85.0, 3.67080093, 71430.695618129),
+    (80.0, 1.807913307, 17260.15465469),
+    (79.0, 3.036983131, 12036.460734888),
+    (75.0, 1.755089162, 5088.628839767),
+    (74.0, 3.503194432, 3154.687084896),
+    (74.0, 4.679265655, 801.820931124),
+    (70.0, 0.83297597, 9437.762934887),
+    (62.0, 3.977638806, 8827.390269875),
+    (61.0, 1.81839811, 7084.896781115),
+    (57.0, 2.78430398, 6286.59896834),
+    (56.0, 4.386948808, 14143.495242431),
+    (56.0, 3.470060091, 6279.552731642),
+    (52.0, 0.189149458, 12139.553509107),
+    (52.0, 1.33282747, 1748.016413067),
+    (51.0, 0.283068645, 5856.477659115),
+    (49.0, 0.48735065, 1194.447010225),
+    (41.0, 5.368173514, 8429.241266467),
+    (41.0, 2.398508817, 19651.048481098),
+    (39.0, 6.16832995, 10447.387839604),
+    (37.0, 6.041338593, 10213.285546211),
+    (37.0, 2.569552386, 1059.381930189),
+    (36.0, 1.708761119, 2352.866153772),
+    (36.0, 1.775973147, 6812.766815086),
+    (33.0, 0.593094995, 17789.845619785),
+    (30.0, 0.442944641, 83996.847318112),
+    (30.0, 2.739751239, 1349.867409659),
+    (25.0, 3.164709534, 4690.479836359),
+    (628331966747.0, 0.0, 0.0),
+    (206059.0, 2.678234556, 6283.075849991),
+    (4303.0, 2.635126504, 12566.151699983),
+    (425.0, 1.590469807, 3.523118349),
+    (119.0, 5.795574878, 26.2983198),
+    (109.0, 2.96618002, 1577.343542448),
+    (93.0, 2.592128354, 18849.227549974),
+    (72.0, 1.138461582, 529.690965095),
+    (68.0, 1.874723048, 398.149003408),
+    (67.0, 4.409182352, 5507.553238667),
+    (59.0, 2.887970385, 5223.693919802),
+    (56.0, 2.174716803, 155.420399434),
+    (45.0, 0.398030798, 796.298006816),
+    (36.0, 0.466247398, 775.522611324),
+    (29.0, 2.647073839, 7.113547001),
+    (21.0, 5.341382751, 0.980321068),
+    (19.0, 1.846283326, 5486.777843175),
+    (19.0, 4.968551246, 213.299095438),
+    (17.0, 2.991168649, 6275.962302991),
+    (16.0, 0.03216483, 2544.314419883),
+    (16.0, 1.430492853, 2146.165416475),
+    (15.0, 1.205323663, 10977.078804699),
+    (12.0, 2.834322855, 1748.016413067),
+    (12.0, 3.258048156, 5088.628839767),
+    (12.0, 5.273797905, 1194.447010225),
+    (12.0, 2.075024182, 4694.002954708),
+    (11.0, 0.766141992, 553.569402842),
+    (10.0, 1.302629911, 6286.59896834),
+    (10.0, 4.239254722, 1349.867409659),
+    (9.0, 2.699570629, 242.728603974),
+    (9.0, 5.644758681, 951.718406251),
+    (8.0, 5.300626649, 2352.866153772),
+    (6.0, 2.65033985, 9437.762934887),
+    (6.0, 4.666325842, 4690.479836359),
+    (52919.0, 0.0, 0.0),
+    (8720.0, 1.072096652, 6283.075849991),
+    (309.0, 0.867288188, 12566.151699983),
+    (27.0, 0.052978717, 3.523118349),
+    (16.0, 5.18826691, 26.2983198),
+    (16.0, 3.684578894, 155.420399434),
+    (10.0, 0.757422977, 18849.227549974),
+    (9.0, 2.057054191, 77713.771468121),
+    (7.0, 0.826733054, 775.522611324),
+    (5.0, 4.662845253, 1577.343542448),
+    (4.0, 1.03057163, 7.113547001),
+    (4.0, 3.440508035, 5573.142801433),
+    (3.0, 5.140746328, 796.298006816),
+    (3.0, 6.052918512, 5507.553238667),
+    (3.0, 1.192465064, 242.728603974),
+    (3.0, 6.116526272, 529.690965095),
+    (3.0, 0.30637881, 398.149003408),
+    (3.0, 2.279928107, 553.569402842),
+    (2.0, 4.381188382, 5223.693919802),
+    (2.0, 3.754353305, 0.980321068),
+    (289.0, 5.843841987, 6283.075849991),
+    (35.0, 0.0, 0.0),
+    (17.0, 5.487669123, 12566.151699983),
+    (3.0, 5.195772652, 155.420399434),
+    (1.0, 4.722002522, 3.523118349),
+    (1.0, 5.300458091, 18849.227549974),
+    (1.0, 5.969259371, 242.728603974),
+    (114.0, 3.141592654, 0.0),
+    (8.0, 4.134465894, 6283.075849991),
+    (1.0, 3.838037762, 12566.151699983),
+    (1.0, 3.141592654, 0.0),
+    (280.0, 3.19870156, 84334.661581308),
+    (102.0, 5.422486193, 5507.553238667),
+    (80.0, 3.880132045, 5223.693919802),
+    (44.0, 3.704446898, 2352.866153772),
+    (32.0, 4.000263698, 1577.343542448),
+    (9.0, 3.897290619, 5507.553238667),
+    (6.0, 1.730388504, 5223.693919802),
+    (100013989.0, 0.0, 0.0),
+    (1670700.0, 3.098463508, 6283.075849991),
+    (13956.0, 3.055246096, 12566.151699983),
+    (3084.0, 5.198466744, 77713.771468121),
+    (1628.0, 1.17387749, 5753.384884897),
+    (1576.0, 2.846852458, 7860.419392439),
+    (925.0, 5.452922341, 11506.769769794),
+    (542.0, 4.564091498, 3930.20969622),
+    (472.0, 3.661000221, 5884.926846583),
+    (346.0, 0.963686177, 5507.553238667),
+    (329.0, 5.899836465, 5223.693919802),
+    (307.0, 0.298671395, 5573.142801433),
+    (243.0, 4.273495362, 11790.629088659),
+    (212.0, 5.847145403, 1577.343542448),
+    (186.0, 5.021944472, 10977.078804699),
+    (175.0, 3.011936365, 18849.227549974),
+    (110.0, 5.055106363, 5486.777843175),
+    (98.0, 0.886813113, 6069.776754553),
+    (86.0, 5.689597783, 15720.838784878),
+    (86.0, 1.270837334, 161000.685737674),
+    (65.0, 0.272506138, 17260.15465469),
+    (63.0, 0.921771088, 529.690965095),
+    (57.0, 2.01374292, 83996.847318112),
+    (56.0, 5.241597989, 71430.695618129),
+    (49.0, 3.245012404, 2544.314419883),
+    (47.0, 2.578050704, 775.522611324),
+    (45.0, 5.537158073, 9437.762934887),
+    (43.0, 6.01110242, 6275.962302991),
+    (39.0, 5.360717382, 4694.002954708),
+    (38.0, 2.39255344, 8827.390269875),
+    (37.0, 0.829529223, 19651.048481098),
+    (37.0, 4.901075919, 12139.553509107),
+    (36.0, 1.67468059, 12036.460734888),
+    (35.0, 1.842706933, 2942.463423292),
+    (33.0, 0.243703001, 7084.896781115),
+    (32.0, 0.183682298, 5088.628839767),
+    (32.0, 1.777756421, 398.149003408),
+    (28.0, 1.213448682, 6286.59896834),
+    (28.0, 1.899343309, 6279.552731642),
+    (26.0, 4.588968504, 10447.387839604),
+    (103019.0, 1.107489696, 6283.075849991),
+    (1721.0, 1.064423014, 12566.151699983),
+    (702.0, 3.141592654, 0.0),
+    (32.0, 1.021690591, 18849.227549974),
+    (31.0, 2.843538048, 5507.553238667),
+    (25.0, 1.319067095, 5223.693919802),
+    (18.0, 1.424297486, 1577.343542448),
+    (10.0, 5.913781946, 10977.078804699),
+    (9.0, 1.420468544, 6275.962302991),
+    (9.0, 0.271461506, 5486.777843175),
+    (4359.0, 5.784551337, 6283.075849991),
+    (124.0, 5.579347222, 12566.151699983),
+    (12.0, 3.141592654, 0.0),
+    (9.0, 3.627777334, 77713.771468121),
+    (6.0, 1.869589051, 5573.142801433),
+    (3.0, 5.470279133, 18849.227549974),
+    (145.0, 4.273194351, 6283.075849991),
+    (7.0, 3.916976087, 12566.151699983),
+    (4.0, 2.563843873, 6283.075849991),
+    (620347712.0, 0.0, 0.0),
+    (18656368.0, 5.050371003, 3340.6124267),
+    (1108217.0, 5.40099837, 6681.2248534),
+    (91798.0, 5.754787451, 10021.837280099),
+    (27745.0, 5.970495129, 3.523118349),
+    (12316.0, 0.849560812, 2810.921461605),
+    (10610.0, 2.93958525, 2281.230496511),
+    (8927.0, 4.156978459, 0.017253652),
+    (8716.0, 6.110051598, 13362.449706799),
+    (7775.0, 3.339686551, 5621.84292321),
+    (6798.0, 0.364622436, 398.149003408),
+    (4161.0, 0.228149753, 2942.463423292),
+    (3575.0, 1.661865401, 2544.314419883),
+    (3075.0, 0.856965971, 191.448266112),
+    (2938.0, 6.078937114, 0.067310303),
+    (2628.0, 0.648061436, 3337.089308351),
+    (2580.0, 0.029967062, 3344.135545049),
+    (2389.0, 5.038964013, 796.298006816),
+    (1799.0, 0.656340268, 529.690965095),
+    (1546.0, 2.915796334, 1751.539531416),
+    (1528.0, 1.149793062, 6151.533888305),
+    (1286.0, 3.067959246, 2146.165416475),
+    (1264.0, 3.622750922, 5092.151958116),
+    (1025.0, 3.693342936, 8962.45534991),
+    (892.0, 0.182938991, 16703.062133499),
+    (859.0, 2.400937042, 2914.014235824),
+    (833.0, 4.494957535, 3340.629680352),
+    (833.0, 2.464185913, 3340.595173048),
+    (749.0, 3.822483995, 155.420399434),
+    (724.0, 0.674975658, 3738.761430108),
+    (713.0, 3.663360148, 1059.381930189),
+    (655.0, 0.488640752, 3127.313331262),
+    (636.0, 2.921827043, 8432.764384816),
+    (553.0, 4.47478863, 1748.016413067),
+    (550.0, 3.810012054, 0.980321068),
+    (472.0, 3.625478194, 1194.447010225),
+    (426.0, 0.553651382, 6283.075849991),
+    (415.0, 0.496623148, 213.299095438),
+    (312.0, 0.998533228, 6677.701735051),
+    (307.0, 0.38052863, 6684.747971749),
+    (302.0, 4.486181503, 3532.060692811),
+    (299.0, 2.783237057, 6254.626662524),
+    (293.0, 4.221312779, 20.775395492),
+    (284.0, 5.768854941, 3149.164160588),
+    (281.0, 5.881633729, 1349.867409659),
+    (274.0, 0.133725012, 3340.679737003),
+    (274.0, 0.542221418, 3340.545116397),
+    (239.0, 5.371554717, 4136.910433516),
+    (236.0, 5.755045156, 3333.498879699),
+    (231.0, 1.282406853, 3870.303391794),
+    (221.0, 3.504666722, 382.896532223),
+    (204.0, 2.821332662, 1221.848566321),
+    (193.0, 3.357151377, 3.590428652),
+    (189.0, 1.491030165, 9492.146315005),
+    (179.0, 1.005611126, 951.718406251),
+    (174.0, 2.413603326, 553.569402842),
+    (172.0, 0.439430417, 5486.777843175),
+    (160.0, 3.948547352, 4562.460993021),
+    (144.0, 1.418741934, 135.065080035),
+    (140.0, 3.325925162, 2700.715140386),
+    (138.0, 4.301451769, 7.113547001),
+    (131.0, 4.044917203, 12303.06777661),
+    (128.0, 2.20806651, 1592.596013633),
+    (128.0, 1.806656433, 5088.628839767),
+    (117.0, 3.128052822, 7903.073419721),
+    (113.0, 3.700707981, 1589.072895284),
+    (110.0, 1.051950797, 242.728603974),
+    (105.0, 0.785353821, 8827.390269875),
+    (100.0, 3.243437409, 11773.376811515),
+    (334085627474.0, 0.0, 0.0),
+    (1458227.0, 3.604260536, 3340.6124267),
+    (164901.0, 3.92631251, 6681.2248534),
+    (19963.0, 4.26594061, 10021.837280099),
+    (3452.0, 4.732103864, 3.523118349),
+    (2485.0, 4.612775673, 13362.449706799),
+    (842.0, 4.458582568, 2281.230496511),
+    (538.0, 5.015897275, 398.149003408),
+    (521.0, 4.994226782, 3344.135545049),
+    (433.0, 2.560664029, 191.448266112),
+    (430.0, 5.316461624, 155.420399434),
+    (382.0, 3.538812894, 796.298006816),
+    (314.0, 4.96335266, 16703.062133499),
+    (283.0, 3.159675182, 2544.314419883),
+    (206.0, 4.568914557, 2146.165416475),
+    (169.0, 1.328948134, 3337.089308351),
+    (158.0, 4.18501036, 1751.539531416),
+    (134.0, 2.233251042, 0.980321068),
+    (134.0, 5.974219039, 1748.016413067),
+    (118.0, 6.024072139, 6151.533888305),
+    (117.0, 2.213476525, 1059.381930189),
+    (114.0, 2.128694551, 1194.447010225),
+    (114.0, 5.428032243, 3738.761430108),
+    (91.0, 1.096278366, 1349.867409659),
+    (85.0, 3.90854841, 553.569402842),
+    (83.0, 5.296366263, 6684.747971749),
+    (81.0, 4.428134059, 529.690965095),
+    (80.0, 2.248642663, 8962.45534991),
+    (73.0, 2.501894606, 951.718406251),
+    (73.0, 5.842081632, 242.728603974),
+    (71.0, 3.856360944, 2914.014235824),
+    (68.0, 5.023276865, 382.896532223),
+    (65.0, 1.018024393, 3340.595173048),
+    (65.0, 3.04879604, 3340.629680352),
+    (62.0, 4.151831598, 3149.164160588),
+    (57.0, 3.888136993, 4136.910433516),
+    (48.0, 4.873621215, 213.299095438),
+    (48.0, 1.182380461, 3333.498879699),
+    (47.0, 1.314524199, 3185.192027266),
+    (41.0, 0.713853755, 1592.596013633),
+    (40.0, 2.725424806, 7.113547001),
+    (40.0, 5.316118755, 20043.674560199),
+    (33.0, 5.41067412, 6283.075849991),
+    (28.0, 0.045341249, 9492.146315005),
+    (27.0, 3.889607248, 1221.848566321),
+    (27.0, 5.112717476, 2700.715140386),
+    (58016.0, 2.049794633, 3340.6124267),
+    (54188.0, 0.0, 0.0),
+    (13908.0, 2.457423599, 6681.2248534),
+    (2465.0, 2.800000209, 10021.837280099),
+    (398.0, 3.141184283, 13362.449706799),
+    (222.0, 3.1943608, 3.523118349),
+    (121.0, 0.543252925, 155.420399434),
+    (62.0, 3.485294274, 16703.062133499),
+    (54.0, 3.541911215, 3344.135545049),
+    (34.0, 6.001884991, 2281.230496511),
+    (32.0, 4.140151718, 191.448266112),
+    (30.0, 1.998706798, 796.298006816),
+    (23.0, 4.334033659, 242.728603974),
+    (22.0, 3.445324664, 398.149003408),
+    (20.0, 5.421913754, 553.569402842),
+    (16.0, 0.656789533, 0.980321068),
+    (16.0, 6.110004724, 2146.165416475),
+    (16.0, 1.220861219, 1748.016413067),
+    (15.0, 6.095417836, 3185.192027266),
+    (14.0, 4.019238121, 951.718406251),
+    (14.0, 2.618518976, 1349.867409659),
+    (13.0, 0.601890084, 1194.447010225),
+    (12.0, 3.86122163, 6684.747971749),
+    (11.0, 4.718223637, 2544.314419883),
+    (10.0, 0.250387147, 382.896532223),
+    (9.0, 0.681707136, 1059.381930189),
+    (9.0, 3.832090923, 20043.674560199),
+    (9.0, 3.882718261, 3738.761430108),
+    (8.0, 5.464986304, 1751.539531416),
+    (7.0, 2.575225041, 3149.164160588),
+    (7.0, 2.378436903, 4136.910433516),
+    (6.0, 5.477730729, 1592.596013633),
+    (6.0, 2.341047937, 3097.883822726),
+    (1482.0, 0.444346949, 3340.6124267),
+    (662.0, 0.884691787, 6681.2248534),
+    (188.0, 1.287999825, 10021.837280099),
+    (41.0, 1.64850787, 13362.449706799),
+    (26.0, 0.0, 0.0),
+    (23.0, 2.052676653, 155.420399434),
+    (10.0, 1.580069064, 3.523118349),
+    (8.0, 1.998587577, 16703.062133499),
+    (5.0, 2.82452458, 242.728603974),
+    (4.0, 2.019142725, 3344.135545049),
+    (3.0, 4.591448979, 3185.192027266),
+    (3.0, 0.650447143, 553.569402842),
+    (114.0, 3.141592654, 0.0),
+    (29.0, 5.63662412, 6681.2248534),
+    (24.0, 5.138684815, 3340.6124267),
+    (11.0, 6.031610744, 10021.837280099),
+    (3.0, 0.132283507, 13362.449706799),
+    (3.0, 3.562679883, 155.420399434),
+    (1.0, 0.493407834, 16703.062133499),
+    (1.0, 1.317345316, 242.728603974),
+    (1.0, 3.141592654, 0.0),
+    (1.0, 4.040899965, 6681.2248534),
+    (3197135.0, 3.768320424, 3340.6124267),
+    (298033.0, 4.106169962, 6681.2248534),
+    (289105.0, 0.0, 0.0),
+    (31366.0, 4.446510529, 10021.837280099),
+    (3484.0, 4.788125479, 13362.449706799),
+    (443.0, 5.026426205, 3344.135545049),
+    (443.0, 5.652330159, 3337.089308351),
+    (399.0, 5.130568147, 16703.062133499),
+    (293.0, 3.792906446, 2281.230496511),
+    (182.0, 6.136480117, 6151.533888305),
+    (163.0, 4.263996266, 529.690965095),
+    (160.0, 2.231946102, 1059.381930189),
+    (149.0, 2.165012099, 5621.84292321),
+    (143.0, 1.182150161, 3340.595173048),
+    (143.0, 3.212921808, 3340.629680352),
+    (139.0, 2.417963442, 8962.45534991),
+    (350069.0, 5.368478362, 3340.6124267),
+    (14116.0, 3.141592654, 0.0),
+    (9671.0, 5.478777865, 6681.2248534),
+    (1472.0, 3.202057668, 10021.837280099),
+    (426.0, 3.408438129, 13362.449706799),
+    (102.0, 0.776172862, 3337.089308351),
+    (79.0, 3.717682939, 16703.062133499),
+    (33.0, 3.458037237, 5621.84292321),
+    (26.0, 2.482935581, 2281.230496511),
+    (16727.0, 0.602213924, 3340.6124267),
+    (4987.0, 3.141592654, 0.0),
+    (302.0, 5.55871276, 6681.2248534),
+    (26.0, 1.896626735, 13362.449706799),
+    (21.0, 0.917499686, 10021.837280099),
+    (12.0, 2.242407387, 3337.089308351),
+    (8.0, 2.248928666, 16703.062133499),
+    (607.0, 1.980506335, 3340.6124267),
+    (43.0, 0.0, 0.0),
+    (14.0, 1.795882288, 6681.2248534),
+    (3.0, 3.453770821, 10021.837280099),
+    (13.0, 0.0, 0.0),
+    (11.0, 3.457243526, 3340.6124267),
+    (1.0, 0.504458053, 6681.2248534),
+    (153033488.0, 0.0, 0.0),
+    (14184953.0, 3.479712835, 3340.6124267),
+    (660776.0, 3.817834421, 6681.2248534),
+    (46179.0, 4.155953163, 10021.837280099),
+    (8110.0, 5.559584602, 2810.921461605),
+    (7485.0, 1.772389981, 5621.84292321),
+    (5523.0, 1.364363189, 2281.230496511),
+    (3825.0, 4.494071824, 13362.449706799),
+    (2484.0, 4.925455779, 2942.463423292),
+    (2307.0, 0.090817425, 2544.314419883),
+    (1999.0, 5.360596052, 3337.089308351),
+    (1960.0, 4.742493863, 3344.135545049),
+    (1167.0, 2.112615012, 5092.151958116),
+    (1103.0, 5.009082642, 398.149003408),
+    (992.0, 5.838624011, 6151.533888305),
+    (899.0, 4.40790434, 529.690965095),
+    (807.0, 2.102166471, 1059.381930189),
+    (798.0, 3.448390262, 796.298006816),
+    (741.0, 1.499063369, 2146.165416475),
+    (726.0, 1.245169135, 8432.764384816),
+    (692.0, 2.133788148, 8962.45534991),
+    (633.0, 0.89353285, 3340.595173048),
+    (633.0, 2.924304482, 3340.629680352),
+    (630.0, 1.287381359, 1751.539531416),
+    (574.0, 0.828961963, 2914.014235824),
+    (526.0, 5.382922762, 3738.761430108),
+    (473.0, 5.198504579, 3127.313331262),
+    (348.0, 4.832191989, 16703.062133499),
+    (284.0, 2.906922949, 3532.060692811),
+    (280.0, 5.257492475, 6283.075849991),
+    (276.0, 1.217679678, 6254.626662524),
+    (275.0, 2.908188838, 1748.016413067),
+    (270.0, 3.763947286, 5884.926846583),
+    (239.0, 2.036698962, 1194.447010225),
+    (234.0, 5.105464925, 5486.777843175),
+    (228.0, 3.255290206, 6872.673119511),
+    (223.0, 4.198615938, 3149.164160588),
+    (219.0, 5.583402488, 191.448266112),
+    (208.0, 4.846264421, 3340.679737003),
+    (208.0, 5.254760808, 3340.545116397),
+    (186.0, 5.698715557, 6677.701735051),
+    (183.0, 5.080626834, 6684.747971749),
+    (179.0, 4.184230255, 3333.498879699),
+    (176.0, 5.953417864, 3870.303391794),
+    (164.0, 3.798890681, 4136.910433516),
+    (1107433.0, 2.03250525, 3340.6124267),
+    (103176.0, 2.370718457, 6681.2248534),
+    (12877.0, 0.0, 0.0),
+    (10816.0, 2.708880938, 10021.837280099),
+    (1195.0, 3.047021825, 13362.449706799),
+    (439.0, 2.888350726, 2281.230496511),
+    (396.0, 3.423246113, 3344.135545049),
+    (183.0, 1.58428644, 2544.314419883),
+    (136.0, 3.38507018, 16703.062133499),
+    (128.0, 6.043433604, 3337.089308351),
+    (128.0, 0.629912206, 1059.381930189),
+    (127.0, 1.953897757, 796.298006816),
+    (118.0, 2.997613451, 2146.165416475),
+    (88.0, 3.42052759, 398.149003408),
+    (83.0, 3.855749867, 3738.761430108),
+    (76.0, 4.451018393, 6151.533888305),
+    (72.0, 2.764421807, 529.690965095),
+    (67.0, 2.548926027, 1751.539531416),
+    (66.0, 4.4059755, 1748.016413067),
+    (58.0, 0.543543279, 1194.447010225),
+    (54.0, 0.677509435, 8962.45534991),
+    (51.0, 3.725854092, 6684.747971749),
+    (49.0, 5.729594284, 3340.595173048),
+    (49.0, 1.477179222, 3340.629680352),
+    (48.0, 2.580616913, 3149.164160588),
+    (48.0, 2.285278968, 2914.014235824),
+    (39.0, 2.319000906, 4136.910433516),
+    (44242.0, 0.479306039, 3340.6124267),
+    (8138.0, 0.869983981, 6681.2248534),
+    (1275.0, 1.225940508, 10021.837280099),
+    (187.0, 1.57298992, 13362.449706799),
+    (52.0, 3.141592654, 0.0),
+    (41.0, 1.970801751, 3344.135545049),
+    (27.0, 1.916656158, 16703.062133499),
+    (18.0, 4.434995053, 2281.230496511),
+    (12.0, 4.525104537, 3185.192027266),
+    (10.0, 5.391434695, 1059.381930189),
+    (10.0, 0.418705772, 796.298006816),
+    (1113.0, 5.149873501, 3340.6124267),
+    (424.0, 5.613437665, 6681.2248534),
+    (100.0, 5.99726827, 10021.837280099),
+    (20.0, 0.076330621, 13362.449706799),
+    (5.0, 3.141592654, 0.0),
+    (3.0, 0.429519076, 16703.062133499),
+    (20.0, 3.582116505, 3340.6124267),
+    (16.0, 4.051160769, 6681.2248534),
+    (6.0, 4.463839621, 10021.837280099),
+    (2.0, 4.843743216, 13362.449706799),
+    (59954691.0, 0.0, 0.0),
+    (9695899.0, 5.061917931, 529.690965095),
+    (573610.0, 1.44406206, 7.113547001),
+    (306389.0, 5.4173473, 1059.381930189),
+    (97178.0, 4.142647088, 632.783739313),
+    (72903.0, 3.640429093, 522.577418094),
+    (64264.0, 3.411451852, 103.092774219),
+    (39806.0, 2.293767449, 419.484643875),
+    (38858.0, 1.272317249, 316.391869657),
+    (27965.0, 1.784545895, 536.804512095),
+    (13590.0, 5.774810316, 1589.072895284),
+    (8769.0, 3.630003244, 949.17560897),
+    (8246.0, 3.582279617, 206.185548437),
+    (7368.0, 5.081011256, 735.876513532),
+    (6263.0, 0.024976437, 213.299095438),
+    (6114.0, 4.513195317, 1162.474704408),
+    (5305.0, 4.186250535, 1052.268383188),
+    (5305.0, 1.306712368, 14.227094002),
+    (4905.0, 1.320846317, 110.206321219),
+    (4647.0, 4.699581095, 3.932153263),
+    (3045.0, 4.316759603, 426.598190876),
+    (2610.0, 1.566675949, 846.082834751),
+    (2028.0, 1.063765474, 3.181393738),
+    (1921.0, 0.971689288, 639.897286314),
+    (1765.0, 2.141480778, 1066.49547719),
+    (1723.0, 3.880360089, 1265.567478626),
+    (1633.0, 3.582010898, 515.463871093),
+    (1432.0, 4.296836903, 625.670192312),
+    (973.0, 4.097649571, 95.979227218),
+    (884.0, 2.437014261, 412.371096874),
+    (733.0, 6.085341132, 838.96928775),
+    (731.0, 3.80591234, 1581.959348283),
+    (709.0, 1.292725737, 742.990060533),
+    (692.0, 6.133682229, 2118.763860378),
+    (614.0, 4.108534968, 1478.866574064),
+    (582.0, 4.539677176, 309.278322656),
+    (495.0, 3.755674614, 323.505416657),
+    (441.0, 2.958184609, 454.909366527),
+    (417.0, 1.035544302, 2.447680555),
+    (390.0, 4.897161059, 1692.165669502),
+    (376.0, 4.702991248, 1368.660252845),
+    (341.0, 5.714525258, 533.623118358),
+    (330.0, 4.740498195, 0.04818411),
+    (262.0, 1.87652461, 0.963207847),
+    (261.0, 0.820472464, 380.12776796),
+    (257.0, 3.724107242, 199.072001436),
+    (244.0, 5.220208789, 728.762966531),
+    (235.0, 1.226939081, 909.818733055),
+    (220.0, 1.65115016, 543.918059096),
+    (207.0, 1.854616666, 525.758811832),
+    (202.0, 1.806845742, 1375.773799846),
+    (197.0, 5.29252149, 1155.361157407),
+    (175.0, 3.729665548, 942.062061969),
+    (175.0, 3.226349034, 1898.35121794),
+    (175.0, 5.909735053, 956.289155971),
+    (158.0, 4.364839218, 1795.258443721),
+    (151.0, 3.906250226, 74.781598567),
+    (149.0, 4.377451043, 1685.052122502),
+    (141.0, 3.135683579, 491.557929457),
+    (138.0, 1.317979208, 1169.588251409),
+    (131.0, 4.168679455, 1045.154836188),
+    (117.0, 2.500221409, 1596.186442285),
+    (117.0, 3.38920921, 0.521264862),
+    (106.0, 4.554397982, 526.509571357),
+    (52993480757.0, 0.0, 0.0),
+    (489741.0, 4.220666899, 529.690965095),
+    (228919.0, 6.02647464, 7.113547001),
+    (27655.0, 4.572659568, 1059.381930189),
+    (20721.0, 5.459389363, 522.577418094),
+    (12106.0, 0.16985765, 536.804512095),
+    (6068.0, 4.42419502, 103.092774219),
+    (5434.0, 3.984783826, 419.484643875),
+    (4238.0, 5.890093513, 14.227094002),
+    (2212.0, 5.267714466, 206.185548437),
+    (1746.0, 4.926693785, 1589.072895284),
+    (1296.0, 5.551327651, 3.181393738),
+    (1173.0, 5.856473044, 1052.268383188),
+    (1163.0, 0.514508953, 3.932153263),
+    (1099.0, 5.307049816, 515.463871093),
+    (1007.0, 0.464783986, 735.876513532),
+    (1004.0, 3.150403018, 426.598190876),
+    (848.0, 5.758058505, 110.206321219),
+    (827.0, 4.803120157, 213.299095438),
+    (816.0, 0.586430549, 1066.49547719),
+    (725.0, 5.518274715, 639.897286314),
+    (568.0, 5.988670495, 625.670192312),
+    (474.0, 4.132452692, 412.371096874),
+    (413.0, 5.736528913, 95.979227218),
+    (345.0, 4.241595654, 632.783739313),
+    (336.0, 3.73248749, 1162.474704408),
+    (234.0, 4.034699703, 949.17560897),
+    (234.0, 6.243022266, 309.278322656),
+    (199.0, 1.504584428, 838.96928775),
+    (195.0, 2.218790109, 323.505416657),
+    (187.0, 6.086205659, 742.990060533),
+    (184.0, 6.279635888, 543.918059096),
+    (171.0, 5.416559838, 199.072001436),
+    (131.0, 0.626433774, 728.762966531),
+    (115.0, 0.680190502, 846.082834751),
+    (115.0, 5.286416991, 2118.763860378),
+    (108.0, 4.492827601, 956.289155971),
+    (80.0, 5.824124003, 1045.154836188),
+    (72.0, 5.341626503, 942.062061969),
+    (70.0, 5.972634503, 532.872358832),
+    (67.0, 5.733651265, 21.340641002),
+    (66.0, 0.129241914, 526.509571357),
+    (65.0, 6.088034903, 1581.959348283),
+    (59.0, 0.58626971, 1155.361157407),
+    (58.0, 0.994530873, 1596.186442285),
+    (57.0, 5.968513048, 1169.588251409),
+    (57.0, 1.411984388, 533.623118358),
+    (55.0, 5.428063837, 10.294940739),
+    (52.0, 5.726614484, 117.31986822),
+    (52.0, 0.229812991, 1368.660252845),
+    (50.0, 6.080751478, 525.758811832),
+    (47.0, 3.626118432, 1478.866574064),
+    (47.0, 0.511440732, 1265.567478626),
+    (40.0, 4.161580136, 1692.165669502),
+    (34.0, 0.099139049, 302.164775655),
+    (33.0, 5.035966895, 220.412642439),
+    (32.0, 5.374925307, 508.350324092),
+    (29.0, 5.422088971, 1272.681025627),
+    (29.0, 3.359272415, 4.665866446),
+    (29.0, 0.759079097, 88.865680217),
+    (25.0, 1.607230634, 831.85574075),
+    (47234.0, 4.321483236, 7.113547001),
+    (38966.0, 0.0, 0.0),
+    (30629.0, 2.930214402, 529.690965095),
+    (3189.0, 1.055046156, 522.577418094),
+    (2729.0, 4.845454814, 536.804512095),
+    (2723.0, 3.414115266, 1059.381930189),
+    (1721.0, 4.187343852, 14.227094002),
+    (383.0, 5.767907144, 419.484643875),
+    (378.0, 0.760489649, 515.463871093),
+    (367.0, 6.055091204, 103.092774219),
+    (337.0, 3.786443842, 3.181393738),
+    (308.0, 0.693566541, 206.185548437),
+    (218.0, 3.813891914, 1589.072895284),
+    (199.0, 5.339964434, 1066.49547719),
+    (197.0, 2.483564021, 3.932153263),
+    (156.0, 1.406424265, 1052.268383188),
+    (146.0, 3.813731968, 639.897286314),
+    (142.0, 1.63435169, 426.598190876),
+    (130.0, 5.837388725, 412.371096874),
+    (117.0, 1.414354626, 625.670192312),
+    (97.0, 4.033834279, 110.206321219),
+    (91.0, 1.10630629, 95.979227218),
+    (87.0, 2.522351748, 632.783739313),
+    (79.0, 4.637261313, 543.918059096),
+    (72.0, 2.2171667, 735.876513532),
+    (58.0, 0.832163174, 199.072001436),
+    (57.0, 3.122920599, 213.299095438),
+    (49.0, 1.672837916, 309.278322656),
+    (40.0, 4.024854447, 21.340641002),
+    (40.0, 0.624169458, 323.505416657),
+    (36.0, 2.32581247, 728.762966531),
+    (29.0, 3.608383278, 10.294940739),
+    (28.0, 3.239920137, 838.96928775),
+    (26.0, 4.501182983, 742.990060533),
+    (26.0, 2.512406239, 1162.474704408),
+    (25.0, 1.218681107, 1045.154836188),
+    (24.0, 3.005321393, 956.289155971),
+    (19.0, 4.290286447, 532.872358832),
+    (18.0, 0.809539416, 508.350324092),
+    (17.0, 4.200019777, 2118.763860378),
+    (17.0, 1.834021466, 526.509571357),
+    (15.0, 5.810379869, 1596.186442285),
+    (15.0, 0.681741655, 942.062061969),
+    (15.0, 3.999896226, 117.31986822),
+    (14.0, 5.951695685, 316.391869657),
+    (14.0, 1.80336678, 302.164775655),
+    (13.0, 2.518566436, 88.865680217),
+    (13.0, 4.368562324, 1169.588251409),
+    (11.0, 4.435866346, 525.758811832),
+    (10.0, 1.715631611, 1581.959348283),
+    (9.0, 2.176845635, 1155.361157407),
+    (9.0, 3.294527833, 220.412642439),
+    (9.0, 3.319244936, 831.85574075),
+    (8.0, 5.756722284, 846.082834751),
+    (8.0, 2.709555168, 533.623118358),
+    (7.0, 2.175600933, 1265.567478626),
+    (6.0, 0.499398635, 949.17560897),
+    (6502.0, 2.598628805, 7.113547001),
+    (1357.0, 1.346358864, 529.690965095),
+    (471.0, 2.475039779, 14.227094002),
+    (417.0, 3.244512432, 536.804512095),
+    (353.0, 2.97360159, 522.577418094),
+    (155.0, 2.075655858, 1059.381930189),
+    (87.0, 2.514315843, 515.463871093),
+    (44.0, 0.0, 0.0),
+    (34.0, 3.826337945, 1066.49547719),
+    (28.0, 2.447547561, 206.185548437),
+    (24.0, 1.276671723, 412.371096874),
+    (23.0, 2.982313268, 543.918059096),
+    (20.0, 2.10099934, 639.897286314),
+    (20.0, 1.40255939, 419.484643875),
+    (19.0, 1.593684035, 103.092774219),
+    (17.0, 2.302146812, 21.340641002),
+    (17.0, 2.598214607, 1589.072895284),
+    (16.0, 3.145211173, 625.670192312),
+    (16.0, 3.360301263, 1052.268383188),
+    (13.0, 2.759738922, 95.979227218),
+    (13.0, 2.538622443, 199.072001436),
+    (13.0, 6.265781104, 426.598190876),
+    (9.0, 1.763349607, 10.294940739),
+    (9.0, 2.265632563, 110.206321219),
+    (7.0, 3.425664333, 309.278322656),
+    (7.0, 4.038695629, 728.762966531),
+    (6.0, 2.520964177, 508.350324092),
+    (5.0, 2.911846871, 1045.154836188),
+    (5.0, 5.251961535, 323.505416657),
+    (4.0, 4.302902612, 88.865680217),
+    (4.0, 3.523813616, 302.164775655),
+    (4.0, 4.091253151, 735.876513532),
+    (3.0, 1.431759913, 956.289155971),
+    (3.0, 4.358175077, 1596.186442285),
+    (3.0, 1.252765908, 213.299095438),
+    (3.0, 5.015058398, 838.96928775),
+    (3.0, 2.237856733, 117.31986822),
+    (2.0, 2.896624092, 742.990060533),
+    (2.0, 2.355818712, 942.062061969),
+    (669.0, 0.852824211, 7.113547001),
+    (114.0, 3.141592654, 0.0),
+    (100.0, 0.742589478, 14.227094002),
+    (50.0, 1.653462082, 536.804512095),
+    (44.0, 5.820263866, 529.690965095),
+    (32.0, 4.858299867, 522.577418094),
+    (15.0, 4.290616358, 515.463871093),
+    (9.0, 0.714785207, 1059.381930189),
+    (5.0, 1.295022594, 543.918059096),
+    (4.0, 2.317155166, 1066.49547719),
+    (4.0, 0.483267975, 21.340641002),
+    (3.0, 3.002455427, 412.371096874),
+    (2.0, 0.398589402, 639.897286314),
+    (2.0, 4.259256203, 199.072001436),
+    (2.0, 4.905362073, 625.670192312),
+    (2.0, 4.261475808, 206.185548437),
+    (1.0, 5.255469557, 1052.268383188),
+    (1.0, 4.716146338, 95.979227218),
+    (1.0, 1.286045712, 1589.072895284),
+    (50.0, 5.256589662, 7.113547001),
+    (16.0, 5.251268375, 14.227094002),
+    (4.0, 0.014618693, 536.804512095),
+    (2.0, 1.097399114, 522.577418094),
+    (1.0, 3.141592654, 0.0),
+    (2268616.0, 3.558526067, 529.690965095),
+    (110090.0, 0.0, 0.0),
+    (109972.0, 3.908093474, 1059.381930189),
+    (8101.0, 3.605095734, 522.577418094),
+    (6438.0, 0.306271214, 536.804512095),
+    (6044.0, 4.258831088, 1589.072895284),
+    (1107.0, 2.985344219, 1162.474704408),
+    (944.0, 1.675222884, 426.598190876),
+    (942.0, 2.936190724, 1052.268383188),
+    (894.0, 1.754474299, 7.113547001),
+    (836.0, 5.178819732, 103.092774219),
+    (767.0, 2.154735941, 632.783739313),
+    (684.0, 3.678087701, 213.299095438),
+    (629.0, 0.643432823, 1066.49547719),
+    (559.0, 0.013548305, 846.082834751),
+    (532.0, 2.703059544, 110.206321219),
+    (464.0, 1.173372492, 949.17560897),
+    (431.0, 2.608250005, 419.484643875),
+    (351.0, 4.610629907, 2118.763860378),
+    (132.0, 4.778169907, 742.990060533),
+    (123.0, 3.349681814, 1692.165669502),
+    (116.0, 1.38688232, 323.505416657),
+    (115.0, 5.048922954, 316.391869657),
+    (104.0, 3.701038381, 515.463871093),
+    (103.0, 2.318789996, 1478.866574064),
+    (102.0, 3.152937854, 1581.959348283),
+    (177352.0, 5.701664885, 529.690965095),
+    (3230.0, 5.779416193, 1059.381930189),
+    (3081.0, 5.474642965, 522.577418094),
+    (2212.0, 4.734774802, 536.804512095),
+    (1694.0, 3.141592654, 0.0),
+    (346.0, 4.745951741, 1052.268383188),
+    (234.0, 5.188560999, 1066.49547719),
+    (196.0, 6.185542866, 7.113547001),
+    (150.0, 3.927212261, 1589.072895284),
+    (114.0, 3.438972718, 632.783739313),
+    (97.0, 2.914263041, 949.17560897),
+    (82.0, 5.076660975, 1162.474704408),
+    (77.0, 2.505221887, 103.092774219),
+    (77.0, 0.612889814, 419.484643875),
+    (74.0, 5.499582922, 515.463871093),
+    (61.0, 5.447400844, 213.299095438),
+    (50.0, 3.947996166, 735.876513532),
+    (46.0, 0.538503609, 110.206321219),
+    (45.0, 1.895166452, 846.082834751),
+    (37.0, 4.698283928, 543.918059096),
+    (36.0, 6.109525788, 316.391869657),
+    (32.0, 4.924527146, 1581.959348283),
+    (8094.0, 1.463228437, 529.690965095),
+    (813.0, 3.141592654, 0.0),
+    (742.0, 0.95691639, 522.577418094),
+    (399.0, 2.898886664, 536.804512095),
+    (342.0, 1.446837897, 1059.381930189),
+    (74.0, 0.407246759, 1052.268383188),
+    (46.0, 3.480368958, 1066.49547719),
+    (30.0, 1.925041713, 1589.072895284),
+    (29.0, 0.990888318, 515.463871093),
+    (23.0, 4.271240524, 7.113547001),
+    (14.0, 2.922423873, 543.918059096),
+    (12.0, 5.221689325, 632.783739313),
+    (11.0, 4.880242225, 949.17560897),
+    (6.0, 6.210891084, 1045.154836188),
+    (252.0, 3.380879231, 529.690965095),
+    (122.0, 2.733118372, 522.577418094),
+    (49.0, 1.036899967, 536.804512095),
+    (11.0, 2.314635613, 1052.268383188),
+    (8.0, 2.767297576, 515.463871093),
+    (7.0, 4.25268319, 1059.381930189),
+    (6.0, 1.781158274, 1066.49547719),
+    (4.0, 1.130289172, 543.918059096),
+    (3.0, 3.141592654, 0.0),
+    (15.0, 4.529569996, 522.577418094),
+    (5.0, 4.474271591, 529.690965095),
+    (4.0, 5.43908581, 536.804512095),
+    (3.0, 0.0, 0.0),
+    (2.0, 4.518070362, 515.463871093),
+    (1.0, 4.201176116, 1052.268383188),
+    (1.0, 0.091985541, 522.577418094),
+    (520887429.0, 0.0, 0.0),
+    (25209327.0, 3.4910864, 529.690965095),
+    (610600.0, 3.841153656, 1059.381930189),
+    (282029.0, 2.574198799, 632.783739313),
+    (187647.0, 2.075903801, 522.577418094),
+    (86793.0, 0.710010906, 419.484643875),
+    (72063.0, 0.214656947, 536.804512095),
+    (65517.0, 5.979958508, 316.391869657),
+    (30135.0, 2.161320584, 949.17560897),
+    (29135.0, 1.677592437, 103.092774219),
+    (23947.0, 0.274578549, 7.113547001),
+    (23453.0, 3.540231473, 735.876513532),
+    (22284.0, 4.193627735, 1589.072895284),
+    (13033.0, 2.960430557, 1162.474704408),
+    (12749.0, 2.715501029, 1052.268383188),
+    (9703.0, 1.906695724, 206.185548437),
+    (9161.0, 4.413526189, 213.299095438),
+    (7895.0, 2.479075514, 426.598190876),
+    (7058.0, 2.181847531, 1265.567478626),
+    (6138.0, 6.264175425, 846.082834751),
+    (5477.0, 5.657293252, 639.897286314),
+    (4170.0, 2.016050339, 515.463871093),
+    (4137.0, 2.722199797, 625.670192312),
+    (3503.0, 0.565312974, 1066.49547719),
+    (2617.0, 2.009939671, 1581.959348283),
+    (2500.0, 4.551820559, 838.96928775),
+    (2128.0, 6.127514618, 742.990060533),
+    (1912.0, 0.856219274, 412.371096874),
+    (1611.0, 3.088677893, 1368.660252845),
+    (1479.0, 2.680261914, 1478.866574064),
+    (1231.0, 1.890429797, 323.505416657),
+    (1217.0, 1.80171561, 110.206321219),
+    (1015.0, 1.386732377, 454.909366527),
+    (999.0, 2.872089401, 309.278322656),
+    (961.0, 4.548769898, 2118.763860378),
+    (886.0, 4.147859485, 533.623118358),
+    (821.0, 1.593425344, 1898.35121794),
+    (812.0, 5.940918991, 909.818733055),
+    (777.0, 3.676969547, 728.762966531),
+    (727.0, 3.988246864, 1155.361157407),
+    (655.0, 2.790656042, 1685.052122502),
+    (654.0, 3.381507753, 1692.165669502),
+    (621.0, 4.82284339, 956.289155971),
+    (615.0, 2.276249156, 942.062061969),
+    (562.0, 0.080959872, 543.918059096),
+    (542.0, 0.283602664, 525.758811832),
+    (1271802.0, 2.649375111, 529.690965095),
+    (61662.0, 3.00076251, 1059.381930189),
+    (53444.0, 3.897176442, 522.577418094),
+    (41390.0, 0.0, 0.0),
+    (31185.0, 4.882766635, 536.804512095),
+    (11847.0, 2.413295882, 419.484643875),
+    (9166.0, 4.759794086, 7.113547001),
+    (3404.0, 3.34688538, 1589.072895284),
+    (3203.0, 5.210832855, 735.876513532),
+    (3176.0, 2.792979871, 103.092774219),
+    (2806.0, 3.742236936, 515.463871093),
+    (2677.0, 4.330528787, 1052.268383188),
+    (2600.0, 3.634351016, 206.185548437),
+    (2412.0, 1.469473083, 426.598190876),
+    (2101.0, 3.927626823, 639.897286314),
+    (1646.0, 5.309535109, 1066.49547719),
+    (1641.0, 4.416286698, 625.670192312),
+    (1050.0, 3.16113623, 213.299095438),
+    (1025.0, 2.55432643, 412.371096874),
+    (806.0, 2.677508014, 632.783739313),
+    (741.0, 2.170946306, 1162.474704408),
+    (677.0, 6.249534798, 838.96928775),
+    (567.0, 4.576554147, 742.990060533),
+    (485.0, 2.468827932, 949.17560897),
+    (469.0, 4.709734635, 543.918059096),
+    (445.0, 0.402811814, 323.505416657),
+    (416.0, 5.368360182, 728.762966531),
+    (402.0, 4.605288415, 309.278322656),
+    (347.0, 4.681488087, 14.227094002),
+    (338.0, 3.167819511, 956.289155971),
+    (261.0, 5.342903061, 846.082834751),
+    (247.0, 3.923138235, 942.062061969),
+    (220.0, 4.84210965, 1368.660252845),
+    (203.0, 5.599954254, 1155.361157407),
+    (200.0, 4.438888144, 1045.154836188),
+    (197.0, 3.705514614, 2118.763860378),
+    (196.0, 3.758775871, 199.072001436),
+    (184.0, 4.265267697, 95.979227218),
+    (180.0, 4.401654912, 532.872358832),
+    (170.0, 4.846474889, 526.509571357),
+    (146.0, 6.129583655, 533.623118358),
+    (133.0, 1.322457359, 110.206321219),
+    (132.0, 4.511879508, 525.758811832),
+    (79645.0, 1.358658966, 529.690965095),
+    (8252.0, 5.777739354, 522.577418094),
+    (7030.0, 3.274769658, 536.804512095),
+    (5314.0, 1.838351097, 1059.381930189),
+    (1861.0, 2.976821394, 7.113547001),
+    (964.0, 5.48031822, 515.463871093),
+    (836.0, 4.198898817, 419.484643875),
+    (498.0, 3.141592654, 0.0),
+    (427.0, 2.227531018, 639.897286314),
+    (406.0, 3.782507304, 1066.49547719),
+    (377.0, 2.242483529, 1589.072895284),
+    (363.0, 5.367618473, 206.185548437),
+    (342.0, 6.099229693, 1052.268383188),
+    (339.0, 6.12690864, 625.670192312),
+    (333.0, 0.003289612, 426.598190876),
+    (280.0, 4.261625558, 412.371096874),
+    (257.0, 0.96295365, 632.783739313),
+    (230.0, 0.705307662, 735.876513532),
+    (201.0, 3.068506234, 543.918059096),
+    (200.0, 4.428841653, 103.092774219),
+    (139.0, 2.932356716, 14.227094002),
+    (114.0, 0.787139113, 728.762966531),
+    (95.0, 1.704980411, 838.96928775),
+    (86.0, 5.14434752, 323.505416657),
+    (83.0, 0.058348735, 309.278322656),
+    (80.0, 2.981223618, 742.990060533),
+    (75.0, 1.604951959, 956.289155971),
+    (70.0, 1.509883575, 213.299095438),
+    (67.0, 5.473071781, 199.072001436),
+    (62.0, 6.101378899, 1045.154836188),
+    (56.0, 0.955348105, 1162.474704408),
+    (52.0, 5.584356256, 942.062061969),
+    (50.0, 2.720631623, 532.872358832),
+    (45.0, 5.524456214, 508.350324092),
+    (44.0, 0.271181526, 526.509571357),
+    (40.0, 5.945665062, 95.979227218),
+    (3519.0, 6.058006338, 529.690965095),
+    (1073.0, 1.673213458, 536.804512095),
+    (916.0, 1.413296761, 522.577418094),
+    (342.0, 0.522965427, 1059.381930189),
+    (255.0, 1.196254735, 7.113547001),
+    (222.0, 0.952252262, 515.463871093),
+    (90.0, 3.141592654, 0.0),
+    (69.0, 2.268852823, 1066.49547719),
+    (58.0, 1.413897453, 543.918059096),
+    (58.0, 0.525801176, 639.897286314),
+    (51.0, 5.980163647, 412.371096874),
+    (47.0, 1.57864238, 625.670192312),
+    (43.0, 6.116896091, 419.484643875),
+    (37.0, 1.182627623, 14.227094002),
+    (34.0, 1.66671707, 1052.268383188),
+    (34.0, 0.847849779, 206.185548437),
+    (31.0, 1.042902459, 1589.072895284),
+    (30.0, 4.63236245, 426.598190876),
+    (21.0, 2.500712438, 728.762966531),
+    (15.0, 0.891369984, 199.072001436),
+    (14.0, 0.960401971, 508.350324092),
+    (13.0, 1.502337886, 1045.154836188),
+    (12.0, 2.609526145, 735.876513532),
+    (12.0, 3.555135101, 323.505416657),
+    (11.0, 1.790414376, 309.278322656),
+    (11.0, 6.278451127, 956.289155971),
+    (10.0, 6.260168595, 103.092774219),
+    (9.0, 3.451268125, 838.96928775),
+    (129.0, 0.084193096, 536.804512095),
+    (113.0, 4.248588558, 529.690965095),
+    (83.0, 3.297549094, 522.577418094),
+    (38.0, 2.733266111, 515.463871093),
+    (27.0, 5.691425886, 7.113547001),
+    (18.0, 5.400125369, 1059.381930189),
+    (13.0, 6.015604161, 543.918059096),
+    (9.0, 0.768139465, 1066.49547719),
+    (8.0, 5.682280657, 14.227094002),
+    (7.0, 1.427512921, 412.371096874),
+    (6.0, 5.122869325, 639.897286314),
+    (5.0, 3.335019473, 625.670192312),
+    (3.0, 3.403348051, 1052.268383188),
+    (3.0, 4.16090413, 728.762966531),
+    (3.0, 2.898020351, 426.598190876),
+    (11.0, 4.752493999, 536.804512095),
+    (4.0, 5.915162292, 522.577418094),
+    (2.0, 5.567815559, 515.463871093),
+    (2.0, 4.296596473, 543.918059096),
+    (2.0, 3.693574958, 7.113547001),
+    (2.0, 4.132228085, 1059.381930189),
+    (2.0, 5.493127962, 1066.49547719),
+    (87401354.0, 0.0, 0.0),
+    (11107660.0, 3.962050902, 213.299095438),
+    (1414151.0, 4.585815159, 7.113547001),
+    (398379.0, 0.52112026, 206.185548437),
+    (350769.0, 3.30329903, 426.598190876),
+    (206816.0, 0.246583669, 103.092774219),
+    (79271.0, 3.840070785, 220.412642439),
+    (23990.0, 4.669769349, 110.206321219),
+    (16574.0, 0.437191235, 419.484643875),
+    (15820.0, 0.938089538, 632.783739313),
+    (15054.0, 2.716700279, 639.897286314),
+    (14907.0, 5.769032838, 316.391869657),
+    (14610.0, 1.565185737, 3.932153263),
+    (13160.0, 4.448911802, 14.227094002),
+    (13005.0, 5.981190671, 11.045700264),
+    (10725.0, 3.129395965, 202.253395174),
+    (6126.0, 1.763284997, 277.034993741),
+    (5863.0, 0.236570288, 529.690965095),
+    (5228.0, 4.207831624, 3.181393738),
+    (5020.0, 3.177879195, 433.711737877),
+    (4593.0, 0.619764244, 199.072001436),
+    (4006.0, 2.244798939, 63.735898303),
+    (3874.0, 3.222826926, 138.517496871),
+    (3269.0, 0.774918958, 949.17560897),
+    (2954.0, 0.982803852, 95.979227218),
+    (2461.0, 2.031636312, 735.876513532),
+    (1758.0, 3.265805148, 522.577418094),
+    (1640.0, 5.505049662, 846.082834751),
+    (1581.0, 4.372663141, 309.278322656),
+    (1391.0, 4.023319781, 323.505416657),
+    (1124.0, 2.837267936, 415.552490612),
+    (1087.0, 4.183432325, 2.447680555),
+    (1017.0, 3.716981518, 227.52618944),
+    (957.0, 0.507408899, 1265.567478626),
+    (853.0, 3.421413507, 175.1660598),
+    (849.0, 3.191498258, 209.366942175),
+    (789.0, 5.007451231, 0.963207847),
+    (749.0, 2.143981493, 853.196381752),
+    (744.0, 5.252769546, 224.344795702),
+    (687.0, 1.747144078, 1052.268383188),
+    (654.0, 1.598893315, 0.04818411),
+    (634.0, 2.29889903, 412.371096874),
+    (625.0, 0.970468313, 210.1177017),
+    (580.0, 3.09259007, 74.781598567),
+    (546.0, 2.126785542, 350.3321196),
+    (543.0, 1.518243205, 9.561227556),
+    (530.0, 4.449388971, 117.31986822),
+    (478.0, 2.964880543, 137.033024162),
+    (474.0, 5.47527186, 742.990060533),
+    (452.0, 1.044366642, 490.334089179),
+    (449.0, 1.289904162, 127.471796607),
+    (372.0, 2.278191086, 217.231248701),
+    (355.0, 3.01286483, 838.96928775),
+    (347.0, 1.539282278, 340.770892045),
+    (343.0, 0.246040391, 0.521264862),
+    (330.0, 0.247156178, 1581.959348283),
+    (322.0, 0.961374561, 203.737867882),
+    (322.0, 2.571823545, 647.010833315),
+    (309.0, 3.494867349, 216.480489176),
+    (287.0, 2.370437459, 351.816592309),
+    (278.0, 0.400204089, 211.81462273),
+    (249.0, 1.470105344, 1368.660252845),
+    (227.0, 4.910031631, 12.530172972),
+    (220.0, 4.204224249, 200.768922466),
+    (209.0, 1.345162553, 625.670192312),
+    (208.0, 0.483498205, 1162.474704408),
+    (208.0, 1.283022189, 39.356875915),
+    (205.0, 6.010822066, 265.989293478),
+    (185.0, 3.50344405, 149.563197135),
+    (184.0, 0.972549527, 4.192785694),
+    (182.0, 5.491222924, 2.920761307),
+    (174.0, 1.863058068, 0.750759525),
+    (165.0, 0.440055175, 5.416625971),
+    (149.0, 5.735943498, 52.69019804),
+    (148.0, 1.535293205, 5.629074293),
+    (146.0, 6.231025441, 195.139848173),
+    (140.0, 4.294502601, 21.340641002),
+    (131.0, 4.068289619, 10.294940739),
+    (125.0, 6.277378058, 1898.35121794),
+    (122.0, 1.975887772, 4.665866446),
+    (118.0, 5.340729339, 554.069987483),
+    (117.0, 2.679204006, 1155.361157407),
+    (114.0, 5.594275447, 1059.381930189),
+    (112.0, 1.105026635, 191.20769491),
+    (110.0, 0.166040241, 1.484472708),
+    (109.0, 3.438127157, 536.804512095),
+    (107.0, 4.011566085, 956.289155971),
+    (104.0, 2.192103631, 88.865680217),
+    (103.0, 1.197481241, 1685.052122502),
+    (101.0, 4.965136665, 269.921446741),
+    (21354295596.0, 0.0, 0.0),
+    (1296855.0, 1.828205447, 213.299095438),
+    (564348.0, 2.885001364, 7.113547001),
+    (107679.0, 2.277699119, 206.185548437),
+    (98323.0, 1.080700613, 426.598190876),
+    (40255.0, 2.041282571, 220.412642439),
+    (19942.0, 1.279546627, 103.092774219),
+    (10512.0, 2.748803928, 14.227094002),
+    (6939.0, 0.4049308, 639.897286314),
+    (4803.0, 2.441940977, 419.484643875),
+    (4056.0, 2.921666188, 110.206321219),
+    (3769.0, 3.649656315, 3.932153263),
+    (3385.0, 2.416942517, 3.181393738),
+    (3302.0, 1.262564867, 433.711737877),
+    (3071.0, 2.327393178, 199.072001436),
+    (1953.0, 3.563946833, 11.045700264),
+    (1249.0, 2.628037375, 95.979227218),
+    (922.0, 1.960898343, 227.52618944),
+    (706.0, 4.416892493, 529.690965095),
+    (650.0, 6.174180937, 202.253395174),
+    (628.0, 6.110882272, 309.278322656),
+    (487.0, 6.039982003, 853.196381752),
+    (479.0, 4.98776988, 522.577418094),
+    (468.0, 4.617078439, 63.735898303),
+    (417.0, 2.117081693, 323.505416657),
+    (408.0, 1.299495567, 209.366942175),
+    (352.0, 2.317070795, 632.783739313),
+    (344.0, 3.958541786, 412.371096874),
+    (340.0, 3.633963988, 316.391869657),
+    (336.0, 3.771730727, 735.876513532),
+    (332.0, 2.860776999, 210.1177017),
+    (289.0, 2.732630802, 117.31986822),
+    (281.0, 5.743988454, 2.447680555),
+    (266.0, 0.543446313, 647.010833315),
+    (230.0, 1.644288796, 216.480489176),
+    (192.0, 2.965129466, 224.344795702),
+    (173.0, 4.07695221, 846.082834751),
+    (167.0, 2.597452027, 21.340641002),
+    (136.0, 2.285802466, 10.294940739),
+    (131.0, 3.441083556, 742.990060533),
+    (128.0, 4.095334712, 217.231248701),
+    (109.0, 6.161410723, 415.552490612),
+    (98.0, 4.728454367, 838.96928775),
+    (94.0, 3.483972799, 1052.268383188),
+    (92.0, 3.947554999, 88.865680217),
+    (87.0, 1.219513251, 440.825284878),
+    (83.0, 3.112695047, 625.670192312),
+    (78.0, 6.244089388, 302.164775655),
+    (67.0, 0.289617386, 4.665866446),
+    (66.0, 5.647570427, 9.561227556),
+    (62.0, 4.293443634, 127.471796607),
+    (62.0, 1.827896126, 195.139848173),
+    (58.0, 2.47630552, 191.958454436),
+    (57.0, 5.018895781, 137.033024162),
+    (55.0, 0.283563415, 74.781598567),
+    (54.0, 5.126285724, 490.334089179),
+    (51.0, 1.457664061, 536.804512095),
+    (47.0, 1.177212111, 149.563197135),
+    (47.0, 5.148183269, 515.463871093),
+    (46.0, 2.231988788, 956.289155971),
+    (44.0, 2.708736277, 5.416625971),
+    (40.0, 0.412815204, 269.921446741),
+    (40.0, 3.888701057, 728.762966531),
+    (38.0, 0.646659672, 422.666037613),
+    (38.0, 2.533790139, 12.530172972),
+    (37.0, 3.782390264, 2.920761307),
+    (35.0, 6.084217941, 5.629074293),
+    (34.0, 3.21070688, 1368.660252845),
+    (33.0, 4.640630921, 277.034993741),
+    (33.0, 5.430380912, 1066.49547719),
+    (33.0, 0.300638846, 351.816592309),
+    (32.0, 4.386229238, 1155.361157407),
+    (31.0, 2.434558555, 52.69019804),
+    (30.0, 2.840670049, 203.0041547),
+    (30.0, 6.186846143, 284.148540742),
+    (30.0, 3.390525691, 1059.381930189),
+    (29.0, 2.026147605, 330.618963658),
+    (28.0, 2.74178954, 265.989293478),
+    (26.0, 4.512141701, 340.770892045),
+    (116441.0, 1.179878506, 7.113547001),
+    (91921.0, 0.074252611, 213.299095438),
+    (90592.0, 0.0, 0.0),
+    (15277.0, 4.064920075, 206.185548437),
+    (10631.0, 0.257782774, 220.412642439),
+    (10605.0, 5.409635959, 426.598190876),
+    (4265.0, 1.045955566, 14.227094002),
+    (1216.0, 2.918600421, 103.092774219),
+    (1165.0, 4.60942129, 639.897286314),
+    (1082.0, 5.691303517, 433.711737877),
+    (1045.0, 4.042064536, 199.072001436),
+    (1020.0, 0.633691826, 3.181393738),
+    (634.0, 4.3882541, 419.484643875),
+    (549.0, 5.573031342, 3.932153263),
+    (457.0, 1.268409713, 110.206321219),
+    (425.0, 0.209354993, 227.52618944),
+    (274.0, 4.288410118, 95.979227218),
+    (162.0, 1.381391494, 11.045700264),
+    (129.0, 1.565868842, 309.278322656),
+    (117.0, 3.88120916, 853.196381752),
+    (105.0, 4.900032036, 647.010833315),
+    (101.0, 0.892704931, 21.340641002),
+    (96.0, 2.910935615, 316.391869657),
+    (95.0, 5.625611506, 412.371096874),
+    (85.0, 5.73472778, 209.366942175),
+    (83.0, 6.050309348, 216.480489176),
+    (82.0, 1.024775583, 117.31986822),
+    (75.0, 4.761784682, 210.1177017),
+    (67.0, 0.456486126, 522.577418094),
+    (66.0, 0.482979406, 10.294940739),
+    (64.0, 0.351798049, 323.505416657),
+    (61.0, 4.875178502, 632.783739313),
+    (53.0, 2.747305414, 529.690965095),
+    (46.0, 5.692966217, 440.825284878),
+    (45.0, 1.668566998, 202.253395174),
+    (42.0, 5.707681877, 88.865680217),
+    (32.0, 0.070500503, 63.735898303),
+    (32.0, 1.671900222, 302.164775655),
+    (31.0, 4.163795377, 191.958454436),
+    (27.0, 0.832562144, 224.344795702),
+    (25.0, 5.655647286, 735.876513532),
+    (20.0, 5.9436461, 217.231248701),
+    (18.0, 4.900147368, 625.670192312),
+    (17.0, 1.625934213, 742.990060533),
+    (16.0, 0.578863208, 515.463871093),
+    (14.0, 0.206752937, 838.96928775),
+    (14.0, 3.764971673, 195.139848173),
+    (12.0, 4.71789724, 203.0041547),
+    (12.0, 0.126207142, 234.63973644),
+    (12.0, 3.120984836, 846.082834751),
+    (11.0, 5.922168448, 536.804512095),
+    (11.0, 5.602079828, 728.762966531),
+    (11.0, 3.20327613, 1066.49547719),
+    (10.0, 4.987366561, 422.666037613),
+    (10.0, 0.25709352, 330.618963658),
+    (10.0, 4.154720491, 860.309928753),
+    (9.0, 0.463799693, 956.289155971),
+    (8.0, 2.139903643, 269.921446741),
+    (8.0, 5.246027423, 429.779584614),
+    (8.0, 4.034011539, 9.561227556),
+    (7.0, 5.397247153, 1052.268383188),
+    (6.0, 4.462111307, 284.148540742),
+    (6.0, 5.934169248, 405.257549874),
+    (16039.0, 5.739453774, 7.113547001),
+    (4250.0, 4.585396756, 213.299095438),
+    (1907.0, 4.760820502, 220.412642439),
+    (1466.0, 5.913266783, 206.185548437),
+    (1162.0, 5.619731324, 14.227094002),
+    (1067.0, 3.608165331, 426.598190876),
+    (239.0, 3.860882734, 433.711737877),
+    (237.0, 5.768264515, 199.072001436),
+    (166.0, 5.116411502, 3.181393738),
+    (151.0, 2.735946419, 639.897286314),
+    (131.0, 4.743275446, 227.52618944),
+    (63.0, 0.228500895, 419.484643875),
+    (62.0, 4.742870525, 103.092774219),
+    (40.0, 5.472980591, 21.340641002),
+    (40.0, 5.964202667, 95.979227218),
+    (39.0, 5.833861995, 110.206321219),
+    (28.0, 3.012353115, 647.010833315),
+    (25.0, 0.988081707, 3.932153263),
+    (19.0, 1.916142375, 853.196381752),
+    (18.0, 4.967384159, 10.294940739),
+    (18.0, 1.025063971, 412.371096874),
+    (18.0, 4.203765053, 216.480489176),
+    (18.0, 3.31913419, 309.278322656),
+    (16.0, 3.898252728, 440.825284878),
+    (16.0, 5.616678096, 117.31986822),
+    (13.0, 1.180689539, 88.865680217),
+    (11.0, 5.575206151, 11.045700264),
+    (11.0, 5.929062663, 191.958454436),
+    (10.0, 3.948387369, 209.366942175),
+    (9.0, 3.393353697, 302.164775655),
+    (8.0, 4.877369132, 323.505416657),
+    (7.0, 0.381987256, 632.783739313),
+    (6.0, 2.254927228, 522.577418094),
+    (6.0, 1.056211577, 210.1177017),
+    (5.0, 4.642684755, 234.63973644),
+    (4.0, 3.141592654, 0.0),
+    (4.0, 2.30677011, 515.463871093),
+    (3.0, 2.203094001, 860.309928753),
+    (3.0, 0.58604395, 529.690965095),
+    (3.0, 4.934476771, 224.344795702),
+    (3.0, 0.423938842, 625.670192312),
+    (2.0, 4.766213918, 330.618963658),
+    (2.0, 3.348091659, 429.779584614),
+    (2.0, 3.198149583, 202.253395174),
+    (2.0, 1.18918501, 1066.49547719),
+    (2.0, 1.354882091, 405.257549874),
+    (2.0, 4.156313513, 223.594036177),
+    (2.0, 3.066935697, 654.124380316),
+    (1662.0, 3.99826249, 7.113547001),
+    (257.0, 2.98436499, 220.412642439),
+    (236.0, 3.902414281, 14.227094002),
+    (149.0, 2.741108242, 213.299095438),
+    (114.0, 3.141592654, 0.0),
+    (110.0, 1.515157393, 206.185548437),
+    (68.0, 1.721209533, 426.598190876),
+    (40.0, 2.046448974, 433.711737877),
+    (38.0, 1.237954584, 199.072001436),
+    (31.0, 3.010941841, 227.52618944),
+    (15.0, 0.828970645, 639.897286314),
+    (9.0, 3.714853009, 21.340641002),
+    (6.0, 2.419952906, 419.484643875),
+    (6.0, 1.156070957, 647.010833315),
+    (4.0, 1.451208187, 95.979227218),
+    (4.0, 2.117832252, 440.825284878),
+    (3.0, 4.092780778, 110.206321219),
+    (3.0, 2.772031539, 412.371096874),
+    (3.0, 3.007302496, 88.865680217),
+    (3.0, 0.002557213, 853.196381752),
+    (3.0, 0.392468541, 103.092774219),
+    (2.0, 3.776891981, 117.31986822),
+    (2.0, 2.828843287, 234.63973644),
+    (2.0, 5.079554577, 309.278322656),
+    (2.0, 2.238160367, 216.480489176),
+    (2.0, 5.191768764, 302.164775655),
+    (1.0, 1.546852465, 191.958454436),
+    (124.0, 2.259233457, 7.113547001),
+    (34.0, 2.162506527, 14.227094002),
+    (28.0, 1.198681502, 220.412642439),
+    (6.0, 1.215842702, 227.52618944),
+    (5.0, 0.235504001, 433.711737877),
+    (4.0, 6.226696944, 426.598190876),
+    (3.0, 2.973720463, 199.072001436),
+    (3.0, 4.287109327, 206.185548437),
+    (2.0, 6.252653623, 213.299095438),
+    (1.0, 5.276125613, 639.897286314),
+    (1.0, 0.235169516, 440.825284878),
+    (1.0, 3.141592654, 0.0),
+    (4330678.0, 3.602844284, 213.299095438),
+    (240348.0, 2.852384894, 426.598190876),
+    (84746.0, 0.0, 0.0),
+    (34116.0, 0.572973078, 206.185548437),
+    (30863.0, 3.484415045, 220.412642439),
+    (14734.0, 2.118465979, 639.897286314),
+    (9917.0, 5.790031894, 419.484643875),
+    (6994.0, 4.736046892, 7.113547001),
+    (4808.0, 5.433053156, 316.391869657),
+    (4788.0, 4.965129274, 110.206321219),
+    (3432.0, 2.732557521, 433.711737877),
+    (1506.0, 6.013045361, 103.092774219),
+    (1060.0, 5.630992924, 529.690965095),
+    (969.0, 5.204349661, 632.783739313),
+    (942.0, 1.396466781, 853.196381752),
+    (708.0, 3.803023295, 323.505416657),
+    (552.0, 5.13149109, 202.253395174),
+    (400.0, 3.35891414, 227.52618944),
+    (319.0, 3.62571551, 209.366942175),
+    (316.0, 1.997167642, 647.010833315),
+    (314.0, 0.465102724, 217.231248701),
+    (284.0, 4.886484816, 224.344795702),
+    (236.0, 2.138874723, 11.045700264),
+    (215.0, 5.949826101, 846.082834751),
+    (209.0, 2.120038938, 415.552490612),
+    (207.0, 0.730214629, 199.072001436),
+    (179.0, 2.953615147, 63.735898303),
+    (141.0, 0.644176203, 490.334089179),
+    (139.0, 4.59535168, 14.227094002),
+    (139.0, 1.998219909, 735.876513532),
+    (135.0, 5.245008196, 742.990060533),
+    (122.0, 3.115371409, 522.577418094),
+    (116.0, 3.108915472, 216.480489176),
+    (114.0, 0.962614421, 210.1177017),
+    (397555.0, 5.332899926, 213.299095438),
+    (49479.0, 3.141592654, 0.0),
+    (18572.0, 6.099192064, 426.598190876),
+    (14801.0, 2.305860605, 206.185548437),
+    (9644.0, 1.696746601, 220.412642439),
+    (3757.0, 1.25429514, 419.484643875),
+    (2717.0, 5.911666648, 639.897286314),
+    (1455.0, 0.851616165, 433.711737877),
+    (1291.0, 2.917708571, 7.113547001),
+    (853.0, 0.43572079, 316.391869657),
+    (298.0, 0.919092067, 632.783739313),
+    (292.0, 5.315742513, 853.196381752),
+    (284.0, 1.618817548, 227.52618944),
+    (275.0, 3.888641373, 103.092774219),
+    (172.0, 0.052151466, 647.010833315),
+    (166.0, 2.443516132, 199.072001436),
+    (158.0, 5.208501258, 110.206321219),
+    (128.0, 1.207114525, 529.690965095),
+    (110.0, 2.456955516, 217.231248701),
+    (82.0, 2.758391714, 210.1177017),
+    (81.0, 2.860383772, 14.227094002),
+    (69.0, 1.655376231, 202.253395174),
+    (65.0, 1.255275213, 216.480489176),
+    (61.0, 1.252734121, 209.366942175),
+    (59.0, 1.824107682, 323.505416657),
+    (46.0, 0.815347053, 440.825284878),
+    (36.0, 1.818510577, 224.344795702),
+    (34.0, 2.83971298, 117.31986822),
+    (33.0, 1.3055708, 412.371096874),
+    (32.0, 1.186761323, 846.082834751),
+    (27.0, 4.647448476, 1066.49547719),
+    (27.0, 4.442287392, 11.045700264),
+    (20630.0, 0.504824228, 213.299095438),
+    (3720.0, 3.998334758, 206.185548437),
+    (1627.0, 6.181899395, 220.412642439),
+    (1346.0, 0.0, 0.0),
+    (706.0, 3.039143088, 419.484643875),
+    (365.0, 5.099286807, 426.598190876),
+    (330.0, 5.2789921, 433.711737877),
+    (219.0, 3.828415338, 639.897286314),
+    (139.0, 1.042726235, 7.113547001),
+    (104.0, 6.15730993, 227.52618944),
+    (93.0, 1.979944128, 316.391869657),
+    (71.0, 4.147543534, 199.072001436),
+    (52.0, 2.883648339, 632.783739313),
+    (49.0, 4.433902067, 647.010833315),
+    (41.0, 3.159277701, 853.196381752),
+    (29.0, 4.529783276, 210.1177017),
+    (24.0, 1.115959121, 14.227094002),
+    (21.0, 4.350958442, 217.231248701),
+    (20.0, 5.307797112, 440.825284878),
+    (18.0, 0.853914768, 110.206321219),
+    (17.0, 5.681120841, 216.480489176),
+    (16.0, 4.257672263, 103.092774219),
+    (14.0, 2.999043341, 412.371096874),
+    (12.0, 2.526799284, 529.690965095),
+    (8.0, 3.315124239, 202.253395174),
+    (7.0, 5.557141299, 209.366942175),
+    (7.0, 0.287660251, 323.505416657),
+    (6.0, 1.161213213, 117.31986822),
+    (6.0, 3.612318865, 860.309928753),
+    (666.0, 1.990063402, 213.299095438),
+    (632.0, 5.697783168, 206.185548437),
+    (398.0, 0.0, 0.0),
+    (188.0, 4.337798048, 220.412642439),
+    (92.0, 4.841042082, 419.484643875),
+    (52.0, 3.421494903, 433.711737877),
+    (42.0, 2.380732391, 426.598190876),
+    (26.0, 4.401672131, 227.52618944),
+    (21.0, 5.853135099, 199.072001436),
+    (18.0, 1.993214332, 639.897286314),
+    (11.0, 5.373445465, 7.113547001),
+    (10.0, 2.549018259, 647.010833315),
+    (7.0, 3.455183727, 316.391869657),
+    (6.0, 4.800552251, 632.783739313),
+    (6.0, 0.016803788, 210.1177017),
+    (6.0, 3.517567478, 440.825284878),
+    (5.0, 5.637197309, 14.227094002),
+    (5.0, 1.22424419, 853.196381752),
+    (4.0, 4.712993709, 412.371096874),
+    (3.0, 0.626792076, 103.092774219),
+    (2.0, 3.719822745, 216.480489176),
+    (80.0, 1.119184147, 206.185548437),
+    (32.0, 3.122187451, 213.299095438),
+    (17.0, 2.480732004, 220.412642439),
+    (12.0, 3.141592654, 0.0),
+    (9.0, 0.384414249, 419.484643875),
+    (6.0, 1.561863795, 433.711737877),
+    (5.0, 2.634982955, 227.52618944),
+    (5.0, 1.282356396, 199.072001436),
+    (1.0, 1.430966716, 426.598190876),
+    (1.0, 0.669880836, 647.010833315),
+    (1.0, 1.720419281, 440.825284878),
+    (1.0, 6.180922741, 639.897286314),
+    (8.0, 2.819275586, 206.185548437),
+    (1.0, 0.511872103, 220.412642439),
+    (955758136.0, 0.0, 0.0),
+    (52921382.0, 2.392262197, 213.299095438),
+    (1873680.0, 5.235496051, 206.185548437),
+    (1464664.0, 1.647630455, 426.598190876),
+    (821891.0, 5.935200254, 316.391869657),
+    (547507.0, 5.015326285, 103.092774219),
+    (371684.0, 2.271148334, 220.412642439),
+    (361778.0, 3.139043033, 7.113547001),
+    (140618.0, 5.70406653, 632.783739313),
+    (108975.0, 3.293135956, 110.206321219),
+    (69007.0, 5.940996224, 419.484643875),
+    (61053.0, 0.940377612, 639.897286314),
+    (48913.0, 1.557333885, 202.253395174),
+    (34144.0, 0.195185507, 277.034993741),
+    (32402.0, 5.470846069, 949.17560897),
+    (20937.0, 0.46349164, 735.876513532),
+    (20839.0, 1.521025906, 433.711737877),
+    (20747.0, 5.332556676, 199.072001436),
+    (15298.0, 3.059436529, 529.690965095),
+    (14296.0, 2.604335379, 323.505416657),
+    (12884.0, 1.648923104, 138.517496871),
+    (11993.0, 5.980514219, 846.082834751),
+    (11380.0, 1.731057466, 522.577418094),
+    (9796.0, 5.20475864, 1265.567478626),
+    (7753.0, 5.851913189, 95.979227218),
+    (6771.0, 3.004334793, 14.227094002),
+    (6466.0, 0.177331601, 1052.268383188),
+    (5850.0, 1.455196361, 415.552490612),
+    (5307.0, 0.597375341, 63.735898303),
+    (4696.0, 2.14919037, 227.52618944),
+    (4044.0, 1.640103239, 209.366942175),
+    (3688.0, 0.780161332, 412.371096874),
+    (3461.0, 1.850888029, 175.1660598),
+    (3420.0, 4.945491489, 1581.959348283),
+    (3401.0, 0.553867475, 350.3321196),
+    (3376.0, 3.695284788, 224.344795702),
+    (2976.0, 5.684679311, 210.1177017),
+    (2885.0, 1.387640776, 838.96928775),
+    (2881.0, 0.179607579, 853.196381752),
+    (2508.0, 3.538518633, 742.990060533),
+    (2448.0, 6.184123863, 1368.660252845),
+    (2406.0, 2.965592203, 117.31986822),
+    (2174.0, 0.015085874, 340.770892045),
+    (2024.0, 5.054112713, 11.045700264),
+    (6182981.0, 0.25843515, 213.299095438),
+    (506578.0, 0.711146509, 206.185548437),
+    (341394.0, 5.79635774, 426.598190876),
+    (188491.0, 0.472157194, 220.412642439),
+    (186262.0, 3.141592654, 0.0),
+    (143891.0, 1.407448642, 7.113547001),
+    (49621.0, 6.017444696, 103.092774219),
+    (20928.0, 5.092456545, 639.897286314),
+    (19953.0, 1.17560125, 419.484643875),
+    (18840.0, 1.608195632, 110.206321219),
+    (13877.0, 0.758862044, 199.072001436),
+    (12893.0, 5.943302584, 433.711737877),
+    (5397.0, 1.288524059, 14.227094002),
+    (4869.0, 0.867938942, 323.505416657),
+    (4247.0, 0.392993845, 227.52618944),
+    (3252.0, 1.258534705, 95.979227218),
+    (3081.0, 3.436625574, 522.577418094),
+    (2909.0, 4.606791548, 202.253395174),
+    (2856.0, 2.167314054, 735.876513532),
+    (1988.0, 2.450542048, 412.371096874),
+    (1941.0, 6.023933851, 209.366942175),
+    (1581.0, 1.291917897, 210.1177017),
+    (1340.0, 4.308018218, 853.196381752),
+    (1316.0, 1.25296446, 117.31986822),
+    (1203.0, 1.866546738, 316.391869657),
+    (1091.0, 0.075272469, 216.480489176),
+    (966.0, 0.479913791, 632.783739313),
+    (954.0, 5.151734105, 647.010833315),
+    (898.0, 0.983437761, 529.690965095),
+    (882.0, 1.884717245, 1052.268383188),
+    (874.0, 1.402246839, 224.344795702),
+    (785.0, 3.063775175, 838.96928775),
+    (740.0, 1.382253567, 625.670192312),
+    (658.0, 4.14362931, 309.278322656),
+    (650.0, 1.724894862, 742.990060533),
+    (613.0, 3.033073068, 63.735898303),
+    (599.0, 2.549241748, 217.231248701),
+    (503.0, 2.129588195, 3.932153263),
+    (436902.0, 4.78671673, 213.299095438),
+    (71923.0, 2.500699949, 206.185548437),
+    (49767.0, 4.971681509, 220.412642439),
+    (43221.0, 3.869404438, 426.598190876),
+    (29646.0, 5.963102643, 7.113547001),
+    (4721.0, 2.475279924, 199.072001436),
+    (4142.0, 4.106709408, 433.711737877),
+    (3789.0, 3.097710251, 639.897286314),
+    (2964.0, 1.372062488, 103.092774219),
+    (2556.0, 2.850657215, 419.484643875),
+    (2327.0, 0.0, 0.0),
+    (2208.0, 6.275888587, 110.206321219),
+    (2188.0, 5.855458322, 14.227094002),
+    (1957.0, 4.92448618, 227.52618944),
+    (924.0, 5.463924227, 323.505416657),
+    (706.0, 2.970812801, 95.979227218),
+    (546.0, 4.128541815, 412.371096874),
+    (431.0, 5.178254146, 522.577418094),
+    (405.0, 4.172941579, 209.366942175),
+    (391.0, 4.481061769, 216.480489176),
+    (374.0, 5.834359918, 117.31986822),
+    (361.0, 3.277030824, 647.010833315),
+    (356.0, 3.191520439, 210.1177017),
+    (326.0, 2.268676017, 853.196381752),
+    (207.0, 4.021883367, 735.876513532),
+    (204.0, 0.087748486, 202.253395174),
+    (180.0, 3.59704904, 632.783739313),
+    (178.0, 4.097165415, 440.825284878),
+    (154.0, 3.134705304, 625.670192312),
+    (148.0, 0.136143005, 302.164775655),
+    (133.0, 2.593504694, 191.958454436),
+    (132.0, 5.932939689, 309.278322656),
+    (20315.0, 3.02186626, 213.299095438),
+    (8924.0, 3.191442058, 220.412642439),
+    (6909.0, 4.351748894, 206.185548437),
+    (4087.0, 4.224069274, 7.113547001),
+    (3879.0, 2.01056446, 426.598190876),
+    (1071.0, 4.203603412, 199.072001436),
+    (907.0, 2.28344368, 433.711737877),
+    (606.0, 3.174585705, 227.52618944),
+    (597.0, 4.134557534, 14.227094002),
+    (483.0, 1.173459733, 639.897286314),
+    (393.0, 0.0, 0.0),
+    (229.0, 4.698385264, 419.484643875),
+    (188.0, 4.59003889, 110.206321219),
+    (150.0, 3.201994444, 103.092774219),
+    (121.0, 3.768313741, 323.505416657),
+    (102.0, 4.709744228, 95.979227218),
+    (101.0, 5.818841378, 412.371096874),
+    (93.0, 1.435312709, 647.010833315),
+    (84.0, 2.634623797, 216.480489176),
+    (73.0, 4.153955985, 117.31986822),
+    (62.0, 2.312393455, 440.825284878),
+    (55.0, 0.305264685, 853.196381752),
+    (50.0, 2.388542329, 209.366942175),
+    (45.0, 4.373170473, 191.958454436),
+    (41.0, 0.688451832, 522.577418094),
+    (40.0, 1.838365698, 302.164775655),
+    (38.0, 5.944551155, 88.865680217),
+    (32.0, 4.011463494, 21.340641002),
+    (1202.0, 1.414994465, 220.412642439),
+    (708.0, 1.161535701, 213.299095438),
+    (516.0, 6.239735683, 206.185548437),
+    (427.0, 2.469248903, 7.113547001),
+    (268.0, 0.186592067, 426.598190876),
+    (170.0, 5.959269724, 199.072001436),
+    (150.0, 0.479701671, 433.711737877),
+    (145.0, 1.442110601, 227.52618944),
+    (121.0, 2.405273208, 14.227094002),
+    (47.0, 5.568574887, 639.897286314),
+    (19.0, 5.856264291, 647.010833315),
+    (17.0, 0.529207743, 440.825284878),
+    (16.0, 2.901124663, 110.206321219),
+    (15.0, 0.299053168, 419.484643875),
+    (14.0, 1.303435507, 412.371096874),
+    (13.0, 2.093493059, 323.505416657),
+    (11.0, 0.21785507, 95.979227218),
+    (11.0, 2.46304826, 117.31986822),
+    (10.0, 3.141592654, 0.0),
+    (9.0, 1.564963128, 88.865680217),
+    (9.0, 2.281273181, 21.340641002),
+    (9.0, 0.68301278, 216.480489176),
+    (8.0, 1.272394885, 234.63973644),
+    (129.0, 5.912825651, 220.412642439),
+    (32.0, 0.692562286, 7.113547001),
+    (27.0, 5.914285286, 227.52618944),
+    (20.0, 4.951368018, 433.711737877),
+    (20.0, 0.673706534, 14.227094002),
+    (14.0, 2.670742802, 206.185548437),
+    (14.0, 1.456695214, 199.072001436),
+    (13.0, 4.588269964, 426.598190876),
+    (7.0, 4.629661272, 213.299095438),
+    (5.0, 3.61448275, 639.897286314),
+    (4.0, 4.89624165, 440.825284878),
+    (3.0, 4.071908595, 647.010833315),
+    (3.0, 4.656610219, 191.958454436),
+    (3.0, 0.486652733, 323.505416657),
+    (3.0, 3.180030192, 419.484643875),
+    (2.0, 3.695535543, 88.865680217),
+    (2.0, 3.316635774, 95.979227218),
+    (2.0, 0.560255528, 117.31986822),
+    (548129294.0, 0.0, 0.0),
+    (9260408.0, 0.891064215, 74.781598567),
+    (1504248.0, 3.627192622, 1.484472708),
+    (365982.0, 1.899621891, 73.297125859),
+    (272328.0, 3.358237105, 149.563197135),
+    (70328.0, 5.39254432, 63.735898303),
+    (68893.0, 6.09292489, 76.266071276),
+    (61999.0, 2.269520405, 2.968945417),
+    (61951.0, 2.850989076, 11.045700264),
+    (26469.0, 3.141520879, 71.812653151),
+    (25711.0, 6.113798429, 454.909366527),
+    (21079.0, 4.360594651, 148.078724426),
+    (17819.0, 1.744369825, 36.64856293),
+    (14613.0, 4.73732048, 3.932153263),
+    (11163.0, 5.826819937, 224.344795702),
+    (10998.0, 0.488654932, 138.517496871),
+    (9527.0, 2.955168931, 35.164090221),
+    (7546.0, 5.236264407, 109.945688789),
+    (4220.0, 3.233285355, 70.849445304),
+    (4052.0, 2.277541587, 151.047669843),
+    (3490.0, 5.483055673, 146.594251718),
+    (3355.0, 1.065490089, 4.453418125),
+    (3144.0, 4.751993076, 77.750543984),
+    (2927.0, 4.629036955, 9.561227556),
+    (2922.0, 5.352367434, 85.827298831),
+    (2273.0, 4.366008028, 70.328180442),
+    (2149.0, 0.607458009, 38.133035638),
+    (2051.0, 1.517735635, 0.111874585),
+    (1992.0, 4.924372908, 277.034993741),
+    (1667.0, 3.627445809, 380.12776796),
+    (1533.0, 2.585934143, 52.69019804),
+    (1376.0, 2.042814091, 65.220371012),
+    (1372.0, 4.196416156, 111.430161497),
+    (1284.0, 3.113463369, 202.253395174),
+    (1282.0, 0.542698695, 222.860322994),
+    (1244.0, 0.916126806, 2.447680555),
+    (1221.0, 0.199013962, 108.46121608),
+    (1151.0, 4.17898207, 33.679617513),
+    (1150.0, 0.93344454, 3.181393738),
+    (1090.0, 1.775016389, 12.530172972),
+    (1072.0, 0.235645029, 62.251425595),
+    (946.0, 1.192494631, 127.471796607),
+    (708.0, 5.182852266, 213.299095438),
+    (653.0, 0.965869091, 78.71375183),
+    (628.0, 0.18210182, 984.600331622),
+    (607.0, 5.43209729, 529.690965095),
+    (559.0, 3.357767377, 0.521264862),
+    (524.0, 2.01276707, 299.126394269),
+    (483.0, 2.105539902, 0.963207847),
+    (471.0, 1.406643364, 184.727287356),
+    (467.0, 0.414840689, 145.10977901),
+    (434.0, 5.521429783, 183.242814648),
+    (405.0, 5.986890114, 8.076754847),
+    (399.0, 0.338107654, 415.552490612),
+    (396.0, 5.870395809, 351.816592309),
+    (379.0, 2.34975805, 56.622351303),
+    (310.0, 5.833013047, 145.631043872),
+    (300.0, 5.643539741, 22.091400528),
+    (294.0, 5.839168262, 39.617508346),
+    (252.0, 1.636967756, 221.375850285),
+    (249.0, 4.746171206, 225.82926841),
+    (239.0, 2.350458747, 137.033024162),
+    (224.0, 0.515748635, 84.342826123),
+    (223.0, 2.843093803, 0.260632431),
+    (220.0, 1.92212988, 67.668051567),
+    (217.0, 6.142118627, 5.937890833),
+    (216.0, 4.778474814, 340.770892045),
+    (208.0, 5.5802057, 68.843707734),
+    (202.0, 1.296930409, 0.04818411),
+    (199.0, 0.95634155, 152.532142551),
+    (194.0, 1.888001226, 456.393839236),
+    (193.0, 0.916160585, 453.424893819),
+    (187.0, 1.319243263, 0.160058694),
+    (182.0, 3.536240292, 79.235016692),
+    (173.0, 1.538607281, 160.608897399),
+    (172.0, 5.679526855, 219.891377577),
+    (170.0, 3.677175207, 5.416625971),
+    (169.0, 5.878740009, 18.159247265),
+    (165.0, 1.423797148, 106.976743372),
+    (163.0, 3.050293777, 112.914634205),
+    (158.0, 0.738119972, 54.174670748),
+    (147.0, 1.263001723, 59.80374504),
+    (143.0, 1.299954876, 35.424722652),
+    (139.0, 5.385977234, 32.195144805),
+    (139.0, 4.259947867, 909.818733055),
+    (124.0, 1.373599903, 7.113547001),
+    (110.0, 2.02685779, 554.069987483),
+    (109.0, 5.705818333, 77.962992305),
+    (104.0, 5.028208888, 0.750759525),
+    (104.0, 1.457702702, 24.379022388),
+    (103.0, 0.680953013, 14.977853527),
+    (7502543122.0, 0.0, 0.0),
+    (154458.0, 5.242016581, 74.781598567),
+    (24456.0, 1.712557053, 1.484472708),
+    (9258.0, 0.428446391, 11.045700264),
+    (8266.0, 1.502200351, 63.735898303),
+    (7842.0, 1.319836073, 149.563197135),
+    (3899.0, 0.46483574, 3.932153263),
+    (2284.0, 4.17367534, 76.266071276),
+    (1927.0, 0.530130802, 2.968945417),
+    (1233.0, 1.586344582, 70.849445304),
+    (791.0, 5.436412241, 3.181393738),
+    (767.0, 1.995554096, 73.297125859),
+    (482.0, 2.984019969, 85.827298831),
+    (450.0, 4.138262375, 138.517496871),
+    (446.0, 3.723004003, 224.344795702),
+    (427.0, 4.731260594, 71.812653151),
+    (354.0, 2.583244969, 148.078724426),
+    (348.0, 2.453722613, 9.561227556),
+    (317.0, 5.578552321, 52.69019804),
+    (206.0, 2.362631443, 2.447680555),
+    (189.0, 4.202428814, 56.622351303),
+    (184.0, 0.283710047, 151.047669843),
+    (180.0, 5.683677309, 12.530172972),
+    (171.0, 3.000600753, 78.71375183),
+    (158.0, 2.909319695, 0.963207847),
+    (155.0, 5.590839256, 4.453418125),
+    (154.0, 4.651868859, 35.164090221),
+    (152.0, 2.942173269, 77.750543984),
+    (143.0, 2.590492467, 62.251425595),
+    (121.0, 4.148392049, 127.471796607),
+    (116.0, 3.732246038, 65.220371012),
+    (102.0, 4.18754518, 145.631043872),
+    (102.0, 6.03385875, 0.111874585),
+    (88.0, 3.99035788, 18.159247265),
+    (88.0, 6.155207876, 202.253395174),
+    (81.0, 2.641247439, 22.091400528),
+    (72.0, 6.045459336, 70.328180442),
+    (69.0, 4.050718953, 77.962992305),
+    (59.0, 3.704139191, 67.668051567),
+    (47.0, 3.543124605, 351.816592309),
+    (44.0, 5.908658219, 7.113547001),
+    (43.0, 5.723573709, 5.416625971),
+    (39.0, 4.915190038, 222.860322994),
+    (36.0, 5.899642788, 33.679617513),
+    (36.0, 3.291972592, 8.076754847),
+    (36.0, 3.327846161, 71.60020483),
+    (35.0, 5.080341121, 38.133035638),
+    (31.0, 5.620156323, 984.600331622),
+    (31.0, 5.495914039, 59.80374504),
+    (31.0, 5.464145926, 160.608897399),
+    (30.0, 1.659808447, 447.795819527),
+    (29.0, 1.147226404, 462.022913528),
+    (29.0, 4.518673904, 84.342826123),
+    (27.0, 5.54127301, 131.40394987),
+    (27.0, 6.146406041, 299.126394269),
+    (26.0, 4.993620284, 137.033024162),
+    (25.0, 5.735846786, 380.12776796),
+    (53033.0, 0.0, 0.0),
+    (2358.0, 2.260146617, 74.781598567),
+    (769.0, 4.525610418, 11.045700264),
+    (552.0, 3.25814281, 63.735898303),
+    (542.0, 2.275739074, 3.932153263),
+    (529.0, 4.923484338, 1.484472708),
+    (258.0, 3.690592169, 3.181393738),
+    (239.0, 5.858066384, 149.563197135),
+    (182.0, 6.217636034, 70.849445304),
+    (54.0, 1.44225241, 76.266071276),
+    (49.0, 6.031013017, 56.622351303),
+    (45.0, 3.909049105, 2.447680555),
+    (45.0, 0.811526395, 85.827298831),
+    (38.0, 1.784678278, 52.69019804),
+    (37.0, 4.46228598, 2.968945417),
+    (33.0, 0.8638815, 9.561227556),
+    (29.0, 5.098186977, 73.297125859),
+    (24.0, 2.10702559, 18.159247265),
+    (22.0, 5.993207287, 138.517496871),
+    (22.0, 4.817308086, 78.71375183),
+    (21.0, 2.398807093, 77.962992305),
+    (21.0, 2.169187865, 224.344795702),
+    (17.0, 2.535371832, 145.631043872),
+    (17.0, 3.466313441, 12.530172972),
+    (12.0, 0.019413619, 22.091400528),
+    (11.0, 0.084962744, 127.471796607),
+    (10.0, 5.164530841, 71.60020483),
+    (10.0, 4.455560326, 62.251425595),
+    (9.0, 4.25550087, 7.113547001),
+    (8.0, 5.5011593, 67.668051567),
+    (7.0, 1.249039064, 5.416625971),
+    (6.0, 3.363201613, 447.795819527),
+    (6.0, 5.446116744, 65.220371012),
+    (6.0, 4.518368363, 151.047669843),
+    (6.0, 5.725000867, 462.022913528),
+    (121.0, 0.024187899, 74.781598567),
+    (68.0, 4.120842677, 3.932153263),
+    (53.0, 2.389640613, 11.045700264),
+    (46.0, 0.0, 0.0),
+    (45.0, 2.044237984, 3.181393738),
+    (44.0, 2.959650397, 1.484472708),
+    (25.0, 4.887413079, 63.735898303),
+    (21.0, 4.545114869, 70.849445304),
+    (20.0, 2.313203141, 149.563197135),
+    (9.0, 1.575488718, 56.622351303),
+    (4.0, 0.227773196, 18.159247265),
+    (4.0, 5.392446113, 76.266071276),
+    (4.0, 0.950524486, 77.962992305),
+    (3.0, 4.976228118, 85.827298831),
+    (3.0, 4.1296936, 52.69019804),
+    (3.0, 0.372877963, 78.71375183),
+    (2.0, 0.857709618, 145.631043872),
+    (2.0, 5.656478215, 9.561227556),
+    (114.0, 3.141592654, 0.0),
+    (6.0, 4.578824244, 74.781598567),
+    (3.0, 0.346230032, 11.045700264),
+    (1.0, 3.421991218, 56.622351303),
+    (1346278.0, 2.618778105, 74.781598567),
+    (62341.0, 5.081111759, 149.563197135),
+    (61601.0, 3.141592654, 0.0),
+    (9964.0, 1.616038764, 76.266071276),
+    (9926.0, 0.576303879, 73.297125859),
+    (3259.0, 1.26119386, 224.344795702),
+    (2972.0, 2.243670355, 1.484472708),
+    (2010.0, 6.055504011, 148.078724426),
+    (1522.0, 0.279603864, 63.735898303),
+    (924.0, 4.038229279, 151.047669843),
+    (761.0, 6.140004319, 71.812653151),
+    (522.0, 3.320851948, 138.517496871),
+    (463.0, 0.742567276, 85.827298831),
+    (437.0, 3.380825243, 529.690965095),
+    (435.0, 0.340652819, 77.750543984),
+    (431.0, 3.554450349, 213.299095438),
+    (420.0, 5.212799848, 11.045700264),
+    (245.0, 0.787951503, 2.968945417),
+    (233.0, 2.257164214, 222.860322994),
+    (216.0, 1.591217049, 38.133035638),
+    (180.0, 3.724879527, 299.126394269),
+    (175.0, 1.235502622, 146.594251718),
+    (174.0, 1.936542691, 380.12776796),
+    (160.0, 5.336354365, 111.430161497),
+    (144.0, 5.962393264, 35.164090221),
+    (116.0, 5.7387719, 70.849445304),
+    (106.0, 0.94103113, 70.328180442),
+    (102.0, 2.618762565, 78.71375183),
+    (206366.0, 4.123943114, 74.781598567),
+    (8563.0, 0.338199862, 149.563197135),
+    (1726.0, 2.121931599, 73.297125859),
+    (1374.0, 0.0, 0.0),
+    (1369.0, 3.06861722, 76.266071276),
+    (451.0, 3.77656181, 1.484472708),
+    (400.0, 2.847670378, 224.344795702),
+    (307.0, 1.254567667, 148.078724426),
+    (154.0, 3.785754677, 63.735898303),
+    (112.0, 5.572998915, 151.047669843),
+    (111.0, 5.328886765, 138.517496871),
+    (83.0, 3.591527956, 71.812653151),
+    (56.0, 3.401354164, 85.827298831),
+    (54.0, 1.704557699, 77.750543984),
+    (42.0, 1.214766074, 11.045700264),
+    (41.0, 4.454766691, 78.71375183),
+    (32.0, 3.774462077, 222.860322994),
+    (30.0, 2.563716836, 2.968945417),
+    (27.0, 5.336955003, 213.299095438),
+    (26.0, 0.416206284, 380.12776796),
+    (9212.0, 5.800443058, 74.781598567),
+    (557.0, 0.0, 0.0),
+    (286.0, 2.177297764, 149.563197135),
+    (95.0, 3.842375698, 73.297125859),
+    (45.0, 4.878220461, 76.266071276),
+    (20.0, 5.462644854, 1.484472708),
+    (15.0, 0.879837157, 138.517496871),
+    (14.0, 2.845177427, 148.078724426),
+    (14.0, 5.07234044, 63.735898303),
+    (10.0, 5.002908949, 224.344795702),
+    (8.0, 6.266556152, 78.71375183),
+    (268.0, 1.250978883, 74.781598567),
+    (11.0, 3.141592654, 0.0),
+    (6.0, 4.006636145, 149.563197135),
+    (3.0, 5.778046949, 73.297125859),
+    (6.0, 2.854995293, 74.781598567),
+    (1921264848.0, 0.0, 0.0),
+    (88784984.0, 5.60377527, 74.781598567),
+    (3440836.0, 0.32836099, 73.297125859),
+    (2055653.0, 1.7829517, 149.563197135),
+    (649322.0, 4.522472981, 76.266071276),
+    (602248.0, 3.860038205, 63.735898303),
+    (496404.0, 1.401399347, 454.909366527),
+    (338526.0, 1.580026829, 138.517496871),
+    (243508.0, 1.570865951, 71.812653151),
+    (190522.0, 1.998093645, 1.484472708),
+    (161858.0, 2.791378635, 148.078724426),
+    (143706.0, 1.383685745, 11.045700264),
+    (93192.0, 0.174371936, 36.64856293),
+    (89806.0, 3.661053663, 109.945688789),
+    (71424.0, 4.245093274, 224.344795702),
+    (46677.0, 1.399765639, 35.164090221),
+    (39026.0, 3.362347107, 277.034993741),
+    (39010.0, 1.669711289, 70.849445304),
+    (36755.0, 3.886489347, 146.594251718),
+    (30349.0, 0.701004463, 151.047669843),
+    (29156.0, 3.180561746, 77.750543984),
+    (25786.0, 3.785377415, 85.827298831),
+    (25620.0, 5.256562928, 380.12776796),
+    (22637.0, 0.725191377, 529.690965095),
+    (20473.0, 2.796398116, 70.328180442),
+    (20472.0, 1.555889615, 202.253395174),
+    (17901.0, 0.554554886, 2.968945417),
+    (15503.0, 5.354050376, 38.133035638),
+    (14702.0, 4.904344066, 108.46121608),
+    (12897.0, 2.621540182, 111.430161497),
+    (12328.0, 5.960391509, 127.471796607),
+    (11959.0, 1.750440722, 984.600331622),
+    (11853.0, 0.993428146, 52.69019804),
+    (11696.0, 3.298255991, 3.932153263),
+    (11495.0, 0.437740279, 65.220371012),
+    (10793.0, 1.421048585, 213.299095438),
+    (9111.0, 4.996386, 62.251425595),
+    (8421.0, 5.253507166, 222.860322994),
+    (8402.0, 5.038775165, 415.552490612),
+    (7449.0, 0.79491906, 351.816592309),
+    (7329.0, 3.972775278, 183.242814648),
+    (6046.0, 5.679609484, 78.71375183),
+    (5524.0, 3.114994842, 9.561227556),
+    (5445.0, 5.105756354, 145.10977901),
+    (5238.0, 2.629601418, 33.679617513),
+    (4079.0, 3.220647887, 340.770892045),
+    (3919.0, 4.250152889, 39.617508346),
+    (3802.0, 6.109855585, 184.727287356),
+    (3781.0, 3.458402729, 456.393839236),
+    (3687.0, 2.487181165, 453.424893819),
+    (3102.0, 4.140310639, 219.891377577),
+    (2963.0, 0.82977992, 56.622351303),
+    (2942.0, 0.423938089, 299.126394269),
+    (2940.0, 2.146374603, 137.033024162),
+    (2938.0, 3.676574509, 140.001969579),
+    (2865.0, 0.309969038, 12.530172972),
+    (2538.0, 4.85457832, 131.40394987),
+    (2364.0, 0.442533284, 554.069987483),
+    (2183.0, 2.940404316, 305.346169393),
+    (1479896.0, 3.672057053, 74.781598567),
+    (71212.0, 6.226010067, 63.735898303),
+    (68627.0, 6.134112651, 149.563197135),
+    (24060.0, 3.141592654, 0.0),
+    (21468.0, 2.601767043, 76.266071276),
+    (20857.0, 5.246254942, 11.045700264),
+    (11405.0, 0.018484616, 70.849445304),
+    (7497.0, 0.423600333, 73.297125859),
+    (4244.0, 1.416923504, 85.827298831),
+    (3927.0, 3.155139913, 71.812653151),
+    (3578.0, 2.311606683, 224.344795702),
+    (3506.0, 2.583540489, 138.517496871),
+    (3229.0, 5.254996029, 3.932153263),
+    (3060.0, 0.153218932, 1.484472708),
+    (2564.0, 0.980768464, 148.078724426),
+    (2429.0, 3.994401225, 52.69019804),
+    (1645.0, 2.653493131, 127.471796607),
+    (1584.0, 1.430456192, 78.71375183),
+    (1508.0, 5.059963254, 151.047669843),
+    (1490.0, 2.675591673, 56.622351303),
+    (1413.0, 4.574618921, 202.253395174),
+    (1403.0, 1.369853497, 77.750543984),
+    (1228.0, 1.047036401, 62.251425595),
+    (1033.0, 0.26459059, 131.40394987),
+    (992.0, 2.171688659, 65.220371012),
+    (862.0, 5.055308022, 351.816592309),
+    (744.0, 3.076401489, 35.164090221),
+    (687.0, 2.499125657, 77.962992305),
+    (647.0, 4.472904229, 70.328180442),
+    (624.0, 0.862530738, 9.561227556),
+    (604.0, 0.90717668, 984.600331622),
+    (575.0, 3.230707085, 447.795819527),
+    (562.0, 2.71778159, 462.022913528),
+    (530.0, 5.91655309, 213.299095438),
+    (528.0, 5.151360071, 2.968945417),
+    (22440.0, 0.699531188, 74.781598567),
+    (4727.0, 1.699016415, 63.735898303),
+    (1682.0, 4.648335517, 70.849445304),
+    (1650.0, 3.09660079, 11.045700264),
+    (1434.0, 3.521199179, 149.563197135),
+    (770.0, 0.0, 0.0),
+    (500.0, 6.172290322, 76.266071276),
+    (461.0, 0.766766328, 3.932153263),
+    (390.0, 4.496052835, 56.622351303),
+    (390.0, 5.526734264, 85.827298831),
+    (292.0, 0.203890121, 52.69019804),
+    (287.0, 3.533576833, 73.297125859),
+    (273.0, 3.847078237, 138.517496871),
+    (220.0, 1.964189429, 131.40394987),
+    (216.0, 0.848124742, 77.962992305),
+    (205.0, 3.247580171, 78.71375183),
+    (149.0, 4.898408638, 127.471796607),
+    (129.0, 2.081468495, 3.181393738),
+    (1164.0, 4.734532916, 74.781598567),
+    (212.0, 3.34255735, 63.735898303),
+    (196.0, 2.980046163, 70.849445304),
+    (105.0, 0.958079376, 11.045700264),
+    (73.0, 0.997019079, 149.563197135),
+    (72.0, 0.025284557, 56.622351303),
+    (55.0, 2.594368113, 3.932153263),
+    (36.0, 5.65035573, 77.962992305),
+    (34.0, 3.815533256, 76.266071276),
+    (32.0, 3.598251778, 131.40394987),
+    (53.0, 3.008380331, 74.781598567),
+    (10.0, 1.913990836, 56.622351303),
+    (531188633.0, 0.0, 0.0),
+    (1798476.0, 2.901012731, 38.133035638),
+    (1019728.0, 0.485809237, 1.484472708),
+    (124532.0, 4.830080907, 36.64856293),
+    (42064.0, 5.410549916, 2.968945417),
+    (37715.0, 6.092218349, 35.164090221),
+    (33785.0, 1.244888656, 76.266071276),
+    (16483.0, 7.7293e-05, 491.557929457),
+    (9199.0, 4.937470599, 39.617508346),
+    (8994.0, 0.274621426, 175.1660598),
+    (4216.0, 1.987119144, 73.297125859),
+    (3365.0, 1.035901218, 33.679617513),
+    (2285.0, 4.206069326, 4.453418125),
+    (1434.0, 2.783404327, 74.781598567),
+    (900.0, 2.076067024, 109.945688789),
+    (745.0, 3.190325301, 71.812653151),
+    (506.0, 5.747853703, 114.399106913),
+    (400.0, 0.349723426, 1021.248894551),
+    (345.0, 3.461862102, 41.101981054),
+    (340.0, 3.303699004, 77.750543984),
+    (323.0, 2.248151886, 32.195144805),
+    (306.0, 0.496840399, 0.521264862),
+    (287.0, 4.50523446, 0.04818411),
+    (282.0, 2.245655797, 146.594251718),
+    (267.0, 4.889326095, 0.963207847),
+    (252.0, 5.781665973, 388.465155238),
+    (245.0, 1.246933379, 9.561227556),
+    (233.0, 2.50459795, 137.033024162),
+    (227.0, 1.797130545, 453.424893819),
+    (170.0, 3.323906307, 108.46121608),
+    (151.0, 2.191530943, 33.940249944),
+    (150.0, 2.997061104, 5.937890833),
+    (148.0, 0.859489861, 111.430161497),
+    (119.0, 3.677062043, 2.447680555),
+    (109.0, 2.41599378, 183.242814648),
+    (103.0, 0.040789667, 0.260632431),
+    (103.0, 4.40441222, 70.328180442),
+    (102.0, 5.70539237, 0.111874585),
+    (3837687717.0, 0.0, 0.0),
+    (16604.0, 4.863191296, 1.484472708),
+    (15807.0, 2.279234885, 38.133035638),
+    (3335.0, 3.68199676, 76.266071276),
+    (1306.0, 3.673208135, 2.968945417),
+    (605.0, 1.504777475, 35.164090221),
+    (179.0, 3.453185241, 39.617508346),
+    (107.0, 2.451261383, 4.453418125),
+    (106.0, 2.754793266, 33.679617513),
+    (73.0, 5.487247327, 36.64856293),
+    (57.0, 1.857676034, 114.399106913),
+    (57.0, 5.21649805, 0.521264862),
+    (35.0, 4.516768275, 74.781598567),
+    (32.0, 5.904114897, 77.750543984),
+    (30.0, 3.670432941, 388.465155238),
+    (29.0, 5.168775292, 9.561227556),
+    (29.0, 5.16732589, 2.447680555),
+    (26.0, 5.245262819, 168.052512799),
+    (53893.0, 0.0, 0.0),
+    (296.0, 1.855202922, 1.484472708),
+    (281.0, 1.190845389, 38.133035638),
+    (270.0, 5.721432281, 76.266071276),
+    (23.0, 1.210355965, 2.968945417),
+    (9.0, 4.42544992, 35.164090221),
+    (7.0, 0.540333068, 2.447680555),
+    (31.0, 0.0, 0.0),
+    (15.0, 1.353370759, 76.266071276),
+    (12.0, 6.044314188, 1.484472708),
+    (12.0, 6.112578084, 38.133035638),
+    (114.0, 3.141592654, 0.0),
+    (3088623.0, 1.441043726, 38.133035638),
+    (27780.0, 5.912718828, 76.266071276),
+    (27624.0, 0.0, 0.0),
+    (15448.0, 3.508770809, 39.617508346),
+    (15355.0, 2.521237995, 36.64856293),
+    (2000.0, 1.509986695, 74.781598567),
+    (1968.0, 4.377781958, 1.484472708),
+    (1015.0, 3.215610359, 35.164090221),
+    (606.0, 2.802466014, 73.297125859),
+    (595.0, 2.128927081, 41.101981054),
+    (589.0, 3.186558825, 2.968945417),
+    (402.0, 4.168832872, 114.399106913),
+    (280.0, 1.681653097, 77.750543984),
+    (262.0, 3.767227047, 213.299095438),
+    (254.0, 3.271204994, 453.424893819),
+    (206.0, 4.256523489, 529.690965095),
+    (140.0, 3.529695564, 137.033024162),
+    (227279.0, 3.807930899, 38.133035638),
+    (1803.0, 1.975764854, 76.266071276),
+    (1433.0, 3.141592654, 0.0),
+    (1386.0, 4.82555548, 36.64856293),
+    (1073.0, 6.080542407, 39.617508346),
+    (148.0, 3.857662313, 74.781598567),
+    (136.0, 0.477649573, 1.484472708),
+    (70.0, 6.187820521, 35.164090221),
+    (52.0, 5.052217919, 73.297125859),
+    (43.0, 0.307217372, 114.399106913),
+    (37.0, 4.894766292, 41.101981054),
+    (37.0, 5.759993491, 2.968945417),
+    (26.0, 5.215663359, 213.299095438),
+    (9691.0, 5.571237503, 38.133035638),
+    (79.0, 3.627054742, 76.266071276),
+    (72.0, 0.454766886, 36.64856293),
+    (59.0, 3.141592654, 0.0),
+    (30.0, 1.606717219, 39.617508346),
+    (6.0, 5.607367566, 74.781598567),
+    (273.0, 1.016889791, 38.133035638),
+    (2.0, 0.0, 0.0),
+    (2.0, 2.368056571, 36.64856293),
+    (2.0, 5.333643213, 76.266071276),
+    (6.0, 2.668726933, 38.133035638),
+    (3007013206.0, 0.0, 0.0),
+    (27062259.0, 1.329994589, 38.133035638),
+    (1691764.0, 3.251861389, 36.64856293),
+    (807831.0, 5.185928362, 1.484472708),
+    (537761.0, 4.521139028, 35.164090221),
+    (495726.0, 1.571056548, 491.557929457),
+    (274572.0, 1.845522568, 175.1660598),
+    (135134.0, 3.372206074, 39.617508346),
+    (121802.0, 5.797544443, 76.266071276),
+    (100895.0, 0.377027487, 73.297125859),
+    (69792.0, 3.796172269, 2.968945417),
+    (46688.0, 5.749378101, 33.679617513),
+    (24594.0, 0.508017282, 109.945688789),
+    (16939.0, 1.59422167, 71.812653151),
+    (14230.0, 1.077861129, 74.781598567),
+    (12012.0, 1.920621316, 1021.248894551),
+    (8395.0, 0.678168955, 146.594251718),
+    (7572.0, 1.071492634, 388.465155238),
+    (5721.0, 2.590595123, 4.453418125),
+    (4840.0, 1.906859911, 41.101981054),
+    (4483.0, 2.905734575, 529.690965095),
+    (4421.0, 1.749937965, 108.46121608),
+    (4354.0, 0.679856624, 32.195144805),
+    (4270.0, 3.413438658, 453.424893819),
+    (3381.0, 0.848106833, 183.242814648),
+    (2881.0, 1.986001051, 137.033024162),
+    (2879.0, 3.674159019, 350.3321196),
+    (2636.0, 3.097559434, 213.299095438),
+    (2530.0, 5.79839567, 490.073456749),
+    (2523.0, 0.486308, 493.042402165),
+    (2306.0, 2.809629357, 70.328180442),
+    (2087.0, 0.618583783, 33.940249944),
+    (236339.0, 0.704980112, 38.133035638),
+    (13220.0, 3.320154999, 1.484472708),
+    (8622.0, 6.216289516, 35.164090221),
+    (2702.0, 1.881406668, 39.617508346),
+    (2155.0, 2.094311981, 2.968945417),
+    (2153.0, 5.16873841, 76.266071276),
+    (1603.0, 0.0, 0.0),
+    (1464.0, 1.18417031, 33.679617513),
+    (1136.0, 3.918911997, 36.64856293),
+    (898.0, 5.241229335, 388.465155238),
+    (790.0, 0.533154846, 168.052512799),
+    (760.0, 0.020510336, 182.279606801),
+    (607.0, 1.077065004, 1021.248894551),
+    (572.0, 3.400607854, 484.444382456),
+    (561.0, 2.886858157, 498.671476458),
+    (4247.0, 5.899106791, 38.133035638),
+    (218.0, 0.345818291, 1.484472708),
+    (163.0, 2.238729471, 168.052512799),
+    (156.0, 4.594144673, 182.279606801),
+    (127.0, 2.847862981, 35.164090221),
+    (166.0, 4.552438935, 38.133035638),
+]
+
+#Polynomials of the mean longitude, D, M, Mp and F of the Moon, in degrees
+elp82_fundamentals = [
+    (218.3164591, 481267.88134236, -0.0013268, 1.855835023689734e-06, -1.5349429768684092e-08),
+    (297.8502042, 445267.1115168, -0.00163, 1.8319447192361523e-06, -8.844469995135542e-09),
+    (357.5291092, 35999.0502909, -0.0001536, 4.083299305839118e-08, 0.0),
+    (134.9634114, 477198.8676313, 0.008997, 1.4347408140719379e-05, -6.797172376291463e-08),
+    (93.2720993, 483202.0175273, -0.0034029, -2.8360748723766307e-07, 1.1583324645839848e-09),
+]
+
+#Multipliers of D, M, Mp and F and amplitudes of the longitude and distance terms
+elp82_lon_dist_terms = [
+    (0, 0, 1, 0, 6288774, -20905335),
+    (2, 0, -1, 0, 1274027, -3699111),
+    (2, 0, 0, 0, 658314, -2955968),
+    (0, 0, 2, 0, 213618, -569925),
+    (0, 1, 0, 0, -185116, 48888),
+    (0, 0, 0, 2, -114332, -3149),
+    (2, 0, -2, 0, 58793, 246158),
+    (2, -1, -1, 0, 57066, -152138),
+    (2, 0, 1, 0, 53322, -170733),
+    (2, -1, 0, 0, 45758, -204586),
+    (0, 1, -1, 0, -40923, -129620),
+    (1, 0, 0, 0, -34720, 108743),
+    (0, 1, 1, 0, -30383, 104755),
+    (2, 0, 0, -2, 15327, 10321),
+    (0, 0, 1, 2, -12528, 0),
+    (0, 0, 1, -2, 10980, 79661),
+    (4, 0, -1, 0, 10675, -34782),
+    (0, 0, 3, 0, 10034, -23210),
+    (4, 0, -2, 0, 8548, -21636),
+    (2, 1, -1, 0, -7888, 24208),
+    (2, 1, 0, 0, -6766, 30824),
+    (1, 0, -1, 0, -5163, -8379),
+    (1, 1, 0, 0, 4987, -16675),
+    (2, -1, 1, 0, 4036, -12831),
+    (2, 0, 2, 0, 3994, -10445),
+    (4, 0, 0, 0, 3861, -11650),
+    (2, 0, -3, 0, 3665, 14403),
+    (0, 1, -2, 0, -2689, -7003),
+    (2, 0, -1, 2, -2602, 0),
+    (2, -1, -2, 0, 2390, 10056),
+    (1, 0, 1, 0, -2348, 6322),
+    (2, -2, 0, 0, 2236, -9884),
+    (0, 1, 2, 0, -2120, 5751),
+    (0, 2, 0, 0, -2069, 0),
+    (2, -2, -1, 0, 2048, -4950),
+    (2, 0, 1, -2, -1773, 4130),
+    (2, 0, 0, 2, -1595, 0),
+    (4, -1, -1, 0, 1215, -3958),
+    (0, 0, 2, 2, -1110, 0),
+    (3, 0, -1, 0, -892, 3258),
+    (2, 1, 1, 0, -810, 2616),
+    (4, -1, -2, 0, 759, -1897),
+    (0, 2, -1, 0, -713, -2117),
+    (2, 2, -1, 0, -700, 2354),
+    (2, 1, -2, 0, 691, 0),
+    (2, -1, 0, -2, 596, 0),
+    (4, 0, 1, 0, 549, -1423),
+    (0, 0, 4, 0, 537, -1117),
+    (4, -1, 0, 0, 520, -1571),
+    (1, 0, -2, 0, -487, -1739),
+    (2, 1, 0, -2, -399, 0),
+    (0, 0, 2, -2, -381, -4421),
+    (1, 1, 1, 0, 351, 0),
+    (3, 0, -2, 0, -340, 0),
+    (4, 0, -3, 0, 330, 0),
+    (2, -1, 2, 0, 327, 0),
+    (0, 2, 1, 0, -323, 1165),
+    (1, 1, -1, 0, 299, 0),
+    (2, 0, 3, 0, 294, 0),
+    (2, 0, -1, -2, 0, 8752),
+]
+
+#Multipliers of D, M, Mp and F and amplitude of the latitude terms
+elp82_lat_terms = [
+    (0, 0, 0, 1, 5128122),
+    (0, 0, 1, 1, 280602),
+    (0, 0, 1, -1, 277693),
+    (2, 0, 0, -1, 173237),
+    (2, 0, -1, 1, 55413),
+    (2, 0, -1, -1, 46271),
+    (2, 0, 0, 1, 32573),
+    (0, 0, 2, 1, 17198),
+    (2, 0, 1, -1, 9266),
+    (0, 0, 2, -1, 8822),
+    (2, -1, 0, -1, 8216),
+    (2, 0, -2, -1, 4324),
+    (2, 0, 1, 1, 4200),
+    (2, 1, 0, -1, -3359),
+    (2, -1, -1, 1, 2463),
+    (2, -1, 0, 1, 2211),
+    (2, -1, -1, -1, 2065),
+    (0, 1, -1, -1, -1870),
+    (4, 0, -1, -1, 1828),
+    (0, 1, 0, 1, -1794),
+    (0, 0, 0, 3, -1749),
+    (0, 1, -1, 1, -1565),
+    (1, 0, 0, 1, -1491),
+    (0, 1, 1, 1, -1475),
+    (0, 1, 1, -1, -1410),
+    (0, 1, 0, -1, -1344),
+    (1, 0, 0, -1, -1335),
+    (0, 0, 3, 1, 1107),
+    (4, 0, 0, -1, 1021),
+    (4, 0, -1, 1, 833),
+    (0, 0, 1, -3, 777),
+    (4, 0, -2, 1, 671),
+    (2, 0, 0, -3, 607),
+    (2, 0, 2, -1, 596),
+    (2, -1, 1, -1, 491),
+    (2, 0, -2, 1, -451),
+    (0, 0, 3, -1, 439),
+    (2, 0, 2, 1, 422),
+    (2, 0, -3, -1, 421),
+    (2, 1, -1, 1, -366),
+    (2, 1, 0, 1, -351),
+    (4, 0, 0, 1, 331),
+    (2, -1, 1, 1, 315),
+    (2, -2, 0, -1, 302),
+    (0, 0, 1, 3, -283),
+    (2, 1, 1, -1, -229),
+    (1, 1, 0, -1, 223),
+    (1, 1, 0, 1, 223),
+    (0, 1, -2, -1, -220),
+    (2, 1, -2, -1, -220),
+    (1, 0, 1, 1, -185),
+    (2, -1, -2, -1, 181),
+    (0, 1, 2, 1, -177),
+    (4, 0, -2, -1, 176),
+    (4, -1, -1, -1, 166),
+    (1, 0, 1, -1, -164),
+    (4, 0, 1, -1, 132),
+    (1, 0, -1, -1, -119),
+    (4, -1, 0, -1, 115),
+    (2, -2, 0, 1, 107),
+]
@@ -100,6 +100,19 @@ class Rotation(object):
     dynamic = False
     def __init__(self, frame):
         self.frame = frame
+        self.invalidate()
+
+    def invalidate(self):
+        #Rotations in the frame of the last evaluated time, only used by the dynamic rotations
+        self.memo_time = None
+        self.memo_rotation = None
+        self.memo_equatorial = None
+
+    def update_memo(self, time):
+        if time != self.memo_time:
+            self.memo_rotation = self.get_frame_rotation_at(time)
+            self.memo_equatorial = self.get_frame_equatorial_orientation_at(time)
+            self.memo_time = time
 
     def is_flipped(self):
         return False
@@ -109,7 +122,7 @@ class Rotation(object):
         return group
 
     def update_user_parameters(self):
-        pass
+        self.invalidate()
 
     def set_frame(self, frame):
         self.frame = frame
@@ -118,13 +131,19 @@ class Rotation(object):
         return None
 
     def get_equatorial_orientation_at(self, time):
-        return self.frame.get_abs_orientation(self.get_frame_equatorial_orientation_at(time))
+        if not self.dynamic:
+            return self.frame.get_abs_orientation(self.get_frame_equatorial_orientation_at(time))
+        self.update_memo(time)
+        return self.frame.get_abs_orientation(self.memo_equatorial)
 
     def get_frame_rotation_at(self, time):
         return None
 
     def get_rotation_at(self, time):
-        return self.frame.get_abs_orientation(self.get_frame_rotation_at(time))
+        if not self.dynamic:
+            return self.frame.get_abs_orientation(self.get_frame_rotation_at(time))
+        self.update_memo(time)
+        return self.frame.get_abs_orientation(self.memo_rotation)
 
 class FixedRotation(Rotation):
     def __init__(self, reference_axis, frame):
@@ -139,6 +158,7 @@ class FixedRotation(Rotation):
         return group
 
     def update_user_parameters(self):
+        Rotation.update_user_parameters(self)
         self.reference_axis.update_user_parameters()
 
     def get_frame_equatorial_orientation_at(self, time):
@@ -205,6 +225,7 @@ class UniformRotation(FixedRotation):
         return rotation
 
 class SynchronousRotation(FixedRotation):
+    dynamic = True
     def __init__(self,
                  reference_axis,
                  meridian_angle,
@@ -228,6 +249,7 @@ class SynchronousRotation(FixedRotation):
         return rotation
 
 class FuncRotation(Rotation):
+    dynamic = True
     def __init__(self, rotation):
         Rotation.__init__(self, frame=J2000EquatorialReferenceFrame())
         self.rotation = rotation
@@ -26,13 +26,14 @@ from ..elementsdb import orbit_elements_db
 from ..orbits import FuncOrbit
 from ..frame import J2000EclipticReferenceFrame
 
+from ..pyastro.pyelp82 import elp82_truncated_positions
+
 try:
     from cosmonium_engine import elp82_truncated_pos
-    loaded = True
 except ImportError as e:
-    print("WARNING: Could not load ELP82 C implementation")
+    print("WARNING: Could not load ELP82 C implementation, fallback on python implementation")
     print("\t", e)
-    loaded = False
+    from ..pyastro.pyelp82 import elp82_truncated_pos
 
 class ELP82Truncated(FuncOrbit):
     def __init__(self, period, semi_major_axis, eccentricity):
@@ -49,11 +50,13 @@ class ELP82Truncated(FuncOrbit):
         #The precession must be taken into account
         return elp82_truncated_pos(time)
 
+    def get_frame_positions_at(self, times):
+        return elp82_truncated_positions(times)
+
     def get_frame_rotation_at(self, time):
         return LQuaterniond()
 
 orbit_elements_db.register_category('elp82-trunc', 50)
 orbit_elements_db.register_category('elp82', 100)
 
-if loaded:
-    orbit_elements_db.register_element('elp82-trunc', 'moon', ELP82Truncated(27.322, 384400, 0.0554))
+orbit_elements_db.register_element('elp82-trunc', 'moon', ELP82Truncated(27.322, 384400, 0.0554))
@@ -25,13 +25,14 @@ from ..elementsdb import orbit_elements_db
 from ..orbits import FuncOrbit
 from cosmonium.astro.frame import J2000EclipticReferenceFrame
 
+from ..pyastro.pygust86 import gust86_positions
+
 try:
     from cosmonium_engine import gust86_sat_pos
-    loaded = True
 except ImportError as e:
-    print("WARNING: Could not load GUST86 C implementation")
+    print("WARNING: Could not load GUST86 C implementation, fallback on python implementation")
     print("\t", e)
-    loaded = False
+    from ..pyastro.pygust86 import gust86_sat_pos
 
 class Gust86(FuncOrbit):
     def __init__(self, sat_id, period, semi_major_axis, eccentricity):
@@ -47,13 +48,15 @@ class Gust86(FuncOrbit):
     def get_frame_position_at(self, time):
         return gust86_sat_pos(time, self.sat_id)
 
+    def get_frame_positions_at(self, times):
+        return gust86_positions(times, self.sat_id)
+
     def get_frame_rotation_at(self, time):
         return LQuaterniond()
 
 orbit_elements_db.register_category('gust86', 100)
-if loaded:
-    orbit_elements_db.register_element('gust86', 'ariel',   Gust86(0,  2.520, 190900, 0.0012))
-    orbit_elements_db.register_element('gust86', 'umbriel', Gust86(1,  4.144, 266000, 0.0039))
-    orbit_elements_db.register_element('gust86', 'titania', Gust86(2,  8.706, 436300, 0.0011))
-    orbit_elements_db.register_element('gust86', 'oberon',  Gust86(3, 13.46,  583500, 0.0014))
-    orbit_elements_db.register_element('gust86', 'miranda', Gust86(4,  1.413, 129900, 0.0013))
+orbit_elements_db.register_element('gust86', 'ariel',   Gust86(0,  2.520, 190900, 0.0012))
+orbit_elements_db.register_element('gust86', 'umbriel', Gust86(1,  4.144, 266000, 0.0039))
+orbit_elements_db.register_element('gust86', 'titania', Gust86(2,  8.706, 436300, 0.0011))
+orbit_elements_db.register_element('gust86', 'oberon',  Gust86(3, 13.46,  583500, 0.0014))
+orbit_elements_db.register_element('gust86', 'miranda', Gust86(4,  1.413, 129900, 0.0013))
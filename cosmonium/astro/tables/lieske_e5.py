@@ -25,13 +25,14 @@ from ..elementsdb import orbit_elements_db
 from ..orbits import FuncOrbit
 from cosmonium.astro.frame import J2000EclipticReferenceFrame
 
+from ..pyastro.pylieske_e5 import lieske_e5_positions
+
 try:
     from cosmonium_engine import lieske_e5_sat_pos
-    loaded = True
 except ImportError as e:
-    print("WARNING: Could not load Leske E5 C implementation")
+    print("WARNING: Could not load Leske E5 C implementation, fallback on python implementation")
     print("\t", e)
-    loaded = False
+    from ..pyastro.pylieske_e5 import lieske_e5_sat_pos
 
 class LieskE5(FuncOrbit):
     def __init__(self, sat_id, period, semi_major_axis, eccentricity):
@@ -49,12 +50,14 @@ class LieskE5(FuncOrbit):
         #The precession must be taken into account
         return lieske_e5_sat_pos(time, self.sat_id)
 
+    def get_frame_positions_at(self, times):
+        return lieske_e5_positions(times, self.sat_id)
+
     def get_frame_rotation_at(self, time):
         return LQuaterniond()
 
 orbit_elements_db.register_category('e5', 100)
-if loaded:
-    orbit_elements_db.register_element('e5', 'io',       LieskE5(0,  1.769,  421800, 0.0041))
-    orbit_elements_db.register_element('e5', 'europa',   LieskE5(1,  3.551,  671100, 0.0094))
-    orbit_elements_db.register_element('e5', 'ganymede', LieskE5(2,  7.155, 1070400, 0.0013))
-    orbit_elements_db.register_element('e5', 'callisto', LieskE5(3, 16.69,  1882700, 0.0074))
+orbit_elements_db.register_element('e5', 'io',       LieskE5(0,  1.769,  421800, 0.0041))
+orbit_elements_db.register_element('e5', 'europa',   LieskE5(1,  3.551,  671100, 0.0094))
+orbit_elements_db.register_element('e5', 'ganymede', LieskE5(2,  7.155, 1070400, 0.0013))
+orbit_elements_db.register_element('e5', 'callisto', LieskE5(3, 16.69,  1882700, 0.0074))
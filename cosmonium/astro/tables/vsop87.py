@@ -27,13 +27,14 @@ from ..orbits import FuncOrbit
 from .. import units
 from cosmonium.astro.frame import J2000HeliocentricEclipticReferenceFrame
 
+from ..pyastro.pyvsop87 import vsop87_positions
+
 try:
     from cosmonium_engine import vsop87_pos
-    loaded = True
 except ImportError as e:
-    print("WARNING: Could not load VSOP87 C implementation")
+    print("WARNING: Could not load VSOP87 C implementation, fallback on python implementation")
     print("\t", e)
-    loaded = False
+    from ..pyastro.pyvsop87 import vsop87_pos
 
 class VSOP87(FuncOrbit):
     def __init__(self, planet_id, period, semi_major_axis, eccentricity):
@@ -51,17 +52,19 @@ class VSOP87(FuncOrbit):
         #The precession must be taken into account
         return vsop87_pos(time, self.planet_id)
 
+    def get_frame_positions_at(self, times):
+        return vsop87_positions(times, self.planet_id)
+
     def get_frame_rotation_at(self, time):
         return LQuaterniond()
 
 orbit_elements_db.register_category('vsop87', 100)
 
-if loaded:
-    orbit_elements_db.register_element('vsop87', 'mercury', VSOP87(1,   0.2408467,   0.38709927, 0.20563593))
-    orbit_elements_db.register_element('vsop87', 'venus',   VSOP87(2,   0.61519726,  0.72333566, 0.00677672))
-    orbit_elements_db.register_element('vsop87', 'earth',   VSOP87(3,   1.0000174,   1.00000261, 0.01671123))
-    orbit_elements_db.register_element('vsop87', 'mars',    VSOP87(4,   1.8808476,   1.52371034, 0.09339410))
-    orbit_elements_db.register_element('vsop87', 'jupiter', VSOP87(5,  11.862615,    5.20288700, 0.04838624))
-    orbit_elements_db.register_element('vsop87', 'saturn',  VSOP87(6,  29.447498,    9.53667594, 0.05386179))
-    orbit_elements_db.register_element('vsop87', 'uranus',  VSOP87(7,  84.016846,   19.18916464, 0.04725744))
-    orbit_elements_db.register_element('vsop87', 'neptune', VSOP87(8, 164.79132,    30.06992276, 0.00859048))
+orbit_elements_db.register_element('vsop87', 'mercury', VSOP87(1,   0.2408467,   0.38709927, 0.20563593))
+orbit_elements_db.register_element('vsop87', 'venus',   VSOP87(2,   0.61519726,  0.72333566, 0.00677672))
+orbit_elements_db.register_element('vsop87', 'earth',   VSOP87(3,   1.0000174,   1.00000261, 0.01671123))
+orbit_elements_db.register_element('vsop87', 'mars',    VSOP87(4,   1.8808476,   1.52371034, 0.09339410))
+orbit_elements_db.register_element('vsop87', 'jupiter', VSOP87(5,  11.862615,    5.20288700, 0.04838624))
+orbit_elements_db.register_element('vsop87', 'saturn',  VSOP87(6,  29.447498,    9.53667594, 0.05386179))
+orbit_elements_db.register_element('vsop87', 'uranus',  VSOP87(7,  84.016846,   19.18916464, 0.04725744))
+orbit_elements_db.register_element('vsop87', 'neptune', VSOP87(8, 164.79132,    30.06992276, 0.00859048))
@@ -29,7 +29,7 @@ from .foundation import VisibleObject
 from .shapes import SphereShape, ScaledSphereShape
 from .surfaces import FlatSurface
 from .appearances import Appearance
-from .astro.frame import RelativeReferenceFrame, SynchroneReferenceFrame
+from .astro.frame import RelativeReferenceFrame
 from .astro.orbits import FixedOrbit
 from .astro.rotations import UnknownRotation
 from .astro.astro import lum_to_abs_mag, abs_mag_to_lum, temp_to_radius
@@ -226,10 +226,10 @@ class StellarBody(StellarObject):
             vectors = self.surface.get_normals_at(x, y)
         else:
             vectors = (LVector3d.up(), LVector3d.forward(), LVector3d.left())
-        sync_frame = SynchroneReferenceFrame(self)
-        return (sync_frame.get_orientation().xform(vectors[0]),
-                sync_frame.get_orientation().xform(vectors[1]),
-                sync_frame.get_orientation().xform(vectors[2]))
+        orientation = self.sync_frame.get_orientation()
+        return (orientation.xform(vectors[0]),
+                orientation.xform(vectors[1]),
+                orientation.xform(vectors[2]))
 
     def show_clouds(self):
         if self.clouds:
@@ -307,6 +307,8 @@ class ReflectiveBody(StellarBody):
         return face < 0.0 and distance < radius
 
     def start_shadows_update(self):
+        #The surface of a body created on demand does not exist until the body is resolved
+        if self.surface is None: return
         self.surface.start_shadows_update()
         #TODO: this should be done by looping over components
         if self.clouds is not None:
@@ -315,6 +317,7 @@ class ReflectiveBody(StellarBody):
             self.atmosphere.start_shadows_update()
 
     def add_shadow_target(self, target):
+        if self.surface is None or target.surface is None: return
         self.surface.add_shadow_target(target.surface)
         if target.clouds is not None:
             self.surface.add_shadow_target(target.clouds)
@@ -322,12 +325,23 @@ class ReflectiveBody(StellarBody):
             self.surface.add_shadow_target(target.atmosphere)
 
     def end_shadows_update(self):
+        if self.surface is None: return
         self.surface.end_shadows_update()
         if self.clouds is not None:
             self.clouds.end_shadows_update()
         if self.atmosphere is not None:
             self.atmosphere.end_shadows_update()
 
+    def get_shadows_version(self):
+        if self.surface is None:
+            return -1
+        version = self.surface.shadows.version
+        if self.clouds is not None:
+            version += self.clouds.shadows.version
+        if self.atmosphere is not None:
+            version += self.atmosphere.shadows.version
+        return version
+
     def create_light(self):
         print("Create light for", self.get_name())
         self.directional_light = DirectionalLight('light_source')
@@ -349,6 +363,9 @@ class ReflectiveBody(StellarBody):
     def configure_shape(self):
         StellarBody.configure_shape(self)
         self.surface.create_shadows()
+        for component in (self.surface, self.ring, self.clouds, self.atmosphere):
+            if component is not None:
+                component.shadows.set_receiver(True)
         if self.ring is not None and self.surface is not None:
             #TODO: This should be in start_shadow_update...
             self.ring.shadow_caster.add_target(self.surface)
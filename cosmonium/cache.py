@@ -32,3 +32,42 @@ def create_path_for(*path):
     if not os.path.isdir(final_path):
         os.makedirs(final_path)
     return final_path
+
+def prune_cache_dir(path, extension, budget):
+    #Removes the least recently used entries, using their modification time, until the size of the cache is under budget
+    entries = []
+    total_size = 0
+    for (root, dirs, files) in os.walk(path):
+        for filename in files:
+            filename = os.path.join(root, filename)
+            try:
+                if filename.endswith('.tmp'):
+                    #Left over by an interrupted write
+                    os.remove(filename)
+                    continue
+                if not filename.endswith(extension): continue
+                stat = os.stat(filename)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, filename))
+            total_size += stat.st_size
+    nb_removed = 0
+    if total_size > budget:
+        entries.sort()
+        for (mtime, size, filename) in entries:
+            if total_size <= budget: break
+            try:
+                os.remove(filename)
+            except OSError as e:
+                print("Could not remove cache entry", filename, e)
+                continue
+            total_size -= size
+            nb_removed += 1
+    return (nb_removed, total_size)
+
+def touch_cache_entry(filename):
+    try:
+        #The modification time is used as last access time when the cache is pruned
+        os.utime(filename, None)
+    except OSError:
+        pass
@@ -18,6 +18,15 @@
 #
 from .utils import int_to_color
 
+class CatalogEntry(object):
+    #Object of a catalog found by its name, the object is only created when the entry is resolved
+    def __init__(self, catalog, index):
+        self.catalog = catalog
+        self.index = index
+
+    def resolve(self):
+        return self.catalog.get_object_by_index(self.index)
+
 class ObjectsDB(object):
     def __init__(self):
         self.db = {}
@@ -42,9 +51,14 @@ class ObjectsDB(object):
         return result
 
 class GlobalObjectsDB(object):
+    max_oid = 0xFFFFFF
+
     def __init__(self):
         self.db = {}
         self.oids = []
+        self.catalogs = []
+        self.oids_ranges = []
+        self.oids_ranges_start = self.max_oid
 
     def add(self, body):
         body.oid = len(self.oids)
@@ -53,14 +67,30 @@ class GlobalObjectsDB(object):
         for name in body.names:
             self.db[name.upper()] = body
 
+    def add_catalog(self, catalog):
+        self.catalogs.append(catalog)
+
+    def reserve_oids(self, catalog, count):
+        #Catalog oids are allocated downward from the top of the oid space
+        self.oids_ranges_start -= count
+        self.oids_ranges.append((self.oids_ranges_start, count, catalog))
+        return self.oids_ranges_start
+
     def get(self, name):
-        return self.db.get(name.upper(), None)
+        body = self.db.get(name.upper(), None)
+        if body is None:
+            for catalog in self.catalogs:
+                body = catalog.find_by_name(name)
+                if body is not None: break
+        return body
 
     def get_oid(self, oid):
         if oid < len(self.oids):
             return self.oids[oid]
-        else:
-            return None
+        for (start, count, catalog) in self.oids_ranges:
+            if oid >= start and oid < start + count:
+                return catalog.get_object_by_oid(oid - start)
+        return None
 
     def remove(self, body):
         for name in body.names:
@@ -73,6 +103,13 @@ class GlobalObjectsDB(object):
         for (key, value) in self.db.items():
             if key.startswith(text):
                 result.append((value.get_exact_name(key), value))
+        for catalog in self.catalogs:
+            result += catalog.startswith(text)
         return result
 
+    def resolve(self, value):
+        if isinstance(value, CatalogEntry):
+            return value.resolve()
+        return value
+
 objectsDB = GlobalObjectsDB()
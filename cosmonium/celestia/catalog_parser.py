@@ -0,0 +1,260 @@
+#
+#This file is part of Cosmonium.
+#
+#Copyright (C) 2018-2019 Laurent Deru.
+#
+#Cosmonium is free software: you can redistribute it and/or modify
+#it under the terms of the GNU General Public License as published by
+#the Free Software Foundation, either version 3 of the License, or
+#(at your option) any later version.
+#
+#Cosmonium is distributed in the hope that it will be useful,
+#but WITHOUT ANY WARRANTY; without even the implied warranty of
+#MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#GNU General Public License for more details.
+#
+#You should have received a copy of the GNU General Public License
+#along with Cosmonium.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+#Hand-written parser of the Celestia catalogs (ssc, stc, dsc, ctx), it produces the same definitions as config_parser
+#The parsed definitions are kept in the cache directory and reused as long as the catalog is not modified
+
+from __future__ import print_function
+from __future__ import absolute_import
+
+from ..cache import create_path_for
+from .. import settings
+
+from time import time
+import os
+import io
+import re
+import sys
+import pickle
+import hashlib
+
+#The catalogs are split into strings, literals, comments and words, the words are then converted into names or numbers
+token_re = re.compile(r'"[^"\n]*"|[^\s"\[\]{}()#]+|[][(){}]|#[^\n]*')
+
+literals = frozenset('[]{}()')
+
+#Characters which can not be part of a token, they are skipped like the t_error rule of the PLY lexer does
+illegal_re = re.compile(r'[^\sA-Za-z0-9_.+\-\[\](){}"#]')
+illegal_scan_re = re.compile(r'"[^"\n]*"|#[^\n]*|([^\sA-Za-z0-9_.+\-\[\](){}"#]|")')
+
+#Version of the format of the cached definitions
+cache_version = 1
+
+class ParseError(Exception):
+    pass
+
+def remove_illegal_characters(data, filepath):
+    #The strings and comments are skipped, the illegal characters found elsewhere are reported and replaced by a space
+    parts = []
+    start = 0
+    for match in illegal_scan_re.finditer(data):
+        character = match.group(1)
+        if character is None: continue
+        position = match.start(1)
+        print("%s:%d: Illegal character '%s'" % (filepath, data.count('\n', 0, position) + 1, character))
+        parts.append(data[start:position])
+        start = position + 1
+    parts.append(data[start:])
+    return ' '.join(parts)
+
+def tokenize(data, filepath=None):
+    if illegal_re.search(data) is not None:
+        data = remove_illegal_characters(data, filepath)
+    return iter([token for token in token_re.findall(data) if token[0] != '#'])
+
+def is_name(token):
+    return (token[0].isalpha() or token[0] == '_') and token.isidentifier() and token != 'true' and token != 'false'
+
+def convert(token):
+    #Converts a word into a bool or a number, as done by the grammar of config_parser
+    if token == 'true':
+        return True
+    elif token == 'false':
+        return False
+    try:
+        if '.' in token or 'e' in token or 'E' in token:
+            return float(token)
+        else:
+            return int(token)
+    except ValueError:
+        raise ParseError("Illegal token %s" % token)
+
+def parse_vector(tokens):
+    vector = []
+    for token in tokens:
+        if token == ']':
+            return vector
+        value = convert(token)
+        if value is True or value is False:
+            raise ParseError("Syntax error at token %s" % token)
+        vector.append(value)
+    raise ParseError("SYNTAX ERROR AT EOF")
+
+def parse_entries(tokens):
+    entries = {}
+    for name in tokens:
+        if name == '}':
+            return entries
+        if not is_name(name):
+            raise ParseError("Syntax error at token %s" % name)
+        value = next(tokens, None)
+        if value is None:
+            break
+        first = value[0]
+        if first == '"':
+            entries[name] = value[1:-1]
+        elif first == '[':
+            entries[name] = parse_vector(tokens)
+        elif first == '{':
+            entries[name] = parse_entries(tokens)
+        elif value in literals or is_name(value):
+            raise ParseError("Syntax error at token %s" % value)
+        else:
+            entries[name] = convert(value)
+    raise ParseError("SYNTAX ERROR AT EOF")
+
+def convert_head(token):
+    if token[0] == '"':
+        return (True, token[1:-1])
+    value = convert(token)
+    if not isinstance(value, int) or value is True or value is False:
+        raise ParseError("Syntax error at token %s" % token)
+    return (False, value)
+
+def create_definition(head):
+    #The head is [[disposition] type] [name [parent or alias]]
+    if len(head) >= 2 and is_name(head[0]) and is_name(head[1]):
+        disposition = head[0]
+        item_type = head[1]
+        names = head[2:]
+        if len(names) == 0:
+            raise ParseError("Syntax error at token {")
+    elif len(head) >= 1 and is_name(head[0]):
+        disposition = 'Add'
+        item_type = head[0]
+        names = head[1:]
+    else:
+        disposition = 'Add'
+        item_type = 'Body'
+        names = head
+        if len(names) == 0:
+            raise ParseError("Syntax error at token {")
+    if len(names) > 2:
+        raise ParseError("Syntax error at token %s" % names[2])
+    item_name = None
+    item_parent = None
+    item_alias = None
+    if len(names) > 0:
+        (is_string, item_name) = convert_head(names[0])
+        if len(names) == 2:
+            (second_is_string, second) = convert_head(names[1])
+            if not second_is_string:
+                raise ParseError("Syntax error at token %s" % names[1])
+            if is_string:
+                item_parent = second
+            else:
+                item_alias = second
+    return [disposition, item_type, item_name, item_parent, item_alias]
+
+def parse(data, filepath=None):
+    tokens = tokenize(data, filepath)
+    definitions = []
+    head = []
+    try:
+        for token in tokens:
+            if token == '{':
+                definition = create_definition(head)
+                definition.append(parse_entries(tokens))
+                definitions.append(definition)
+                head = []
+            elif token in literals or len(head) == 4:
+                raise ParseError("Syntax error at token %s" % token)
+            else:
+                head.append(token)
+        if len(head) > 0 or len(definitions) == 0:
+            raise ParseError("SYNTAX ERROR AT EOF")
+    except ParseError as e:
+        print("%s: %s" % (filepath, e))
+        return None
+    return definitions
+
+def parse_with_ply(data):
+    #The PLY parser is only imported when needed as its creation is slow
+    from . import config_parser
+    return config_parser.parse(data)
+
+def get_cache_file(filepath):
+    cache_path = create_path_for('celestia')
+    md5 = hashlib.md5(filepath.encode()).hexdigest()
+    return os.path.join(cache_path, md5 + ".dat")
+
+def load_from_cache(filepath):
+    items = None
+    cache_file = get_cache_file(filepath)
+    if os.path.exists(cache_file):
+        try:
+            with open(cache_file, "rb") as f:
+                (version, mtime, size, data) = pickle.load(f)
+            if version == cache_version and mtime == os.path.getmtime(filepath) and size == os.path.getsize(filepath):
+                print("Loading %s (cached)" % filepath)
+                items = data
+        except (IOError, ValueError, EOFError, pickle.UnpicklingError) as e:
+            print("Could not read cache for", filepath, cache_file, ':', e)
+    return items
+
+def store_to_cache(items, filepath):
+    cache_file = get_cache_file(filepath)
+    tmp_file = cache_file + '.tmp'
+    try:
+        #The entry is written aside and renamed so that an interrupted write does not leave a truncated entry
+        with open(tmp_file, "wb") as f:
+            pickle.dump((cache_version, os.path.getmtime(filepath), os.path.getsize(filepath), items), f, pickle.HIGHEST_PROTOCOL)
+        if os.path.exists(cache_file):
+            os.remove(cache_file)
+        os.rename(tmp_file, cache_file)
+    except (IOError, OSError) as e:
+        print("Could not write cache for", filepath, cache_file, ':', e)
+
+def load_file(filepath, encoding=None):
+    items = None
+    if settings.cache_celestia:
+        items = load_from_cache(filepath)
+    if items is None:
+        data = io.open(filepath, encoding=encoding).read()
+        if settings.celestia_ply_parser:
+            items = parse_with_ply(data)
+        else:
+            items = parse(data, filepath)
+        if settings.cache_celestia and items is not None:
+            store_to_cache(items, filepath)
+    return items
+
+def benchmark(filepaths):
+    #Compare the PLY and the hand-written parsers, and the loading of the cached definitions
+    from . import config_parser
+    print("%-30s %10s %10s %10s %s" % ("File", "PLY (s)", "Parser (s)", "Cache (s)", "Same"))
+    for filepath in filepaths:
+        data = io.open(filepath, encoding='latin-1').read()
+        start = time()
+        ply_items = config_parser.parse(data)
+        ply_time = time() - start
+        start = time()
+        items = parse(data)
+        parser_time = time() - start
+        cached = pickle.dumps(items, pickle.HIGHEST_PROTOCOL)
+        start = time()
+        pickle.loads(cached)
+        cache_time = time() - start
+        print("%-30s %10.3f %10.3f %10.3f %s" % (os.path.basename(filepath), ply_time, parser_time, cache_time, items == ply_items))
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        benchmark(sys.argv[1:])
+    else:
+        print("Usage: %s <catalog> [<catalog>...]" % sys.argv[0])
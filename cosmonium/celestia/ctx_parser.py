@@ -23,7 +23,7 @@ from __future__ import absolute_import
 from ..textures import InvalidTextureSource
 from ..dircontext import defaultDirContext
 from .textures import CelestiaVirtualTextureSource
-from . import config_parser
+from . import catalog_parser
 
 import sys
 import os
@@ -71,11 +71,10 @@ def parse_file(filename, context=defaultDirContext):
         print("Can not find file", filename)
         return InvalidTextureSource()
     try:
-        data = open(filepath).read()
+        items = catalog_parser.load_file(filepath)
     except IOError:
         print("Could not read file", filepath)
         return InvalidTextureSource()
-    items = config_parser.parse(data)
     if items and len(items) == 1:
         return instanciate_item(filepath, context, *items[0])
     else:
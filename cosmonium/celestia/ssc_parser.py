@@ -22,7 +22,7 @@ from __future__ import absolute_import
 
 from panda3d.core import LColor, LQuaterniond
 
-from . import config_parser
+from . import catalog_parser
 from .celestia_utils import instanciate_elliptical_orbit, instanciate_custom_orbit, \
     instanciate_uniform_rotation, instanciate_precessing_rotation, instanciate_custom_rotation, \
     instanciate_reference_frame, \
@@ -32,7 +32,7 @@ from .shaders import LunarLambertLightingModel
 from ..celestia.atmosphere import CelestiaAtmosphere, CelestiaScattering
 from ..universe import Universe
 from ..systems import StellarSystem, SimpleSystem
-from ..bodies import ReflectiveBody, ReferencePoint
+from ..bodies import ReflectiveBody, ReferencePoint, SurfaceFactory
 from ..surfaces import FlatSurface
 from ..bodyelements import Ring, Clouds
 from ..appearances import Appearance
@@ -43,10 +43,10 @@ from ..astro.rotations import FixedRotation, create_uniform_rotation
 from ..astro import units
 from ..astro.frame import J2000EclipticReferenceFrame, RelativeReferenceFrame, EquatorialReferenceFrame
 from ..dircontext import defaultDirContext
+from .. import settings
 
 from time import time
 import sys
-import io
 
 def get_color(value):
     if len(value) == 4:
@@ -135,45 +135,22 @@ def instanciate_rings(data):
                 appearance=appearance,
                 shader=BasicShader())
 
-def instanciate_body(universe, names, is_planet, data):
+#Keys of a body used to create its surface, atmosphere and clouds
+surface_keys = frozenset(['Texture', 'NightTexture', 'BumpHeight', 'BumpMap', 'NormalMap', 'BlendTexture',
+                          'SpecularPower', 'SpecularColor', 'SpecularTexture', 'LunarLambert', 'Mesh', 'MeshCenter',
+                          'Atmosphere'])
+
+def instanciate_surface(radius, data):
     appearance=Appearance()
-    point_color=None
-    radius=1.0
-    oblateness=None
-    scale=None
     lunar_lambert = 0.0
     atmosphere = None
     clouds=None
-    rings=None
-    orbit=None
-    legacy_rotation = False
-    rotation_period = None
-    rotation_obliquity = 0.0
-    rotation_ascending_node = 0.0
-    rotation_offset = 0.0
-    rotation_epoch = units.J2000
-    rotation = None
     model = None
     shape_offset = None
-    albedo = 0.5
     bump_map = None
     bump_height = 1.0
-    orbit_frame = None
-    custom_orbit = False
-    body_frame = None
-    custom_rotation = False
-    if is_planet:
-        body_class="planet"
-        orbit_global_coord=True
-        rotation_global_coord=True
-    else:
-        body_class="moon"
-        orbit_global_coord=False
-        rotation_global_coord=False
     for (key, value) in data.items():
-        if key == 'Radius':
-            radius = value
-        elif key == 'Texture':
+        if key == 'Texture':
             appearance.set_texture(value)
         elif key == 'NightTexture':
             appearance.set_emission_texture(value)
@@ -185,15 +162,11 @@ def instanciate_body(universe, names, is_planet, data):
             bump_map = value
         elif key == 'NormalMap':
             appearance.set_normal_map(value)
-        elif key == 'Color':
-            point_color = get_color(value)
         elif key == 'BlendTexture':
             pass #= value
         elif key == 'SpecularPower':
             #Multiply by 4 as we use Blinn-Phong and not Phong specular
             appearance.shininess = value * 4.0
-        elif key == 'Albedo':
-            albedo = value
         elif key == 'SpecularColor':
             appearance.specularColor = get_color(value)
         elif key == 'SpecularTexture':
@@ -204,6 +177,84 @@ def instanciate_body(universe, names, is_planet, data):
             model = value
         elif key == 'MeshCenter':
             shape_offset = value
+        elif key == 'Atmosphere':
+            (atmosphere, clouds) = instanciate_atmosphere(value)
+    if model != None and not (model.endswith('.cmod') or model.endswith('.cms')):
+        shape=MeshShape(model=model, radius=radius, offset=shape_offset)
+    else:
+        shape=SphereShape()
+    if bump_map is not None:
+        appearance.set_bump_map(bump_map, bump_height)
+    lighting_model = None
+    if lunar_lambert > 0.0:
+        lighting_model = LunarLambertLightingModel()
+    else:
+        lighting_model = LambertPhongLightingModel()
+    surface = FlatSurface(
+                          shape=shape,
+                          appearance=appearance,
+                          shader=BasicShader(lighting_model=lighting_model))
+    if atmosphere is not None:
+        atmosphere.add_shape_object(surface)
+        if clouds is not None:
+            atmosphere.add_shape_object(clouds)
+    return (surface, atmosphere, clouds)
+
+class CelestiaSurfaceFactory(SurfaceFactory):
+    #Creates the surface, the atmosphere and the clouds of the body the first time it is resolved
+    def __init__(self, data):
+        self.data = data
+        self.surface = None
+
+    def create(self, body):
+        if self.surface is None:
+            (self.surface, atmosphere, clouds) = instanciate_surface(body.radius, self.data)
+            self.data = None
+            if atmosphere is not None:
+                body.atmosphere = atmosphere
+                atmosphere.owner = body
+            if clouds is not None:
+                body.clouds = clouds
+                clouds.owner = body
+        return self.surface
+
+def instanciate_body(universe, names, is_planet, data):
+    point_color=None
+    radius=1.0
+    oblateness=None
+    scale=None
+    surface_data = {}
+    rings=None
+    orbit=None
+    legacy_rotation = False
+    rotation_period = None
+    rotation_obliquity = 0.0
+    rotation_ascending_node = 0.0
+    rotation_offset = 0.0
+    rotation_epoch = units.J2000
+    rotation = None
+    albedo = 0.5
+    orbit_frame = None
+    custom_orbit = False
+    body_frame = None
+    custom_rotation = False
+    if is_planet:
+        body_class="planet"
+        orbit_global_coord=True
+        rotation_global_coord=True
+    else:
+        body_class="moon"
+        orbit_global_coord=False
+        rotation_global_coord=False
+    for (key, value) in data.items():
+        if key in surface_keys:
+            surface_data[key] = value
+        elif key == 'Radius':
+            radius = value
+        elif key == 'Color':
+            point_color = get_color(value)
+        elif key == 'Albedo':
+            albedo = value
         elif key == 'Oblateness':
             oblateness = value
         elif key == 'SemiAxes':
@@ -218,8 +269,6 @@ def instanciate_body(universe, names, is_planet, data):
             pass #= value
         elif key == 'Rings':
             rings = instanciate_rings(value)
-        elif key == 'Atmosphere':
-            (atmosphere, clouds) = instanciate_atmosphere(value)
         elif key == 'EllipticalOrbit':
             orbit = instanciate_elliptical_orbit(value, orbit_global_coord)
         elif key == 'CustomOrbit':
@@ -282,24 +331,18 @@ def instanciate_body(universe, names, is_planet, data):
         rotation = FixedRotation(LQuaterniond(), frame=body_frame)
     elif not custom_rotation:
         rotation.set_frame(body_frame)
-    if model != None and not (model.endswith('.cmod') or model.endswith('.cms')):
-        shape=MeshShape(model=model, radius=radius, offset=shape_offset)
+    if settings.lazy_celestia_bodies:
+        surface = None
+        surface_factory = CelestiaSurfaceFactory(surface_data)
+        atmosphere = None
+        clouds = None
     else:
-        shape=SphereShape()
-    if bump_map is not None:
-        appearance.set_bump_map(bump_map, bump_height)
-    lighting_model = None
-    if lunar_lambert > 0.0:
-        lighting_model = LunarLambertLightingModel()
-    else:
-        lighting_model = LambertPhongLightingModel()
-    surface = FlatSurface(
-                          shape=shape,
-                          appearance=appearance,
-                          shader=BasicShader(lighting_model=lighting_model))
+        (surface, atmosphere, clouds) = instanciate_surface(radius, surface_data)
+        surface_factory = None
     body = ReflectiveBody(names=names,
                           radius=radius,
                           surface=surface,
+                          surface_factory=surface_factory,
                           oblateness=oblateness,
                           orbit=orbit,
                           rotation=rotation,
@@ -307,10 +350,6 @@ def instanciate_body(universe, names, is_planet, data):
                           atmosphere=atmosphere,
                           clouds=clouds,
                           point_color=point_color)
-    if atmosphere is not None:
-        atmosphere.add_shape_object(surface)
-        if clouds is not None:
-            atmosphere.add_shape_object(clouds)
     body.albedo = albedo
     body.body_class = body_class
     return body
@@ -442,8 +481,7 @@ def parse_file(filename, universe, context=defaultDirContext):
         start = time()
         print("Loading", filepath)
         base.splash.set_text("Loading %s" % filepath)
-        data = io.open(filepath, encoding='latin-1').read()
-        items = config_parser.parse(data)
+        items = catalog_parser.load_file(filepath, encoding='latin-1')
         if items is not None:
             instanciate(items, universe)
         end = time()
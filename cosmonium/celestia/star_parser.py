@@ -19,10 +19,9 @@
 
 from __future__ import print_function
 
-from panda3d.core import LVector3d
-
 from ..universe import Universe
 from ..bodies import Star
+from ..starcatalog import StarCatalog
 from ..astro.spectraltype import spectralTypeStringDecoder, spectralTypeIntDecoder
 from ..astro.orbits import FixedPosition
 from ..astro.rotations import UnknownRotation
@@ -35,6 +34,7 @@ from .bodies import celestiaStarSurfaceFactory
 
 from time import time
 import struct
+import numpy
 import sys
 import io
 import re
@@ -80,12 +80,18 @@ def load_text(filename, names, universe, context=defaultDirContext):
         print("File not found", filename)
         return {}
 
+star_record = numpy.dtype([('catalog', '<u4'),
+                         ('x', '<f4'), ('y', '<f4'), ('z', '<f4'),
+                         ('abs_magnitude', '<i2'),
+                         ('spectral_type', '<u2')])
+
 def do_load_bin(filepath, names, universe):
     start = time()
     print("Loading", filepath)
     base.splash.set_text("Loading %s" % filepath)
     data = open(filepath, 'rb')
     field=data.read(8+2+4)
+    data.close()
     header, version, count = struct.unpack("<8shi", field)
     if not header == b"CELSTARS":
         print("Invalid header", header)
@@ -94,24 +100,22 @@ def do_load_bin(filepath, names, universe):
         print("Invalid version", version)
         return
     print("Found", count, "stars")
-    fmt="<ifffhh"
-    size=struct.calcsize(fmt)
-    for i in range(count):
-        fields = data.read(size)
-        catNo, x, y, z, abs_magnitude, spectral_type = struct.unpack(fmt, fields)
-        if catNo in names:
-            name = names[catNo]
-        else:
-            name = "HIP %d" % catNo
-        position = LVector3d(x * units.Ly, -z * units.Ly, y * units.Ly)
-        orbit = FixedPosition(position=position)
-        star = Star(name,
-                    surface_factory=celestiaStarSurfaceFactory,
-                    spectral_type=spectralTypeIntDecoder.decode(spectral_type),
-                    abs_magnitude=abs_magnitude / 256.0,
-                    orbit=orbit,
-                    rotation=UnknownRotation())
-        universe.add_child_star_fast(star)
+    records = numpy.memmap(filepath, dtype=star_record, mode='r', offset=8+2+4, shape=(count,))
+    positions = numpy.empty((count, 3))
+    positions[:, 0] = records['x']
+    positions[:, 1] = -records['z']
+    positions[:, 2] = records['y']
+    positions *= units.Ly
+    catalog = StarCatalog(filepath,
+                          catalog_numbers=numpy.array(records['catalog']),
+                          positions=positions,
+                          abs_magnitudes=records['abs_magnitude'] / 256.0,
+                          spectral_types=numpy.array(records['spectral_type']),
+                          spectral_type_decoder=spectralTypeIntDecoder,
+                          names=names,
+                          surface_factory=celestiaStarSurfaceFactory)
+    del records
+    universe.add_star_catalog(catalog)
     end = time()
     print("Load time:", end - start)
 
@@ -155,6 +159,6 @@ if __name__ == '__main__':
     if len(sys.argv) == 2:
         universe=Universe(None)
         if sys.argv[1].endswith('.txt'):
-            struct = load_text(sys.argv[1], universe)
+            load_text(sys.argv[1], universe)
         else:
-            struct = load_bin(sys.argv[1], universe)
+            load_bin(sys.argv[1], universe)
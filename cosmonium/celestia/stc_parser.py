@@ -34,11 +34,10 @@ from ..dircontext import defaultDirContext
 from .celestia_utils import instanciate_elliptical_orbit, instanciate_custom_orbit, \
     instanciate_uniform_rotation, instanciate_custom_rotation
 from .bodies import celestiaStarSurfaceFactory
-from . import config_parser
+from . import catalog_parser
 
 from time import time
 import sys
-import io
 
 def names_list(name):
     return name.split(':')
@@ -194,8 +193,7 @@ def parse_file(filename, universe, context=defaultDirContext):
         start = time()
         print("Loading", filepath)
         base.splash.set_text("Loading %s" % filepath)
-        data = io.open(filepath, encoding='latin-1').read()
-        items = config_parser.parse(data)
+        items = catalog_parser.load_file(filepath, encoding='latin-1')
         if items is not None:
             instanciate(items, universe)
         end = time()
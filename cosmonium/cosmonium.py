@@ -43,6 +43,11 @@ from .systems import StellarSystem, SimpleSystem
 from .universe import Universe
 from .annotations import Grid
 from .pointsset import PointsSet
+from .labelsset import LabelsSet
+from .linesset import LinesSet
+from .patchescache import patchesCache
+from .shaderscache import shadersDiskCache
+from .procedural.tilescache import tilesDiskCache
 from .sprites import RoundDiskPointSprite, GaussianPointSprite, ExpPointSprite, MergeSprite
 from .astro.frame import J2000EquatorialReferenceFrame, J2000EclipticReferenceFrame
 from .astro.frame import AbsoluteReferenceFrame, SynchroneReferenceFrame, RelativeReferenceFrame
@@ -67,6 +72,7 @@ from .astro import units
 from .parsers.yamlparser import YamlModuleParser
 from .fonts import fontsManager
 from .pstats import pstat
+from .profiler import profiler
 from . import utils
 from . import workers
 from . import cache
@@ -134,6 +140,10 @@ class CosmoniumBase(ShowBase):
         self.disableMouse()
         self.render_textures = check_and_create_rendering_buffers(self)
         cache.init_cache()
+        if settings.shaders_disk_cache:
+            shadersDiskCache.prune()
+        if settings.tiles_disk_cache:
+            tilesDiskCache.prune()
         self.register_events()
 
         self.world = self.render.attachNewNode("world")
@@ -146,6 +156,7 @@ class CosmoniumBase(ShowBase):
 
         workers.asyncTextureLoader = workers.AsyncTextureLoader(self)
         workers.syncTextureLoader = workers.SyncTextureLoader()
+        workers.asyncGeometryBuilder = workers.AsyncGeometryBuilder(self)
 
     def load_lang(self, domain, locale_path):
         languages = None
@@ -454,10 +465,20 @@ class Cosmonium(CosmoniumBase):
         if settings.render_sprite_points:
             self.pointset.instance.reparentTo(self.world)
 
-        self.haloset = PointsSet(use_sprites=True, sprite=ExpPointSprite(size=256, max_value=0.6), background=settings.halo_depth)
+        self.haloset = PointsSet(use_sprites=True, sprite=ExpPointSprite(size=256, max_value=0.6), background=settings.halo_depth, name='halos')
         if settings.render_sprite_points:
             self.haloset.instance.reparentTo(self.world)
 
+        self.labelset = LabelsSet()
+        self.labelset.instance.reparentTo(self.annotation)
+        self.background_labelset = LabelsSet(background=settings.constellations_depth, name='background-labels')
+        self.background_labelset.instance.reparentTo(self.annotation)
+
+        self.asterisms_set = LinesSet('asterisms', settings.asterism_thickness, settings.asterisms_depth)
+        self.asterisms_set.instance.reparentTo(self.annotation)
+        self.boundaries_set = LinesSet('boundaries', settings.boundary_thickness, settings.boundaries_depth)
+        self.boundaries_set.instance.reparentTo(self.annotation)
+
         render.setAntialias(AntialiasAttrib.MMultisample)
         self.setFrameRateMeter(False)
         self.render.set_attrib(DepthTestAttrib.make(DepthTestAttrib.M_less_equal))
@@ -900,11 +921,18 @@ class Cosmonium(CosmoniumBase):
     def update_instances(self):
         self.pointset.reset()
         self.haloset.reset()
+        self.labelset.reset()
+        self.background_labelset.reset()
         self.universe.check_and_update_instance(self.observer.get_camera_pos(), self.observer.get_camera_rot(), self.pointset)
         for controller in self.controllers_to_update:
             controller.check_and_update_instance(self.observer.get_camera_pos(), self.observer.get_camera_rot(), self.pointset)
         self.pointset.update()
         self.haloset.update()
+        self.labelset.update(self.observer.get_camera_rot())
+        self.background_labelset.update(self.observer.get_camera_rot())
+        self.asterisms_set.update()
+        self.boundaries_set.update()
+        patchesCache.update()
         self.gui.update_status()
 
     def time_task(self, task):
@@ -913,6 +941,7 @@ class Cosmonium(CosmoniumBase):
         else:
             dt = 0
 
+        profiler.start_frame(globalClock.get_frame_count())
         self.gui.update()
 
         self.time.update_time(dt)
@@ -929,6 +958,7 @@ class Cosmonium(CosmoniumBase):
         StellarObject.nb_instance = 0
 
         if self.trigger_check_settings:
+            shadersDiskCache.check_settings()
             self.universe.check_settings()
             #TODO: This should be done by a container object
             self.ecliptic_grid.check_settings()
@@ -999,6 +1029,11 @@ class Cosmonium(CosmoniumBase):
         obs.set_level(StellarObject.nb_obs)
         visibility.set_level(StellarObject.nb_visibility)
         instance.set_level(StellarObject.nb_instance)
+        profiler.set_counter('nb_update', StellarObject.nb_update)
+        profiler.set_counter('nb_obs', StellarObject.nb_obs)
+        profiler.set_counter('nb_visibility', StellarObject.nb_visibility)
+        profiler.set_counter('nb_instance', StellarObject.nb_instance)
+        profiler.end_frame()
 
         if settings.color_picking:
             self.oid_texture.clear_image()
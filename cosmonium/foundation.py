@@ -20,7 +20,7 @@
 from __future__ import print_function
 from __future__ import absolute_import
 
-from panda3d.core import LVecBase3, LQuaternion, NodePath, LColor, DrawMask
+from panda3d.core import LVecBase3, LVector3, LVector3d, LQuaternion, NodePath, LColor, DrawMask
 from panda3d.core import GeomNode, TextNode, CardMaker
 
 from .bodyclass import bodyClasses
@@ -351,6 +351,10 @@ class ObjectLabel(VisibleObject):
     def __init__(self, names):
         VisibleObject.__init__(self, names)
         self.fade = 1.0
+        self.layout = None
+        self.layout_text = None
+        self.label_color = None
+        self.layout_color = None
 
     @classmethod
     def create_shader(cls):
@@ -423,6 +427,57 @@ class ObjectLabel(VisibleObject):
         card_node.setPythonTag('owner', self.parent)
         self.look_at = self.instance.attachNewNode("dummy")
 
+    def remove_instance(self):
+        VisibleObject.remove_instance(self)
+        self.layout = None
+
+    def do_show(self):
+        #The batched labels have no instance, they are drawn by the labels set
+        if not settings.batch_labels:
+            VisibleObject.do_show(self)
+
+    def check_and_update_instance(self, camera_pos, camera_rot, pointset):
+        if settings.batch_labels:
+            if self.shown and self.visible:
+                self.update_instance(camera_pos, camera_rot)
+        else:
+            VisibleObject.check_and_update_instance(self, camera_pos, camera_rot, pointset)
+
+    def get_labels_set(self):
+        return self.context.labelset
+
+    def get_position_and_scale(self, camera_rot):
+        return (None, 0.0)
+
+    def add_to_labels_set(self, position, scale):
+        labels_set = self.get_labels_set()
+        #The text and the color of the label can be modified at any time
+        text = self.parent.get_label_text()
+        if self.layout is None or text != self.layout_text:
+            self.layout = labels_set.get_layout(bayer.decode_name(text))
+            self.layout_text = text
+        color = tuple(self.parent.get_label_color())
+        if color != self.layout_color:
+            self.label_color = srgb_to_linear(color)
+            self.layout_color = color
+        labels_set.add_label(self.layout, position, scale, self.label_color, self.fade, self.get_oid_color())
+
+    def update_instance(self, camera_pos, camera_rot):
+        (position, scale) = self.get_position_and_scale(camera_rot)
+        if scale < 1e-7:
+            print("Label too far", self.get_name())
+            scale = 1e-7
+        if settings.batch_labels:
+            if position is not None:
+                self.add_to_labels_set(position, scale)
+            return
+        if position is not None:
+            self.instance.setPos(*position)
+        self.look_at.set_pos(LVector3(*(camera_rot.xform(LVector3d.forward()))))
+        self.label_instance.look_at(self.look_at, LVector3(), LVector3(*(camera_rot.xform(LVector3d.up()))))
+        self.instance.set_color_scale(LColor(self.fade, self.fade, self.fade, 1.0))
+        self.instance.setScale(scale)
+
 class LabelledObject(CompositeObject):
     def __init__(self, names):
         CompositeObject.__init__(self, names)
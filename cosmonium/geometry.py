@@ -24,12 +24,13 @@ from __future__ import print_function
 from panda3d.core import Geom, GeomNode, GeomPatches, GeomPoints, GeomVertexData, GeomVertexArrayFormat, InternalName,\
     LVector3d, GlobPattern, BoundingBox, LPoint3, BoundingSphere
 from panda3d.core import GeomVertexFormat, GeomTriangles, GeomVertexWriter, ColorAttrib
-from panda3d.core import NodePath, VBase3, Vec3, LPoint3d, LPoint2d, BitMask32, LVector3
+from panda3d.core import NodePath, VBase3, Vec3, LPoint3d, LPoint2d, BitMask32
 from panda3d.egg import EggData, EggVertexPool, EggVertex, EggPolygon, loadEggData
 
 from . import settings
 
 from math import sin, cos, pi, atan2, sqrt, asin
+import numpy
 
 def empty_node(prefix, color=False):
     path = NodePath(prefix + '_path')
@@ -85,6 +86,79 @@ def empty_geom(prefix, nb_data, nb_vertices, points=False, normal=True, texture=
         prim.reserve_num_vertices(nb_vertices)
     return (gvw, gcw, gtw, gnw, gtanw, gbiw, prim, geom)
 
+def write_vertex_data(geom, columns):
+    #Copy the attributes, given as arrays with one row per vertex, in the interleaved vertex array in one pass
+    gvd = geom.modify_vertex_data()
+    array_format = gvd.get_format().get_array(0)
+    stride = array_format.get_stride() // 4
+    nb_rows = len(columns[0][1])
+    gvd.unclean_set_num_rows(nb_rows)
+    data = numpy.asarray(memoryview(gvd.modify_array(0))).view(numpy.float32).reshape(nb_rows, stride)
+    for (name, values) in columns:
+        column = array_format.get_column(name)
+        start = column.get_start() // 4
+        data[:, start:start + column.get_num_components()] = values
+
+primitives_cache = {}
+
+def set_cached_primitives(prim, key, builder, *args):
+    #The topology of a patch only depends on its configuration, the index array is built once and shared
+    if not key in primitives_cache:
+        template = GeomTriangles(Geom.UHStatic)
+        builder(template, *args)
+        template.closePrimitive()
+        primitives_cache[key] = (template.get_index_type(), template.get_vertices())
+    (index_type, vertices) = primitives_cache[key]
+    prim.set_index_type(index_type)
+    prim.set_vertices(vertices)
+
+def normalize_rows(vectors):
+    return vectors / numpy.sqrt(numpy.einsum('ij,ij->i', vectors, vectors))[:, numpy.newaxis]
+
+def make_patch_grid(inner, skirts):
+    #Returns the grid coordinates of the vertices of a square patch, followed by the vertices of the 4 skirts
+    nb_vertices = inner + 1
+    (i, j) = numpy.meshgrid(numpy.arange(nb_vertices, dtype=numpy.float64), numpy.arange(nb_vertices, dtype=numpy.float64), indexing='ij')
+    i = i.ravel()
+    j = j.ravel()
+    if skirts:
+        b = numpy.arange(nb_vertices, dtype=numpy.float64)
+        first = numpy.zeros(nb_vertices)
+        last = numpy.full(nb_vertices, float(inner))
+        i = numpy.concatenate((i, first, last, b, b))
+        j = numpy.concatenate((j, b, b, first, last))
+    return (i, j)
+
+def make_patch_texcoords(i, j, inner, inv_u, inv_v, swap_uv):
+    u = i / inner
+    v = j / inner
+    if inv_u:
+        u = 1.0 - u
+    if inv_v:
+        v = 1.0 - v
+    if swap_uv:
+        u, v = v, u
+    return numpy.column_stack((u, v))
+
+def make_patch_square_primitives(prim, inner, nb_vertices, ratio):
+    skirts = settings.use_patch_skirts
+    if settings.use_patch_adaptation:
+        key = ('adapted', inner, tuple(ratio), skirts)
+        set_cached_primitives(prim, key, make_adapted_square_primitives_all, inner, nb_vertices, ratio, skirts)
+    else:
+        key = ('square', inner, skirts)
+        set_cached_primitives(prim, key, make_square_primitives_all, inner, nb_vertices, skirts)
+
+def make_adapted_square_primitives_all(prim, inner, nb_vertices, ratio, skirts):
+    make_adapted_square_primitives(prim, inner, nb_vertices, ratio)
+    if skirts:
+        make_adapted_square_primitives_skirt(prim, inner, nb_vertices, ratio)
+
+def make_square_primitives_all(prim, inner, nb_vertices, skirts):
+    make_square_primitives(prim, inner, nb_vertices)
+    if skirts:
+        make_primitives_skirt(prim, inner, nb_vertices)
+
 def BoundingBoxGeom(box):
     (path, node) = empty_node('bb')
     (gvw, gcw, gtw, gnw, gtanw, gbiw, prim, geom) = empty_geom('bb', 8, 12, normal=False, texture=False, tanbin=False)
@@ -288,6 +362,13 @@ def UVPatchNormal(x0, y0, x1, y1):
     z = -cos(pi * (y0 + dy / 2))
     return LVector3d(x, y, z)
 
+def make_uv_primitives(prim, rings, sectors):
+    r_sectors = sectors + 1
+    for r in range(0, rings):
+        for s in range(0, sectors):
+            prim.addVertices(r * r_sectors + s, r * r_sectors + (s+1), (r+1) * r_sectors + s)
+            prim.addVertices(r * r_sectors + (s+1), (r+1) * r_sectors + (s+1), (r+1) * r_sectors + s)
+
 def UVPatch(radius, rings, sectors, x0, y0, x1, y1, global_texture=False, inv_texture_u=False, inv_texture_v=False, offset=None):
     r_sectors = sectors + 1
     r_rings = rings + 1
@@ -298,56 +379,39 @@ def UVPatch(radius, rings, sectors, x0, y0, x1, y1, global_texture=False, inv_te
     dx = x1 - x0
     dy = y1 - y0
 
+    (r, s) = numpy.meshgrid(numpy.arange(r_rings, dtype=numpy.float64), numpy.arange(r_sectors, dtype=numpy.float64), indexing='ij')
+    r = r.ravel()
+    s = s.ravel()
+    cos_s = numpy.cos(2*pi * (x0 + s * dx / sectors) + pi)
+    sin_s = numpy.sin(2*pi * (x0 + s * dx / sectors) + pi)
+    sin_r = numpy.sin(pi * (y0 + r * dy / rings))
+    cos_r = numpy.cos(pi * (y0 + r * dy / rings))
+    normals = numpy.column_stack((cos_s * sin_r, sin_s * sin_r, -cos_r))
+    if global_texture:
+        texcoords = numpy.column_stack((x0 + s * dx / sectors, y0 + r * dy / rings))
+    else:
+        u = s / sectors
+        v = r / rings
+        if inv_texture_v:
+            v = 1.0 - v
+        if inv_texture_u:
+            u = 1.0 - u
+        texcoords = numpy.column_stack((u, v))
+    vertices = normals * radius
     if offset is not None:
         normal = UVPatchNormal(x0, y0, x1, y1)
-    
-    for r in range(0, r_rings):
-        for s in range(0, r_sectors):
-            cos_s = cos(2*pi * (x0 + s * dx / sectors) + pi)
-            sin_s = sin(2*pi * (x0 + s * dx / sectors) + pi)
-            sin_r = sin(pi * (y0 + r * dy / rings))
-            cos_r = cos(pi * (y0 + r * dy / rings))
-            x = cos_s * sin_r
-            y = sin_s * sin_r
-            z = -cos_r
-            if global_texture:
-                gtw.add_data2f((x0 + s * dx / sectors), (y0 + r * dy / rings))
-            else:
-                u = s / sectors
-                v = r / rings
-                if inv_texture_v:
-                    v = 1.0 - v
-                if inv_texture_u:
-                    u = 1.0 - u
-                gtw.add_data2f(u, v)
-            if offset is not None:
-                gvw.add_data3f(x * radius - normal[0] * offset,
-                               y * radius - normal[1] * offset,
-                               z * radius - normal[2] * offset)
-            else:
-                gvw.add_data3f(x * radius, y * radius, z * radius)
-            gnw.add_data3f(x, y, z)
-            #Derivation wrt s and normalization (sin_r is dropped)
-            gtanw.add_data3f(-sin_s, cos_s, 0) #-y, x, 0
-            #Derivation wrt r
-            binormal = LVector3d(cos_s * cos_r, sin_s * cos_r, sin_r)
-            binormal.normalize()
-            gbiw.add_data3f(*binormal)
-
-    for r in range(0, r_rings - 1):
-        for s in range(0, r_sectors - 1):
-#             if y0 == 0 and r == 0:
-#                 #prim.addVertices((r+1) * r_sectors + (s+1), (r+1) * r_sectors + s, r * r_sectors + (s+1))
-#             elif y1 == rings and r == r_rings - 1:
-#                 #prim.addVertices((r+1) * r_sectors + (s+1), (r+1) * r_sectors + s, r * r_sectors + (s+1))
-#             else:
-#             if y0 >= 0.5:
-                prim.addVertices(r * r_sectors + s, r * r_sectors + (s+1), (r+1) * r_sectors + s)
-                prim.addVertices(r * r_sectors + (s+1), (r+1) * r_sectors + (s+1), (r+1) * r_sectors + s)
-#             else:
-#                 prim.addVertices((r + 1) * r_sectors + s, r * r_sectors + (s+1), r * r_sectors + s)
-#                 prim.addVertices(r * r_sectors + (s+1), (r+1) * r_sectors + s, (r + 1) * r_sectors + (s+1))
-    prim.closePrimitive()
+        vertices -= numpy.array(tuple(normal)) * offset
+    #Derivation wrt s and normalization (sin_r is dropped)
+    tangents = numpy.column_stack((-sin_s, cos_s, numpy.zeros(len(s))))
+    #Derivation wrt r
+    binormals = normalize_rows(numpy.column_stack((cos_s * cos_r, sin_s * cos_r, sin_r)))
+    write_vertex_data(geom, [(InternalName.get_vertex(), vertices),
+                             (InternalName.get_texcoord(), texcoords),
+                             (InternalName.get_normal(), normals),
+                             (InternalName.get_tangent(), tangents),
+                             (InternalName.get_binormal(), binormals)])
+
+    set_cached_primitives(prim, ('uv', rings, sectors), make_uv_primitives, rings, sectors)
     geom.addPrimitive(prim)
     node.add_geom(geom)
     return path
@@ -724,70 +788,17 @@ def Tile(size, inner, outer=None, inv_u=False, inv_v=False, swap_uv=False):
     (gvw, gcw, gtw, gnw, gtanw, gbiw, prim, geom) = empty_geom('cube', nb_points, nb_primitives, tanbin=True)
     node.add_geom(geom)
 
-    for i in range(0, nb_vertices):
-        for j in range(0, nb_vertices):
-            u = float(i) / inner
-            v = float(j) / inner
-
-            x = u
-            y = v
-
-            if inv_u:
-                u = 1.0 - u
-            if inv_v:
-                v = 1.0 - v
-            if swap_uv:
-                gtw.add_data2f(v, u)
-            else:
-                gtw.add_data2f(u, v)
-            gvw.add_data3f(x * size, y * size, 0)
-            gnw.add_data3f(0, 0, 1.0)
-            gtanw.add_data3f(1, 0, 0)
-            gbiw.add_data3f(0, 1, 0)
-
-    if settings.use_patch_skirts:
-        for a in range(0, 4):
-            for b in range(0, nb_vertices):
-                if a == 0:
-                    i = 0
-                    j = b
-                elif a == 1:
-                    i = inner
-                    j = b
-                elif a == 2:
-                    i = b
-                    j = 0
-                elif a == 3:
-                    i = b
-                    j = inner
-                u = float(i) / inner
-                v = float(j) / inner
-
-                x = u
-                y = v
-
-                if inv_u:
-                    u = 1.0 - u
-                if inv_v:
-                    v = 1.0 - v
-                if swap_uv:
-                    gtw.add_data2f(v, u)
-                else:
-                    gtw.add_data2f(u, v)
-                gvw.add_data3f(x * size, y * size, -size)
-                gnw.add_data3f(0, 0, 1.0)
-                gtanw.add_data3f(1, 0, 0)
-                gbiw.add_data3f(0, 1, 0)
-
-    if settings.use_patch_adaptation:
-        make_adapted_square_primitives(prim, inner, nb_vertices, ratio)
-        if settings.use_patch_skirts:
-            make_adapted_square_primitives_skirt(prim, inner, nb_vertices, ratio)
-    else:
-        make_square_primitives(prim, inner, nb_vertices)
-        if settings.use_patch_skirts:
-            make_primitives_skirt(prim, inner, nb_vertices)
-    prim.closePrimitive()
+    (i, j) = make_patch_grid(inner, settings.use_patch_skirts)
+    nb_rows = len(i)
+    vertices = numpy.column_stack((i / inner * size, j / inner * size, numpy.zeros(nb_rows)))
+    vertices[nb_vertices * nb_vertices:, 2] = -size
+    write_vertex_data(geom, [(InternalName.get_vertex(), vertices),
+                             (InternalName.get_texcoord(), make_patch_texcoords(i, j, inner, inv_u, inv_v, swap_uv)),
+                             (InternalName.get_normal(), (0, 0, 1.0)),
+                             (InternalName.get_tangent(), (1, 0, 0)),
+                             (InternalName.get_binormal(), (0, 1, 0))])
+
+    make_patch_square_primitives(prim, inner, nb_vertices, ratio)
     geom.addPrimitive(prim)
 
     return path
@@ -910,6 +921,23 @@ def SquarePatch(height, inner, outer,
 
     return path
 
+def make_patch_offsets(nb_rows, nb_vertices, inner, dx, dy, offset):
+    #The skirts are moved further below the surface by the size of a cell
+    if offset is None:
+        offset = 0.0
+    offsets = numpy.full(nb_rows, float(offset))
+    offsets[nb_vertices * nb_vertices:] += sqrt(dx * dx + dy * dy) / inner
+    return offsets
+
+def orient_tangents(tangents, binormals, inv_u, inv_v, swap_uv):
+    if inv_u:
+        tangents = -tangents
+    if inv_v:
+        binormals = -binormals
+    if swap_uv:
+        tangents, binormals = binormals, tangents
+    return (tangents, binormals)
+
 def SquaredDistanceSquarePatch(height, inner, outer,
                 x0, y0, x1, y1,
                 inv_u=False, inv_v=False, swap_uv=False,
@@ -924,116 +952,31 @@ def SquaredDistanceSquarePatch(height, inner, outer,
     (gvw, gcw, gtw, gnw, gtanw, gbiw, prim, geom) = empty_geom('cube', nb_points, nb_primitives, tanbin=True)
     node.add_geom(geom)
 
-    if offset is not None:
-        normal = SquaredDistanceSquarePatchNormal(x0, y0, x1, y1, x_inverted, y_inverted, xy_swap)
+    normal = SquaredDistanceSquarePatchNormal(x0, y0, x1, y1, x_inverted, y_inverted, xy_swap)
 
     (x0, y0, x1, y1, dx, dy) = convert_xy(x0, y0, x1, y1, x_inverted, y_inverted, xy_swap)
 
-    for i in range(0, nb_vertices):
-        for j in range(0, nb_vertices):
-            u = float(i) / inner
-            v = float(j) / inner
-            x = x0 + i * dx / inner
-            y = y0 + j * dy / inner
-            x = 2.0 * x - 1.0
-            y = 2.0 * y - 1.0
-            z = 1.0
-            x2 = x * x
-            y2 = y * y
-            z2 = z * z
-            xp = x * sqrt(1.0 - y2 * 0.5 - z2 * 0.5 + y2 * z2 / 3.0)
-            yp = y * sqrt(1.0 - z2 * 0.5 - x2 * 0.5 + z2 * x2 / 3.0)
-            zp = z * sqrt(1.0 - x2 * 0.5 - y2 * 0.5 + x2 * y2 / 3.0)
-            if inv_u:
-                u = 1.0 - u
-            if inv_v:
-                v = 1.0 - v
-            if swap_uv:
-                u, v = v, u
-            gtw.add_data2f(u, v)
-            if offset is not None:
-                gvw.add_data3f(xp * height - normal[0] * offset,
-                               yp * height - normal[1] * offset,
-                               zp * height - normal[2] * offset)
-            else:
-                gvw.add_data3f(xp * height, yp * height, zp * height)
-            gnw.add_data3f(xp, yp, zp)
-            tan = LVector3(1.0, x * y * (z2 / 3.0 - 0.5), x * z * (y2 / 3.0 - 0.5))
-            tan.normalize()
-            bin = LVector3(x * y * (z2 / 3.0 - 0.5), 1.0, y * z * (x2 / 3.0 - 0.5))
-            bin.normalize()
-            if inv_u: tan = -tan
-            if inv_v: bin = -bin
-            if swap_uv:
-                tan, bin = bin, tan
-            gtanw.add_data3(tan)
-            gbiw.add_data3(bin)
-
-    if settings.use_patch_skirts:
-        if offset is None:
-            offset = 0
-        offset = offset + sqrt(dx * dx + dy * dy) / inner
-        for a in range(0, 4):
-            for b in range(0, nb_vertices):
-                if a == 0:
-                    i = 0
-                    j = b
-                elif a == 1:
-                    i = inner
-                    j = b
-                elif a == 2:
-                    i = b
-                    j = 0
-                elif a == 3:
-                    i = b
-                    j = inner
-                u = float(i) / inner
-                v = float(j) / inner
-                x = x0 + i * dx / inner
-                y = y0 + j * dy / inner
-                x = 2.0 * x - 1.0
-                y = 2.0 * y - 1.0
-                z = 1.0
-                x2 = x * x
-                y2 = y * y
-                z2 = z * z
-                xp = x * sqrt(1.0 - y2 * 0.5 - z2 * 0.5 + y2 * z2 / 3.0)
-                yp = y * sqrt(1.0 - z2 * 0.5 - x2 * 0.5 + z2 * x2 / 3.0)
-                zp = z * sqrt(1.0 - x2 * 0.5 - y2 * 0.5 + x2 * y2 / 3.0)
-                if inv_u:
-                    u = 1.0 - u
-                if inv_v:
-                    v = 1.0 - v
-                if swap_uv:
-                    u, v = v, u
-                gtw.add_data2f(u, v)
-                if offset is not None:
-                    gvw.add_data3f(xp * height - normal[0] * offset,
-                                   yp * height - normal[1] * offset,
-                                   zp * height - normal[2] * offset)
-                else:
-                    gvw.add_data3f(xp * height, yp * height, zp * height)
-                gnw.add_data3f(xp, yp, zp)
-                tan = LVector3(1.0, x * y * (z2 / 3.0 - 0.5), x * z * (y2 / 3.0 - 0.5))
-                tan.normalize()
-                bin = LVector3(x * y * (z2 / 3.0 - 0.5), 1.0, y * z * (x2 / 3.0 - 0.5))
-                bin.normalize()
-                if inv_u: tan = -tan
-                if inv_v: bin = -bin
-                if swap_uv:
-                    tan, bin = bin, tan
-                gtanw.add_data3(tan)
-                gbiw.add_data3(bin)
-
-    if settings.use_patch_adaptation:
-        make_adapted_square_primitives(prim, inner, nb_vertices, ratio)
-        if settings.use_patch_skirts:
-            make_adapted_square_primitives_skirt(prim, inner, nb_vertices, ratio)
-    else:
-        make_square_primitives(prim, inner, nb_vertices)
-        if settings.use_patch_skirts:
-            make_primitives_skirt(prim, inner, nb_vertices)
-    prim.closePrimitive()
+    (i, j) = make_patch_grid(inner, settings.use_patch_skirts)
+    x = 2.0 * (x0 + i * dx / inner) - 1.0
+    y = 2.0 * (y0 + j * dy / inner) - 1.0
+    x2 = x * x
+    y2 = y * y
+    xp = x * numpy.sqrt(0.5 - y2 / 6.0)
+    yp = y * numpy.sqrt(0.5 - x2 / 6.0)
+    zp = numpy.sqrt(1.0 - x2 * 0.5 - y2 * 0.5 + x2 * y2 / 3.0)
+    normals = numpy.column_stack((xp, yp, zp))
+    offsets = make_patch_offsets(len(x), nb_vertices, inner, dx, dy, offset)
+    vertices = normals * height - numpy.array(tuple(normal)) * offsets[:, numpy.newaxis]
+    tangents = normalize_rows(numpy.column_stack((numpy.ones(len(x)), x * y * (1.0 / 3.0 - 0.5), x * (y2 / 3.0 - 0.5))))
+    binormals = normalize_rows(numpy.column_stack((x * y * (1.0 / 3.0 - 0.5), numpy.ones(len(x)), y * (x2 / 3.0 - 0.5))))
+    (tangents, binormals) = orient_tangents(tangents, binormals, inv_u, inv_v, swap_uv)
+    write_vertex_data(geom, [(InternalName.get_vertex(), vertices),
+                             (InternalName.get_texcoord(), make_patch_texcoords(i, j, inner, inv_u, inv_v, swap_uv)),
+                             (InternalName.get_normal(), normals),
+                             (InternalName.get_tangent(), tangents),
+                             (InternalName.get_binormal(), binormals)])
+
+    make_patch_square_primitives(prim, inner, nb_vertices, ratio)
     geom.addPrimitive(prim)
 
     return path
@@ -1109,104 +1052,26 @@ def NormalizedSquarePatch(height, inner, outer,
     (gvw, gcw, gtw, gnw, gtanw, gbiw, prim, geom) = empty_geom('cube', nb_points, nb_primitives, tanbin=True)
     node.add_geom(geom)
 
-    if offset is not None:
-        normal = NormalizedSquarePatchNormal(x0, y0, x1, y1, x_inverted, y_inverted, xy_swap)
+    normal = NormalizedSquarePatchNormal(x0, y0, x1, y1, x_inverted, y_inverted, xy_swap)
 
     (x0, y0, x1, y1, dx, dy) = convert_xy(x0, y0, x1, y1, x_inverted, y_inverted, xy_swap)
 
-    for i in range(0, nb_vertices):
-        for j in range(0, nb_vertices):
-            x = x0 + i * dx / inner
-            y = y0 + j * dy / inner
-            x = 2.0 * x - 1.0
-            y = 2.0 * y - 1.0
-            vec = LVector3d(x, y, 1.0)
-            vec.normalize()
-            u = float(i) / inner
-            v = float(j) / inner
-            if inv_u:
-                u = 1.0 - u
-            if inv_v:
-                v = 1.0 - v
-            if swap_uv:
-                u, v = v, u
-            gtw.add_data2f(u, v)
-            nvec = vec
-            vec = vec * height
-            if offset is not None:
-                vec = vec - normal * offset
-            gvw.add_data3f(*vec)
-            gnw.add_data3f(nvec.x, nvec.y, nvec.z)
-            tan = LVector3(1.0 + y*y, -x*y, -x)
-            tan.normalize()
-            bin = LVector3(x * y, 1.0 + x*x, -y)
-            bin.normalize()
-            if inv_u: tan = -tan
-            if inv_v: bin = -bin
-            if swap_uv:
-                tan, bin = bin, tan
-            gtanw.add_data3(tan)
-            gbiw.add_data3(bin)
-
-    if settings.use_patch_skirts:
-        if offset is None:
-            offset = 0
-        offset = offset + sqrt(dx * dx + dy * dy) / inner
-        for a in range(0, 4):
-            for b in range(0, nb_vertices):
-                if a == 0:
-                    i = 0
-                    j = b
-                elif a == 1:
-                    i = inner
-                    j = b
-                elif a == 2:
-                    i = b
-                    j = 0
-                elif a == 3:
-                    i = b
-                    j = inner
-                x = x0 + i * dx / inner
-                y = y0 + j * dy / inner
-                x = 2.0 * x - 1.0
-                y = 2.0 * y - 1.0
-                vec = LVector3d(x, y, 1.0)
-                vec.normalize()
-                u = float(i) / inner
-                v = float(j) / inner
-                if inv_u:
-                    u = 1.0 - u
-                if inv_v:
-                    v = 1.0 - v
-                if swap_uv:
-                    u, v = v, u
-                gtw.add_data2f(u, v)
-                nvec = vec
-                vec = vec * height
-                if offset is not None:
-                    vec = vec - normal * offset
-                gvw.add_data3f(*vec)
-                gnw.add_data3f(nvec.x, nvec.y, nvec.z)
-                tan = LVector3(1.0 + y*y, -x*y, -x)
-                tan.normalize()
-                bin = LVector3(x * y, 1.0 + x*x, -y)
-                bin.normalize()
-                if inv_u: tan = -tan
-                if inv_v: bin = -bin
-                if swap_uv:
-                    tan, bin = bin, tan
-                gtanw.add_data3(tan)
-                gbiw.add_data3(bin)
-
-    if settings.use_patch_adaptation:
-        make_adapted_square_primitives(prim, inner, nb_vertices, ratio)
-        if settings.use_patch_skirts:
-            make_adapted_square_primitives_skirt(prim, inner, nb_vertices, ratio)
-    else:
-        make_square_primitives(prim, inner, nb_vertices)
-        if settings.use_patch_skirts:
-            make_primitives_skirt(prim, inner, nb_vertices)
-    prim.closePrimitive()
+    (i, j) = make_patch_grid(inner, settings.use_patch_skirts)
+    x = 2.0 * (x0 + i * dx / inner) - 1.0
+    y = 2.0 * (y0 + j * dy / inner) - 1.0
+    normals = normalize_rows(numpy.column_stack((x, y, numpy.ones(len(x)))))
+    offsets = make_patch_offsets(len(x), nb_vertices, inner, dx, dy, offset)
+    vertices = normals * height - numpy.array(tuple(normal)) * offsets[:, numpy.newaxis]
+    tangents = normalize_rows(numpy.column_stack((1.0 + y * y, -x * y, -x)))
+    binormals = normalize_rows(numpy.column_stack((x * y, 1.0 + x * x, -y)))
+    (tangents, binormals) = orient_tangents(tangents, binormals, inv_u, inv_v, swap_uv)
+    write_vertex_data(geom, [(InternalName.get_vertex(), vertices),
+                             (InternalName.get_texcoord(), make_patch_texcoords(i, j, inner, inv_u, inv_v, swap_uv)),
+                             (InternalName.get_normal(), normals),
+                             (InternalName.get_tangent(), tangents),
+                             (InternalName.get_binormal(), binormals)])
+
+    make_patch_square_primitives(prim, inner, nb_vertices, ratio)
     geom.addPrimitive(prim)
 
     return path
@@ -24,6 +24,7 @@ from panda3d.core import LVector2, Texture, LColor
 from .patchedshapes import PatchLodControl
 from .textures import TexCoord, AutoTextureSource, TextureBase, HeightMapTexture
 from .interpolator import BilinearInterpolator
+from .patchescache import PatchMap, texture_sizes
 from .dircontext import defaultDirContext
 
 import traceback
@@ -414,7 +415,21 @@ class PatchedHeightmap(Heightmap):
         self.patch_factory = patch_factory
         self.max_lod = max_lod
         self.normal_scale_lod = True
-        self.map_patch = {}
+        self.map_patch = PatchMap(self.get_patch_sizes, self.get_patch_parent_key)
+
+    def get_patch_sizes(self, heightmap):
+        if not heightmap.heightmap_ready:
+            return None
+        if heightmap.cloned:
+            #The texture is owned by the parent heightmap
+            return (0, 0)
+        return texture_sizes(heightmap.texture)
+
+    def get_patch_parent_key(self, heightmap):
+        #The cloned heightmaps share the texture of their parent
+        if heightmap.cloned and heightmap.parent_heightmap is not None:
+            return heightmap.parent_heightmap.patch.str_id()
+        return None
 
     def get_u_scale(self, patch):
         if self.normal_scale_lod:
@@ -431,16 +446,23 @@ class PatchedHeightmap(Heightmap):
             return self.v_scale
 
     def get_texture_offset(self, patch):
-        return self.map_patch[patch.str_id()].texture_offset
+        heightmap = self.map_patch.get(patch.str_id())
+        if heightmap is None:
+            return LVector2()
+        return heightmap.texture_offset
 
     def get_texture_scale(self, patch):
-        return self.map_patch[patch.str_id()].texture_scale
+        heightmap = self.map_patch.get(patch.str_id())
+        if heightmap is None:
+            return LVector2(1, 1)
+        return heightmap.texture_scale
 
     def get_heightmap(self, patch):
         return self.map_patch.get(patch.str_id(), None)
 
     def create_heightmap(self, patch, callback=None, cb_args=()):
-        if not patch.str_id() in self.map_patch:
+        heightmap = self.map_patch.find(patch.str_id())
+        if heightmap is None:
             #TODO: Should be done by inheritance
             if patch.coord == TexCoord.Cylindrical:
                 x = patch.sector
@@ -457,14 +479,14 @@ class PatchedHeightmap(Heightmap):
             #TODO: Should be done with a factory
             heightmap = self.patch_factory.create_patch(parent=self, x=x, y=y, scale=patch.scale, lod=patch.lod, density=self.size,
                                                        coord=patch.coord, face=face)
-            self.map_patch[patch.str_id()] = heightmap
+            self.map_patch.add(patch.str_id(), heightmap, patch)
             #TODO: Should be linked properly
             heightmap.patch = patch
             if patch.parent is not None:
-                heightmap.parent_heightmap = self.map_patch[patch.parent.str_id()]
+                heightmap.parent_heightmap = self.map_patch.get(patch.parent.str_id())
             else:
                 heightmap.parent_heightmap = None
-            if patch.lod > self.max_lod and patch.parent is not None:
+            if patch.lod > self.max_lod and heightmap.parent_heightmap is not None:
                 #print("CLONE", patch.str_id())
                 heightmap.calc_sub_patch()
                 #print(patch.str_id(), ':', parent_heightmap.lod, heightmap.texture_offset, heightmap.texture_scale)
@@ -475,15 +497,15 @@ class PatchedHeightmap(Heightmap):
                 heightmap.load(patch, callback, cb_args)
         else:
             #print("CACHE", patch.str_id())
-            heightmap = self.map_patch[patch.str_id()]
             if heightmap.is_ready() and callback is not None:
                 callback(heightmap, *cb_args)
             else:
                 print("PATCH NOT READY?", heightmap.heightmap_ready, callback)
 
     def apply(self, patch):
-        heightmap = self.map_patch[patch.str_id()]
-        heightmap.apply(patch)
+        heightmap = self.map_patch.get(patch.str_id())
+        if heightmap is not None:
+            heightmap.apply(patch)
 
 class StackedHeightmapPatch(HeightmapPatch):
     def __init__(self, patches, *args, **kwargs):
@@ -0,0 +1,214 @@
+#
+#This file is part of Cosmonium.
+#
+#Copyright (C) 2018-2019 Laurent Deru.
+#
+#Cosmonium is free software: you can redistribute it and/or modify
+#it under the terms of the GNU General Public License as published by
+#the Free Software Foundation, either version 3 of the License, or
+#(at your option) any later version.
+#
+#Cosmonium is distributed in the hope that it will be useful,
+#but WITHOUT ANY WARRANTY; without even the implied warranty of
+#MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#GNU General Public License for more details.
+#
+#You should have received a copy of the GNU General Public License
+#along with Cosmonium.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+from __future__ import print_function
+from __future__ import absolute_import
+
+from panda3d.core import GeomVertexArrayFormat, InternalName, GeomVertexFormat, GeomVertexData
+from panda3d.core import GeomTriangles, Geom, GeomNode, NodePath, OmniBoundingVolume
+from panda3d.core import TextNode, LVecBase4, LVector3d
+from .foundation import VisibleObject, ObjectLabel
+from .appearances import ModelAppearance
+from .shaders import BasicShader, FlatLightingModel
+from .utils import TransparencyBlend
+from .pstats import levelpstat
+
+import numpy
+
+class LabelsAtlas(object):
+    #The glyphs are rasterized once in the pages of the dynamic font, the layout of each label string is kept and
+    #reused by all the labels with the same text. The layout holds a reference on its glyphs, the dynamic font
+    #reuses the slots of the unreferenced glyphs when a page is full.
+    def __init__(self, font):
+        self.font = font
+        self.layouts = {}
+
+    def get_layout(self, text):
+        layout = self.layouts.get(text)
+        if layout is None:
+            layout = self.create_layout(text)
+            self.layouts[text] = layout
+        return layout
+
+    def create_layout(self, text):
+        #Returns, for each page of the font, the page texture and the corners and texture coordinates of the glyphs
+        pages = {}
+        dimensions = LVecBase4()
+        texcoords = LVecBase4()
+        x = 0.0
+        for character in text:
+            glyph = self.font.get_glyph(ord(character))
+            if glyph is None: continue
+            if glyph.has_quad() and glyph.get_quad(dimensions, texcoords):
+                (left, bottom, right, top) = dimensions
+                (u0, v0, u1, v1) = texcoords
+                page = glyph.get_page()
+                (_, corners, uvs, glyphs) = pages.setdefault(page.get_name(), (page, [], [], []))
+                glyphs.append(glyph)
+                corners.extend(((x + left, bottom), (x + right, bottom), (x + right, top), (x + left, top)))
+                uvs.extend(((u0, v0), (u1, v0), (u1, v1), (u0, v1)))
+            x += glyph.get_advance()
+        layout = []
+        for (name, (page, corners, uvs, glyphs)) in pages.items():
+            layout.append((name, page, numpy.array(corners, dtype=numpy.float32), numpy.array(uvs, dtype=numpy.float32), glyphs))
+        return layout
+
+class LabelsBatch(object):
+    #The quads of all the glyphs of one font page, drawn with a single geom
+    min_capacity = 256
+
+    def __init__(self, name, page, parent):
+        self.capacity = 0
+        self.nb_glyphs = 0
+        array = GeomVertexArrayFormat()
+        array.addColumn(InternalName.get_vertex(), 3, Geom.NTFloat32, Geom.CPoint)
+        array.addColumn(InternalName.get_color(), 4, Geom.NTFloat32, Geom.CColor)
+        array.addColumn(InternalName.get_texcoord(), 2, Geom.NTFloat32, Geom.CTexcoord)
+        oids_column_name = InternalName.make('oid')
+        array.addColumn(oids_column_name, 4, Geom.NTFloat32, Geom.COther)
+        self.stride = array.get_stride() // 4
+        self.vertex_column = array.get_column(InternalName.get_vertex()).get_start() // 4
+        self.color_column = array.get_column(InternalName.get_color()).get_start() // 4
+        self.texcoord_column = array.get_column(InternalName.get_texcoord()).get_start() // 4
+        self.oid_column = array.get_column(oids_column_name).get_start() // 4
+        format = GeomVertexFormat()
+        format.addArray(array)
+        format = GeomVertexFormat.registerFormat(format)
+        self.vdata = GeomVertexData('vdata', format, Geom.UH_dynamic)
+        self.triangles = GeomTriangles(Geom.UH_dynamic)
+        self.triangles.set_index_type(Geom.NT_uint32)
+        self.geom = Geom(self.vdata)
+        self.geom.add_primitive(self.triangles)
+        self.gnode = GeomNode(name)
+        self.gnode.add_geom(self.geom)
+        self.gnode.set_bounds(OmniBoundingVolume())
+        self.gnode.set_final(True)
+        self.instance = parent.attach_new_node(self.gnode)
+        self.instance.set_texture(page)
+
+    def reserve_glyphs(self, count):
+        if count <= self.capacity: return
+        self.capacity = max(count, self.capacity * 2, self.min_capacity)
+        self.vdata.unclean_set_num_rows(self.capacity * 4)
+
+    def update_arrays(self, vertices, colors, texcoords, oids):
+        count = len(vertices) // 4
+        self.reserve_glyphs(count)
+        if count > 0:
+            rows = numpy.asarray(memoryview(self.vdata.modify_array(0))).view(numpy.float32).reshape(self.capacity * 4, self.stride)
+            rows[:count * 4, self.vertex_column:self.vertex_column + 3] = vertices
+            rows[:count * 4, self.color_column:self.color_column + 4] = colors
+            rows[:count * 4, self.texcoord_column:self.texcoord_column + 2] = texcoords
+            rows[:count * 4, self.oid_column:self.oid_column + 4] = oids
+            del rows
+        if count != self.nb_glyphs:
+            #Two triangles per glyph quad
+            indices = self.triangles.modify_vertices()
+            indices.unclean_set_num_rows(count * 6)
+            if count > 0:
+                quad = numpy.array([0, 1, 2, 0, 2, 3], dtype=numpy.uint32)
+                view = numpy.asarray(memoryview(indices)).view(numpy.uint32)
+                view[:] = (numpy.arange(count, dtype=numpy.uint32)[:, numpy.newaxis] * 4 + quad).reshape(-1)
+                del view
+            self.nb_glyphs = count
+
+class LabelsSet(VisibleObject):
+    #Draws all the visible labels with one geom per font page instead of one node per label. The labels register their
+    #position, scale, color and oid each frame, the quads are oriented towards the camera when the set is updated.
+    def __init__(self, background=None, name='labels'):
+        VisibleObject.__init__(self, name)
+        self.background = background
+        self.atlas = None
+        self.batches = {}
+        self.labels = []
+        self.glyphs_pstat = levelpstat(name + ' glyphs')
+        self.instance = NodePath(name)
+        self.instance_ready = True
+        self.appearance = ModelAppearance()
+        self.appearance.has_attribute_color = True
+        self.appearance.has_material = False
+        self.appearance.texture = True
+        self.appearance.texture_index = 0
+        self.appearance.nb_textures = 1
+        self.appearance.transparency = True
+        self.appearance.transparency_blend = TransparencyBlend.TB_Alpha
+        self.appearance.alpha_mask = True
+        self.shader = BasicShader(lighting_model=FlatLightingModel(), vertex_oids=True)
+        self.shader.apply(self, self.appearance)
+        self.shader.update(self, self.appearance)
+        TransparencyBlend.apply(self.appearance.transparency_blend, self.instance)
+        if self.background is not None:
+            self.instance.setBin('background', self.background)
+        self.instance.set_depth_write(False)
+
+    def get_layout(self, text):
+        if self.atlas is None:
+            if not ObjectLabel.font_init:
+                ObjectLabel.load_font()
+            font = ObjectLabel.font
+            if font is None:
+                font = TextNode.get_default_font()
+            self.atlas = LabelsAtlas(font)
+        return self.atlas.get_layout(text)
+
+    def reset(self):
+        self.labels = []
+
+    def add_label(self, layout, position, scale, color, fade, oid):
+        if oid is None:
+            oid = (0, 0, 0, 0)
+        (r, g, b, a) = color
+        self.labels.append((layout, tuple(position), scale, (r * fade, g * fade, b * fade, a), tuple(oid)))
+
+    def update(self, camera_rot):
+        #The labels are split by font page and each page is written at once
+        pages = {}
+        for (layout, position, scale, color, oid) in self.labels:
+            for (name, page, corners, uvs, glyphs) in layout:
+                entry = pages.get(name)
+                if entry is None:
+                    entry = (page, [], [], [], [], [], [])
+                    pages[name] = entry
+                (_, entry_corners, entry_uvs, counts, positions, params, oids) = entry
+                entry_corners.append(corners)
+                entry_uvs.append(uvs)
+                counts.append(len(corners))
+                positions.append(position)
+                params.append((scale,) + color)
+                oids.append(oid)
+        right = numpy.array(tuple(camera_rot.xform(LVector3d.right())))
+        up = numpy.array(tuple(camera_rot.xform(LVector3d.up())))
+        nb_glyphs = 0
+        for (name, (page, corners, uvs, counts, positions, params, oids)) in pages.items():
+            batch = self.batches.get(name)
+            if batch is None:
+                batch = LabelsBatch(name, page, self.instance)
+                self.batches[name] = batch
+            corners = numpy.concatenate(corners)
+            positions = numpy.repeat(numpy.array(positions), counts, axis=0)
+            params = numpy.repeat(numpy.array(params), counts, axis=0)
+            oids = numpy.repeat(numpy.array(oids), counts, axis=0)
+            scales = params[:, 0]
+            vertices = positions + (corners[:, 0] * scales)[:, numpy.newaxis] * right + (corners[:, 1] * scales)[:, numpy.newaxis] * up
+            batch.update_arrays(vertices, params[:, 1:], numpy.concatenate(uvs), oids)
+            nb_glyphs += len(corners) // 4
+        for (name, batch) in self.batches.items():
+            if name not in pages:
+                batch.update_arrays(numpy.empty((0, 3)), None, None, None)
+        self.glyphs_pstat.set_level(nb_glyphs)
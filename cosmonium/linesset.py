@@ -0,0 +1,142 @@
+#
+#This file is part of Cosmonium.
+#
+#Copyright (C) 2018-2019 Laurent Deru.
+#
+#Cosmonium is free software: you can redistribute it and/or modify
+#it under the terms of the GNU General Public License as published by
+#the Free Software Foundation, either version 3 of the License, or
+#(at your option) any later version.
+#
+#Cosmonium is distributed in the hope that it will be useful,
+#but WITHOUT ANY WARRANTY; without even the implied warranty of
+#MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#GNU General Public License for more details.
+#
+#You should have received a copy of the GNU General Public License
+#along with Cosmonium.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+from __future__ import print_function
+from __future__ import absolute_import
+
+from panda3d.core import GeomVertexArrayFormat, InternalName, GeomVertexFormat, GeomVertexData
+from panda3d.core import GeomLines, Geom, GeomNode, NodePath, OmniBoundingVolume
+from .foundation import VisibleObject
+from .utils import srgb_to_linear
+
+import numpy
+
+class LinesSet(VisibleObject):
+    #Packs the static lines of many annotations in a single geom. The vertices of each object are kept in a contiguous
+    #range, showing or hiding an object only rewrites the index buffer and changing its color only its vertex range.
+    def __init__(self, name, thickness, background=None):
+        VisibleObject.__init__(self, name)
+        self.background = background
+        self.objects = {}
+        self.shown_objects = set()
+        self.geometry_dirty = False
+        self.indices_dirty = False
+        self.nb_vertices = 0
+        array = GeomVertexArrayFormat()
+        array.addColumn(InternalName.get_vertex(), 3, Geom.NTFloat32, Geom.CPoint)
+        array.addColumn(InternalName.get_color(), 4, Geom.NTFloat32, Geom.CColor)
+        self.stride = array.get_stride() // 4
+        self.vertex_column = array.get_column(InternalName.get_vertex()).get_start() // 4
+        self.color_column = array.get_column(InternalName.get_color()).get_start() // 4
+        format = GeomVertexFormat()
+        format.addArray(array)
+        format = GeomVertexFormat.registerFormat(format)
+        self.vdata = GeomVertexData('vdata', format, Geom.UH_static)
+        self.lines = GeomLines(Geom.UH_dynamic)
+        self.lines.set_index_type(Geom.NT_uint32)
+        self.geom = Geom(self.vdata)
+        self.geom.add_primitive(self.lines)
+        self.gnode = GeomNode(name)
+        self.gnode.add_geom(self.geom)
+        #The geometry is rewritten in place, its bounds are never recomputed
+        self.gnode.set_bounds(OmniBoundingVolume())
+        self.gnode.set_final(True)
+        self.instance = NodePath(self.gnode)
+        self.instance.setRenderModeThickness(thickness)
+        if self.background is not None:
+            self.instance.setBin('background', self.background)
+        self.instance.set_depth_write(False)
+
+    def has_object(self, obj):
+        return obj in self.objects
+
+    def add_object(self, obj, color, vertices, indices):
+        #The indices are the pairs of vertices of each segment, relative to the vertices of the object
+        self.objects[obj] = [numpy.array(vertices, dtype=numpy.float32).reshape(-1, 3),
+                             numpy.array(indices, dtype=numpy.uint32),
+                             tuple(srgb_to_linear(color)),
+                             0]
+        self.geometry_dirty = True
+
+    def remove_object(self, obj):
+        if obj in self.objects:
+            del self.objects[obj]
+            self.shown_objects.discard(obj)
+            self.geometry_dirty = True
+
+    def show_object(self, obj):
+        if obj not in self.shown_objects:
+            self.shown_objects.add(obj)
+            self.indices_dirty = True
+
+    def hide_object(self, obj):
+        if obj in self.shown_objects:
+            self.shown_objects.remove(obj)
+            self.indices_dirty = True
+
+    def set_object_color(self, obj, color):
+        entry = self.objects.get(obj)
+        if entry is None: return
+        entry[2] = tuple(srgb_to_linear(color))
+        if not self.geometry_dirty:
+            (vertices, indices, color, start) = entry
+            rows = self.get_rows()
+            rows[start:start + len(vertices), self.color_column:self.color_column + 4] = color
+            del rows
+
+    def get_rows(self):
+        return numpy.asarray(memoryview(self.vdata.modify_array(0))).view(numpy.float32).reshape(-1, self.stride)
+
+    def update_geometry(self):
+        count = sum(len(entry[0]) for entry in self.objects.values())
+        self.vdata.unclean_set_num_rows(count)
+        if count > 0:
+            rows = self.get_rows()
+            start = 0
+            for entry in self.objects.values():
+                (vertices, indices, color, _) = entry
+                end = start + len(vertices)
+                rows[start:end, self.vertex_column:self.vertex_column + 3] = vertices
+                rows[start:end, self.color_column:self.color_column + 4] = color
+                entry[3] = start
+                start = end
+            del rows
+        self.nb_vertices = count
+        self.geometry_dirty = False
+        self.indices_dirty = True
+
+    def update_indices(self):
+        indices = [entry[1] + entry[3] for (obj, entry) in self.objects.items() if obj in self.shown_objects]
+        if len(indices) > 0:
+            indices = numpy.concatenate(indices)
+        else:
+            indices = numpy.empty(0, dtype=numpy.uint32)
+        array = self.lines.modify_vertices()
+        array.unclean_set_num_rows(len(indices))
+        if len(indices) > 0:
+            view = numpy.asarray(memoryview(array)).view(numpy.uint32)
+            view[:] = indices
+            del view
+        self.indices_dirty = False
+
+    def update(self):
+        if self.geometry_dirty:
+            self.update_geometry()
+        if self.indices_dirty:
+            self.update_indices()
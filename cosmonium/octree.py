@@ -19,13 +19,22 @@
 from __future__ import print_function
 from __future__ import absolute_import
 
+from . import settings
+
 try:
     from cosmonium_engine import OctreeNode, OctreeLeaf, InfiniteFrustum, VisibleObjectsTraverser
+    IncrementalVisibility = None
     hasOctreeLeaf = True
     print("Using C++ Engine")
 except ImportError as e:
     print("WARNING: Could not load Octree C implementation, fallback on python implementation")
     print("\t", e)
-    from .pyengine.pyoctree import OctreeNode, OctreeLeaf, VisibleObjectsTraverser
-    from .pyengine.pyfrustum import InfiniteFrustum
+    if settings.batched_octree:
+        print("Using batched octree traversal")
+        from .pyengine.npoctree import OctreeNode, OctreeLeaf, VisibleObjectsTraverser, IncrementalVisibility
+        from .pyengine.npfrustum import InfiniteFrustum
+    else:
+        from .pyengine.pyoctree import OctreeNode, OctreeLeaf, VisibleObjectsTraverser
+        from .pyengine.pyfrustum import InfiniteFrustum
+        IncrementalVisibility = None
     hasOctreeLeaf = False
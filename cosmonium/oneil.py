@@ -27,8 +27,12 @@ from .shaders import StructuredShader, ShaderProgram, BasicShader, LightingModel
 from .utils import TransparencyBlend
 from .parameters import AutoUserParameter, UserParameter
 from .procedural.generator import GeneratorVertexShader, TexGenerator
+from .procedural.tilescache import tilesDiskCache
+from . import settings
 
 from math import pow, pi
+import hashlib
+import numpy
 
 class ONeilAtmosphereBase(Atmosphere):
     def __init__(self, shape, appearance, shader):
@@ -158,6 +162,7 @@ class ONeilAtmosphere(ONeilAtmosphereBase):
         self.height = height
         self.lookup_size = lookup_size
         self.lookup_samples = lookup_samples
+        self.lookup_key = None
         self.pbOpticalDepth = None
         shader = BasicShader(lighting_model=LightingModel(), scattering=self.create_scattering_shader(atmosphere=True, displacement=False, extinction=False))
         self.set_shader(shader)
@@ -166,7 +171,7 @@ class ONeilAtmosphere(ONeilAtmosphereBase):
     def get_generator(cls, size):
         if not size in cls.tex_generators:
             cls.tex_generators[size] = TexGenerator()
-            texture_format = Texture.F_rgb32
+            texture_format = Texture.F_rgba32
             cls.tex_generators[size].make_buffer(size, size, texture_format)
         tex_generator = cls.tex_generators[size]
         return tex_generator
@@ -188,16 +193,9 @@ class ONeilAtmosphere(ONeilAtmosphereBase):
         return scattering
 
     def generate_lookup_table(self):
-        tex_generator = self.get_generator(self.lookup_size)
-        shader = ONeilLookupTableShader(self)
-        shader.create_and_register_shader(None, None)
-        self.pbOpticalDepth = Texture()
-        self.pbOpticalDepth.setWrapU(Texture.WM_clamp)
-        self.pbOpticalDepth.setWrapV(Texture.WM_clamp)
-        self.pbOpticalDepth.setMinfilter(Texture.FT_linear)
-        self.pbOpticalDepth.setMagfilter(Texture.FT_linear)
-
-        tex_generator.generate(shader, 0, self.pbOpticalDepth)
+        if self.lookup_key is not None:
+            oneilLookupTables.release(self.lookup_key)
+        (self.lookup_key, self.pbOpticalDepth) = oneilLookupTables.get_table(self)
 
     def get_lookup_table(self):
         if self.pbOpticalDepth is None:
@@ -236,6 +234,113 @@ class ONeilAtmosphere(ONeilAtmosphereBase):
                             )
         return group
 
+def generate_lookup_table_data(ratio, rayleigh_scale_depth, mie_scale_depth, size, samples):
+    #NumPy version of ONeilLookupTableFragmentShader, the planet radius is 1.0 and the atmosphere radius is ratio.
+    #The texture coordinates are those of the card of TexGenerator, the result is in the BGRA order of the RAM images.
+    inner_radius = 1.0
+    outer_radius = ratio
+    scale = 1.0 / (outer_radius - inner_radius)
+    coords = (numpy.arange(size) + 0.5) / size * (1.0 + 1.0 / size) - 0.5 / size
+    cos_angle = (1.0 - 2.0 * coords)[:, numpy.newaxis]
+    sin_angle = numpy.sin(numpy.arccos(numpy.clip(cos_angle, -1.0, 1.0)))
+    height = (1e-6 + inner_radius + (outer_radius - inner_radius) * coords)[numpy.newaxis, :]
+    b = 2.0 * height * cos_angle
+    bsq = b * b
+    cpart = height * height
+    det = bsq - 4.0 * (cpart - inner_radius * inner_radius)
+    with numpy.errstate(invalid='ignore'):
+        root = numpy.sqrt(det)
+        visible = (det < 0.0) | ((0.5 * (-b - root) <= 0.0) & (0.5 * (-b + root) <= 0.0))
+    altitude = (height - inner_radius) * scale
+    rayleigh_density = numpy.where(visible, numpy.exp(-altitude / rayleigh_scale_depth), 0.0)
+    mie_density = numpy.where(visible, numpy.exp(-altitude / mie_scale_depth), 0.0)
+    far = 0.5 * (-b + numpy.sqrt(bsq - 4.0 * (cpart - outer_radius * outer_radius)))
+    sample_length = far / samples
+    rayleigh_depth = numpy.zeros((size, size))
+    mie_depth = numpy.zeros((size, size))
+    for i in range(samples):
+        distance = sample_length * (i + 0.5)
+        x = sin_angle * distance
+        y = height + cos_angle * distance
+        sample_altitude = numpy.maximum((numpy.sqrt(x * x + y * y) - inner_radius) * scale, 0.0)
+        rayleigh_depth += numpy.exp(-sample_altitude / rayleigh_scale_depth)
+        mie_depth += numpy.exp(-sample_altitude / mie_scale_depth)
+    scaled_length = sample_length * scale
+    rayleigh_depth *= scaled_length
+    mie_depth *= scaled_length
+    return numpy.stack((mie_density, rayleigh_depth, rayleigh_density, mie_depth), axis=-1).astype(numpy.float32)
+
+class ONeilLookupTables(object):
+    #The optical depth tables only depend on the ratio of the radii, the scale depths and the sampling of the table.
+    #They are shared between the atmospheres and kept on disk.
+    version = 1
+
+    def __init__(self):
+        self.tables = {}
+
+    def get_key(self, parameters):
+        return (parameters.radius / parameters.planet_radius,
+                parameters.rayleigh_scale_depth,
+                parameters.mie_scale_depth,
+                int(parameters.lookup_size),
+                int(parameters.lookup_samples))
+
+    def get_disk_key(self, key):
+        md5 = hashlib.md5()
+        md5.update(("oneil-%d-%r-%r-%r-%d-%d" % ((self.version,) + key)).encode())
+        return md5.hexdigest()
+
+    def get_table(self, parameters):
+        key = self.get_key(parameters)
+        entry = self.tables.get(key)
+        if entry is None:
+            entry = [self.create_table(key, parameters), 0]
+            self.tables[key] = entry
+        entry[1] += 1
+        return (key, entry[0])
+
+    def release(self, key):
+        entry = self.tables.get(key)
+        if entry is None: return
+        entry[1] -= 1
+        if entry[1] <= 0:
+            del self.tables[key]
+
+    def create_table(self, key, parameters):
+        texture = Texture()
+        disk_key = None
+        if settings.oneil_lookup_disk_cache:
+            disk_key = self.get_disk_key(key)
+            if tilesDiskCache.load(disk_key, texture):
+                self.configure(texture)
+                return texture
+        if settings.oneil_cpu_lookup_tables:
+            (ratio, rayleigh_scale_depth, mie_scale_depth, size, samples) = key
+            data = generate_lookup_table_data(ratio, rayleigh_scale_depth, mie_scale_depth, size, samples)
+            texture.setup_2d_texture(size, size, Texture.T_float, Texture.F_rgba32)
+            texture.set_ram_image(data.tobytes())
+            if disk_key is not None:
+                tilesDiskCache.store(disk_key, texture)
+        else:
+            tex_generator = ONeilAtmosphere.get_generator(parameters.lookup_size)
+            shader = ONeilLookupTableShader(parameters)
+            shader.create_and_register_shader(None, None)
+            tex_generator.generate(shader, 0, texture, self.table_ready, (disk_key,))
+        self.configure(texture)
+        return texture
+
+    def configure(self, texture):
+        texture.setWrapU(Texture.WM_clamp)
+        texture.setWrapV(Texture.WM_clamp)
+        texture.setMinfilter(Texture.FT_linear)
+        texture.setMagfilter(Texture.FT_linear)
+
+    def table_ready(self, texture, disk_key):
+        if disk_key is not None:
+            tilesDiskCache.store(disk_key, texture)
+
+oneilLookupTables = ONeilLookupTables()
+
 class ONeilScatteringBase(AtmosphericScattering):
     use_vertex = True
     world_vertex = True
@@ -221,6 +221,10 @@ def check_opengl_config(base):
 
     if settings.use_color_picking and settings.non_power_of_two_textures and glsl_version >= 420:
         settings.color_picking = True
+        settings.async_color_picking = settings.use_async_color_picking and gsg.supports_compute_shaders
+
+    #Without color picking the labels are picked with their collision card and can not be batched
+    settings.batch_labels = settings.use_batch_labels and settings.color_picking
 
     print("Hardware Vendor:", gsg.driver_vendor)
     print("Driver Renderer: %s (%s)" % (gsg.driver_renderer, gsg.driver_version))
@@ -235,6 +239,8 @@ def check_opengl_config(base):
     print("Render to buffer:", settings.buffer_texture)
     print("Floating point buffer:", settings.floating_point_buffer)
     print("Texture array:", settings.texture_array)
+    print("Color picking:", settings.color_picking, "(async)" if settings.async_color_picking else '')
+    print("Batched labels:", settings.batch_labels)
 
 def check_and_create_rendering_buffers(showbase):
     if not settings.render_scene_to_buffer:
@@ -0,0 +1,200 @@
+#
+#This file is part of Cosmonium.
+#
+#Copyright (C) 2018-2019 Laurent Deru.
+#
+#Cosmonium is free software: you can redistribute it and/or modify
+#it under the terms of the GNU General Public License as published by
+#the Free Software Foundation, either version 3 of the License, or
+#(at your option) any later version.
+#
+#Cosmonium is distributed in the hope that it will be useful,
+#but WITHOUT ANY WARRANTY; without even the implied warranty of
+#MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#GNU General Public License for more details.
+#
+#You should have received a copy of the GNU General Public License
+#along with Cosmonium.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+#Archive of the parsed YAML files, all the entries are appended to a single file which is mapped in memory at startup.
+#Each record is a marshalled header (path, stamp, dependencies) followed by the marshalled data of the file, the last
+#record of a file replaces the previous ones.
+
+from __future__ import print_function
+from __future__ import absolute_import
+
+from ..cache import create_path_for
+from .. import settings
+
+import os
+import mmap
+import struct
+import marshal
+
+import ruamel.yaml
+
+class YamlCache(object):
+    magic = b'CSMYAML\0'
+    #Version of the format of the archive and of the records
+    version = 1
+    record_header = struct.Struct('<II')
+    #The archive is rewritten when the replaced records take more space than the valid ones
+    compact_ratio = 1.0
+
+    def __init__(self):
+        self.index = None
+        self.mmap = None
+        self.archive_file = None
+        self.archive_size = 0
+        self.stamp = None
+
+    def get_archive_path(self):
+        return os.path.join(create_path_for('config'), 'yaml-cache.dat')
+
+    def get_header(self):
+        return self.magic + struct.pack('<I', self.version)
+
+    def get_stamp(self):
+        #Anything that changes the data produced by the parser must be part of the stamp
+        return (settings.version, ruamel.yaml.__version__, marshal.version)
+
+    def get_file_stamp(self, filepath):
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            return None
+        return (stat.st_mtime, stat.st_size)
+
+    def open(self):
+        self.index = {}
+        self.stamp = self.get_stamp()
+        self.archive_file = self.get_archive_path()
+        self.map_archive()
+        if self.mmap is None: return
+        header = self.get_header()
+        if self.mmap[:len(header)] != header:
+            print("Discarding YAML cache", self.archive_file)
+            self.reset()
+            return
+        live_size = 0
+        position = len(header)
+        size = len(self.mmap)
+        while position + self.record_header.size <= size:
+            (header_size, data_size) = self.record_header.unpack_from(self.mmap, position)
+            header_start = position + self.record_header.size
+            data_start = header_start + header_size
+            if data_start + data_size > size:
+                #Truncated record, the end of the archive is ignored and overwritten
+                break
+            try:
+                (filepath, stamp, file_stamp, deps) = marshal.loads(self.mmap[header_start:data_start])
+            except (ValueError, EOFError, TypeError) as e:
+                print("Corrupted YAML cache", self.archive_file, ':', e)
+                break
+            previous = self.index.get(filepath)
+            if previous is not None and previous[2] == self.stamp:
+                live_size -= previous[0] - previous[5] + previous[1]
+            if stamp == self.stamp:
+                live_size += data_start - position + data_size
+            self.index[filepath] = (data_start, data_size, stamp, file_stamp, deps, position)
+            position = data_start + data_size
+        self.archive_size = position
+        stale_size = position - len(header) - live_size
+        if position != size or stale_size > live_size * self.compact_ratio:
+            self.compact()
+
+    def map_archive(self):
+        self.close()
+        if not os.path.exists(self.archive_file) or os.path.getsize(self.archive_file) == 0: return
+        try:
+            with open(self.archive_file, 'rb') as f:
+                self.mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (IOError, OSError, ValueError) as e:
+            print("Could not map YAML cache", self.archive_file, ':', e)
+            self.mmap = None
+
+    def close(self):
+        if self.mmap is not None:
+            self.mmap.close()
+            self.mmap = None
+
+    def reset(self):
+        self.close()
+        self.index = {}
+        self.archive_size = 0
+        try:
+            with open(self.archive_file, 'wb') as f:
+                f.write(self.get_header())
+            self.archive_size = len(self.get_header())
+        except IOError as e:
+            print("Could not write YAML cache", self.archive_file, ':', e)
+
+    def compact(self):
+        print("Compacting YAML cache", self.archive_file)
+        records = []
+        for (filepath, (data_start, data_size, stamp, file_stamp, deps, position)) in self.index.items():
+            if stamp != self.stamp: continue
+            records.append((marshal.dumps((filepath, stamp, file_stamp, deps)), self.mmap[data_start:data_start + data_size]))
+        self.reset()
+        self.write_records(records)
+
+    def write_records(self, records):
+        try:
+            with open(self.archive_file, 'r+b') as f:
+                f.seek(self.archive_size)
+                for (header, data) in records:
+                    f.write(self.record_header.pack(len(header), len(data)))
+                    f.write(header)
+                    f.write(data)
+                    (filepath, stamp, file_stamp, deps) = marshal.loads(header)
+                    data_start = self.archive_size + self.record_header.size + len(header)
+                    self.index[filepath] = (data_start, len(data), stamp, file_stamp, deps, self.archive_size)
+                    self.archive_size = data_start + len(data)
+        except IOError as e:
+            print("Could not write YAML cache", self.archive_file, ':', e)
+
+    def is_valid(self, entry):
+        (data_start, data_size, stamp, file_stamp, deps, position) = entry
+        if stamp != self.stamp: return False
+        for (filepath, dep_stamp) in deps:
+            if self.get_file_stamp(filepath) != dep_stamp:
+                return False
+        return True
+
+    def load(self, filepath):
+        if self.index is None:
+            self.open()
+        entry = self.index.get(filepath)
+        if entry is None or entry[3] != self.get_file_stamp(filepath) or not self.is_valid(entry):
+            return None
+        (data_start, data_size) = entry[:2]
+        if self.mmap is None or data_start + data_size > len(self.mmap):
+            #The record has been appended after the archive was mapped
+            self.map_archive()
+        try:
+            return marshal.loads(self.mmap[data_start:data_start + data_size])
+        except (ValueError, EOFError, TypeError) as e:
+            print("Could not read cache for", filepath, ':', e)
+            return None
+
+    def encode(self, filepath, data):
+        #The YAML timestamps and other non builtin types can not be marshalled, those files are not cached
+        try:
+            return marshal.dumps(data)
+        except ValueError as e:
+            print("Could not cache", filepath, ':', e)
+            return None
+
+    def store(self, filepath, blob, deps):
+        if self.index is None:
+            self.open()
+        file_stamp = self.get_file_stamp(filepath)
+        if file_stamp is None: return
+        deps = [(dep, self.get_file_stamp(dep)) for dep in deps]
+        header = marshal.dumps((filepath, self.stamp, file_stamp, deps))
+        if self.archive_size == 0:
+            self.reset()
+        self.write_records([(header, blob)])
+
+yamlCache = YamlCache()
@@ -21,12 +21,11 @@ from __future__ import print_function
 from __future__ import absolute_import
 
 from ..dircontext import defaultDirContext, DirContext
-from ..cache import create_path_for
+from .yamlcache import yamlCache
 from ..import settings
 
+from time import time
 import os
-import hashlib
-import pickle
 import io
 
 import ruamel.yaml
@@ -113,6 +112,7 @@ class YamlModuleParser(YamlParser):
     context = defaultDirContext
     translation = None
     app = None
+    dependencies = []
 
     @classmethod
     def set_translation(cls, translation):
@@ -142,45 +142,24 @@ class YamlModuleParser(YamlParser):
             new_context.add_path(category, os.path.join(path, category))
         return new_context
 
-    def load_from_cache(self, filename, filepath):
-        data = None
-        config_path = create_path_for('config')
-        md5 = hashlib.md5(filepath.encode()).hexdigest()
-        cache_file = os.path.join(config_path, md5 + ".dat")
-        if os.path.exists(cache_file):
-            file_timestamp = os.path.getmtime(filepath)
-            cache_timestamp = os.path.getmtime(cache_file)
-            if cache_timestamp > file_timestamp:
-                print("Loading %s (cached)" % filepath)
-                base.splash.set_text("Loading %s (cached)" % filepath)
-                try:
-                    with open(cache_file, "rb") as f:
-                        data = pickle.load(f)
-                except (IOError, ValueError) as e:
-                    print("Could not read cache for", filename, cache_file, ':', e)
-        return data
-
-    def store_to_cache(self, data, filename, filepath):
-        config_path = create_path_for('config')
-        md5 = hashlib.md5(filepath.encode()).hexdigest()
-        cache_file = os.path.join(config_path, md5 + ".dat")
-        try:
-            with open(cache_file, "wb") as f:
-                print("Caching into", cache_file)
-                pickle.dump(data, f, pickle.HIGHEST_PROTOCOL)
-        except IOError as e:
-            print("Could not write cache for", filename, cache_file, ':', e)
-
     def load_and_parse(self, filename, context=None):
         data = None
         if context is None:
             context = YamlModuleParser.context
         filepath = context.find_data(filename)
         if filepath is not None:
+            start = time()
+            #The files loaded while decoding this one are recorded as its dependencies
+            if len(YamlModuleParser.dependencies) > 0:
+                YamlModuleParser.dependencies[-1].append(filepath)
+            YamlModuleParser.dependencies.append([])
             saved_context = YamlModuleParser.context
             YamlModuleParser.context = self.create_new_context(context, filepath)
+            blob = None
+            cached = False
             if settings.cache_yaml:
-                data = self.load_from_cache(filename, filepath)
+                data = yamlCache.load(filepath)
+                cached = data is not None
             if data is None:
                 print("Loading %s" % filepath)
                 base.splash.set_text("Loading %s" % filepath)
@@ -190,11 +169,20 @@ class YamlModuleParser(YamlParser):
                 except IOError as e:
                     print("Could not read", filename, filepath, ':', e)
                 if settings.cache_yaml and data is not None:
-                    self.store_to_cache(data, filename, filepath)
+                    #The data is encoded before decode() as the decoders may modify it
+                    blob = yamlCache.encode(filepath, data)
+            else:
+                print("Loading %s (cached)" % filepath)
+                base.splash.set_text("Loading %s (cached)" % filepath)
+            parse_time = time() - start
             if data is not None:
                 data = self.decode(data)
+            deps = YamlModuleParser.dependencies.pop()
+            if blob is not None:
+                yamlCache.store(filepath, blob, deps)
             YamlModuleParser.context = saved_context
+            end = time()
+            print("Load time %s: %.3f s (%s %.3f s, decode %.3f s)" % (filepath, end - start, "cache" if cached else "parse", parse_time, end - start - parse_time))
         else:
             print("Could not find", filename)
         return data
-
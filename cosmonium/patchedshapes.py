@@ -27,6 +27,7 @@ from panda3d.core import RenderState, ColorAttrib, RenderModeAttrib, CullFaceAtt
 from .shapes import Shape
 from .textures import TexCoord
 from . import geometry
+from . import workers
 from . import settings
 
 from math import cos, sin, pi, sqrt, copysign, log
@@ -93,6 +94,8 @@ class PatchBase(Shape):
         self.apparent_size = None
         self.patch_in_view = False
         self.last_split = 0
+        self.geometry_request = None
+        self.template_parent = None
         if self.parent is not None:
             self.parent.add_child(self)
         #TODO: Remove and use enum
@@ -118,9 +121,40 @@ class PatchBase(Shape):
 
     def remove_instance(self):
         Shape.remove_instance(self)
+        self.geometry_request = None
+        self.template_parent = None
         if self.bounds_shape is not None:
             self.bounds_shape.remove_instance()
 
+    def get_template(self, cache, patch_id, factory, args, sync):
+        #Returns the template of the patch, or None if it must be built by the geometry builder
+        if patch_id in cache:
+            return cache[patch_id]
+        if sync or not settings.async_patch_geometry:
+            cache[patch_id] = factory(*args)
+            return cache[patch_id]
+        self.geometry_request = (cache, patch_id, factory, args)
+        return None
+
+    def load_geometry(self, callback, cb_args):
+        (cache, patch_id, factory, args) = self.geometry_request
+        workers.asyncGeometryBuilder.build(factory, args, (id(cache), patch_id),
+                                           self.geometry_ready_cb, (cache, patch_id, callback, cb_args), owner=self)
+
+    def geometry_ready_cb(self, template, cache, patch_id, callback, cb_args):
+        if not patch_id in cache:
+            cache[patch_id] = template
+        request = self.geometry_request
+        if request is not None:
+            if request[1] == patch_id:
+                self.geometry_request = None
+                cache[patch_id].instanceTo(self.template_parent)
+            else:
+                #The patch has been instanciated again with another template
+                self.load_geometry(callback, cb_args)
+                return
+        callback(self, *cb_args)
+
     def add_child(self, child):
         child.parent = self
         self.children.append(child)
@@ -341,22 +375,21 @@ class SpherePatch(Patch):
     def str_id(self):
         return "%d - %d %d" % (self.lod, self.ring, self.sector)
 
-    def create_instance(self):
+    def create_instance(self, sync=False):
         if not self.owner in self.patch_cache:
             self.patch_cache[self.owner] = {}
         cache = self.patch_cache[self.owner]
+        self.geometry_request = None
         if settings.software_instancing:
             patch_id = "%d-%d" % (self.lod, self.ring)
-            if not patch_id in cache:
-                cache[patch_id] = geometry.UVPatch(1.0,
-                                                   self.density, self.density,
-                                                   0.0, self.y0,
-                                                   1.0 / self.s_div,self.y1,
-                                                   offset=self.offset)
+            template = self.get_template(cache, patch_id, geometry.UVPatch,
+                                         (1.0, self.density, self.density, 0.0, self.y0, 1.0 / self.s_div, self.y1,
+                                          False, False, False, self.offset),
+                                         sync)
             self.instance = NodePath('patch')
-            child = self.instance.attach_new_node('instance')
-            template = cache[patch_id]
-            template.instanceTo(child)
+            self.template_parent = self.instance.attach_new_node('instance')
+            if template is not None:
+                template.instanceTo(self.template_parent)
             self.instance.setH(360.0 * self.x0)
         else:
             patch_id = "%d-%d %d" % (self.lod, self.ring, self.sector)
@@ -483,7 +516,7 @@ class SquarePatchBase(Patch):
     def create_centre(self, x, y):
         return None
 
-    def create_patch_instance(self, x, y):
+    def create_patch_instance(self, x, y, outer_level):
         return None
 
     def get_patch_length(self):
@@ -493,7 +526,7 @@ class SquarePatchBase(Patch):
     def str_id(self):
         return "%d - %d %d %d" % (self.lod, self.face, self.x, self.y)
 
-    def create_instance(self):
+    def create_instance(self, sync=False):
         if self.use_shader and self.use_tessellation:
             if self.owner.face_unique:
                 patch_id = "%d : %d - %d %d" % (self.lod, self.face, self.x, self.y)
@@ -508,6 +541,7 @@ class SquarePatchBase(Patch):
         if not self.owner in self.patch_cache:
             self.patch_cache[self.owner] = {}
         cache = self.patch_cache[self.owner]
+        self.geometry_request = None
         if not patch_id in cache:
             if self.use_shader:
                 if self.use_tessellation:
@@ -522,11 +556,17 @@ class SquarePatchBase(Patch):
                                                   float(self.y) / self.div,
                                                   float(self.x + 1) / self.div,
                                                   float(self.y + 1) / self.div)
+                cache[patch_id] = template
             else:
-                template = self.create_patch_instance(self.x, self.y)
-            cache[patch_id] = template
+                template = self.get_template(cache, patch_id, self.create_patch_instance,
+                                             (self.x, self.y, list(self.tessellation_outer_level)),
+                                             sync)
+        else:
+            template = cache[patch_id]
         self.instance = NodePath('face')
-        cache[patch_id].instanceTo(self.instance)
+        self.template_parent = self.instance
+        if template is not None:
+            template.instanceTo(self.instance)
         self.orientation = self.rotations[self.face]
         self.instance.setQuat(LQuaternion(*self.orientation))
         if settings.debug_lod_show_bb:
@@ -538,11 +578,11 @@ class SquarePatchBase(Patch):
         if self.instance is not None and not self.use_tessellation:
             if self.shown:
                 parent.remove_patch_instance(self)
-                parent.create_patch_instance(self)
+                parent.create_patch_instance(self, sync=True)
                 parent.owner.surface.jobs_done_cb(self)
             else:
                 parent.remove_patch_instance(self)
-                parent.create_patch_instance(self, hide=True)
+                parent.create_patch_instance(self, hide=True, sync=True)
 
     def set_texture_to_lod(self, texture, texture_stage, texture_lod, patched):
         #TODO: Refactor into Patch
@@ -600,10 +640,10 @@ class NormalizedSquarePatch(SquarePatchBase):
                                                   float(y) / self.div,
                                                   float(x + 1) / self.div,
                                                   float(y + 1) / self.div)
-    def create_patch_instance(self, x, y):
+    def create_patch_instance(self, x, y, outer_level):
         return geometry.NormalizedSquarePatch(1.0,
                                               self.density,
-                                              self.tessellation_outer_level,
+                                              outer_level,
                                               float(x) / self.div,
                                               float(y) / self.div,
                                               float(x + 1) / self.div,
@@ -645,10 +685,10 @@ class SquaredDistanceSquarePatch(SquarePatchBase):
                                                        float(x + 1) / self.div,
                                                        float(y + 1) / self.div)
 
-    def create_patch_instance(self, x, y):
+    def create_patch_instance(self, x, y, outer_level):
         return geometry.SquaredDistanceSquarePatch(1.0,
                                                    self.density,
-                                                   self.tessellation_outer_level,
+                                                   outer_level,
                                                    float(x) / self.div,
                                                    float(y) / self.div,
                                                    float(x + 1) / self.div,
@@ -748,14 +788,26 @@ class PatchedShapeBase(Shape):
         patch.instance.show()
         patch.shown = True
 
+    def cancel_patch_jobs(self, patch):
+        #The pending loads are cancelled only if they are the only jobs of the patch, the jobs are then scheduled again
+        #when the patch is instanciated again
+        nb_requests = len(patch.async_requests)
+        if nb_requests == 0 or nb_requests != patch.jobs_pending: return
+        for request in list(patch.async_requests):
+            request.cancel()
+        patch.jobs_pending = 0
+        patch.jobs = 0
+
     def remove_patch_instance(self, patch, split=False):
         if patch in self.patches:
             self.patches.remove(patch)
+        self.cancel_patch_jobs(patch)
         patch.remove_instance()
         patch.shown = False
 
     def remove_all_patches_instances(self):
         for patch in self.patches:
+            self.cancel_patch_jobs(patch)
             patch.remove_instance()
             patch.shown = False
         self.patches = []
@@ -776,9 +828,9 @@ class PatchedShapeBase(Shape):
         self.remove_all_patches_instances()
         Shape.remove_instance(self)
 
-    def create_patch_instance(self, patch, hide=False):
+    def create_patch_instance(self, patch, hide=False, sync=False):
         if patch.instance is None:
-            patch.create_instance()
+            patch.create_instance(sync)
             patch.instance.reparentTo(self.instance)
             if hide:
                 patch.instance.hide()
@@ -0,0 +1,190 @@
+#
+#This file is part of Cosmonium.
+#
+#Copyright (C) 2018-2019 Laurent Deru.
+#
+#Cosmonium is free software: you can redistribute it and/or modify
+#it under the terms of the GNU General Public License as published by
+#the Free Software Foundation, either version 3 of the License, or
+#(at your option) any later version.
+#
+#Cosmonium is distributed in the hope that it will be useful,
+#but WITHOUT ANY WARRANTY; without even the implied warranty of
+#MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#GNU General Public License for more details.
+#
+#You should have received a copy of the GNU General Public License
+#along with Cosmonium.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+from __future__ import print_function
+from __future__ import absolute_import
+
+from .pstats import levelpstat
+from . import settings
+
+from collections import OrderedDict
+
+def is_patch_used(patch):
+    #A patch is used when it is instanced or when one of its descendant is
+    if patch.instance is not None:
+        return True
+    for child in patch.children:
+        if is_patch_used(child):
+            return True
+    return False
+
+def texture_sizes(texture):
+    if texture is None:
+        return (0, 0)
+    return (texture.estimate_texture_memory(), texture.get_ram_image_size() if texture.has_ram_image() else 0)
+
+class PatchCacheEntry(object):
+    def __init__(self, patch_map, key, value, patch):
+        self.patch_map = patch_map
+        self.key = key
+        self.value = value
+        self.patch = patch
+        self.gpu_size = None
+        self.ram_size = None
+        #Entry whose data is shared by this entry and number of entries sharing the data of this entry
+        self.parent = None
+        self.nb_dependents = 0
+
+    def update_size(self):
+        #The size is only known once the data of the patch is loaded
+        if self.gpu_size is not None: return False
+        sizes = self.patch_map.get_sizes(self.value)
+        if sizes is None: return False
+        (self.gpu_size, self.ram_size) = sizes
+        self.patch_map.link_parent(self)
+        return True
+
+    def unlink_parent(self):
+        if self.parent is not None:
+            self.parent.nb_dependents -= 1
+            self.parent = None
+
+class PatchesCache(object):
+    #LRU of the textures of all the patch maps, the least recently used patches are evicted when over budget
+    def __init__(self):
+        self.entries = OrderedDict()
+        #Entries whose size is not yet known
+        self.pending = OrderedDict()
+        self.gpu_size = 0
+        self.ram_size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.hits_pstat = levelpstat('hits', 'Patches cache')
+        self.misses_pstat = levelpstat('misses', 'Patches cache')
+        self.evictions_pstat = levelpstat('evictions', 'Patches cache')
+        self.gpu_pstat = levelpstat('gpu', 'Patches cache')
+        self.ram_pstat = levelpstat('ram', 'Patches cache')
+
+    def add(self, entry):
+        self.entries[entry] = None
+        self.pending[entry] = None
+        self.misses += 1
+
+    def touch(self, entry):
+        self.entries.move_to_end(entry)
+
+    def remove(self, entry):
+        del self.entries[entry]
+        self.pending.pop(entry, None)
+        entry.unlink_parent()
+        if entry.gpu_size is not None:
+            self.gpu_size -= entry.gpu_size
+            self.ram_size -= entry.ram_size
+
+    def update_sizes(self):
+        for entry in list(self.pending):
+            if entry.update_size():
+                self.gpu_size += entry.gpu_size
+                self.ram_size += entry.ram_size
+                del self.pending[entry]
+
+    def is_over_budget(self):
+        return self.gpu_size > settings.patches_cache_gpu_budget * 1024 * 1024 or \
+               self.ram_size > settings.patches_cache_ram_budget * 1024 * 1024
+
+    def evict(self):
+        for entry in list(self.entries):
+            if not self.is_over_budget(): break
+            if entry.gpu_size is None or entry.nb_dependents > 0 or is_patch_used(entry.patch): continue
+            entry.patch_map.evict(entry)
+            self.evictions += 1
+
+    def update(self):
+        #The patches can be loaded, hidden or removed at any time, the budget is checked on each frame
+        if len(self.pending) > 0:
+            self.update_sizes()
+        if self.is_over_budget():
+            self.evict()
+        self.hits_pstat.set_level(self.hits)
+        self.misses_pstat.set_level(self.misses)
+        self.evictions_pstat.set_level(self.evictions)
+        self.gpu_pstat.set_level(self.gpu_size / 1024.0 / 1024.0)
+        self.ram_pstat.set_level(self.ram_size / 1024.0 / 1024.0)
+
+patchesCache = PatchesCache()
+
+class PatchMap(object):
+    #Dict like map of the patches data, the entries are registered in the global patches cache
+    #get_parent_key(value) returns the key of the entry whose data is shared by the value, or None
+    def __init__(self, get_sizes, get_parent_key=None):
+        self.map = {}
+        self.get_sizes = get_sizes
+        self.get_parent_key = get_parent_key
+
+    def __contains__(self, key):
+        return key in self.map
+
+    def __getitem__(self, key):
+        entry = self.map[key]
+        patchesCache.touch(entry)
+        return entry.value
+
+    def get(self, key, default=None):
+        entry = self.map.get(key)
+        if entry is None:
+            return default
+        patchesCache.touch(entry)
+        return entry.value
+
+    def find(self, key):
+        #Lookup done when loading a patch, counted as a cache hit
+        entry = self.map.get(key)
+        if entry is None:
+            return None
+        patchesCache.touch(entry)
+        patchesCache.hits += 1
+        return entry.value
+
+    def add(self, key, value, patch):
+        entry = self.map.get(key)
+        if entry is not None:
+            patchesCache.remove(entry)
+        entry = PatchCacheEntry(self, key, value, patch)
+        self.map[key] = entry
+        patchesCache.add(entry)
+
+    def link_parent(self, entry):
+        #The parent can not be evicted while its data is shared
+        if self.get_parent_key is None: return
+        parent_key = self.get_parent_key(entry.value)
+        if parent_key is None: return
+        parent = self.map.get(parent_key)
+        if parent is not None and parent is not entry:
+            entry.parent = parent
+            parent.nb_dependents += 1
+
+    def evict(self, entry):
+        del self.map[entry.key]
+        patchesCache.remove(entry)
+
+    def clear(self):
+        for entry in self.map.values():
+            patchesCache.remove(entry)
+        self.map = {}
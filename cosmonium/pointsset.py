@@ -20,18 +20,22 @@
 from __future__ import print_function
 from __future__ import absolute_import
 
-from panda3d.core import GeomVertexArrayFormat, InternalName, GeomVertexFormat, GeomVertexData, GeomVertexWriter
+from panda3d.core import GeomVertexArrayFormat, InternalName, GeomVertexFormat, GeomVertexData
 from panda3d.core import GeomPoints, Geom, GeomNode
 from panda3d.core import NodePath, OmniBoundingVolume, DrawMask
 from .foundation import VisibleObject
 from .appearances import ModelAppearance
 from .shaders import BasicShader, FlatLightingModel, StaticSizePointControl
 from .sprites import SimplePoint, RoundDiskPointSprite
+from .pstats import levelpstat
+
+import numpy
 
 class PointsSet(VisibleObject):
     tex = None
-    def __init__(self, use_sprites=True, use_sizes=True, points_size=2, sprite=None, background=None, shader=None):
-        self.gnode = GeomNode('starfield')
+    min_capacity = 1024
+    def __init__(self, use_sprites=True, use_sizes=True, points_size=2, sprite=None, background=None, shader=None, name='starfield'):
+        self.gnode = GeomNode(name)
         self.use_sprites = use_sprites
         self.use_sizes = use_sizes
         self.use_oids = True
@@ -39,10 +43,16 @@ class PointsSet(VisibleObject):
         if shader is None:
             shader = BasicShader(lighting_model=FlatLightingModel(), vertex_oids=True)
         self.shader = shader
+        self.points_pstat = levelpstat(name + ' points')
+        self.bytes_pstat = levelpstat(name + ' bytes')
 
+        self.points_capacity = 0
+        self.reserve_points(self.min_capacity)
         self.reset()
 
-        self.geom = self.makeGeom([], [], [], [])
+        self.capacity = 0
+        self.nb_vertices = 0
+        self.geom = self.makeGeom()
         self.gnode.addGeom(self.geom)
         self.instance = NodePath(self.gnode)
         if self.use_sprites:
@@ -74,21 +84,66 @@ class PointsSet(VisibleObject):
         pass
 
     def reset(self):
-        self.points = []
-        self.colors = []
-        self.sizes = []
-        self.oids = []
+        self.count = 0
+
+    def reserve_points(self, count):
+        if count <= self.points_capacity: return
+        capacity = max(count, self.points_capacity * 2)
+        points = numpy.empty((capacity, 3), dtype=numpy.float32)
+        colors = numpy.empty((capacity, 4), dtype=numpy.float32)
+        sizes = numpy.empty(capacity, dtype=numpy.float32)
+        oids = numpy.empty((capacity, 4), dtype=numpy.float32)
+        if self.points_capacity > 0:
+            points[:self.count] = self.points[:self.count]
+            colors[:self.count] = self.colors[:self.count]
+            sizes[:self.count] = self.sizes[:self.count]
+            oids[:self.count] = self.oids[:self.count]
+        self.points = points
+        self.colors = colors
+        self.sizes = sizes
+        self.oids = oids
+        #Writing scalars through flat memoryviews is much faster than assigning Panda vectors to NumPy rows
+        self.points_view = memoryview(points.reshape(-1))
+        self.colors_view = memoryview(colors.reshape(-1))
+        self.sizes_view = memoryview(sizes)
+        self.oids_view = memoryview(oids.reshape(-1))
+        self.points_capacity = capacity
+
+    def reserve(self, count):
+        self.reserve_points(self.count + count)
+
+    def add_point(self, position, color, size, oid, scale=1.0):
+        index = self.count
+        if index == self.points_capacity:
+            self.reserve_points(index + 1)
+        self.count = index + 1
+        offset = index * 3
+        view = self.points_view
+        (view[offset], view[offset + 1], view[offset + 2]) = position
+        offset = index * 4
+        (r, g, b, a) = color
+        view = self.colors_view
+        (view[offset], view[offset + 1], view[offset + 2], view[offset + 3]) = (r * scale, g * scale, b * scale, a * scale)
+        self.sizes_view[index] = size
+        view = self.oids_view
+        (view[offset], view[offset + 1], view[offset + 2], view[offset + 3]) = oid
+        return index
 
-    def add_point(self, position, color, size, oid):
-        self.points.append(position)
-        self.colors.append(color)
-        self.sizes.append(size)
-        self.oids.append(oid)
+    def alloc_points(self, count):
+        #Returns slices of the points arrays to be filled by the caller
+        self.reserve_points(self.count + count)
+        start = self.count
+        end = start + count
+        self.count = end
+        return (self.points[start:end], self.colors[start:end], self.sizes[start:end], self.oids[start:end])
 
     def update(self):
-        self.update_arrays(self.points, self.colors, self.sizes, self.oids)
+        count = self.count
+        self.update_arrays(self.points[:count], self.colors[:count], self.sizes[:count], self.oids[:count])
+        self.points_pstat.set_level(count)
+        self.bytes_pstat.set_level(count * self.stride * 4)
 
-    def makeGeom(self, points, colors, sizes, oids):
+    def makeGeom(self):
         array = GeomVertexArrayFormat()
         array.addColumn(InternalName.get_vertex(), 3, Geom.NTFloat32, Geom.CPoint)
         array.addColumn(InternalName.get_color(), 4, Geom.NTFloat32, Geom.CColor)
@@ -97,36 +152,41 @@ class PointsSet(VisibleObject):
         if self.use_oids:
             oids_column_name = InternalName.make('oid')
             array.addColumn(oids_column_name, 4, Geom.NTFloat32, Geom.COther)
+        #All the columns are 32 bits floats, the rows are accessed as a 2D float32 array
+        self.stride = array.get_stride() // 4
+        self.vertex_column = array.get_column(InternalName.get_vertex()).get_start() // 4
+        self.color_column = array.get_column(InternalName.get_color()).get_start() // 4
+        if self.use_sizes:
+            self.size_column = array.get_column(InternalName.get_size()).get_start() // 4
+        if self.use_oids:
+            self.oid_column = array.get_column(oids_column_name).get_start() // 4
         format = GeomVertexFormat()
         format.addArray(array)
         format = GeomVertexFormat.registerFormat(format)
-        vdata = GeomVertexData('vdata', format, Geom.UH_static)
-        vdata.unclean_set_num_rows(len(points))
-        self.vwriter = GeomVertexWriter(vdata, InternalName.get_vertex())
-        self.colorwriter = GeomVertexWriter(vdata, InternalName.get_color())
-        if self.use_sizes:
-            self.sizewriter = GeomVertexWriter(vdata, InternalName.get_size())
-        if self.use_oids:
-            self.oidwriter = GeomVertexWriter(vdata, oids_column_name)
-        geompoints = GeomPoints(Geom.UH_static)
-        geompoints.reserve_num_vertices(len(points))
-        index = 0
-        for (point, color, size, oid) in zip(points, colors, sizes, oids):
-            self.vwriter.addData3f(*point)
-            #self.colorwriter.addData3f(color[0], color[1], color[2])
-            self.colorwriter.addData4(color)
-            if self.use_sizes:
-                self.sizewriter.addData1f(size)
-            if self.use_oids:
-                self.oidwriter.addData4(oid)
-            geompoints.addVertex(index)
-            geompoints.closePrimitive()
-            index += 1
-        geom = Geom(vdata)
-        geom.addPrimitive(geompoints)
+        self.vdata = GeomVertexData('vdata', format, Geom.UH_dynamic)
+        self.geompoints = GeomPoints(Geom.UH_dynamic)
+        self.geompoints.set_nonindexed_vertices(0, 0)
+        geom = Geom(self.vdata)
+        geom.addPrimitive(self.geompoints)
         return geom
 
+    def reserve_vertices(self, count):
+        if count <= self.capacity: return
+        self.capacity = max(count, self.capacity * 2, self.min_capacity)
+        self.vdata.unclean_set_num_rows(self.capacity)
+
     def update_arrays(self, points, colors, sizes, oids):
-        self.gnode.removeAllGeoms()
-        self.geom = self.makeGeom(points, colors, sizes, oids)
-        self.gnode.addGeom(self.geom)
+        count = len(points)
+        self.reserve_vertices(count)
+        if count > 0:
+            rows = numpy.asarray(memoryview(self.vdata.modify_array(0))).view(numpy.float32).reshape(self.capacity, self.stride)
+            rows[:count, self.vertex_column:self.vertex_column + 3] = points
+            rows[:count, self.color_column:self.color_column + 4] = colors
+            if self.use_sizes:
+                rows[:count, self.size_column] = sizes
+            if self.use_oids:
+                rows[:count, self.oid_column:self.oid_column + 4] = oids
+            del rows
+        if count != self.nb_vertices:
+            self.geompoints.set_nonindexed_vertices(0, count)
+            self.nb_vertices = count
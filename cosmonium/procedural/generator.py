@@ -25,6 +25,7 @@ from panda3d.core import FrameBufferProperties, GraphicsPipe, WindowProperties
 from direct.task import Task
 
 from ..shaders import ShaderProgram
+from .tilescache import tilesDiskCache
 from .. import settings
 
 class GeneratorVertexShader(ShaderProgram):
@@ -107,8 +108,10 @@ class TexGenerator(object):
 
     def callback(self, task):
         if len(self.processed) > 0:
-            (shader, face, texture, callback, cb_args) = self.processed[0]
+            (shader, face, texture, callback, cb_args, key) = self.processed[0]
             if texture.has_ram_image():
+                if key is not None:
+                    tilesDiskCache.store(key, texture)
                 if callback is not None:
                     #print(texture)
                     #print(self.buffer.get_fb_properties(), self.buffer.get_texture())
@@ -120,7 +123,7 @@ class TexGenerator(object):
         if self.buffer is None:
             return Task.cont
         if self.first and len(self.queue) > 0:
-            (shader, face, texture, callback, cb_args) = self.queue[0]
+            (shader, face, texture, callback, cb_args, key) = self.queue[0]
             if not texture.has_ram_image():
                 #print("FIRST")
                 self.buffer.setOneShot(True)
@@ -144,22 +147,29 @@ class TexGenerator(object):
         self.buffer.add_render_texture(texture, GraphicsOutput.RTM_copy_ram)
 
     def schedule_next(self):
-        (shader, face, texture, callback, cb_args) = self.queue[0]
+        (shader, face, texture, callback, cb_args, key) = self.queue[0]
         self.prepare(shader, face, texture)
 
     def schedule(self, item):
         self.queue.append(item)
         if not self.busy:
             #print("SCHEDULE")
-            (shader, face, texture, callback, cb_args) = item
+            (shader, face, texture, callback, cb_args, key) = item
             self.prepare(shader, face, texture)
             self.busy = True
 
-    def generate(self, shader, face, texture, callback=None, cb_args=()):
+    def generate(self, shader, face, texture, callback=None, cb_args=(), cache_id=None):
         #print("ADD")
         if texture.has_ram_image() and callback is not None:
             print("Texture already has data")
-        self.schedule((shader, face, texture, callback, cb_args))
+        key = None
+        if cache_id is not None and settings.tiles_disk_cache:
+            key = tilesDiskCache.get_key(cache_id, shader, face, self.width, self.height)
+            if tilesDiskCache.load(key, texture):
+                if callback is not None:
+                    callback(texture, *cb_args)
+                return
+        self.schedule((shader, face, texture, callback, cb_args, key))
 
 class GeneratorPool(object):
     def __init__(self, number):
@@ -172,9 +182,9 @@ class GeneratorPool(object):
         for generator in self.generators:
             generator.make_buffer(width, height, texture_format)
 
-    def generate(self, shader, face, texture, callback=None, cb_args=()):
+    def generate(self, shader, face, texture, callback=None, cb_args=(), cache_id=None):
         lowest = self.generators[0]
         for generator in self.generators[1:]:
             if len(generator.queue) < len(lowest.queue):
                 lowest = generator
-        lowest.generate(shader, face, texture, callback, cb_args)
+        lowest.generate(shader, face, texture, callback, cb_args, cache_id)
@@ -125,4 +125,5 @@ class ShaderHeightmapPatch(HeightmapPatch):
             self.shader.global_frequency = self.parent.global_frequency
             self.shader.global_scale = self.parent.global_scale
             self.shader.create_and_register_shader(None, None)
-        tex_generator.generate(self.shader, self.face, self.texture, self.heightmap_ready_cb, (callback, cb_args))
+        cache_id = 'heightmap-%d-%d-%d-%d' % (self.lod, self.x, self.y, self.density)
+        tex_generator.generate(self.shader, self.face, self.texture, self.heightmap_ready_cb, (callback, cb_args), cache_id)
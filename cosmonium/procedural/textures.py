@@ -23,6 +23,7 @@ from __future__ import absolute_import
 from panda3d.core import Texture
 
 from ..textures import TextureSource
+from ..patchescache import PatchMap, texture_sizes
 from .generator import GeneratorPool
 from .shadernoise import NoiseShader
 from .. import settings
@@ -36,13 +37,16 @@ class ProceduralVirtualTextureSource(TextureSource):
         self.noise = noise
         self.target = target
         self.texture_size = size
-        self.map_patch = {}
+        self.map_patch = PatchMap(self.get_patch_sizes)
         self.global_frequency = frequency
         self.global_scale = scale
 
     def is_patched(self):
         return True
 
+    def get_patch_sizes(self, entry):
+        return texture_sizes(entry[0])
+
     def child_texture_name(self, patch):
         return None
 
@@ -54,7 +58,7 @@ class ProceduralVirtualTextureSource(TextureSource):
 
     def texture_loaded_cb(self, texture, patch, callback, cb_args):
         if texture is not None:
-            self.map_patch[patch] = (texture, self.texture_size, patch.lod)
+            self.map_patch.add(patch, (texture, self.texture_size, patch.lod), patch)
             if callback is not None:
                 callback(texture, self.texture_size, patch.lod, *cb_args)
         else:
@@ -69,16 +73,18 @@ class ProceduralVirtualTextureSource(TextureSource):
                     callback(None, None, self.texture_size, patch.lod, *cb_args)
 
     def load(self, patch, color_space, sync=False, callback=None, cb_args=()):
-        if not patch in self.map_patch:
+        entry = self.map_patch.find(patch)
+        if entry is None:
             self._make_texture(patch, callback, cb_args)
         else:
-            callback(*(self.map_patch[patch] + cb_args))
+            callback(*(entry + cb_args))
 
     def texture_ready_cb(self, texture, patch, callback, cb_args):
         #print("READY", patch.str_id())
-        self.map_patch[patch] = (texture, self.texture_size, patch.lod)
+        entry = (texture, self.texture_size, patch.lod)
+        self.map_patch.add(patch, entry, patch)
         if callback is not None:
-            callback(*(self.map_patch[patch] + cb_args))
+            callback(*(entry + cb_args))
 
     def _make_texture(self, patch, callback, cb_args):
         if not self.texture_size in ProceduralVirtualTextureSource.tex_generators:
@@ -103,10 +109,12 @@ class ProceduralVirtualTextureSource(TextureSource):
             self.texture.setMinfilter(Texture.FT_linear)
         self.texture.setMagfilter(Texture.FT_linear)
 
-        self.tex_generator.generate(shader, patch.face, self.texture, self.texture_ready_cb, (patch, callback, cb_args))
+        cache_id = 'texture-%s-%d' % (patch.str_id(), self.texture_size)
+        self.tex_generator.generate(shader, patch.face, self.texture, self.texture_ready_cb, (patch, callback, cb_args), cache_id)
 
     def get_texture(self, patch):
-        if patch in self.map_patch:
-            return self.map_patch[patch]
+        entry = self.map_patch.get(patch)
+        if entry is not None:
+            return entry
         else:
             return (None, self.texture_size, patch.lod)
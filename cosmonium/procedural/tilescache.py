@@ -0,0 +1,119 @@
+#
+#This file is part of Cosmonium.
+#
+#Copyright (C) 2018-2019 Laurent Deru.
+#
+#Cosmonium is free software: you can redistribute it and/or modify
+#it under the terms of the GNU General Public License as published by
+#the Free Software Foundation, either version 3 of the License, or
+#(at your option) any later version.
+#
+#Cosmonium is distributed in the hope that it will be useful,
+#but WITHOUT ANY WARRANTY; without even the implied warranty of
+#MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#GNU General Public License for more details.
+#
+#You should have received a copy of the GNU General Public License
+#along with Cosmonium.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+from __future__ import print_function
+from __future__ import absolute_import
+
+from panda3d.core import Texture
+
+from ..cache import create_path_for, prune_cache_dir, touch_cache_entry
+from .. import settings
+
+import hashlib
+import numpy
+import os
+
+class ShaderInputsRecorder(object):
+    #Collects the inputs set by a generator shader, they are part of the key of the generated tile
+    def __init__(self):
+        self.inputs = []
+
+    def set_shader_input(self, name, value):
+        self.inputs.append("%s=%r" % (name, value))
+
+class TilesDiskCache(object):
+    #Increase when the format of the cache entries changes
+    version = 1
+    formats = {(numpy.dtype(numpy.float32), 1): (Texture.T_float, Texture.F_r32),
+               (numpy.dtype(numpy.float32), 3): (Texture.T_float, Texture.F_rgb32),
+               (numpy.dtype(numpy.float32), 4): (Texture.T_float, Texture.F_rgba32),
+               (numpy.dtype(numpy.uint8), 3): (Texture.T_unsigned_byte, Texture.F_rgb),
+               (numpy.dtype(numpy.uint8), 4): (Texture.T_unsigned_byte, Texture.F_rgba),
+              }
+    dtypes = {Texture.T_float: numpy.float32,
+              Texture.T_unsigned_byte: numpy.uint8}
+
+    def __init__(self):
+        self.path = None
+        self.hits = 0
+        self.misses = 0
+
+    def get_path(self):
+        if self.path is None:
+            self.path = create_path_for('tiles', 'cache')
+        return self.path
+
+    def get_key(self, cache_id, shader, face, width, height):
+        #The tile is fully defined by the generated code, the inputs of the shader and the size of the buffer
+        recorder = ShaderInputsRecorder()
+        shader.update(recorder, face=face)
+        md5 = hashlib.md5()
+        md5.update(("%d-%s-%s-%d-%dx%d-" % (self.version, cache_id, shader.get_shader_id(), face, width, height)).encode())
+        md5.update(';'.join(recorder.inputs).encode())
+        md5.update(shader.get_code_hash().encode())
+        return md5.hexdigest()
+
+    def get_filename(self, key):
+        return os.path.join(self.get_path(), key[:2], key + '.npy')
+
+    def load(self, key, texture):
+        filename = self.get_filename(key)
+        if not os.path.exists(filename):
+            self.misses += 1
+            return False
+        try:
+            data = numpy.load(filename, mmap_mode='r')
+        except (IOError, ValueError) as e:
+            print("Invalid tile cache entry", filename, e)
+            self.misses += 1
+            return False
+        texture_format = self.formats.get((data.dtype, data.shape[2]))
+        if texture_format is None:
+            self.misses += 1
+            return False
+        (component_type, data_format) = texture_format
+        texture.setup_2d_texture(data.shape[1], data.shape[0], component_type, data_format)
+        texture.set_ram_image(data.tobytes())
+        touch_cache_entry(filename)
+        self.hits += 1
+        return True
+
+    def store(self, key, texture):
+        dtype = self.dtypes.get(texture.get_component_type())
+        if dtype is None or not texture.has_ram_image(): return
+        data = numpy.frombuffer(texture.get_ram_image(), dtype)
+        data = data.reshape(texture.get_y_size(), texture.get_x_size(), texture.get_num_components())
+        filename = self.get_filename(key)
+        path = os.path.dirname(filename)
+        tmp_filename = filename + '.tmp'
+        try:
+            if not os.path.isdir(path):
+                os.makedirs(path)
+            with open(tmp_filename, 'wb') as tile_file:
+                numpy.save(tile_file, data)
+            os.rename(tmp_filename, filename)
+        except (IOError, OSError) as e:
+            print("Could not write tile cache entry", filename, e)
+
+    def prune(self):
+        (nb_removed, size) = prune_cache_dir(self.get_path(), '.npy', settings.tiles_disk_cache_budget * 1024 * 1024)
+        if nb_removed > 0:
+            print("Tiles cache: removed", nb_removed, "entries, size", size // (1024 * 1024), "MB")
+
+tilesDiskCache = TilesDiskCache()
@@ -0,0 +1,149 @@
+#
+#This file is part of Cosmonium.
+#
+#Copyright (C) 2018-2019 Laurent Deru.
+#
+#Cosmonium is free software: you can redistribute it and/or modify
+#it under the terms of the GNU General Public License as published by
+#the Free Software Foundation, either version 3 of the License, or
+#(at your option) any later version.
+#
+#Cosmonium is distributed in the hope that it will be useful,
+#but WITHOUT ANY WARRANTY; without even the implied warranty of
+#MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#GNU General Public License for more details.
+#
+#You should have received a copy of the GNU General Public License
+#along with Cosmonium.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+from __future__ import print_function
+from __future__ import absolute_import
+
+from collections import deque
+try:
+    from time import perf_counter
+except ImportError:
+    from time import time as perf_counter
+
+from . import settings
+
+import atexit
+import json
+
+class FrameRecord(object):
+    def __init__(self, frame, start):
+        self.frame = frame
+        self.start = start
+        self.duration = 0.0
+        self.stages = []
+        self.counters = {}
+
+class FrameProfiler(object):
+    #Keeps the duration of the profiled stages and the counters of the last frames in a ring buffer
+    def __init__(self, size):
+        self.enabled = False
+        self.frames = deque(maxlen=size)
+        self.current = None
+        self.stage_names = []
+        self.counter_names = []
+        self.origin = perf_counter()
+        self.trace_filename = None
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+        self.current = None
+
+    def toggle(self):
+        if self.enabled:
+            self.disable()
+        else:
+            self.enable()
+
+    def clear(self):
+        self.frames.clear()
+
+    def start_frame(self, frame):
+        if not self.enabled: return
+        self.current = FrameRecord(frame, perf_counter())
+
+    def end_frame(self):
+        if self.current is None: return
+        self.current.duration = perf_counter() - self.current.start
+        self.frames.append(self.current)
+        self.current = None
+
+    def add_stage(self, name, start, duration):
+        if self.current is None: return
+        if not name in self.stage_names:
+            self.stage_names.append(name)
+        self.current.stages.append((name, start, duration))
+
+    def set_counter(self, name, value):
+        if self.current is None: return
+        if not name in self.counter_names:
+            self.counter_names.append(name)
+        self.current.counters[name] = value
+
+    def get_averages(self, count=None):
+        #Returns the mean frame duration and the mean duration of each stage and value of each counter, in ms
+        frames = list(self.frames)
+        if count is not None:
+            frames = frames[-count:]
+        if len(frames) == 0:
+            return (0.0, {}, {})
+        nb_frames = float(len(frames))
+        stages = dict([(name, 0.0) for name in self.stage_names])
+        counters = dict([(name, 0.0) for name in self.counter_names])
+        duration = 0.0
+        for record in frames:
+            duration += record.duration
+            for (name, start, stage_duration) in record.stages:
+                stages[name] += stage_duration
+            for (name, value) in record.counters.items():
+                counters[name] += value
+        for name in stages:
+            stages[name] *= 1000.0 / nb_frames
+        for name in counters:
+            counters[name] /= nb_frames
+        return (duration * 1000.0 / nb_frames, stages, counters)
+
+    def make_trace(self):
+        #Chrome trace event format, the times are in microseconds
+        events = []
+        for record in self.frames:
+            args = {'frame': record.frame}
+            events.append({'name': 'frame', 'cat': 'frame', 'ph': 'X', 'pid': 0, 'tid': 0,
+                           'ts': (record.start - self.origin) * 1e6, 'dur': record.duration * 1e6, 'args': args})
+            for (name, start, duration) in record.stages:
+                events.append({'name': name, 'cat': 'stage', 'ph': 'X', 'pid': 0, 'tid': 0,
+                               'ts': (start - self.origin) * 1e6, 'dur': duration * 1e6})
+            if len(record.counters) > 0:
+                events.append({'name': 'counters', 'cat': 'counters', 'ph': 'C', 'pid': 0, 'tid': 0,
+                               'ts': (record.start - self.origin) * 1e6, 'args': dict(record.counters)})
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def export_trace(self, filename):
+        try:
+            with open(filename, 'w') as trace_file:
+                json.dump(self.make_trace(), trace_file)
+            print("Profile trace of %d frames saved in" % len(self.frames), filename)
+            return True
+        except IOError as e:
+            print("Could not write profile trace", filename, e)
+            return False
+
+    def export_at_exit(self, filename):
+        if self.trace_filename is None:
+            atexit.register(self.export_on_exit)
+        self.trace_filename = filename
+        self.enable()
+
+    def export_on_exit(self):
+        if self.trace_filename is not None:
+            self.export_trace(self.trace_filename)
+
+profiler = FrameProfiler(settings.profiler_frames)
@@ -20,6 +20,8 @@
 from panda3d.core import PStatCollector
 from functools import wraps
 
+from .profiler import profiler, perf_counter
+
 custom_collectors = {}
 
 def pstat(func):
@@ -30,7 +32,12 @@ def pstat(func):
     @wraps(func)
     def doPstat(*args, **kargs):
         pstat.start()
-        returned = func(*args, **kargs)
+        if profiler.enabled:
+            start = perf_counter()
+            returned = func(*args, **kargs)
+            profiler.add_stage(func.__name__, start, perf_counter() - start)
+        else:
+            returned = func(*args, **kargs)
         pstat.stop()
         return returned
     return doPstat
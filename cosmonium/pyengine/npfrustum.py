@@ -0,0 +1,50 @@
+#
+#This file is part of Cosmonium.
+#
+#Copyright (C) 2018-2019 Laurent Deru.
+#
+#Cosmonium is free software: you can redistribute it and/or modify
+#it under the terms of the GNU General Public License as published by
+#the Free Software Foundation, either version 3 of the License, or
+#(at your option) any later version.
+#
+#Cosmonium is distributed in the hope that it will be useful,
+#but WITHOUT ANY WARRANTY; without even the implied warranty of
+#MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#GNU General Public License for more details.
+#
+#You should have received a copy of the GNU General Public License
+#along with Cosmonium.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+from __future__ import print_function
+from __future__ import absolute_import
+
+import numpy
+
+#Same as pyfrustum.InfiniteFrustum but with the planes stored in arrays to test many spheres at once
+class InfiniteFrustum(object):
+    def __init__(self, frustum, view_mat, view_position):
+        self.position = view_position
+        self.normals = numpy.empty((5, 3))
+        self.offsets = numpy.empty(5)
+        position = tuple(view_position)
+        for i in range(5):
+            plane = frustum.get_plane(i + 1) * view_mat
+            self.normals[i] = (plane[0], plane[1], plane[2])
+            self.offsets[i] = plane[3] - self.normals[i].dot(position)
+        #Scalar copy of the planes, faster for single tests
+        self.planes = [tuple(normal) + (offset,) for (normal, offset) in zip(self.normals.tolist(), self.offsets.tolist())]
+
+    def is_sphere_in(self, center, radius):
+        (x, y, z) = center
+        for (a, b, c, d) in self.planes:
+            if a * x + b * y + c * z + d > radius: return False
+        return True
+
+    def are_spheres_in(self, centers, radii):
+        dists = centers.dot(self.normals.T) + self.offsets
+        return numpy.all(dists <= radii[:, numpy.newaxis], axis=1)
+
+    def get_position(self):
+        return self.position
@@ -0,0 +1,296 @@
+#
+#This file is part of Cosmonium.
+#
+#Copyright (C) 2018-2019 Laurent Deru.
+#
+#Cosmonium is free software: you can redistribute it and/or modify
+#it under the terms of the GNU General Public License as published by
+#the Free Software Foundation, either version 3 of the License, or
+#(at your option) any later version.
+#
+#Cosmonium is distributed in the hope that it will be useful,
+#but WITHOUT ANY WARRANTY; without even the implied warranty of
+#MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#GNU General Public License for more details.
+#
+#You should have received a copy of the GNU General Public License
+#along with Cosmonium.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+from __future__ import print_function
+from __future__ import absolute_import
+
+from ..astro.astro import app_to_abs_mag
+from ..astro import units
+from . import pyoctree
+
+from panda3d.core import LQuaterniond
+
+from math import sqrt, acos
+import numpy
+
+OctreeLeaf = pyoctree.OctreeLeaf
+
+def cull_leaves(positions, magnitudes, extends, frustum, frustum_position, limit):
+    #Returns the mask of the visible leaves, their apparent magnitude and their distance
+    deltas = positions - frustum_position
+    distances = numpy.sqrt(numpy.einsum('ij,ij->i', deltas, deltas))
+    #A leaf at the frustum position gets an infinitely bright magnitude and is always in the frustum
+    with numpy.errstate(divide='ignore'):
+        app_magnitudes = magnitudes + 5 * (numpy.log10(distances / units.KmPerParsec) - 1)
+    visible = app_magnitudes < limit
+    visible[visible] = frustum.are_spheres_in(positions[visible], extends[visible])
+    return visible, app_magnitudes, distances
+
+def limit_distances(magnitudes, limit):
+    #Distance at which an object of the given absolute magnitude reaches the limit apparent magnitude
+    return numpy.power(10.0, (limit - magnitudes) / 5.0 + 1) * units.KmPerParsec
+
+def faintest_magnitude(center, radius, frustum_position, limit):
+    distance = sqrt(((center - frustum_position) ** 2).sum()) - radius
+    if distance > 0.0:
+        return app_to_abs_mag(limit, distance)
+    else:
+        return 99.0
+
+class OctreeNode(pyoctree.OctreeNode):
+    #Below this number of leaves the per leaf tests are faster than the vectorized ones
+    min_batch_size = 16
+
+    def __init__(self, level, center, width, threshold, index = -1):
+        pyoctree.OctreeNode.__init__(self, level, center, width, threshold, index)
+        self.np_center = numpy.array(tuple(center))
+        self.leaves_arrays = None
+        self.leaves_min_magnitude = 99.0
+        self.dynamic_leaves = None
+        IncrementalVisibility.init_cell(self)
+
+    def _add(self, obj, position, magnitude):
+        pyoctree.OctreeNode._add(self, obj, position, magnitude)
+        self.leaves_arrays = None
+
+    def _split(self):
+        pyoctree.OctreeNode._split(self)
+        self.leaves_arrays = None
+
+    def get_leaves_arrays(self):
+        if self.leaves_arrays is None:
+            count = len(self.leaves)
+            positions = numpy.empty((count, 3))
+            magnitudes = numpy.empty(count)
+            extends = numpy.empty(count)
+            self.dynamic_leaves = []
+            for (i, leaf) in enumerate(self.leaves):
+                positions[i] = tuple(leaf.get_global_position())
+                magnitudes[i] = leaf.get_abs_magnitude()
+                extends[i] = leaf._extend
+                if leaf.orbit.dynamic:
+                    self.dynamic_leaves.append(i)
+            self.leaves_arrays = (positions, magnitudes, extends)
+            self.leaves_min_magnitude = magnitudes.min() if count > 0 else 99.0
+        else:
+            positions = self.leaves_arrays[0]
+            for i in self.dynamic_leaves:
+                positions[i] = tuple(self.leaves[i]._global_position)
+        return self.leaves_arrays
+
+    def get_cells(self):
+        return [child for child in self.children if child is not None]
+
+    def has_dynamic_leaves(self):
+        return len(self.dynamic_leaves) > 0
+
+    def get_visible_items(self, visible):
+        leaves = self.leaves
+        return [leaves[index] for index in numpy.nonzero(visible)[0]]
+
+class VisibleObjectsTraverser(pyoctree.VisibleObjectsTraverser):
+    def __init__(self, frustum, limit, update_id):
+        pyoctree.VisibleObjectsTraverser.__init__(self, frustum, limit, update_id)
+        self.frustum_position = numpy.array(tuple(frustum.get_position()))
+
+    def traverse(self, octree, leaves):
+        if len(leaves) < octree.min_batch_size:
+            pyoctree.VisibleObjectsTraverser.traverse(self, octree, leaves)
+            return
+        frustum_position = self.frustum_position
+        (positions, magnitudes, extends) = octree.get_leaves_arrays()
+        faintest = faintest_magnitude(octree.np_center, octree.radius, frustum_position, self.limit)
+        if octree.leaves_min_magnitude >= faintest: return
+        candidates = numpy.nonzero(magnitudes < faintest)[0]
+        if len(candidates) == 0: return
+        if len(candidates) < octree.min_batch_size:
+            pyoctree.VisibleObjectsTraverser.traverse(self, octree, [leaves[index] for index in candidates])
+            return
+        visible, app_magnitudes, distances = cull_leaves(positions[candidates], magnitudes[candidates], extends[candidates],
+                                                         self.frustum, frustum_position, self.limit)
+        for index in candidates[visible]:
+            leaf = leaves[index]
+            self.collected_leaves.append(leaf)
+            leaf.update_id = self.update_id
+
+class IncrementalVisibility(object):
+    #Keeps the visible leaves of a tree across frames. Each evaluated cell stores a margin, the displacement of the
+    #observer, relative to a reference pose, that can not change the result of the evaluation. Only the cells whose
+    #margin is exceeded are evaluated again and the changes are reported as added and removed leaves.
+    #The cells must provide np_center, radius, max_magnitude, get_cells(), get_leaves_arrays(), has_dynamic_leaves()
+    #and get_visible_items(), and be initialized with init_cell()
+    #The margins are reduced to absorb the approximations of the displacement bound
+    margin_factor = 0.5
+    #Ratio of evaluated cells above which the reference pose is moved to the current pose
+    reanchor_ratio = 0.5
+
+    @staticmethod
+    def init_cell(cell):
+        cell.inc_center = tuple(cell.np_center.tolist())
+        cell.inc_entered = False
+        cell.inc_enter_margin = -1.0
+        cell.inc_leaves_margin = -1.0
+        cell.inc_subtree_margin = -1.0
+        cell.inc_visible = []
+
+    def __init__(self):
+        self.root = None
+        self.key = None
+        self.ref_position = None
+        self.ref_orientation = None
+        self.reanchor = False
+        self.visible = {}
+        self.added = []
+        self.removed = []
+        self.nb_visited = 0
+        self.nb_evaluated = 0
+
+    def get_leaves(self):
+        return list(self.visible)
+
+    def reset(self):
+        if self.root is not None:
+            self.clear(self.root)
+        self.root = None
+        self.ref_position = None
+
+    def update(self, root, frustum, orientation, limit, key):
+        #Returns True if the set of visible leaves has changed
+        self.added = []
+        self.removed = []
+        self.frustum = frustum
+        self.limit = limit
+        self.position = numpy.array(tuple(frustum.get_position()))
+        self.scalar_position = tuple(self.position.tolist())
+        if root is not self.root:
+            self.reset()
+            self.root = root
+        force = self.ref_position is None or key != self.key or self.reanchor
+        if force:
+            self.key = key
+            self.ref_position = self.position
+            self.scalar_ref_position = self.scalar_position
+            self.ref_orientation = LQuaterniond(orientation)
+            self.delta = 0.0
+            self.angle = 0.0
+        else:
+            self.delta = sqrt(((self.position - self.ref_position) ** 2).sum())
+            #get_angle_rad() returns NaN when the real part of the rotation is rounded above 1
+            rotation = self.ref_orientation.conjugate() * orientation
+            self.angle = 2 * acos(min(1.0, abs(rotation.get_r())))
+        self.nb_visited = 0
+        self.nb_evaluated = 0
+        self.visit(root, force)
+        self.reanchor = not force and self.nb_evaluated > self.nb_visited * self.reanchor_ratio
+        return len(self.added) > 0 or len(self.removed) > 0
+
+    def displacement(self, cell):
+        #Upper bound of the displacement of the cell in the view frame since the reference pose
+        if self.angle == 0.0:
+            return self.delta
+        (x, y, z) = cell.inc_center
+        (px, py, pz) = self.scalar_ref_position
+        distance = sqrt((x - px) ** 2 + (y - py) ** 2 + (z - pz) ** 2)
+        return self.delta + self.angle * (distance + cell.radius)
+
+    def visit(self, cell, force):
+        self.nb_visited += 1
+        displacement = self.displacement(cell)
+        if not force and cell.inc_subtree_margin > displacement: return
+        self.nb_evaluated += 1
+        if force or cell.inc_leaves_margin <= displacement:
+            (items, margin) = self.evaluate_leaves(cell)
+            self.update_items(cell, items)
+            cell.inc_leaves_margin = margin - displacement
+        subtree_margin = cell.inc_leaves_margin
+        for child in cell.get_cells():
+            child_displacement = self.displacement(child)
+            if force or child.inc_enter_margin <= child_displacement:
+                (entered, margin) = self.evaluate_enter(child)
+                if child.inc_entered and not entered:
+                    self.clear(child)
+                child.inc_entered = entered
+                child.inc_enter_margin = margin - child_displacement
+            subtree_margin = min(subtree_margin, child.inc_enter_margin)
+            if child.inc_entered:
+                self.visit(child, force)
+                subtree_margin = min(subtree_margin, child.inc_subtree_margin)
+        cell.inc_subtree_margin = subtree_margin
+
+    def evaluate_enter(self, cell):
+        (x, y, z) = cell.inc_center
+        (px, py, pz) = self.scalar_position
+        radius = cell.radius
+        distance = sqrt((x - px) ** 2 + (y - py) ** 2 + (z - pz) ** 2) - radius
+        if distance <= 0.0:
+            return True, -distance * self.margin_factor
+        limit_distance = 10.0 ** ((self.limit - cell.max_magnitude) / 5.0 + 1) * units.KmPerParsec
+        if distance > limit_distance:
+            return False, (distance - limit_distance) * self.margin_factor
+        outside = max([a * x + b * y + c * z + d for (a, b, c, d) in self.frustum.planes]) - radius
+        if outside > 0.0:
+            return False, min(outside, distance) * self.margin_factor
+        return True, min(limit_distance - distance, -outside) * self.margin_factor
+
+    def evaluate_leaves(self, cell):
+        (positions, magnitudes, extends) = cell.get_leaves_arrays()
+        if len(positions) == 0:
+            return [], float('inf')
+        deltas = positions - self.position
+        distances = numpy.sqrt(numpy.einsum('ij,ij->i', deltas, deltas))
+        limit_distance = limit_distances(magnitudes, self.limit)
+        outside = (positions.dot(self.frustum.normals.T) + self.frustum.offsets).max(axis=1) - extends
+        bright = distances < limit_distance
+        visible = bright & (outside <= 0.0)
+        if cell.has_dynamic_leaves():
+            margin = -1.0
+        else:
+            margins = numpy.where(visible, numpy.minimum(limit_distance - distances, -outside),
+                                  numpy.where(bright, outside, distances - limit_distance))
+            margin = margins.min() * self.margin_factor
+        return cell.get_visible_items(visible), margin
+
+    def update_items(self, cell, items):
+        previous = cell.inc_visible
+        cell.inc_visible = items
+        if previous == items: return
+        visible = self.visible
+        current = set(items)
+        for item in previous:
+            if item not in current:
+                del visible[item]
+                self.removed.append(item)
+        previous = set(previous)
+        for item in items:
+            if item not in previous:
+                visible[item] = None
+                self.added.append(item)
+
+    def clear(self, cell):
+        for item in cell.inc_visible:
+            del self.visible[item]
+            self.removed.append(item)
+        cell.inc_visible = []
+        cell.inc_leaves_margin = -1.0
+        cell.inc_subtree_margin = -1.0
+        for child in cell.get_cells():
+            if child.inc_entered:
+                self.clear(child)
+            child.inc_entered = False
+            child.inc_enter_margin = -1.0
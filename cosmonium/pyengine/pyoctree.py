@@ -96,7 +96,7 @@ class OctreeNode(object):
                 child_center.z += child_offset
             else:
                 child_center.z -= child_offset
-            child = OctreeNode(self.level + 1, child_center, self.width / 2.0, self.threshold + self.child_threshold, index)
+            child = self.__class__(self.level + 1, child_center, self.width / 2.0, self.threshold + self.child_threshold, index)
             self.children[index] = child
         self.children[index]._add(obj, position, magnitude)
 
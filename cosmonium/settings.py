@@ -34,6 +34,12 @@ version = '0.2.0'
 
 use_double = LPoint3 == LPoint3d
 cache_yaml = True
+#Keep the parsed Celestia catalogs in the cache directory
+cache_celestia = True
+#Parse the Celestia catalogs with the PLY grammar instead of the hand-written parser
+celestia_ply_parser = False
+#Only create the surface, atmosphere and clouds of the Celestia bodies when they are resolved
+lazy_celestia_bodies = True
 prc_file = 'config.prc'
 
 #OpenGL user configuration
@@ -69,9 +75,18 @@ deferred=False
 deferred_split=False
 deferred_load=True
 patch_pool_size = 4
+#Number of threads loading the texture files
+texture_loader_threads = 2
+#Build the geometry of the patches in a separate thread
+async_patch_geometry = True
+#Memory budgets, in MB, of the textures of the patches kept in cache
+patches_cache_gpu_budget = 512
+patches_cache_ram_budget = 512
 
 mouse_over = False
 use_color_picking = True
+#Read back only the region around the mouse, a few frames later, instead of the whole picking texture
+use_async_color_picking = True
 celestia_nav = True
 invert_wheel = False
 damped_nav = True
@@ -99,6 +114,16 @@ shadow_size = 1024
 shadows_slope_scale_bias = True
 shadows_pcf_16 = True
 shadows_snap_cam = False
+#Render the shadow maps in the tiles of a single shared depth buffer
+shadow_atlas = True
+#Number of tiles on each side of the shadow atlas
+shadow_atlas_tiles = 2
+#Number of frames after which a shadow map is rendered again even if its caster did not move
+shadows_max_age = 60
+#Generate the shaders with fixed shadow slots enabled by uniforms, a change of caster does not rebuild the shader
+shadows_fixed_slots = True
+#Number of shadow map slots of each shader when the fixed slots are used
+shadow_map_slots = 2
 
 hud_font = 'DejaVuSans'
 markdown_font = 'DejaVuSans'
@@ -106,6 +131,9 @@ label_font = 'DejaVuSans'
 
 label_size = 12
 constellations_label_size = 16
+#Draw all the labels with a few batched geoms instead of one node per label, the batched labels are only pickable
+#with the color picking
+use_batch_labels = True
 convert_utf8 = True
 
 screenshot_path = None
@@ -146,12 +174,35 @@ min_altitude = 2 * units.m
 shader_noise=True
 c_noise=True
 
+#Use the NumPy octree traversal when the C++ engine is not available
+batched_octree = True
+#Only re-evaluate the octree cells whose visibility can have changed since the last frame
+incremental_octree = True
+#Propagate the elliptical orbits of the bodies of a system with a single vectorized Kepler solver
+batched_orbits = True
+
 debug_vt = False
 debug_lod_show_bb = False
 debug_lod_freeze = False
 debug_lod_split_merge = False
 debug_lod_frustum = False
 dump_shaders = True
+#Keep the generated shaders in the cache directory across runs
+shaders_disk_cache = True
+#Size budget, in MB, of the shaders disk cache, the least recently used shaders are removed at startup
+shaders_disk_cache_budget = 64
+#Number of frames kept by the frame profiler
+profiler_frames = 600
+#Number of frames averaged in the profiler panel
+profiler_hud_frames = 60
+#Keep the generated heightmap and texture patches on disk
+tiles_disk_cache = True
+#Size budget, in MB, of the tiles disk cache, the least recently used tiles are removed at startup
+tiles_disk_cache_budget = 1024
+#Keep the O'Neil optical depth lookup tables on disk
+oneil_lookup_disk_cache = True
+#Generate the O'Neil lookup tables with NumPy instead of an offscreen buffer
+oneil_cpu_lookup_tables = False
 dump_panda_shaders = False
 debug_shadow_frustum = False
 debug_sync_load = False
@@ -193,6 +244,8 @@ grid_thickness = 0.5
 
 asterism_thickness = 0.9
 boundary_thickness = 0.9
+#Pack the lines of all the asterisms and all the boundaries in one geom each
+merge_annotation_lines = True
 
 wireframe_fill_color = LColor(0.5, 0.5, 0.5, 1.0)
 
@@ -252,6 +305,8 @@ hardware_instancing = False
 texture_array = False
 aux_buffer = False
 color_picking = False
+async_color_picking = False
+batch_labels = False
 
 # Window configuration
 win_fullscreen = False
@@ -21,9 +21,11 @@ from __future__ import print_function
 from __future__ import absolute_import
 
 from panda3d.core import Shader, ShaderAttrib, LVector3d, LMatrix4, PTA_LMatrix4, LQuaternion
+from panda3d.core import Texture, Camera, OrthographicLens, NodePath, LVecBase4, LColor
 
 from .utils import TransparencyBlend
 from .cache import create_path_for
+from .shaderscache import shadersDiskCache
 from .parameters import ParametersGroup
 from . import settings
 
@@ -34,6 +36,8 @@ import re
 
 class ShaderBase(object):
     shaders_cache = {}
+    #Hash of the code of the created shaders, indexed by shader id
+    shaders_code_hashes = {}
 
     def __init__(self):
         self.shader = None
@@ -42,6 +46,9 @@ class ShaderBase(object):
     def get_shader_id(self):
         return None
 
+    def get_code_hash(self):
+        return self.shaders_code_hashes.get(self.get_shader_id(), '')
+
     def define_shader(self, shape, appearance):
         pass
 
@@ -171,9 +178,11 @@ class ShaderProgram(object):
         self.shader_type = shader_type
         self.version = settings.shader_version
         self.functions = {}
+        self.includes = []
 
     def clear_functions(self):
         self.functions = {}
+        self.includes = []
 
     def add_function(self, code, name, func):
         if not name in self.functions:
@@ -185,6 +194,7 @@ class ShaderProgram(object):
             data = open(filename)
             code += data.readlines()
             self.functions[name] = True
+            self.includes.append(filename)
 
     def pi(self, code):
         code.append("const float pi  = 3.14159265358;")
@@ -311,39 +321,48 @@ class StructuredShader(ShaderBase):
 
     def create_shader(self):
         shader_id = self.get_shader_id()
+        stages = None
+        if settings.shaders_disk_cache:
+            stages = shadersDiskCache.load(shader_id)
+            if stages is not None:
+                print("Loading cached shader", shader_id)
+        if stages is None:
+            stages = self.generate_stages(shader_id)
+            if settings.shaders_disk_cache:
+                shadersDiskCache.store(shader_id, stages)
+        md5 = hashlib.md5()
+        for stage in shadersDiskCache.stages:
+            md5.update(stages[stage].encode())
+        self.shaders_code_hashes[shader_id] = md5.hexdigest()
+        return Shader.make(Shader.SL_GLSL,
+                           vertex=stages['vertex'],
+                           tess_control=stages['tess_control'],
+                           tess_evaluation=stages['tess_evaluation'],
+                           geometry=stages['geometry'],
+                           fragment=stages['fragment'])
+
+    def generate_stages(self, shader_id):
         if settings.dump_shaders:
             dump = hashlib.md5(shader_id.encode()).hexdigest()
             print("Creating shader %s (%s)" %(shader_id, dump))
         else:
             dump = None
             print("Creating shader", shader_id)
-
-        if self.vertex_shader:
-            vertex = self.vertex_shader.generate_shader(dump, shader_id)
-        else:
-            vertex = ''
-        if self.tessellation_control_shader:
-            tess_control = self.tessellation_control_shader.generate_shader(dump, shader_id)
-        else:
-            tess_control = ''
-        if self.tessellation_eval_shader:
-            tess_evaluation = self.tessellation_eval_shader.generate_shader(dump, shader_id)
-        else:
-            tess_evaluation = ''
-        if self.geometry_shader:
-            geometry = self.geometry_shader.generate_shader(dump, shader_id)
-        else:
-            geometry = ''
-        if self.fragment_shader:
-            fragment = self.fragment_shader.generate_shader(dump, shader_id)
-        else:
-            fragment = ''
-        return Shader.make(Shader.SL_GLSL,
-                           vertex=vertex,
-                           tess_control=tess_control,
-                           tess_evaluation=tess_evaluation,
-                           geometry=geometry,
-                           fragment=fragment)
+        stages = {}
+        includes = set()
+        for (name, program) in (('vertex', self.vertex_shader),
+                                ('tess_control', self.tessellation_control_shader),
+                                ('tess_evaluation', self.tessellation_eval_shader),
+                                ('geometry', self.geometry_shader),
+                                ('fragment', self.fragment_shader)):
+            if program:
+                stages[name] = program.generate_shader(dump, shader_id)
+                includes.update(program.includes)
+            else:
+                stages[name] = ''
+        #The included files are not part of the generator sources, they are checked when the shader is reloaded
+        stages['includes'] = sorted(includes)
+        return stages
 
 class TexturePassThroughVertexShader(ShaderProgram):
     def __init__(self, config):
@@ -2240,84 +2259,162 @@ vec3 get_bias(float slope_bias, float normal_bias, vec3 normal, vec3 light_dir)
 
     def fragment_uniforms(self, code):
         code.append("uniform sampler2DShadow %s_depthmap;" % self.name)
+        code.append("uniform vec4 %s_shadow_tile;" % self.name)
         code.append("uniform float %s_shadow_coef;" % self.name)
 
     def fragment_inputs(self, code):
         code.append("in vec4 %s_lightcoord;" % self.name)
 
+    def tile_sample(self, code):
+        code.append('''
+float shadow_tile_sample(sampler2DShadow shadow_map, vec3 shadow_coord, vec4 tile)
+{
+    //The filtered texels are kept inside the tile, the neighbour tiles belong to other casters
+    vec2 half_texel = 0.5 / textureSize(shadow_map, 0).xy;
+    return texture(shadow_map, vec3(clamp(shadow_coord.xy, tile.xy + half_texel, tile.xy + tile.zw - half_texel), shadow_coord.z));
+}''')
+
     def pcf_16(self, code):
         code.append('''
-float shadow_pcf_16(sampler2DShadow shadow_map, vec4 shadow_coord)
+float shadow_pcf_16(sampler2DShadow shadow_map, vec3 shadow_coord, vec4 tile)
 {
     float shadow = 0.0;
-    if (shadow_coord.w > .0)
-    {
-        vec2 pixel_size = 1.0 / textureSize(shadow_map, 0).xy;
-        float x, y;
-        for (y = -1.5 ; y <= 1.5 ; y += 1.0) {
-            for (x = -1.5 ; x <= 1.5 ; x += 1.0) {
-                float offset_x = x * pixel_size.x * shadow_coord.w;
-                float offset_y = y * pixel_size.y * shadow_coord.w;
-                shadow += textureProj(shadow_map, vec4(shadow_coord.x + offset_x, shadow_coord.y + offset_y, shadow_coord.z, shadow_coord.w));
-            }
+    vec2 pixel_size = 1.0 / textureSize(shadow_map, 0).xy;
+    float x, y;
+    for (y = -1.5 ; y <= 1.5 ; y += 1.0) {
+        for (x = -1.5 ; x <= 1.5 ; x += 1.0) {
+            shadow += shadow_tile_sample(shadow_map, vec3(shadow_coord.xy + vec2(x, y) * pixel_size, shadow_coord.z), tile);
         }
-        shadow /= 16.0;
-    } else {
-        shadow = 1.0;
     }
-    return shadow;
+    return shadow / 16.0;
 }''')
 
     def fragment_extra(self, code):
-        if self.use_pcf_16:
-            self.shader.fragment_shader.add_function(code, 'shadow_pcf_16', self.pcf_16)
+        if self.shader.fragment_shader.version >= 130:
+            self.shader.fragment_shader.add_function(code, 'shadow_tile_sample', self.tile_sample)
+            if self.use_pcf_16:
+                self.shader.fragment_shader.add_function(code, 'shadow_pcf_16', self.pcf_16)
 
     def fragment_shader(self, code):
+        #The map can be a tile of the shadow atlas, the fragments outside of the tile are not shadowed
+        code.append("if (%s_lightcoord.w > 0.0 && all(greaterThanEqual(%s_lightcoord.xy, vec2(0.0))) && all(lessThanEqual(%s_lightcoord.xy, vec2(%s_lightcoord.w)))) {" % (self.name, self.name, self.name, self.name))
+        code.append("  vec3 %s_tilecoord = vec3(%s_lightcoord.xy / %s_lightcoord.w * %s_shadow_tile.zw + %s_shadow_tile.xy, %s_lightcoord.z / %s_lightcoord.w);" % (self.name, self.name, self.name, self.name, self.name, self.name, self.name))
         if self.shader.fragment_shader.version < 130:
-            code.append("shadow *= 1.0 - (1.0 - shadow2D(%s_depthmap, %s_lightcoord.xyz).x) * %s_shadow_coef;" % (self.name, self.name, self.name))
+            code.append("  shadow *= 1.0 - (1.0 - shadow2D(%s_depthmap, %s_tilecoord).x) * %s_shadow_coef;" % (self.name, self.name, self.name))
         else:
             if self.use_pcf_16:
-                code.append("shadow *= 1.0 - (1.0 - shadow_pcf_16(%s_depthmap, %s_lightcoord)) * %s_shadow_coef;" % (self.name, self.name, self.name))
+                code.append("  shadow *= 1.0 - (1.0 - shadow_pcf_16(%s_depthmap, %s_tilecoord, %s_shadow_tile)) * %s_shadow_coef;" % (self.name, self.name, self.name, self.name))
             else:
-                code.append("shadow *= 1.0 - (1.0 - textureProj(%s_depthmap, %s_lightcoord)) * %s_shadow_coef;" % (self.name, self.name, self.name))
+                code.append("  shadow *= 1.0 - (1.0 - shadow_tile_sample(%s_depthmap, %s_tilecoord, %s_shadow_tile)) * %s_shadow_coef;" % (self.name, self.name, self.name, self.name))
+        code.append("}")
 
     def update_shader_shape_static(self, shape, appearance):
         shape.instance.setShaderInput('%s_depthmap' % self.name, self.caster.depthmap)
         shape.instance.setShaderInput("%sLightSource" % self.name, self.caster.cam)
+        shape.instance.setShaderInput('%s_shadow_tile' % self.name, self.caster.tile_rect)
         if self.caster_body is None:
             shape.instance.setShaderInput('%s_shadow_coef' % self.name, 1.0)
 
     def update_shader_shape(self, shape, appearance):
         if self.use_bias:
-            normal_bias = appearance.shadow_normal_bias / 100.0 * shape.owner.scene_scale_factor * shape.owner.get_apparent_radius()
-            slope_bias = appearance.shadow_slope_bias /100.0 * shape.owner.scene_scale_factor * shape.owner.get_apparent_radius()
-            depth_bias = appearance.shadow_depth_bias / 100.0 * shape.owner.scene_scale_factor * shape.owner.get_apparent_radius()
-            #print(normal_bias, slope_bias, depth_bias, shape.owner.scene_scale_factor, shape.owner.get_apparent_radius())
-            shape.instance.setShaderInput('%s_shadow_normal_bias' % self.name, normal_bias)
-            shape.instance.setShaderInput('%s_shadow_slope_bias' % self.name, slope_bias)
-            shape.instance.setShaderInput('%s_shadow_depth_bias' % self.name, depth_bias)
-            light_dir = shape.owner.vector_to_star
-            shape.instance.setShaderInput("%s_light_dir" % self.name, *light_dir)
+            self.update_bias(shape, appearance)
         if self.caster_body is not None:
-            caster = self.caster_body
-            body = shape.owner
-            self_radius = caster.get_apparent_radius()
-            body_radius = body.get_apparent_radius()
-            position = caster._local_position
-            body_position = body._local_position
-            pa = body_position - position
-            distance = abs(pa.length() - body_radius)
-            if distance != 0:
-                self_ar = asin(self_radius / distance) if self_radius < distance else pi / 2
-                star_ar = asin(caster.star.get_apparent_radius() / ((caster.star._local_position - body_position).length() - body_radius))
-                ar_ratio = self_ar /star_ar
-            else:
-                ar_ratio = 1.0
-            shape.instance.setShaderInput('%s_shadow_coef' % self.name, min(max(ar_ratio * ar_ratio, 0.0), 1.0))
+            self.update_shadow_coef(shape)
+
+    def update_bias(self, shape, appearance):
+        normal_bias = appearance.shadow_normal_bias / 100.0 * shape.owner.scene_scale_factor * shape.owner.get_apparent_radius()
+        slope_bias = appearance.shadow_slope_bias /100.0 * shape.owner.scene_scale_factor * shape.owner.get_apparent_radius()
+        depth_bias = appearance.shadow_depth_bias / 100.0 * shape.owner.scene_scale_factor * shape.owner.get_apparent_radius()
+        #print(normal_bias, slope_bias, depth_bias, shape.owner.scene_scale_factor, shape.owner.get_apparent_radius())
+        shape.instance.setShaderInput('%s_shadow_normal_bias' % self.name, normal_bias)
+        shape.instance.setShaderInput('%s_shadow_slope_bias' % self.name, slope_bias)
+        shape.instance.setShaderInput('%s_shadow_depth_bias' % self.name, depth_bias)
+        light_dir = shape.owner.vector_to_star
+        shape.instance.setShaderInput("%s_light_dir" % self.name, *light_dir)
+
+    def update_shadow_coef(self, shape):
+        caster = self.caster_body
+        body = shape.owner
+        self_radius = caster.get_apparent_radius()
+        body_radius = body.get_apparent_radius()
+        position = caster._local_position
+        body_position = body._local_position
+        pa = body_position - position
+        distance = abs(pa.length() - body_radius)
+        if distance != 0:
+            self_ar = asin(self_radius / distance) if self_radius < distance else pi / 2
+            star_ar = asin(caster.star.get_apparent_radius() / ((caster.star._local_position - body_position).length() - body_radius))
+            ar_ratio = self_ar /star_ar
+        else:
+            ar_ratio = 1.0
+        shape.instance.setShaderInput('%s_shadow_coef' % self.name, min(max(ar_ratio * ar_ratio, 0.0), 1.0))
 
     def clear(self, shape, appearance):
         shape.instance.clearShaderInput('%s_depthmap' % self.name)
         shape.instance.clearShaderInput("%sLightSource" % self.name)
+        shape.instance.clearShaderInput('%s_shadow_tile' % self.name)
+
+class EmptyShadowMap(object):
+    #Bound to the unused shadow map slots, a cleared depth map which never shadows
+    def __init__(self):
+        self.depthmap = Texture('empty-shadow-map')
+        self.depthmap.setup_2d_texture(1, 1, Texture.T_float, Texture.F_depth_component)
+        self.depthmap.set_clear_color(LColor(1, 1, 1, 1))
+        self.depthmap.setMinfilter(Texture.FTShadow)
+        self.depthmap.setMagfilter(Texture.FTShadow)
+        self.cam = NodePath(Camera('empty-shadow-camera', OrthographicLens()))
+        self.tile_rect = LVecBase4(0, 0, 1, 1)
+
+class ShaderShadowMapSlot(ShaderShadowMap):
+    #Shadow map with a fixed name, the shader does not depend on the caster and is not rebuilt when it changes.
+    #The bias code is always generated and the slot is disabled with a zero shadow coefficient
+    empty_map = None
+
+    def __init__(self, index, shader=None):
+        ShaderShadowMap.__init__(self, 'slot%d' % index, None, None, True, shader)
+        self.self_shadow = False
+
+    def is_free(self):
+        return self.caster is None
+
+    def set_caster(self, caster_body, caster, self_shadow):
+        self.caster_body = caster_body
+        self.caster = caster
+        self.self_shadow = self_shadow
+
+    def fragment_shader(self, code):
+        code.append("if (%s_shadow_coef > 0.0) {" % self.name)
+        ShaderShadowMap.fragment_shader(self, code)
+        code.append("}")
+
+    def update_shader_shape_static(self, shape, appearance):
+        caster = self.caster
+        if caster is None:
+            if ShaderShadowMapSlot.empty_map is None:
+                ShaderShadowMapSlot.empty_map = EmptyShadowMap()
+            caster = ShaderShadowMapSlot.empty_map
+        shape.instance.setShaderInput('%s_depthmap' % self.name, caster.depthmap)
+        shape.instance.setShaderInput("%sLightSource" % self.name, caster.cam)
+        shape.instance.setShaderInput('%s_shadow_tile' % self.name, caster.tile_rect)
+        if self.caster is None:
+            shape.instance.setShaderInput('%s_shadow_coef' % self.name, 0.0)
+        elif self.caster_body is None:
+            shape.instance.setShaderInput('%s_shadow_coef' % self.name, 1.0)
+
+    def update_shader_shape(self, shape, appearance):
+        if self.self_shadow:
+            self.update_bias(shape, appearance)
+        else:
+            shape.instance.setShaderInput('%s_shadow_normal_bias' % self.name, 0.0)
+            shape.instance.setShaderInput('%s_shadow_slope_bias' % self.name, 0.0)
+            shape.instance.setShaderInput('%s_shadow_depth_bias' % self.name, 0.0)
+            shape.instance.setShaderInput("%s_light_dir" % self.name, *shape.owner.vector_to_star)
+        if self.caster is not None and self.caster_body is not None:
+            self.update_shadow_coef(shape)
+
+    def clear(self, shape, appearance):
+        ShaderShadowMap.clear(self, shape, appearance)
+        shape.instance.clearShaderInput('%s_shadow_coef' % self.name)
 
 class ShaderSphereShadow(ShaderShadow):
     use_vertex = True
@@ -2405,10 +2502,17 @@ class ShaderSphereShadow(ShaderShadow):
         star = shape.owner.star
         observer = shape.owner.context.observer._position
         scale = shape.owner.scene_scale_factor
-        if self.far_sun:
-            shape.instance.setShaderInput('star_ar', asin(star.get_apparent_radius() / shape.owner.distance_to_star))
-        star_center = (star._local_position - observer) * scale
-        star_radius = star.get_apparent_radius() * scale
+        if star is not None:
+            if self.far_sun:
+                shape.instance.setShaderInput('star_ar', asin(star.get_apparent_radius() / shape.owner.distance_to_star))
+            star_center = (star._local_position - observer) * scale
+            star_radius = star.get_apparent_radius() * scale
+        else:
+            #The component can be installed before the target has a star, there is then no occluder
+            if self.far_sun:
+                shape.instance.setShaderInput('star_ar', 0.0)
+            star_center = LVector3d()
+            star_radius = 0.0
         shape.instance.setShaderInput('star_center', star_center)
         shape.instance.setShaderInput('star_radius', star_radius)
         centers = []
@@ -2430,6 +2534,12 @@ class ShaderSphereShadow(ShaderShadow):
                 descale_mat = rotation_mat_inv * descale * rotation_mat
                 occluder_transform.push_back(descale_mat)
         nb_of_occluders = len(shape.parent.shadows.sphere_shadows.occluders)
+        #The arrays are padded as the component can be kept in the shader without any occluder
+        while len(centers) < self.max_occluders:
+            centers.append(LVector3d())
+            radii.append(0.0)
+            if self.oblate_occluder:
+                occluder_transform.push_back(LMatrix4.ident_mat())
         shape.instance.setShaderInput('occluder_centers', centers)
         shape.instance.setShaderInput('occluder_radii', radii)
         if self.oblate_occluder:
@@ -0,0 +1,142 @@
+#
+#This file is part of Cosmonium.
+#
+#Copyright (C) 2018-2019 Laurent Deru.
+#
+#Cosmonium is free software: you can redistribute it and/or modify
+#it under the terms of the GNU General Public License as published by
+#the Free Software Foundation, either version 3 of the License, or
+#(at your option) any later version.
+#
+#Cosmonium is distributed in the hope that it will be useful,
+#but WITHOUT ANY WARRANTY; without even the implied warranty of
+#MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#GNU General Public License for more details.
+#
+#You should have received a copy of the GNU General Public License
+#along with Cosmonium.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+from __future__ import print_function
+from __future__ import absolute_import
+
+from panda3d.core import PandaSystem
+
+from .cache import create_path_for, prune_cache_dir, touch_cache_entry
+from . import settings
+
+import hashlib
+import json
+import os
+
+class ShadersDiskCache(object):
+    #Increase when the format of the cache entries changes
+    version = 2
+    stages = ['vertex', 'tess_control', 'tess_evaluation', 'geometry', 'fragment']
+    #Settings read by the generators that are not part of the shader ids
+    generator_settings = ['shader_version', 'core_profile', 'use_double', 'encode_float', 'instancing_use_tex',
+                          'multisamples', 'disable_multisampling', 'shader_normals_use_centroid',
+                          'shadows_slope_scale_bias', 'shadows_pcf_16', 'shadow_atlas', 'shadow_atlas_tiles',
+                          'shadows_fixed_slots', 'shadow_map_slots',
+                          'shader_debug_fragment_shader', 'shader_debug_coord', 'shader_debug_coord_line_width',
+                          'shader_debug_raymarching_canvas', 'shader_debug_raymarching_slice']
+
+    def __init__(self):
+        self.path = None
+        self.sources_hash = None
+        self.generator_hash = None
+        self.files_hashes = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get_path(self):
+        if self.path is None:
+            self.path = create_path_for('shaders', 'cache')
+        return self.path
+
+    def get_sources_hash(self):
+        #The generator sources do not change while running, they are hashed once per run
+        if self.sources_hash is None:
+            md5 = hashlib.md5()
+            md5.update(("%d-%s" % (self.version, PandaSystem.get_version_string())).encode())
+            package_path = os.path.dirname(os.path.abspath(__file__))
+            for (root, dirs, files) in os.walk(package_path):
+                dirs.sort()
+                for filename in sorted(files):
+                    if not filename.endswith('.py'): continue
+                    with open(os.path.join(root, filename), 'rb') as source:
+                        md5.update(source.read())
+            self.sources_hash = md5.hexdigest()
+        return self.sources_hash
+
+    def get_generator_hash(self):
+        #The generated code also depends on some settings, the hash is recomputed when they are modified
+        if self.generator_hash is None:
+            md5 = hashlib.md5()
+            md5.update(self.get_sources_hash().encode())
+            for name in self.generator_settings:
+                md5.update(("%s=%r" % (name, getattr(settings, name, None))).encode())
+            self.generator_hash = md5.hexdigest()
+        return self.generator_hash
+
+    def get_file_hash(self, filename):
+        file_hash = self.files_hashes.get(filename)
+        if file_hash is None:
+            try:
+                with open(filename, 'rb') as source:
+                    file_hash = hashlib.md5(source.read()).hexdigest()
+            except IOError:
+                file_hash = ''
+            self.files_hashes[filename] = file_hash
+        return file_hash
+
+    def check_settings(self):
+        self.generator_hash = None
+
+    def get_filename(self, shader_id):
+        key = hashlib.md5((shader_id + '-' + self.get_generator_hash()).encode()).hexdigest()
+        return os.path.join(self.get_path(), key + '.json')
+
+    def load(self, shader_id):
+        filename = self.get_filename(shader_id)
+        if not os.path.exists(filename):
+            self.misses += 1
+            return None
+        try:
+            with open(filename) as cache_file:
+                entry = json.load(cache_file)
+        except (IOError, ValueError) as e:
+            print("Invalid shader cache entry", filename, e)
+            self.misses += 1
+            return None
+        if entry.get('id') != shader_id:
+            self.misses += 1
+            return None
+        includes = entry.get('includes', {})
+        for (include, file_hash) in includes.items():
+            if self.get_file_hash(include) != file_hash:
+                self.misses += 1
+                return None
+        touch_cache_entry(filename)
+        self.hits += 1
+        stages = dict([(stage, entry.get(stage, '')) for stage in self.stages])
+        stages['includes'] = sorted(includes)
+        return stages
+
+    def store(self, shader_id, stages):
+        entry = dict([(stage, stages.get(stage, '')) for stage in self.stages])
+        entry['id'] = shader_id
+        entry['includes'] = dict([(include, self.get_file_hash(include)) for include in stages.get('includes', [])])
+        filename = self.get_filename(shader_id)
+        try:
+            with open(filename, 'w') as cache_file:
+                json.dump(entry, cache_file)
+        except IOError as e:
+            print("Could not write shader cache entry", filename, e)
+
+    def prune(self):
+        (nb_removed, size) = prune_cache_dir(self.get_path(), '.json', settings.shaders_disk_cache_budget * 1024 * 1024)
+        if nb_removed > 0:
+            print("Shaders cache: removed", nb_removed, "entries, size", size // (1024 * 1024), "MB")
+
+shadersDiskCache = ShadersDiskCache()
@@ -21,25 +21,243 @@ from __future__ import print_function
 from __future__ import absolute_import
 
 from panda3d.core import WindowProperties, FrameBufferProperties, GraphicsPipe, GraphicsOutput
-from panda3d.core import Texture, OrthographicLens, PandaNode, NodePath
-from panda3d.core import LVector3, LPoint3, LVector3d, LPoint4, Mat4
+from panda3d.core import Texture, OrthographicLens, PandaNode, NodePath, Camera
+from panda3d.core import LVector3, LPoint3, LVector3d, LPoint4, LVecBase4, Mat4
 from panda3d.core import ColorWriteAttrib, LColor, CullFaceAttrib, RenderState, DepthOffsetAttrib
 
 from .foundation import BaseObject
-from .shaders import ShaderShadowMap, ShaderRingShadow, ShaderSphereShadow
+from .shaders import AutoShader, ShaderShadowMap, ShaderShadowMapSlot, ShaderRingShadow, ShaderSphereShadow
+from .pstats import levelpstat
 
 from . import settings
 
+from math import pi
+import numpy
+
+def check_cast_shadows(positions, radii, vectors_to_star, target_positions, target_radii, star_positions, star_radii):
+    #Same test as ReflectiveBody.check_cast_shadow_on() done on arrays of casters and targets
+    #Returns the mask of the casting pairs and the distance of each pair to the boundary of the test
+    pa = target_positions - positions
+    distances = numpy.abs(numpy.sqrt(numpy.einsum('ij,ij->i', pa, pa)) - target_radii)
+    star_deltas = star_positions - target_positions
+    star_distances = numpy.sqrt(numpy.einsum('ij,ij->i', star_deltas, star_deltas)) - target_radii
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        self_ar = numpy.where(radii < distances, numpy.arcsin(numpy.minimum(radii / distances, 1.0)), pi / 2)
+        star_ar = numpy.arcsin(star_radii / star_distances)
+        ar_ratio = numpy.where(distances != 0, self_ar / star_ar, 1.0)
+    #The shadow coef must be bigger than the min change in pixel color
+    visible = (distances == 0) | (ar_ratio * ar_ratio >= 1.0 / 255)
+    #As the vector to the star is normalized, the face is the projection of the vector to the target
+    face = numpy.einsum('ij,ij->i', vectors_to_star, pa)
+    distance_vectors = pa - vectors_to_star * face[:, numpy.newaxis]
+    distances = numpy.sqrt(numpy.einsum('ij,ij->i', distance_vectors, distance_vectors))
+    radius = (1 + ar_ratio) * radii + target_radii
+    casting = visible & (face < 0.0) & (distances < radius)
+    margins = numpy.minimum(numpy.abs(face), numpy.abs(radius - distances))
+    return casting, margins
+
+class ShadowCastersCache(object):
+    #Keeps the shadow relationships between the bodies of a system. The relationships are evaluated again only if
+    #the relative position of a pair or the direction of the star has moved more than the margin of the pair.
+    #The caster set is only reported when it has changed, so the shadow inputs of the shaders are not rebuilt
+    #Below this number of pairs the per pair tests are faster than the vectorized ones
+    min_batch_size = 8
+    #The margins are reduced to absorb the change of the apparent size ratio of the caster and the star
+    margin_factor = 0.5
+
+    def __init__(self):
+        self.pairs = None
+        self.bodies = None
+        self.casters = None
+        self.targets = None
+        self.casting = None
+        self.key = None
+        self.ref_pa = None
+        self.ref_vectors = None
+        self.margins = None
+        self.nb_evaluated = 0
+
+    def set_pairs(self, pairs):
+        self.pairs = pairs
+        indexes = {}
+        for pair in pairs:
+            for body in pair:
+                if body not in indexes:
+                    indexes[body] = len(indexes)
+        self.bodies = list(indexes)
+        self.casters = numpy.array([indexes[caster] for (caster, target) in pairs])
+        self.targets = numpy.array([indexes[target] for (caster, target) in pairs])
+
+    def get_geometry(self):
+        positions = numpy.array([tuple(body._local_position) for body in self.bodies])
+        vectors = numpy.array([tuple(body.vector_to_star) for body in self.bodies])
+        return positions, positions[self.targets] - positions[self.casters], vectors[self.casters]
+
+    def moved(self, pa, vectors):
+        deltas = pa - self.ref_pa
+        vector_deltas = vectors - self.ref_vectors
+        displacements = numpy.sqrt(numpy.einsum('ij,ij->i', deltas, deltas))
+        displacements += 2 * numpy.sqrt(numpy.einsum('ij,ij->i', vector_deltas, vector_deltas)) * numpy.sqrt(numpy.einsum('ij,ij->i', pa, pa))
+        return numpy.any(displacements >= self.margins)
+
+    def evaluate(self, positions, pa, vectors):
+        self.nb_evaluated += 1
+        bodies = self.bodies
+        radii = numpy.array([body.get_apparent_radius() for body in bodies])
+        star_positions = numpy.array([tuple(body.star._local_position) for body in bodies])
+        star_radii = numpy.array([body.star.get_apparent_radius() for body in bodies])
+        casters = self.casters
+        targets = self.targets
+        casting, margins = check_cast_shadows(positions[casters], radii[casters], vectors,
+                                              positions[targets], radii[targets],
+                                              star_positions[casters], star_radii[casters])
+        self.ref_pa = pa
+        self.ref_vectors = vectors
+        self.margins = margins * self.margin_factor
+        return [pair for (pair, cast) in zip(self.pairs, casting.tolist()) if cast]
+
+    def update(self, pairs, key):
+        #Returns the list of casting pairs if it has changed since the last call, None otherwise
+        if len(pairs) < self.min_batch_size:
+            self.nb_evaluated += 1
+            casting = [(caster, target) for (caster, target) in pairs if caster.check_cast_shadow_on(target)]
+            self.pairs = None
+        elif pairs != self.pairs:
+            self.set_pairs(pairs)
+            casting = self.evaluate(*self.get_geometry())
+        else:
+            (positions, pa, vectors) = self.get_geometry()
+            if not self.moved(pa, vectors):
+                casting = self.casting
+            else:
+                casting = self.evaluate(positions, pa, vectors)
+        if casting == self.casting and key == self.key:
+            return None
+        self.casting = casting
+        self.key = key
+        return casting
+
+class ShadowAtlasTile(object):
+    def __init__(self, atlas, index, display_region, cam):
+        self.atlas = atlas
+        self.index = index
+        self.display_region = display_region
+        self.cam = cam
+        tiles = atlas.nb_tiles
+        (x, y) = (index % tiles, index // tiles)
+        #Offset and scale of the tile in the atlas texture
+        self.rect = LVecBase4(float(x) / tiles, float(y) / tiles, 1.0 / tiles, 1.0 / tiles)
+
+class ShadowAtlas(object):
+    #A single depth buffer split in tiles, each shadow map renders in its own tile with its own camera
+    def __init__(self):
+        self.buffer = None
+        self.depthmap = None
+        self.tiles = None
+        self.free_tiles = []
+        self.frame = None
+        self.nb_rendered = 0
+        self.nb_skipped = 0
+        self.tiles_pstat = levelpstat('shadow tiles')
+        self.rendered_pstat = levelpstat('shadow rendered')
+        self.skipped_pstat = levelpstat('shadow skipped')
+
+    def create(self):
+        self.nb_tiles = settings.shadow_atlas_tiles
+        self.tile_size = settings.shadow_size
+        self.size = self.tile_size * self.nb_tiles
+        self.tiles = []
+        winprops = WindowProperties.size(self.size, self.size)
+        props = FrameBufferProperties()
+        props.setRgbColor(0)
+        props.setAlphaBits(0)
+        props.setDepthBits(1)
+        self.buffer = base.graphicsEngine.makeOutput(
+            base.pipe, "shadowsAtlas", -2,
+            props, winprops,
+            GraphicsPipe.BFRefuseWindow,
+            base.win.getGsg(), base.win)
+        if not self.buffer:
+            print("Video driver cannot create an offscreen buffer.")
+            return
+        #The tiles are cleared by their display region, the tiles not rendered keep their content
+        self.buffer.disable_clears()
+        self.depthmap = Texture()
+        self.buffer.addRenderTexture(self.depthmap, GraphicsOutput.RTMBindOrCopy,
+                                 GraphicsOutput.RTPDepthStencil)
+        self.depthmap.setMinfilter(Texture.FTShadow)
+        self.depthmap.setMagfilter(Texture.FTShadow)
+        self.depthmap.setBorderColor(LColor(1, 1, 1, 1))
+        self.depthmap.setWrapU(Texture.WMBorderColor)
+        self.depthmap.setWrapV(Texture.WMBorderColor)
+        self.free_tiles = list(range(self.nb_tiles * self.nb_tiles))
+
+    def alloc_tile(self):
+        if self.tiles is None:
+            self.create()
+        if self.buffer is None or len(self.free_tiles) == 0:
+            return None
+        index = self.free_tiles.pop(0)
+        tiles = self.nb_tiles
+        (x, y) = (index % tiles, index // tiles)
+        display_region = self.buffer.make_display_region(float(x) / tiles, float(x + 1) / tiles, float(y) / tiles, float(y + 1) / tiles)
+        display_region.set_clear_depth_active(True)
+        display_region.set_clear_depth(1.0)
+        cam = render.attach_new_node(Camera('shadow-tile-%d' % index, OrthographicLens()))
+        display_region.set_camera(cam)
+        tile = ShadowAtlasTile(self, index, display_region, cam)
+        self.tiles.append(tile)
+        self.tiles_pstat.set_level(len(self.tiles))
+        return tile
+
+    def free_tile(self, tile):
+        self.buffer.remove_display_region(tile.display_region)
+        self.tiles.remove(tile)
+        self.free_tiles.append(tile.index)
+        self.free_tiles.sort()
+        self.tiles_pstat.set_level(len(self.tiles))
+
+    def count(self, rendered):
+        frame = globalClock.get_frame_count()
+        if frame != self.frame:
+            self.frame = frame
+            self.nb_rendered = 0
+            self.nb_skipped = 0
+        if rendered:
+            self.nb_rendered += 1
+        else:
+            self.nb_skipped += 1
+        self.rendered_pstat.set_level(self.nb_rendered)
+        self.skipped_pstat.set_level(self.nb_skipped)
+
+shadow_atlas = ShadowAtlas()
+
 class ShadowMap(object):
+    #The map is rendered again only when the caster moved by more than a texel relative to the shadow camera, or
+    #after shadows_max_age frames to pick up the changes of its geometry
     def __init__(self, size):
         self.size = size
         self.buffer = None
         self.depthmap = None
         self.cam = None
+        self.tile = None
+        self.tile_rect = LVecBase4(0, 0, 1, 1)
         self.shadow_caster = None
         self.snap_cam = settings.shadows_snap_cam
+        self.last_state = None
+        self.age = 0
 
     def create(self):
+        if settings.shadow_atlas:
+            self.tile = shadow_atlas.alloc_tile()
+            if self.tile is not None:
+                self.depthmap = shadow_atlas.depthmap
+                self.cam = self.tile.cam
+                self.tile_rect = self.tile.rect
+                self.size = shadow_atlas.tile_size
+                self.configure_cam()
+                return
+            print("Shadow atlas full, using a separate buffer")
         winprops = WindowProperties.size(self.size, self.size)
         props = FrameBufferProperties()
         props.setRgbColor(0)
@@ -66,6 +284,9 @@ class ShadowMap(object):
 
         self.cam = base.makeCamera(self.buffer, lens=OrthographicLens())
         self.cam.reparent_to(render)
+        self.configure_cam()
+
+    def configure_cam(self):
         self.node = self.cam.node()
         self.node.setInitialState(RenderState.make(CullFaceAttrib.make_reverse(),
                                                    ColorWriteAttrib.make(ColorWriteAttrib.M_none),
@@ -87,6 +308,42 @@ class ShadowMap(object):
                                        1.0))
         self.cam.set_pos(self.cam.get_pos() - LVector3(new_center.x, new_center.y, new_center.z))
 
+    def get_texel_state(self, caster):
+        #Transform of the caster in the shadow camera, the distances are expressed in texels of the map
+        transform = caster.get_transform(self.cam)
+        texels = self.size / self.get_lens().get_film_size()[0]
+        return (transform.get_pos() * texels, transform.get_scale() * texels, transform.get_quat())
+
+    def has_moved(self, state):
+        if self.last_state is None: return True
+        (position, scale, quat) = state
+        (last_position, last_scale, last_quat) = self.last_state
+        #The texel snapping threshold of align_cam, one texel of the map
+        if (position - last_position).length() > 1.0: return True
+        if (scale - last_scale).length() > 1.0: return True
+        angle = (last_quat.conjugate() * quat).get_angle_rad()
+        angle = min(angle, 2 * pi - angle)
+        return angle * max(scale[0], scale[1], scale[2]) > 1.0
+
+    def check_render(self, caster):
+        #Enable the rendering of the map only if the caster moved relative to the camera
+        if caster is None or caster.is_empty():
+            render = True
+        else:
+            state = self.get_texel_state(caster)
+            render = self.age >= settings.shadows_max_age or self.has_moved(state)
+            if render:
+                self.last_state = state
+        if render:
+            self.age = 0
+        else:
+            self.age += 1
+        if self.tile is not None:
+            self.tile.display_region.set_active(render)
+            shadow_atlas.count(render)
+        elif self.buffer is not None:
+            self.buffer.set_active(render)
+
     def set_lens(self, size, near, far, direction):
         lens = self.node.get_lens()
         lens.set_film_size(size)
@@ -114,9 +371,13 @@ class ShadowMap(object):
         self.cam.remove_node()
         self.cam = None
         self.depthmap = None
-        self.buffer.set_active(False)
-        base.graphicsEngine.removeWindow(self.buffer)
-        self.buffer = None
+        if self.tile is not None:
+            shadow_atlas.free_tile(self.tile)
+            self.tile = None
+        else:
+            self.buffer.set_active(False)
+            base.graphicsEngine.removeWindow(self.buffer)
+            self.buffer = None
 
 class ShadowCasterBase(object):
     def create(self):
@@ -212,6 +473,10 @@ class CustomShadowMapShadowCaster(ShadowMapShadowCaster):
     def update(self):
         ShadowMapShadowCaster.update(self)
         self.shadow_caster.set_pos(self.body.light_source.getPos())
+        if self.body.surface is not None and self.body.surface.instance is not None:
+            self.shadow_caster.check_render(self.body.surface.instance)
+        else:
+            self.shadow_caster.check_render(None)
 
     def add_target(self, shape_object, self_shadow=False):
         shape_object.shadows.add_generic_occluder(self, self_shadow)
@@ -239,6 +504,7 @@ class SphereShadows(ShadowBase):
     def __init__(self):
         self.occluders = []
         self.shader_component = ShaderSphereShadow()
+        self.installed = False
 
     def add_occluder(self, occluder):
         if not occluder in self.occluders:
@@ -251,71 +517,134 @@ class SphereShadows(ShadowBase):
         self.occluders = []
 
 class GenericShadows(ShadowBase):
-    def __init__(self, target):
+    def __init__(self, target, fixed_slots=False):
         self.target = target
+        self.fixed_slots = fixed_slots
         self.occluders = []
         self.old_occluders = []
+        self.new_occluders = []
         self.shader_components = {}
+        self.slots = None
         self.update_needed = False
 
+    def create_slots(self):
+        #All the slots are added at once, the shader is then kept as long as the shadows are not cleared
+        self.slots = [ShaderShadowMapSlot(i) for i in range(settings.shadow_map_slots)]
+        for slot in self.slots:
+            self.target.shader.add_shadows(slot)
+
+    def find_free_slot(self):
+        if self.slots is None:
+            self.create_slots()
+        for slot in self.slots:
+            if slot.is_free():
+                return slot
+        return None
+
     def add_occluder(self, occluder, self_shadow):
         if not occluder.is_valid(): return
-        self.occluders.append(occluder)
         if not occluder in self.old_occluders:
+            if self.fixed_slots:
+                #The slot is assigned in end_update, once the slots of the removed casters are free
+                self.new_occluders.append((occluder, self_shadow))
+                return
             print("Add shadow caster", occluder.name)
             shadow_shader =  ShaderShadowMap(occluder.name, occluder.body, occluder.shadow_caster, self_shadow)
-            self.shader_components[occluder] = shadow_shader
             self.target.shader.add_shadows(shadow_shader)
+            self.shader_components[occluder] = shadow_shader
             self.update_needed = True
         else:
             self.old_occluders.remove(occluder)
+        self.occluders.append(occluder)
 
     def start_update(self):
         self.old_occluders = self.occluders
         self.occluders = []
+        self.new_occluders = []
         self.update_needed = False
 
     def end_update(self):
         for occluder in self.old_occluders:
             print("Remove shadow caster", occluder.name)
             shadow_shader = self.shader_components[occluder]
-            self.target.shader.remove_shadows(self.target.shape, self.target.appearance, shadow_shader)
+            if self.fixed_slots:
+                #The slot is disabled, only its shader inputs are updated
+                shadow_shader.set_caster(None, None, False)
+            else:
+                self.target.shader.remove_shadows(self.target.shape, self.target.appearance, shadow_shader)
             del self.shader_components[occluder]
             self.update_needed = True
         self.old_occluders = []
+        for (occluder, self_shadow) in self.new_occluders:
+            shadow_shader = self.find_free_slot()
+            if shadow_shader is None: break
+            shadow_shader.set_caster(occluder.body, occluder.shadow_caster, self_shadow)
+            self.shader_components[occluder] = shadow_shader
+            self.occluders.append(occluder)
+            self.update_needed = True
+        self.new_occluders = []
         return self.update_needed
 
+    def clear(self):
+        #The shader components have been removed from the shader by the caller
+        self.occluders = []
+        self.old_occluders = []
+        self.new_occluders = []
+        self.shader_components = {}
+        self.slots = None
+
 class MultiShadows(ShadowBase):
     def __init__(self, target):
         self.target = target
+        self.fixed_slots = settings.shadows_fixed_slots
         self.ring_shadow = None
         self.sphere_shadows = SphereShadows()
-        self.generic_shadows = GenericShadows(target)
+        self.generic_shadows = GenericShadows(target, self.fixed_slots)
+        self.receiver = False
         self.update_needed = False
-        self.had_sphere_occluder = False
+        #Incremented each time the shadows are cleared outside of an update
+        self.version = 0
 
     def clear_shadows(self):
         self.ring_shadow = None
         self.sphere_shadows.clear()
+        self.sphere_shadows.installed = False
+        self.generic_shadows.clear()
         self.shadow_map = None
         self.target.shader.clear_shadows(self.target.shape, self.target.appearance)
         self.update_needed = True
-        self.had_sphere_occluder = False
+        self.version += 1
+
+    def set_receiver(self, receiver):
+        self.receiver = receiver
+
+    def create_fixed_slots(self):
+        #The components are added before the shader of the target is created, so it is generated only once
+        if not self.fixed_slots or not self.receiver or isinstance(self.target.shader, AutoShader): return
+        if self.generic_shadows.slots is None:
+            self.generic_shadows.create_slots()
+        if not self.sphere_shadows.installed:
+            self.target.shader.add_shadows(self.sphere_shadows.shader_component)
+            self.sphere_shadows.shader_component.set_oblate_occluder(True)
+            self.sphere_shadows.installed = True
 
     def start_update(self):
-        self.had_sphere_occluder = not self.sphere_shadows.empty()
         self.sphere_shadows.clear()
         self.generic_shadows.start_update()
 
     def end_update(self):
-        if self.sphere_shadows.empty() and self.had_sphere_occluder:
-            print("Remove sphere shadow component")
-            self.target.shader.remove_shadows(self.target.shape, self.target.appearance, self.sphere_shadows.shader_component)
-            self.update_needed = True
-        elif not self.had_sphere_occluder and not self.sphere_shadows.empty():
+        if self.sphere_shadows.empty():
+            #With fixed slots the component is kept and disabled by the number of occluders
+            if self.sphere_shadows.installed and not self.fixed_slots:
+                print("Remove sphere shadow component")
+                self.target.shader.remove_shadows(self.target.shape, self.target.appearance, self.sphere_shadows.shader_component)
+                self.sphere_shadows.installed = False
+                self.update_needed = True
+        elif not self.sphere_shadows.installed:
             self.target.shader.add_shadows(self.sphere_shadows.shader_component)
             #TODO: We could check if the caster is actually oblate or not
             self.sphere_shadows.shader_component.set_oblate_occluder(True)
+            self.sphere_shadows.installed = True
             print("Add sphere shadow component")
             self.update_needed = True
         self.update_needed = self.generic_shadows.end_update() or self.update_needed
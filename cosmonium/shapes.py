@@ -53,6 +53,7 @@ class Shape:
         self.instance_ready = False
         self.jobs_pending = 0
         self.jobs = 0
+        self.async_requests = []
         self.clickable = False
         self.attribution = None
         #TODO: Used to fix ring textures
@@ -206,6 +207,7 @@ class CompositeShapeObject(VisibleObject):
 
 class ShapeObject(VisibleObject):
     default_camera_mask = VisibleObject.DefaultCameraMask | VisibleObject.WaterCameraMask | VisibleObject.ShadowCameraMask
+    JOB_GEOMETRY = 0x0004
     def __init__(self, name, shape=None, appearance=None, shader=None, clickable=True):
         VisibleObject.__init__(self, name)
         self.shape = None
@@ -283,6 +285,7 @@ class ShapeObject(VisibleObject):
     def create_instance(self, callback=None, cb_args=()):
         self.callback = callback
         self.cb_args = cb_args
+        self.shadows.create_fixed_slots()
         self.instance = self.shape.create_instance()
         if not self.shape.deferred_instance:
             self.apply_instance(self.instance)
@@ -330,6 +333,10 @@ class ShapeObject(VisibleObject):
             self.shadow_caster.add_target(target)
 
     def schedule_patch_jobs(self, patch):
+        if patch.geometry_request is not None and (patch.jobs & ShapeObject.JOB_GEOMETRY) == 0:
+            patch.jobs |= ShapeObject.JOB_GEOMETRY
+            patch.jobs_pending += 1
+            patch.load_geometry(self.jobs_done_cb, ())
         if self.appearance is not None:
             self.appearance.apply_patch(patch, self)
 
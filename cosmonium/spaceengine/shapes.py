@@ -57,11 +57,11 @@ class SpaceEngineTextureSquarePatch(SquarePatchBase):
                                                   float(x + 1) / self.div,
                                                   float(y + 1) / self.div)
 
-    def create_patch_instance(self, x, y):
+    def create_patch_instance(self, x, y, outer_level):
         (x, y) = self.calc_xy(x, y)
         return geometry.NormalizedSquarePatch(1.0,
                                               self.density,
-                                              self.tessellation_outer_level,
+                                              outer_level,
                                               float(x) / self.div,
                                               float(y) / self.div,
                                               float(x + 1) / self.div,
@@ -0,0 +1,370 @@
+#
+#This file is part of Cosmonium.
+#
+#Copyright (C) 2018-2019 Laurent Deru.
+#
+#Cosmonium is free software: you can redistribute it and/or modify
+#it under the terms of the GNU General Public License as published by
+#the Free Software Foundation, either version 3 of the License, or
+#(at your option) any later version.
+#
+#Cosmonium is distributed in the hope that it will be useful,
+#but WITHOUT ANY WARRANTY; without even the implied warranty of
+#MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#GNU General Public License for more details.
+#
+#You should have received a copy of the GNU General Public License
+#along with Cosmonium.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+from __future__ import print_function
+from __future__ import absolute_import
+
+from panda3d.core import LPoint3d
+
+from .bodies import Star
+from .bodyclass import bodyClasses
+from .catalogs import objectsDB, CatalogEntry
+from .astro.orbits import FixedPosition
+from .astro.rotations import UnknownRotation
+from .astro.astro import abs_to_app_mag, magnitude_brightness_ratio
+from .astro.blackbody import temp_to_RGB
+from .astro import units
+from .pyengine.npoctree import cull_leaves, faintest_magnitude, IncrementalVisibility
+from .utils import srgb_to_linear
+from . import settings
+
+from math import sqrt
+import numpy
+
+def calc_scene_positions(rel_positions, abs_positions, distances, vectors_to_obs, mid_plane):
+    #Vectorized version of BaseObject.calc_scene_params() for points
+    if settings.camera_at_origin:
+        positions = rel_positions / settings.scale
+    else:
+        positions = abs_positions / settings.scale
+    if settings.use_depth_scaling:
+        distances = distances / settings.scale
+        far = distances > mid_plane
+        if numpy.any(far):
+            if settings.use_inv_scaling:
+                scaled_distances = mid_plane * (1 - mid_plane / distances[far])
+            else:
+                scaled_distances = mid_plane * (1 - numpy.log2(mid_plane / distances[far] + 1))
+            positions[far] = -vectors_to_obs[far] * (mid_plane + scaled_distances)[:, numpy.newaxis]
+    return positions
+
+def mag_to_scales(magnitudes):
+    #Vectorized version of utils.mag_to_scale()
+    scales = settings.min_mag_scale + (1 - settings.min_mag_scale) * (settings.lowest_app_magnitude - magnitudes) / (settings.lowest_app_magnitude - settings.max_app_magnitude)
+    scales[magnitudes < settings.max_app_magnitude] = 1.0
+    scales[magnitudes > settings.lowest_app_magnitude] = 0.0
+    return scales
+
+def oids_to_colors(base, count):
+    #Vectorized version of utils.int_to_color()
+    oids = numpy.arange(base, base + count, dtype=numpy.uint32)
+    colors = numpy.empty((count, 4), dtype=numpy.float32)
+    colors[:, 0] = (oids & 0xFF) / 255.0
+    colors[:, 1] = ((oids >> 8) & 0xFF) / 255.0
+    colors[:, 2] = ((oids >> 16) & 0xFF) / 255.0
+    colors[:, 3] = 1.0
+    return colors
+
+class StarCatalogCell(object):
+    def __init__(self, catalog, level, center, width, threshold):
+        self.catalog = catalog
+        self.level = level
+        self.center = center
+        self.np_center = center
+        self.width = width
+        self.radius = width / 2.0 * sqrt(3)
+        self.threshold = threshold
+        self.max_magnitude = 99.0
+        self.indices = None
+        self.children = []
+        IncrementalVisibility.init_cell(self)
+
+    def get_cells(self):
+        return self.children
+
+    def get_leaves_arrays(self):
+        catalog = self.catalog
+        indices = self.indices
+        return (catalog.positions[indices], catalog.abs_magnitudes[indices], catalog.extends[indices])
+
+    def has_dynamic_leaves(self):
+        return False
+
+    def get_visible_items(self, visible):
+        indices = self.indices[visible]
+        return indices[~self.catalog.removed[indices]].tolist()
+
+class StarCatalog(object):
+    max_level = 200
+    max_leaves = 75
+    child_threshold = 0.5 # Same as OctreeNode.child_threshold
+    body_class = 'star'
+
+    def __init__(self, name, catalog_numbers, positions, abs_magnitudes, spectral_types, spectral_type_decoder,
+                 names=None, name_prefix="HIP ", surface_factory=None):
+        self.name = name
+        self.catalog_numbers = catalog_numbers
+        self.positions = positions
+        self.abs_magnitudes = abs_magnitudes
+        self.spectral_types = spectral_types
+        self.spectral_type_decoder = spectral_type_decoder
+        if names is None:
+            names = {}
+        self.names = names
+        self.name_prefix = name_prefix
+        self.surface_factory = surface_factory
+        self.count = len(catalog_numbers)
+        self.parent = None
+        self.root = None
+        self.visibility = IncrementalVisibility()
+        self.stars = {}
+        self.stars_index = {}
+        self.removed = numpy.zeros(self.count, dtype=bool)
+        self.visible_indices = numpy.empty(0, dtype=numpy.int64)
+        self.promoted_indices = numpy.empty(0, dtype=numpy.int64)
+        self.calc_spectral_arrays()
+        self.build_names_index()
+        self.oid_base = objectsDB.reserve_oids(self, self.count)
+        self.oid_colors = oids_to_colors(self.oid_base, self.count)
+
+    def calc_spectral_arrays(self):
+        codes, inverse = numpy.unique(self.spectral_types, return_inverse=True)
+        temperatures = numpy.empty(len(codes))
+        white_dwarfs = numpy.empty(len(codes), dtype=bool)
+        colors = numpy.empty((len(codes), 4), dtype=numpy.float32)
+        for (i, code) in enumerate(codes):
+            spectral_type = self.spectral_type_decoder.decode(int(code))
+            temperatures[i] = spectral_type.temperature
+            white_dwarfs[i] = spectral_type.white_dwarf
+            colors[i] = tuple(srgb_to_linear(temp_to_RGB(spectral_type.temperature)))
+        inverse = inverse.reshape(-1)
+        self.point_colors = colors[inverse]
+        temperature_ratios = units.sun_temperature / temperatures[inverse]
+        luminosity_ratios = numpy.power(magnitude_brightness_ratio, units.sun_abs_magnitude - self.abs_magnitudes)
+        #See astro.temp_to_radius() and Star constructor
+        self.extends = temperature_ratios * temperature_ratios * numpy.sqrt(luminosity_ratios) * units.sun_radius
+        self.extends[white_dwarfs[inverse]] = 7000.0
+
+    def build_names_index(self):
+        self.sorted_indices = numpy.argsort(self.catalog_numbers, kind='stable')
+        self.sorted_numbers = self.catalog_numbers[self.sorted_indices]
+        self.names_index = {}
+        for (catalog_number, aliases) in self.names.items():
+            index = self.find_index(catalog_number)
+            if index is None: continue
+            for alias in aliases:
+                self.names_index[alias.upper()] = index
+
+    def find_index(self, catalog_number):
+        pos = numpy.searchsorted(self.sorted_numbers, catalog_number)
+        if pos < self.count and self.sorted_numbers[pos] == catalog_number:
+            return int(self.sorted_indices[pos])
+        return None
+
+    def find_index_by_name(self, name):
+        name_up = name.upper()
+        index = self.names_index.get(name_up)
+        if index is None:
+            prefix = self.name_prefix.upper()
+            if name_up.startswith(prefix):
+                try:
+                    index = self.find_index(int(name_up[len(prefix):]))
+                except ValueError:
+                    index = None
+        if index is not None and self.removed[index]:
+            index = None
+        return index
+
+    def get_names(self, index):
+        catalog_number = int(self.catalog_numbers[index])
+        names = self.names.get(catalog_number)
+        if names is None:
+            names = ["%s%d" % (self.name_prefix, catalog_number)]
+        return names
+
+    def set_parent(self, parent):
+        self.parent = parent
+
+    def get_star(self, index):
+        star = self.stars.get(index)
+        if star is None:
+            star = Star(self.get_names(index),
+                        surface_factory=self.surface_factory,
+                        spectral_type=self.spectral_type_decoder.decode(int(self.spectral_types[index])),
+                        abs_magnitude=float(self.abs_magnitudes[index]),
+                        orbit=FixedPosition(position=LPoint3d(*self.positions[index])),
+                        rotation=UnknownRotation())
+            self.stars[index] = star
+            self.stars_index[star] = index
+            if self.parent is not None:
+                self.parent.add_child_star_fast(star)
+        return star
+
+    def has_star(self, star):
+        return star in self.stars_index
+
+    def remove_star(self, star):
+        index = self.stars_index.pop(star, None)
+        if index is not None:
+            del self.stars[index]
+            self.removed[index] = True
+
+    def find_by_name(self, name):
+        index = self.find_index_by_name(name)
+        if index is not None:
+            return self.get_star(index)
+        return None
+
+    def get_object_by_index(self, index):
+        if self.removed[index]:
+            return None
+        return self.get_star(index)
+
+    def get_object_by_oid(self, oid):
+        return self.get_object_by_index(oid)
+
+    def get_exact_name(self, index, key):
+        for name in self.get_names(index):
+            if name.upper() == key:
+                return name
+        return key
+
+    def startswith(self, text):
+        #The stars are only created when the entry is selected
+        text = text.upper()
+        result = []
+        for (key, index) in self.names_index.items():
+            if key.startswith(text) and index not in self.stars and not self.removed[index]:
+                result.append((self.get_exact_name(index, key), CatalogEntry(self, index)))
+        return result
+
+    def build_cells(self, center, width, threshold):
+        print("Building cells for", self.name)
+        indices = numpy.arange(self.count)[~self.removed]
+        self.root = self.build_cell(indices, 0, numpy.array(tuple(center)), width, threshold)
+
+    def build_cell(self, indices, level, center, width, threshold):
+        cell = StarCatalogCell(self, level, center, width, threshold)
+        magnitudes = self.abs_magnitudes[indices]
+        if len(indices) > 0:
+            cell.max_magnitude = magnitudes.min()
+        if len(indices) < self.max_leaves or level >= self.max_level:
+            cell.indices = indices
+            return cell
+        positions = self.positions[indices]
+        deltas = positions - center
+        distances = numpy.sqrt(numpy.einsum('ij,ij->i', deltas, deltas))
+        keep = (magnitudes < threshold) | (distances < self.extends[indices])
+        cell.indices = indices[keep]
+        positions = positions[~keep]
+        octants = (positions[:, 0] >= center[0]).astype(numpy.int8)
+        octants |= (positions[:, 1] >= center[1]) << 1
+        octants |= (positions[:, 2] >= center[2]) << 2
+        child_indices = indices[~keep]
+        child_offset = width / 4.0
+        for octant in range(8):
+            selection = child_indices[octants == octant]
+            if len(selection) == 0: continue
+            child_center = center + numpy.array([child_offset if (octant & 1) != 0 else -child_offset,
+                                                 child_offset if (octant & 2) != 0 else -child_offset,
+                                                 child_offset if (octant & 4) != 0 else -child_offset])
+            child = self.build_cell(selection, level + 1, child_center, width / 2.0, threshold + self.child_threshold)
+            cell.children.append(child)
+        return cell
+
+    def enter_cell(self, cell, frustum, position, limit):
+        distance = sqrt(((cell.center - position) ** 2).sum()) - cell.radius
+        if distance <= 0.0:
+            return True
+        if abs_to_app_mag(cell.max_magnitude, distance) > limit:
+            return False
+        return frustum.is_sphere_in(cell.center, cell.radius)
+
+    def traverse_cell(self, cell, frustum, position, limit):
+        indices = cell.indices
+        faintest = faintest_magnitude(cell.center, cell.radius, position, limit)
+        indices = indices[(self.abs_magnitudes[indices] < faintest) & ~self.removed[indices]]
+        if len(indices) == 0:
+            return indices, numpy.empty(0), numpy.empty(0)
+        visible, app_magnitudes, distances = cull_leaves(self.positions[indices], self.abs_magnitudes[indices], self.extends[indices],
+                                                         frustum, position, limit)
+        return indices[visible], app_magnitudes[visible], distances[visible]
+
+    def build_visible_list(self, frustum, orientation, limit, pixel_size, promote_magnitude, key):
+        if self.root is None:
+            return []
+        if settings.incremental_octree:
+            if self.visibility.update(self.root, frustum, orientation, limit, key):
+                self.visible_indices = numpy.fromiter(self.visibility.visible, dtype=numpy.int64, count=len(self.visibility.visible))
+            deltas = self.positions[self.visible_indices] - tuple(frustum.get_position())
+            distances = numpy.sqrt(numpy.einsum('ij,ij->i', deltas, deltas))
+            with numpy.errstate(divide='ignore'):
+                app_magnitudes = self.abs_magnitudes[self.visible_indices] + 5 * (numpy.log10(distances / units.KmPerParsec) - 1)
+        else:
+            (app_magnitudes, distances) = self.traverse_cells(frustum, limit)
+        #Bright or nearly resolved stars are promoted to full Star objects
+        promoted = (app_magnitudes < promote_magnitude) | (self.extends[self.visible_indices] > distances * pixel_size)
+        self.promoted_indices = self.visible_indices[promoted]
+        return [self.get_star(index) for index in self.promoted_indices]
+
+    def traverse_cells(self, frustum, limit):
+        position = numpy.array(tuple(frustum.get_position()))
+        all_indices = []
+        all_magnitudes = []
+        all_distances = []
+        cells = [self.root]
+        while len(cells) > 0:
+            cell = cells.pop()
+            if len(cell.indices) > 0:
+                (indices, app_magnitudes, distances) = self.traverse_cell(cell, frustum, position, limit)
+                all_indices.append(indices)
+                all_magnitudes.append(app_magnitudes)
+                all_distances.append(distances)
+            for child in cell.children:
+                if self.enter_cell(child, frustum, position, limit):
+                    cells.append(child)
+        if len(all_indices) > 0:
+            self.visible_indices = numpy.concatenate(all_indices)
+            app_magnitudes = numpy.concatenate(all_magnitudes)
+            distances = numpy.concatenate(all_distances)
+        else:
+            self.visible_indices = numpy.empty(0, dtype=numpy.int64)
+            app_magnitudes = numpy.empty(0)
+            distances = numpy.empty(0)
+        return (app_magnitudes, distances)
+
+    def update_points(self, observer, pointset, extra_objects):
+        indices = self.visible_indices
+        if len(indices) == 0 or not bodyClasses.get_show(self.body_class): return
+        excluded = list(self.promoted_indices)
+        for extra in extra_objects:
+            index = self.stars_index.get(extra)
+            if index is not None:
+                excluded.append(index)
+        if len(excluded) > 0:
+            indices = indices[~numpy.isin(indices, excluded)]
+        if len(indices) == 0: return
+        abs_positions = self.positions[indices]
+        rel_positions = abs_positions - tuple(observer.camera_global_pos) - tuple(observer._position)
+        distances = numpy.sqrt(numpy.einsum('ij,ij->i', rel_positions, rel_positions))
+        app_magnitudes = self.abs_magnitudes[indices] + 5 * (numpy.log10(distances / units.KmPerParsec) - 1)
+        scales = mag_to_scales(app_magnitudes)
+        shown = scales > 0
+        if not numpy.any(shown): return
+        indices = indices[shown]
+        scales = scales[shown]
+        rel_positions = rel_positions[shown]
+        distances = distances[shown]
+        vectors_to_obs = -rel_positions / distances[:, numpy.newaxis]
+        positions = calc_scene_positions(rel_positions, abs_positions[shown], distances, vectors_to_obs, observer.midPlane)
+        (points, colors, sizes, oids) = pointset.alloc_points(len(indices))
+        points[:] = positions
+        numpy.multiply(self.point_colors[indices], scales[:, numpy.newaxis], out=colors)
+        numpy.add(settings.min_point_size, scales * settings.mag_pixel_scale, out=sizes)
+        oids[:] = self.oid_colors[indices]
@@ -20,7 +20,7 @@
 from __future__ import print_function
 from __future__ import absolute_import
 
-from panda3d.core import LPoint3d, LVector3d, LVector3, LQuaterniond, LColor
+from panda3d.core import LPoint3d, LVector3d, LQuaterniond, LColor
 
 from .foundation import CompositeObject, ObjectLabel, LabelledObject
 from .annotations import ReferenceAxis, RotationAxis, Orbit
@@ -59,13 +59,14 @@ class StellarBodyLabel(ObjectLabel):
                 self.fade = min(1.0, max(0.0, (size - settings.orbit_fade) / settings.orbit_fade))
         self.fade = clamp(self.fade, 0.0, 1.0)
 
-    def update_instance(self, camera_pos, camera_rot):
+    def get_position_and_scale(self, camera_rot):
         body = self.parent
         if body.is_emissive() and (not body.resolved or body.background):
             if body.scene_position != None:
-                self.instance.setPos(*body.scene_position)
+                position = body.scene_position
                 scale = abs(self.context.observer.pixel_size * body.get_label_size() * body.scene_distance)
             else:
+                position = None
                 scale = 0.0
         else:
             offset = body.get_apparent_radius() * 1.01
@@ -74,15 +75,8 @@ class StellarBodyLabel(ObjectLabel):
             distance_to_obs = vector_to_obs.length()
             vector_to_obs /= distance_to_obs
             position, distance, scale_factor = self.calc_scene_params(rel_front_pos, rel_front_pos, distance_to_obs, vector_to_obs)
-            self.instance.setPos(*position)
             scale = abs(self.context.observer.pixel_size * body.get_label_size() * distance)
-        self.look_at.set_pos(LVector3(*(camera_rot.xform(LVector3d.forward()))))
-        self.label_instance.look_at(self.look_at, LVector3(), LVector3(*(camera_rot.xform(LVector3d.up()))))
-        self.instance.set_color_scale(LColor(self.fade, self.fade, self.fade, 1.0))
-        if scale < 1e-7:
-            print("Label too far", self.get_name())
-            scale = 1e-7
-        self.instance.setScale(scale)
+        return (position, scale)
 
 class FixedOrbitLabel(StellarBodyLabel):
     def check_visibility(self, pixel_size):
@@ -140,6 +134,9 @@ class StellarObject(LabelledObject):
         self._equatorial = LQuaterniond()
         self._app_magnitude = None
         self._extend = 0.0
+        #Time of the last update, the values above are valid for that time
+        self.update_time = None
+        self.sync_frame = SynchroneReferenceFrame(self)
         #Scene parameters
         self.rel_position = None
         self.distance_to_obs = None
@@ -163,6 +160,8 @@ class StellarObject(LabelledObject):
         self.init_annotations = False
         self.init_components = False
         self.update_frozen = False
+        #The position is computed by the orbits group of the parent system
+        self.batched_orbit = False
         #TODO: Should be done properly
         self.orbit.body = self
         self.rotation.body = self
@@ -199,13 +198,18 @@ class StellarObject(LabelledObject):
         LabelledObject.update_user_parameters(self)
         if isinstance(self.orbit, FixedOrbit) and self.system is not None:
             self.system.orbit.update_user_parameters()
+            if self.system.parent is not None:
+                self.system.parent.invalidate_orbits_group()
             if self.system.orbit_object is not None:
                 self.system.orbit_object.update_user_parameters()
         else:
             self.orbit.update_user_parameters()
+            if self.parent is not None:
+                self.parent.invalidate_orbits_group()
             if self.orbit_object is not None:
                 self.orbit_object.update_user_parameters()
         self.rotation.update_user_parameters()
+        self.update_time = None
 
     def get_fullname(self, separator='/'):
         if hasattr(self, "primary") and self.primary is not None:
@@ -276,6 +280,8 @@ class StellarObject(LabelledObject):
             self.orbit_object = None
         self.orbit = orbit
         self.orbit.set_body(self)
+        if self.parent is not None:
+            self.parent.invalidate_orbits_group()
         if self.has_orbit and self.init_annotations:
             self.create_orbit_object()
 
@@ -311,6 +317,7 @@ class StellarObject(LabelledObject):
         CompositeObject.set_parent(self, parent)
         self.orbit.frame.set_parent_body(self.parent)
         self.rotation.frame.set_parent_body(self.parent)
+        self.update_time = None
         self.create_orbit_object()
 
     def set_star(self, star):
@@ -351,7 +358,8 @@ class StellarObject(LabelledObject):
 
     def get_global_position(self):
         #TODO: should be done in frame
-        #TODO: cache value for given time
+        if self.update_time is not None:
+            return LPoint3d(self._global_position)
         global_position = self.parent.get_global_position() + self.orbit.get_global_position_at(0)
         return global_position
 
@@ -389,8 +397,7 @@ class StellarObject(LabelledObject):
         return (phi, theta, distance)
 
     def cartesian_to_spherical(self, position):
-        sync_frame = SynchroneReferenceFrame(self)
-        rel_position = sync_frame.get_rel_position(position)
+        rel_position = self.sync_frame.get_rel_position(position)
         return self.frame_cartesian_to_spherical(rel_position)
 
     def spherical_to_frame_cartesian(self, position):
@@ -403,8 +410,7 @@ class StellarObject(LabelledObject):
 
     def spherical_to_cartesian(self, position):
         rel_position = self.spherical_to_frame_cartesian(position)
-        sync_frame = SynchroneReferenceFrame(self)
-        position = sync_frame.get_local_position(rel_position)
+        position = self.sync_frame.get_local_position(rel_position)
         return position
 
     def spherical_to_xy(self, position):
@@ -445,9 +451,11 @@ class StellarObject(LabelledObject):
         StellarObject.nb_update += 1
         self._orientation = self.rotation.get_rotation_at(time)
         self._equatorial = self.rotation.get_equatorial_orientation_at(time)
-        self._local_position = self.orbit.get_position_at(time)
+        if not self.batched_orbit or self.parent.orbits_group_time != time:
+            self._local_position = self.orbit.get_position_at(time)
         self._global_position = self.parent._global_position + self.orbit.get_global_position_at(time)
         self._position = self._global_position + self._local_position
+        self.update_time = time
         if self.star is not None:
             (self.vector_to_star, self.distance_to_star) = self.calc_local_distance_to(self.star.get_local_position())
         CompositeObject.update(self, time, dt)
@@ -555,9 +563,8 @@ class StellarObject(LabelledObject):
     def update_point(self, pointset):
         scale = mag_to_scale(self._app_magnitude)
         if scale > 0:
-            color = self.point_color * scale
             size = max(settings.min_point_size, settings.min_point_size + scale * settings.mag_pixel_scale)
-            pointset.add_point(self.scene_position, color, size, self.oid_color)
+            pointset.add_point(self.scene_position, self.point_color, size, self.oid_color, scale)
             if self.has_halo and self._app_magnitude < smallest_glare_mag:
                 self.update_halo()
 
@@ -568,8 +575,7 @@ class StellarObject(LabelledObject):
         if radius < 1.0:
             radius = 1.0
         size = radius * coef * 2.0
-        position = self.scene_position
-        self.context.haloset.add_point(LVector3(*position), self.point_color, size, self.oid_color)
+        self.context.haloset.add_point(self.scene_position, self.point_color, size, self.oid_color)
 
     def show_rotation_axis(self):
         if self.rotation_axis:
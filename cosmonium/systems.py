@@ -20,13 +20,20 @@
 from __future__ import print_function
 from __future__ import absolute_import
 
+from panda3d.core import LPoint3d
+
 from .stellarobject import StellarObject
 from .catalogs import ObjectsDB, objectsDB
+from .astro.orbits import EllipticalOrbitsGroup
+from .shadows import ShadowCastersCache
 from .astro.astro import lum_to_abs_mag, abs_mag_to_lum
+from . import settings
 
 class StellarSystem(StellarObject):
     virtual_object = True
     support_offset_body_center = False
+    #Below this number of elliptical orbits the scalar Kepler solver is faster than the vectorized one
+    min_batch_orbits = 16
 
     def __init__(self, names, orbit=None, rotation=None, body_class=None, point_color=None, description=''):
         StellarObject.__init__(self, names, orbit, rotation, body_class, point_color, description)
@@ -37,6 +44,10 @@ class StellarSystem(StellarObject):
         self.has_halo = False
         self.was_visible = True
         self.abs_magnitude = None
+        self.orbits_group = None
+        self.orbits_group_bodies = []
+        self.orbits_group_valid = False
+        self.orbits_group_time = None
 
     def is_system(self):
         return True
@@ -126,6 +137,7 @@ class StellarSystem(StellarObject):
         #print("Add child", child.get_name(), "to", self.get_name())
         self.children.append(child)
         child.set_parent(self)
+        self.invalidate_orbits_group()
         #TODO: Temporary workaround until multiple stars are supported
         if self.star is not None:
             child.set_star(self.star)
@@ -138,6 +150,7 @@ class StellarSystem(StellarObject):
         #print("Add child", child.get_name(), "to", self.get_name())
         self.children.append(child)
         child.set_parent(self)
+        self.invalidate_orbits_group()
         self.star = child
         self.has_halo = True
 
@@ -155,6 +168,7 @@ class StellarSystem(StellarObject):
     def remove_child_fast(self, child):
         #print("Remove child", child.get_name(), "from", self.get_name())
         self.children.remove(child)
+        self.invalidate_orbits_group()
         child.set_parent(None)
         child.set_star(None)
         self.children_map.remove(child)
@@ -184,8 +198,38 @@ class StellarSystem(StellarObject):
         for child in self.children:
             child.set_star(star)
 
+    def invalidate_orbits_group(self):
+        for child in self.orbits_group_bodies:
+            child.batched_orbit = False
+        self.orbits_group = None
+        self.orbits_group_bodies = []
+        self.orbits_group_valid = False
+        self.orbits_group_time = None
+
+    def build_orbits_group(self):
+        self.orbits_group_valid = True
+        if not settings.batched_orbits: return
+        #Only the orbits centered on this system can share the same frame center
+        bodies = [child for child in self.children if EllipticalOrbitsGroup.supports(child.orbit) and child.orbit.frame.body is self]
+        if len(bodies) < self.min_batch_orbits: return
+        self.orbits_group = EllipticalOrbitsGroup([body.orbit for body in bodies])
+        self.orbits_group_bodies = bodies
+        for body in bodies:
+            body.batched_orbit = True
+
+    def update_orbits_group(self, time):
+        if not self.orbits_group_valid:
+            self.build_orbits_group()
+        if self.orbits_group is None: return
+        positions = self.orbits_group.get_positions_at(time, self._local_position)
+        for (body, position) in zip(self.orbits_group_bodies, positions.tolist()):
+            body._local_position = LPoint3d(*position)
+        #The bodies updated without their system must not use the positions of another time
+        self.orbits_group_time = time
+
     def first_update(self, time):
         StellarObject.update(self, time, 0)
+        self.update_orbits_group(time)
         for child in self.children:
             child.first_update(time)
 
@@ -193,6 +237,7 @@ class StellarSystem(StellarObject):
         StellarObject.update(self, time, dt)
         #No need to update the children if not visible
         if not self.visible or not self.resolved: return
+        self.update_orbits_group(time)
         for child in self.children:
             child.update(time, dt)
 
@@ -260,6 +305,7 @@ class SimpleSystem(StellarSystem):
     def __init__(self, names, primary=None, star_system=False, orbit=None, rotation=None, body_class='system', point_color=None, description=''):
         StellarSystem.__init__(self, names, orbit, rotation, body_class, point_color, description)
         self.star_system = star_system
+        self.shadow_casters = ShadowCastersCache()
         self.set_primary(primary)
 
     def set_primary(self, primary):
@@ -320,21 +366,25 @@ class SimpleSystem(StellarSystem):
         primary = self.primary
         if primary is None or primary.is_emissive(): return
         check_primary = primary.visible and primary.resolved and primary.in_view
-        for child in self.children:
-            child.start_shadows_update()
+        pairs = []
         for child in self.children:
             if child == primary: continue
             if child.visible and child.resolved and child.in_view:
-                if primary.atmosphere is not None and primary.init_components and (child._local_position - self.primary._local_position).length() < primary.atmosphere.radius:
+                if primary.atmosphere is not None and primary.init_components and child.surface is not None and (child._local_position - self.primary._local_position).length() < primary.atmosphere.radius:
                     primary.atmosphere.add_shape_object(child.surface)
-                if primary.check_cast_shadow_on(child):
-                    #print(primary.get_friendly_name(), "casts shadow on", child.get_friendly_name())
-                    primary.add_shadow_target(child)
-            if check_primary:
-                #TODO: The test should be done on the actual shadow size, not the resolved state of the child
-                if child.resolved and child.check_cast_shadow_on(primary):
-                    #print(child.get_friendly_name(), "casts shadow on", primary.get_friendly_name())
-                    child.add_shadow_target(primary)
+                pairs.append((primary, child))
+            #TODO: The test should be done on the actual shadow size, not the resolved state of the child
+            if check_primary and child.resolved:
+                pairs.append((child, primary))
+        #The shadows of the targets must be rebuilt if they have been cleared
+        key = tuple(child.get_shadows_version() for child in self.children)
+        casting = self.shadow_casters.update(pairs, key)
+        if casting is None: return
+        for child in self.children:
+            child.start_shadows_update()
+        for (caster, target) in casting:
+            #print(caster.get_friendly_name(), "casts shadow on", target.get_friendly_name())
+            caster.add_shadow_target(target)
         for child in self.children:
             child.end_shadows_update()
 
@@ -25,6 +25,7 @@ from panda3d.core import TextureStage, Texture, LColor, PNMImage, CS_linear, CS_
 
 from .dircontext import defaultDirContext
 from .utils import TransparencyBlend
+from .patchescache import PatchMap, texture_sizes
 from . import workers
 from . import settings
 
@@ -582,7 +583,7 @@ class VirtualTextureSource(TextureSource):
     cached = False
     def __init__(self, root, ext, size, attribution=None, context=defaultDirContext):
         TextureSource.__init__(self, attribution)
-        self.map_patch = {}
+        self.map_patch = PatchMap(self.get_patch_sizes)
         self.root = root
         self.ext = ext
         self.texture_size = size
@@ -591,6 +592,9 @@ class VirtualTextureSource(TextureSource):
     def is_patched(self):
         return True
 
+    def get_patch_sizes(self, entry):
+        return texture_sizes(entry[0])
+
     def child_texture_name(self, patch):
         return None
 
@@ -607,7 +611,7 @@ class VirtualTextureSource(TextureSource):
 
     def texture_loaded_cb(self, texture, patch, callback, cb_args):
         if texture is not None:
-            self.map_patch[patch.str_id()] = (texture, self.texture_size, patch.lod)
+            self.map_patch.add(patch.str_id(), (texture, self.texture_size, patch.lod), patch)
             if callback is not None:
                 callback(texture, self.texture_size, patch.lod, *cb_args)
         else:
@@ -622,7 +626,8 @@ class VirtualTextureSource(TextureSource):
                     callback(None, self.texture_size, patch.lod, *cb_args)
 
     def load(self, patch, color_space=None, sync=False, callback=None, cb_args=()):
-        if not patch.str_id() in self.map_patch:
+        entry = self.map_patch.find(patch.str_id())
+        if entry is None:
             tex_name = self.texture_name(patch)
             filename = self.context.find_texture(tex_name)
             alpha_tex_name = self.alpha_texture_name(patch)
@@ -632,23 +637,24 @@ class VirtualTextureSource(TextureSource):
                     texture = workers.syncTextureLoader.load_texture(filename, alpha_filename)
                     self.texture_loaded_cb(texture, patch, callback, cb_args)
                 else:
-                    workers.asyncTextureLoader.load_texture(filename, alpha_filename, self.texture_loaded_cb, (patch, callback, cb_args))
+                    workers.asyncTextureLoader.load_texture(filename, alpha_filename, self.texture_loaded_cb, (patch, callback, cb_args), owner=patch)
             else:
                 print("File", tex_name, "not found")
                 self.texture_loaded_cb(None, patch, callback, cb_args)
         else:
-            callback(*(self.map_patch[patch.str_id()] + cb_args))
+            callback(*(entry + cb_args))
 
     def get_texture(self, patch, strict=False):
-        if patch.str_id() in self.map_patch:
-            return self.map_patch[patch.str_id()]
+        entry = self.map_patch.get(patch.str_id())
+        if entry is not None:
+            return entry
         elif not strict:
             parent_patch = patch.parent
-            while parent_patch is not None and parent_patch.str_id() not in self.map_patch:
+            while parent_patch is not None:
+                entry = self.map_patch.get(parent_patch.str_id())
+                if entry is not None:
+                    return entry
                 parent_patch = parent_patch.parent
-            if parent_patch is not None:
-                return self.map_patch[parent_patch.str_id()]
-            else:
-                return (None, self.texture_size, patch.lod)
+            return (None, self.texture_size, patch.lod)
         else:
             return (None, self.texture_size, patch.lod)
@@ -97,7 +97,7 @@ class Tile(PatchBase):
         self.holder.node().setBounds(OmniBoundingVolume())
         self.holder.node().setFinal(1)
 
-    def create_instance(self):
+    def create_instance(self, sync=False):
         self.instance = self.holder
         self.apply_owner()
         for layer in self.layers:
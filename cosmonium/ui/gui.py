@@ -40,6 +40,8 @@ from .. import utils
 from .. import settings
 #TODO: should only be used by Cosmonium main class
 from ..parsers.configparser import configParser
+from ..profiler import profiler
+from ..cache import create_path_for
 
 from .hud import HUD
 from .query import Query
@@ -52,6 +54,7 @@ from .clipboard import create_clipboard
 from .browser import Browser
 from .time import TimeEditor
 
+from time import strftime
 import os
 
 about_text = """# Cosmonium
@@ -150,6 +153,8 @@ class Gui(object):
         event_ctrl.accept('f1', self.show_info)
         event_ctrl.accept('shift-f1', self.show_help)
         event_ctrl.accept('f2', self.cosmonium.connect_pstats)
+        event_ctrl.accept('shift-f2', self.toggle_profiler)
+        event_ctrl.accept('control-f2', self.save_profile_trace)
         event_ctrl.accept('f3', self.cosmonium.toggle_filled_wireframe)
         event_ctrl.accept('shift-f3', self.cosmonium.toggle_wireframe)
         event_ctrl.accept('f4', self.cosmonium.toggle_hdr)
@@ -272,6 +277,8 @@ class Gui(object):
 
     def update(self):
         self.clipboard.update()
+        if self.hud.profiler.shown:
+            self.hud.update_profiler(profiler)
 
     def escape(self):
         if len(self.opened_windows) != 0:
@@ -327,6 +334,22 @@ class Gui(object):
         else:
             self.update_info(_("Unfreeze LOD"))
 
+    def toggle_profiler(self):
+        profiler.toggle()
+        if profiler.enabled:
+            profiler.clear()
+            self.hud.profiler.show()
+        else:
+            self.hud.profiler.hide()
+
+    def save_profile_trace(self):
+        if len(profiler.frames) == 0:
+            self.update_info(_("No profile data"), 0.5, 1.0)
+            return
+        filename = os.path.join(create_path_for('profiles'), strftime('trace-%Y-%m-%d-%H-%M-%S.json'))
+        if profiler.export_trace(filename):
+            self.update_info(_("Profile trace saved"), 0.5, 1.0)
+
     def toggle_bb(self):
         settings.debug_lod_show_bb = not settings.debug_lod_show_bb
         self.cosmonium.trigger_check_settings = True
@@ -818,7 +841,7 @@ class Gui(object):
         return True
 
     def select_object(self, body):
-        self.cosmonium.select_body(body)
+        self.cosmonium.select_body(objectsDB.resolve(body))
 
     def get_object(self, name):
         result = objectsDB.get(name)
@@ -190,6 +190,8 @@ class HUD():
         self.bottomRight = TextBlock(base.a2dBottomRight, self.scale, 0, TextNode.ARight, False, 5, self.font, settings.hud_text_size)
         #TODO: Info should be moved out of HUD
         self.info = FadeTextLine(base.a2dBottomLeft, self.scale, 0, TextNode.ALeft, False, 6, self.font, settings.hud_info_text_size)
+        self.profiler = TextBlock(base.a2dTopRight, self.scale, self.topRight.get_height(), TextNode.ARight, True, 12, self.font, settings.hud_text_size)
+        self.profiler.hide()
         self.shown = True
 
     def hide(self):
@@ -215,9 +217,24 @@ class HUD():
         self.topRight.set_scale(scale)
         self.bottomRight.set_scale(scale)
         self.info.set_scale(scale)
+        self.profiler.set_scale(scale)
 
     def set_y_offset(self, y_offset):
         self.title.set_y_offset(y_offset)
         title_height = self.title.get_height()
         self.topLeft.set_y_offset(y_offset + title_height)
         self.topRight.set_y_offset(y_offset)
+        self.profiler.set_y_offset(y_offset + self.topRight.get_height())
+
+    def update_profiler(self, profiler):
+        (duration, stages, counters) = profiler.get_averages(settings.profiler_hud_frames)
+        lines = [_("Frame: %.2f ms") % duration]
+        for name in profiler.stage_names:
+            lines.append("%s: %.2f ms" % (name, stages[name]))
+        for name in profiler.counter_names:
+            lines.append("%s: %d" % (name, counters[name]))
+        for i in range(self.profiler.count):
+            if i < len(lines):
+                self.profiler.set(i, lines[i])
+            else:
+                self.profiler.set(i, "")
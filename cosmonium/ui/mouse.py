@@ -23,6 +23,7 @@ from __future__ import absolute_import
 from panda3d.core import CollisionTraverser, CollisionNode
 from panda3d.core import CollisionHandlerQueue, CollisionRay
 from panda3d.core import GeomNode, LColor, Texture
+from panda3d.core import Shader, ShaderAttrib, LVecBase2i
 
 from direct.task.Task import Task
 
@@ -30,6 +31,153 @@ from .. import settings
 from cosmonium.utils import color_to_int
 from cosmonium.catalogs import objectsDB
 
+from collections import deque
+import numpy
+
+class ColorPicker(object):
+    #Copies the region of the picking texture around the mouse into a ring of small staging textures with a compute
+    #shader and reads them back a few frames later, once the GPU is done with them
+    region_size = 9
+    nb_staging = 3
+    latency = 2
+
+    copy_shader = """#version 430
+layout (local_size_x = 16, local_size_y = 16) in;
+layout (rgba8) uniform readonly image2D oid_store;
+layout (rgba8) uniform writeonly image2D region;
+uniform ivec2 origin;
+void main() {
+  ivec2 coord = ivec2(gl_GlobalInvocationID.xy);
+  if (any(greaterThanEqual(coord, imageSize(region)))) return;
+  ivec2 source = origin + coord;
+  vec4 value = vec4(0.0);
+  if (all(greaterThanEqual(source, ivec2(0))) && all(lessThan(source, imageSize(oid_store)))) {
+    value = imageLoad(oid_store, source);
+  }
+  imageStore(region, coord, value);
+}
+"""
+
+    def __init__(self, base, oid_texture):
+        self.base = base
+        self.oid_texture = oid_texture
+        self.shader = Shader.make_compute(Shader.SL_GLSL, self.copy_shader)
+        self.staging = []
+        for i in range(self.nb_staging):
+            texture = Texture('picking-region-%d' % i)
+            texture.setup_2d_texture(self.region_size, self.region_size, Texture.T_unsigned_byte, Texture.F_rgba8)
+            texture.set_clear_color(LColor(0, 0, 0, 0))
+            self.staging.append(texture)
+        self.next_staging = 0
+        self.pending = deque()
+        self.last_key = None
+        #Offsets of the texels of the region, sorted by distance to the center
+        half = self.region_size // 2
+        (y, x) = numpy.mgrid[-half:half + 1, -half:half + 1]
+        self.search_order = numpy.argsort((x * x + y * y).reshape(-1), kind='stable')
+        self.oid = 0
+
+    def get_key(self, mpos):
+        observer = self.base.observer
+        return (mpos.get_x(), mpos.get_y(), self.oid_texture.get_x_size(), self.oid_texture.get_y_size(),
+                tuple(observer.camera_global_pos), tuple(observer.get_camera_pos()), tuple(observer.get_camera_rot()))
+
+    def dispatch(self, mpos, texture):
+        x = int((mpos.get_x() + 1) / 2 * self.oid_texture.get_x_size())
+        y = int((mpos.get_y() + 1) / 2 * self.oid_texture.get_y_size())
+        half = self.region_size // 2
+        attrib = ShaderAttrib.make(self.shader)
+        attrib = attrib.set_shader_input('oid_store', self.oid_texture)
+        attrib = attrib.set_shader_input('region', texture)
+        attrib = attrib.set_shader_input('origin', LVecBase2i(x - half, y - half))
+        groups = (self.region_size + 15) // 16
+        self.base.graphicsEngine.dispatch_compute((groups, groups, 1), attrib, self.base.win.gsg)
+
+    def read(self, texture):
+        #Returns the oid nearest to the center of the region
+        if not self.base.graphicsEngine.extract_texture_data(texture, self.base.win.gsg):
+            return 0
+        data = texture.get_ram_image_as('RGBA')
+        texture.clear_ram_image()
+        texels = numpy.frombuffer(bytes(data), dtype=numpy.uint8).reshape(-1, 4)[self.search_order]
+        found = numpy.nonzero(texels[:, :3].any(axis=1))[0]
+        if len(found) == 0:
+            return 0
+        (r, g, b, a) = texels[found[0]].tolist()
+        #Same encoding as color_to_int()
+        return r + (g << 8) + (b << 16)
+
+    def update(self, mpos):
+        #Collect the most recent region that is old enough, and request a new one if something has changed
+        frame = globalClock.get_frame_count()
+        ready = None
+        while len(self.pending) > 0 and self.pending[0][1] <= frame - self.latency:
+            ready = self.pending.popleft()[0]
+        if ready is not None:
+            self.oid = self.read(ready)
+        key = self.get_key(mpos)
+        if key != self.last_key:
+            self.last_key = key
+            if len(self.pending) == self.nb_staging:
+                self.pending.popleft()
+            texture = self.staging[self.next_staging]
+            self.next_staging = (self.next_staging + 1) % self.nb_staging
+            self.dispatch(mpos, texture)
+            self.pending.append((texture, frame))
+        return self.oid
+
+    def pick(self, mpos):
+        #Synchronous version, used when the mouse is not tracked each frame
+        texture = self.staging[self.next_staging]
+        self.dispatch(mpos, texture)
+        self.oid = self.read(texture)
+        return self.oid
+
+def collect_instances(obj, instances):
+    instance = getattr(obj, 'instance', None)
+    if instance is not None:
+        instances.append(instance)
+    else:
+        for component in getattr(obj, 'components', []):
+            collect_instances(component, instances)
+
+class PickingIndex(object):
+    #Bounding spheres of the visible bodies, the ray is first tested against all of them at once and the collision
+    #traversal is only done on the instances of the bodies hit, nearest first
+    #The spheres are enlarged to absorb the offset of the body center and the relief of the surface
+    margin_factor = 1.1
+
+    def __init__(self, base):
+        self.base = base
+
+    def find_candidates(self, origin, direction):
+        bodies = [body for body in self.base.visibles if body.scene_position is not None and body.scene_scale_factor is not None]
+        if len(bodies) == 0:
+            return []
+        centers = numpy.array([tuple(body.scene_position) for body in bodies])
+        radii = numpy.array([body.get_extend() * body.scene_scale_factor * self.margin_factor + body.world_body_center_offset.length() for body in bodies])
+        deltas = centers - origin
+        distances = deltas.dot(direction)
+        sqr_closest = numpy.einsum('ij,ij->i', deltas, deltas) - distances * distances
+        sqr_radii = radii * radii
+        hit = (sqr_closest <= sqr_radii) & (distances + radii >= 0.0)
+        indices = numpy.nonzero(hit)[0]
+        entries = distances[indices] - numpy.sqrt(numpy.maximum(sqr_radii[indices] - sqr_closest[indices], 0.0))
+        order = numpy.argsort(entries)
+        return [(bodies[indices[i]], entries[i]) for i in order]
+
+    def find_roots(self, origin, direction):
+        #Returns the roots to traverse, with the distance at which the ray enters their bounding sphere
+        roots = []
+        for (body, entry) in self.find_candidates(origin, direction):
+            instances = []
+            collect_instances(body, instances)
+            roots.append((entry, instances))
+        if not settings.batch_labels:
+            #The labels of the bodies are outside the bounding spheres
+            roots.insert(0, (0.0, [self.base.annotation]))
+        return roots
+
 class Mouse(object):
     def __init__(self, base, oid_texture):
         self.base = base
@@ -42,6 +190,11 @@ class Mouse(object):
         self.pickerRay = CollisionRay()
         self.pickerNode.addSolid(self.pickerRay)
         self.picker.addCollider(self.pickerNP, self.pq)
+        self.picking_index = PickingIndex(base)
+        if settings.async_color_picking and oid_texture is not None:
+            self.color_picker = ColorPicker(base, oid_texture)
+        else:
+            self.color_picker = None
         #self.picker.showCollisions(render)
         if settings.mouse_over:
             taskMgr.add(self.mouse_task, 'mouse-task')
@@ -52,23 +205,51 @@ class Mouse(object):
         if self.base.mouseWatcherNode.hasMouse():
             mpos = self.base.mouseWatcherNode.getMouse()
             self.pickerRay.setFromLens(self.base.camNode, mpos.getX(), mpos.getY())
-            self.picker.traverse(render)
-            if self.pq.getNumEntries() > 0:
-                self.pq.sortEntries()
-                np = self.pq.getEntry(0).getIntoNodePath().findNetPythonTag('owner')
+            origin = render.get_relative_point(self.pickerNP, self.pickerRay.get_origin())
+            direction = render.get_relative_vector(self.pickerNP, self.pickerRay.get_direction())
+            direction.normalize()
+            nearest = None
+            nearest_distance = None
+            for (entry_distance, instances) in self.picking_index.find_roots(numpy.array(tuple(origin)), numpy.array(tuple(direction))):
+                #The roots are sorted by distance, the remaining ones can not be nearer than the current hit
+                if nearest is not None and entry_distance > nearest_distance: break
+                for instance in instances:
+                    self.picker.traverse(instance)
+                    for i in range(self.pq.getNumEntries()):
+                        entry = self.pq.getEntry(i)
+                        distance = (entry.get_surface_point(render) - origin).length()
+                        if nearest is None or distance < nearest_distance:
+                            nearest = entry.getIntoNodePath()
+                            nearest_distance = distance
+            if nearest is not None:
+                np = nearest.findNetPythonTag('owner')
                 owner = np.getPythonTag('owner')
                 over = owner
-                np = self.pq.getEntry(0).getIntoNodePath().findNetPythonTag('patch')
+                np = nearest.findNetPythonTag('patch')
                 if np is not None:
                     self.patch = np.getPythonTag('patch')
                 else:
                     self.patch = None
         return over
 
+    def find_over_oid(self, oid):
+        over = None
+        if oid != 0:
+            over = objectsDB.get_oid(oid)
+            if over is None:
+                print("Unknown oid", oid)
+        return over
+
     def find_over_color(self):
         over = None
         if self.base.mouseWatcherNode.hasMouse():
             mpos = self.base.mouseWatcherNode.getMouse()
+            if self.color_picker is not None:
+                if settings.mouse_over:
+                    oid = self.color_picker.update(mpos)
+                else:
+                    oid = self.color_picker.pick(mpos)
+                return self.find_over_oid(oid)
             self.base.graphicsEngine.extract_texture_data(self.picking_texture, self.base.win.gsg)
             texture_peeker = self.picking_texture.peek()
             if texture_peeker is not None:
@@ -30,8 +30,11 @@ from .astro import units
 
 from .foundation import CompositeObject
 from .systems import StellarSystem
-from .octree import OctreeNode, OctreeLeaf, InfiniteFrustum, VisibleObjectsTraverser, hasOctreeLeaf
+from .octree import OctreeNode, OctreeLeaf, InfiniteFrustum, VisibleObjectsTraverser, IncrementalVisibility, hasOctreeLeaf
+from .pyengine import npfrustum
+from .catalogs import objectsDB
 from .pstats import pstat
+from . import settings
 
 from math import sqrt
 from time import time
@@ -51,11 +54,14 @@ class Universe(StellarSystem):
                              self.octree_width,
                              abs_mag)
         self.update_id = 0
+        self.catalogs = []
+        self.catalogs_stars = []
         self.previous_leaves = []
         self.to_update_leaves = []
         self.to_update = []
         self.to_update_extra = []
         self.to_remove = []
+        self.visibility = IncrementalVisibility() if IncrementalVisibility is not None else None
         self.nb_cells = 0
         self.nb_leaves = 0
         self.nb_leaves_in_cells = 0
@@ -79,20 +85,58 @@ class Universe(StellarSystem):
     def dumpOctreeStats(self):
         self.dump_octree_stats = not self.dump_octree_stats
 
+    def add_star_catalog(self, catalog):
+        catalog.set_parent(self)
+        self.catalogs.append(catalog)
+        objectsDB.add_catalog(catalog)
+
+    def is_catalog_star(self, child):
+        for catalog in self.catalogs:
+            if catalog.has_star(child):
+                return True
+        return False
+
+    def remove_child_fast(self, child):
+        StellarSystem.remove_child_fast(self, child)
+        for catalog in self.catalogs:
+            catalog.remove_star(child)
+
+    def find_by_name(self, name, name_up=None):
+        found = StellarSystem.find_by_name(self, name, name_up)
+        if found is None:
+            for catalog in self.catalogs:
+                found = catalog.find_by_name(name)
+                if found is not None: break
+        return found
+
     def create_octree(self):
         print("Creating octree...")
         start = time()
         for child in self.children:
+            #Stars from a catalog are managed by the catalog cells
+            if self.is_catalog_star(child): continue
             self.octree.add(OctreeLeaf(child, child.get_global_position(), child.get_abs_magnitude(), child.get_extend()))
+        for catalog in self.catalogs:
+            catalog.build_cells(self.octree.center, self.octree_width, self.octree.threshold)
         end = time()
         print("Creation time:", end - start)
 
-    def build_octree_cells_list(self, limit):
-        self.update_id += 1
+    def build_catalogs_list(self, bh, mat, pos, orientation, limit, key):
+        previous_stars = self.catalogs_stars
+        self.catalogs_stars = []
+        if len(self.catalogs) == 0: return
+        f = npfrustum.InfiniteFrustum(bh, mat, pos)
+        promote_magnitude = max(settings.label_lowest_app_magnitude, settings.smallest_glare_mag)
+        for catalog in self.catalogs:
+            self.catalogs_stars += catalog.build_visible_list(f, orientation, limit, self.context.observer.pixel_size, promote_magnitude, key)
+        self.to_update = self.to_update + self.catalogs_stars
+        current_stars = set(self.catalogs_stars)
+        for old in previous_stars:
+            if old not in current_stars:
+                self.to_remove.append(old)
+
+    def build_full_octree_list(self, bh, mat, pos, limit):
         self.previous_leaves = self.to_update_leaves
-        pos = self.context.observer.get_position()
-        mat = self.context.camera.getMat()
-        bh = self.context.observer.realCamLens.make_bounds()
         f = InfiniteFrustum(bh, mat, pos)
         t = VisibleObjectsTraverser(f, limit, self.update_id)
         self.octree.traverse(t)
@@ -108,6 +152,28 @@ class Universe(StellarSystem):
             for old in self.previous_leaves:
                 if old.update_id != self.update_id:
                     self.to_remove.append(old)
+
+    def build_incremental_octree_list(self, bh, mat, pos, orientation, limit, key):
+        f = InfiniteFrustum(bh, mat, pos)
+        if self.visibility.update(self.octree, f, orientation, limit, key):
+            self.to_update_leaves = self.visibility.get_leaves()
+        self.to_update = self.to_update_leaves
+        self.to_remove = list(self.visibility.removed)
+
+    def build_octree_cells_list(self, limit):
+        self.update_id += 1
+        pos = self.context.observer.get_position()
+        orientation = self.context.observer.get_camera_rot()
+        mat = self.context.camera.getMat()
+        lens = self.context.observer.realCamLens
+        bh = lens.make_bounds()
+        #Any change of the lens invalidates the cached visibility
+        key = (tuple(lens.get_fov()), lens.get_near(), limit)
+        if settings.incremental_octree and self.visibility is not None:
+            self.build_incremental_octree_list(bh, mat, pos, orientation, limit, key)
+        else:
+            self.build_full_octree_list(bh, mat, pos, limit)
+        self.build_catalogs_list(bh, mat, pos, orientation, limit, key)
         self.octree_cells_to_clean = []
         self.to_update_extra = []
 #         cells = pstats.levelpstat('cells')
@@ -179,10 +245,13 @@ class Universe(StellarSystem):
 
     def check_and_update_instance(self, camera_pos, camera_rot, pointset):
         CompositeObject.check_and_update_instance(self, camera_pos, camera_rot, pointset)
+        pointset.reserve(len(self.to_update))
         for leaf in self.to_update:
             leaf.check_and_update_instance(camera_pos, camera_rot, pointset)
         for leaf in self.to_remove:
             leaf.remove_instance()
+        for catalog in self.catalogs:
+            catalog.update_points(self.context.observer, pointset, self.to_update_extra)
 
     def get_distance(self, time):
         return 0
@@ -25,9 +25,13 @@ try:
     import queue
 except ImportError:
     import Queue as queue
+import heapq
+import threading
 import sys
 import traceback
 
+from . import settings
+
 # These will be initialized in cosmonium base class
 asyncTextureLoader = None
 syncTextureLoader = None
@@ -66,61 +70,169 @@ class AsyncMethod():
             self.callback()
             return task.done
 
+class AsyncRequest(object):
+    def __init__(self, loader, job, callback, cb_args, owner):
+        self.loader = loader
+        self.job = job
+        self.callback = callback
+        self.cb_args = cb_args
+        self.owner = owner
+        self.cancelled = False
+        if owner is not None:
+            owner.async_requests.append(self)
+
+    def get_priority(self):
+        #Requests without owner are the most urgent, then the nearest and coarsest patches
+        if self.owner is None:
+            return (0.0, 0)
+        return (getattr(self.owner, 'distance', 0.0), getattr(self.owner, 'lod', 0))
+
+    def detach(self):
+        if self.owner is not None:
+            if self in self.owner.async_requests:
+                self.owner.async_requests.remove(self)
+            self.owner = None
+
+    def cancel(self):
+        self.loader.cancel(self)
+
+class AsyncJob(object):
+    def __init__(self, func, fargs, key):
+        self.func = func
+        self.fargs = fargs
+        self.key = key
+        self.requests = []
+        self.priority = None
+        self.running = False
+        self.cancelled = False
+
+    def get_priority(self):
+        return min([request.get_priority() for request in self.requests])
+
 class AsyncLoader():
-    def __init__(self, base, name):
+    def __init__(self, base, name, nb_threads=1):
         self.base = base
-        self.in_queue = queue.Queue()
+        self.lock = threading.Lock()
+        self.in_queue = []
+        self.jobs = {}
+        self.sequence = 0
         self.cb_queue = queue.Queue()
         self.base.taskMgr.setupTaskChain(name,
-                                         numThreads = 1,
+                                         numThreads = nb_threads,
                                          tickClock = False,
                                          threadPriority = None,
                                          frameBudget = -1,
                                          frameSync = False,
                                          timeslicePriority = True)
 
-        self.process_task = self.base.taskMgr.add(self.processTask, name + 'ProcessTask', taskChain=name)
+        #One process task per thread of the chain
+        self.process_tasks = []
+        for i in range(nb_threads):
+            self.process_tasks.append(self.base.taskMgr.add(self.processTask, name + 'ProcessTask%d' % i, taskChain=name))
         self.callback_task = self.base.taskMgr.add(self.callbackTask, name + 'CallbackTask')
 
     def remove(self):
-        self.base.taskMgr.remove(self.process_task)
-        self.process_task = None
+        for process_task in self.process_tasks:
+            self.base.taskMgr.remove(process_task)
+        self.process_tasks = []
         self.base.taskMgr.remove(self.callback_task)
         self.callback_task = None
 
-    def add_job(self, func, fargs, callback, cb_args):
-        job = [func, fargs, callback, cb_args]
-        self.in_queue.put(job)
+    def add_job(self, func, fargs, callback, cb_args, key=None, owner=None):
+        #Requests with the same key are coalesced into a single job
+        with self.lock:
+            job = None
+            if key is not None:
+                job = self.jobs.get(key)
+            if job is None:
+                job = AsyncJob(func, fargs, key)
+                if key is not None:
+                    self.jobs[key] = job
+            request = AsyncRequest(self, job, callback, cb_args, owner)
+            job.requests.append(request)
+            if not job.running:
+                priority = request.get_priority()
+                if job.priority is None or priority < job.priority:
+                    job.priority = priority
+                    heapq.heappush(self.in_queue, (priority, self.sequence, job))
+                    self.sequence += 1
+        return request
+
+    def cancel(self, request):
+        with self.lock:
+            request.cancelled = True
+            request.detach()
+            job = request.job
+            if request in job.requests:
+                job.requests.remove(request)
+            if len(job.requests) == 0 and not job.running:
+                job.cancelled = True
+                if job.key is not None and self.jobs.get(job.key) is job:
+                    del self.jobs[job.key]
+
+    def pop_job(self):
+        with self.lock:
+            while len(self.in_queue) > 0:
+                (priority, sequence, job) = heapq.heappop(self.in_queue)
+                if job.running or job.cancelled: continue
+                job.running = True
+                return job
+        return None
+
+    def update_priorities(self):
+        #The distance of the patches changes each frame, the heap is rebuilt with the current priorities
+        with self.lock:
+            if len(self.in_queue) == 0: return
+            queued = {}
+            for (priority, sequence, job) in self.in_queue:
+                if job.running or job.cancelled: continue
+                queued[job] = min(sequence, queued.get(job, sequence))
+            self.in_queue = []
+            for (job, sequence) in queued.items():
+                job.priority = job.get_priority()
+                self.in_queue.append((job.priority, sequence, job))
+            heapq.heapify(self.in_queue)
 
     def processTask(self, task):
-        try:
-            job = self.in_queue.get_nowait()
-            (func, fargs, callback, cb_args) = job
-            result = func(*fargs)
-            self.cb_queue.put([callback, result, cb_args])
-        except queue.Empty:
-            pass
+        job = self.pop_job()
+        if job is not None:
+            try:
+                result = job.func(*job.fargs)
+            except Exception:
+                #The requests are still notified, or the requests coalesced on the key would wait forever
+                traceback.print_exc()
+                result = None
+            self.cb_queue.put([job, result])
         return Task.cont
 
     def callbackTask(self, task):
         try:
             while True:
-                job = self.cb_queue.get_nowait()
-                (callback, result, cb_args) = job
-                callback(result, *cb_args)
+                (job, result) = self.cb_queue.get_nowait()
+                with self.lock:
+                    if job.key is not None and self.jobs.get(job.key) is job:
+                        del self.jobs[job.key]
+                    requests = job.requests
+                    job.requests = []
+                for request in requests:
+                    request.detach()
+                    if not request.cancelled:
+                        request.callback(result, *request.cb_args)
         except queue.Empty:
             pass
+        self.update_priorities()
         return Task.cont
 
 class AsyncTextureLoader(AsyncLoader):
     def __init__(self, base):
-        AsyncLoader.__init__(self, base, 'TextureLoader')
+        AsyncLoader.__init__(self, base, 'TextureLoader', settings.texture_loader_threads)
 
-    def load_texture(self, filename, alpha_filename, callback, args):
-        self.add_job(self.do_load_texture, [filename, alpha_filename], callback, args)
+    def load_texture(self, filename, alpha_filename, callback, args, owner=None):
+        return self.add_job(self.do_load_texture, [filename, alpha_filename], callback, args,
+                            key=('texture', filename, alpha_filename), owner=owner)
 
     def load_texture_array(self, textures, callback, args):
-        self.add_job(self.do_load_texture_array, [textures], callback, args)
+        return self.add_job(self.do_load_texture_array, [textures], callback, args)
 
     def do_load_texture(self, filename, alpha_filename):
         tex = Texture()
@@ -147,6 +259,13 @@ class AsyncTextureLoader(AsyncLoader):
                 tex.load(image, z=page, n=0)
         return tex
 
+class AsyncGeometryBuilder(AsyncLoader):
+    def __init__(self, base):
+        AsyncLoader.__init__(self, base, 'GeometryBuilder')
+
+    def build(self, factory, args, key, callback, cb_args, owner=None):
+        return self.add_job(factory, args, callback, cb_args, key=key, owner=owner)
+
 class SyncTextureLoader():
     def load_texture(self, filename, alpha_filename=None):
         texture = None
@@ -163,7 +282,6 @@ class SyncTextureLoader():
 
 if __name__ == '__main__':
     import direct.directbase.DirectStart
-    import sys
 
     loader = AsyncTextureLoader(base)
 
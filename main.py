@@ -46,10 +46,14 @@ from cosmonium.celestia import dsc_parser
 from cosmonium.celestia import asterisms_parser
 from cosmonium.celestia import boundaries_parser
 from cosmonium.dircontext import defaultDirContext
+from cosmonium.systems import StellarSystem
+from cosmonium.bodies import StellarBody
+from cosmonium.shaderscache import shadersDiskCache
+from cosmonium.profiler import profiler
 
-#import textures to register celestia texture parser
-from cosmonium.celestia import textures
-from cosmonium.spaceengine import textures
+#import textures to register celestia and spaceengine texture parsers
+from cosmonium.celestia import textures as celestia_textures
+from cosmonium.spaceengine import textures as spaceengine_textures
 from cosmonium import settings
 
 #import orbits and rotations elements to add them to the DB
@@ -84,6 +88,8 @@ class CosmoniumConfig(object):
         self.celestia_start_script = 'start.cel'
         self.prc_file = 'config.prc'
         self.test_start = False
+        self.prewarm_shaders = False
+        self.profile_trace = None
 
     def update_from_args(self, args):
         #TODO: add input checking here
@@ -106,6 +112,8 @@ class CosmoniumConfig(object):
         if self.celestia and self.script is None and self.default is None:
             self.script = self.celestia_start_script
         self.test_start = args.test_start
+        self.prewarm_shaders = args.prewarm_shaders
+        self.profile_trace = args.profile_trace
 
 class CosmoniumConfigParser(YamlParser):
     def __init__(self, config_file):
@@ -156,6 +164,8 @@ class CosmoniumApp(Cosmonium):
         self.app_config = parser.load()
         self.app_config.update_from_args(args)
         settings.prc_file = self.app_config.prc_file
+        if self.app_config.profile_trace is not None:
+            profiler.export_at_exit(self.app_config.profile_trace)
         Cosmonium.__init__(self)
 
     def find_celestia_data(self):
@@ -232,7 +242,52 @@ class CosmoniumApp(Cosmonium):
         else:
             self.load_universe_cosmonium()
 
+    def get_body_type(self, body):
+        components = [body.surface, body.ring, body.clouds, body.atmosphere]
+        body_type = [body.__class__.__name__, body.body_class]
+        for component in components:
+            if component is None:
+                body_type.append(None)
+            else:
+                body_type.append((component.__class__.__name__,
+                                  getattr(component, 'shape', None).__class__.__name__,
+                                  getattr(component, 'appearance', None).__class__.__name__,
+                                  getattr(component, 'shader', None).__class__.__name__))
+        return tuple(body_type)
+
+    def collect_body_types(self, system, body_types):
+        for child in system.children:
+            if isinstance(child, StellarSystem):
+                self.collect_body_types(child, body_types)
+            elif isinstance(child, StellarBody):
+                body_type = self.get_body_type(child)
+                if not body_type in body_types:
+                    body_types[body_type] = child
+
+    def prewarm_shaders(self):
+        body_types = {}
+        self.collect_body_types(self.universe, body_types)
+        self.prewarm_bodies = list(body_types.values())
+        print("Prewarming shaders for %d body types" % len(self.prewarm_bodies))
+        taskMgr.add(self.prewarm_task, "prewarm-task")
+
+    def prewarm_task(self, task):
+        #Each body is shown during a few frames to let the async jobs complete and the shaders be created
+        if task.frame % 30 != 0:
+            return task.cont
+        if len(self.prewarm_bodies) == 0:
+            print("Shaders cache: %d hits, %d misses" % (shadersDiskCache.hits, shadersDiskCache.misses))
+            self.userExit()
+            return task.done
+        body = self.prewarm_bodies.pop()
+        self.select_body(body)
+        self.autopilot.go_to_front(duration=0.0)
+        return task.cont
+
     def start_universe(self):
+        if self.app_config.prewarm_shaders:
+            self.prewarm_shaders()
+            return
         running = False
         if self.app_config.script is not None:
             if self.app_config.script.startswith('cel://'):
@@ -272,6 +327,13 @@ parser.add_argument("--extra",
                     help="Extra configuration files or directories to load",
                     nargs='+',
                     default=None)
+parser.add_argument("--prewarm-shaders",
+                    help="Create the shaders of all the body types of the universe in the cache and exit",
+                    action='store_true',
+                    default=False)
+parser.add_argument("--profile-trace",
+                    help="Record the duration of each frame and save it as a Chrome trace file at exit",
+                    default=None)
 parser.add_argument("--test-start",
                     help=argparse.SUPPRESS,
                     action='store_true',
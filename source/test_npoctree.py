@@ -0,0 +1,89 @@
+from __future__ import print_function
+
+import os
+import sys
+root_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, root_path)
+sys.path.insert(1, os.path.join(root_path, 'third-party'))
+
+from panda3d.core import LPoint3d, LMatrix4, LQuaterniond, LQuaternion, PerspectiveLens
+
+from cosmonium.pyengine.npoctree import OctreeNode, VisibleObjectsTraverser, IncrementalVisibility
+from cosmonium.pyengine.npfrustum import InfiniteFrustum
+
+import random
+
+class Orbit(object):
+    dynamic = False
+
+class Leaf(object):
+    orbit = Orbit()
+
+    def __init__(self, position, abs_magnitude, extend):
+        self._global_position = position
+        self.abs_magnitude = abs_magnitude
+        self._extend = extend
+        self.update_id = 0
+
+    def get_global_position(self):
+        return self._global_position
+
+    def get_abs_magnitude(self):
+        return self.abs_magnitude
+
+def create_octree(nb_leaves, width, rng):
+    octree = OctreeNode(0, LPoint3d(), width, 1.0)
+    for i in range(nb_leaves):
+        position = LPoint3d(*[rng.uniform(-width / 2, width / 2) for j in range(3)])
+        octree.add(Leaf(position, rng.uniform(-5.0, 15.0), rng.uniform(0.0, 1.0)))
+    return octree
+
+def create_frustum(position, orientation):
+    lens = PerspectiveLens()
+    lens.set_fov(60)
+    bh = lens.make_bounds()
+    mat = LMatrix4()
+    LQuaternion(*orientation).extract_to_matrix(mat)
+    mat.set_row(3, tuple(position))
+    return InfiniteFrustum(bh, mat, position)
+
+def full_traversal(octree, frustum, limit):
+    traverser = VisibleObjectsTraverser(frustum, limit, 1)
+    octree.traverse(traverser)
+    return set(traverser.get_leaves())
+
+def random_orientation(rng):
+    orientation = LQuaterniond(*[rng.gauss(0.0, 1.0) for j in range(4)])
+    orientation.normalize()
+    return orientation
+
+def test_stationary_camera():
+    #The camera does not move, the incremental visible set must match a full traversal on every frame
+    rng = random.Random(42)
+    octree = create_octree(2000, 1e15, rng)
+    limit = 6.0
+    visibility = IncrementalVisibility()
+    for i in range(200):
+        position = LPoint3d(*[rng.uniform(-1e14, 1e14) for j in range(3)])
+        orientation = random_orientation(rng)
+        frustum = create_frustum(position, orientation)
+        expected = full_traversal(octree, frustum, limit)
+        for frame in range(3):
+            visibility.update(octree, frustum, LQuaterniond(orientation), limit, None)
+            assert set(visibility.get_leaves()) == expected
+
+def test_stationary_orientation():
+    #The camera moves without rotating, the angle with the reference orientation must not disable the updates
+    rng = random.Random(42)
+    octree = create_octree(2000, 1e15, rng)
+    limit = 6.0
+    visibility = IncrementalVisibility()
+    for i in range(20):
+        orientation = random_orientation(rng)
+        position = LPoint3d(*[rng.uniform(-1e14, 1e14) for j in range(3)])
+        step = LPoint3d(*[rng.uniform(-1e12, 1e12) for j in range(3)])
+        for frame in range(30):
+            frustum = create_frustum(position, orientation)
+            visibility.update(octree, frustum, LQuaterniond(orientation), limit, None)
+            assert set(visibility.get_leaves()) == full_traversal(octree, frustum, limit)
+            position = position + step
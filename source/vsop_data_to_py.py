@@ -0,0 +1,108 @@
+#
+#This file is part of Cosmonium.
+#
+#Copyright (C) 2018-2020 Laurent Deru.
+#
+#Cosmonium is free software: you can redistribute it and/or modify
+#it under the terms of the GNU General Public License as published by
+#the Free Software Foundation, either version 3 of the License, or
+#(at your option) any later version.
+#
+#Cosmonium is distributed in the hope that it will be useful,
+#but WITHOUT ANY WARRANTY; without even the implied warranty of
+#MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#GNU General Public License for more details.
+#
+#You should have received a copy of the GNU General Public License
+#along with Cosmonium.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+#Extract the VSOP87 and ELP82 coefficients from vsop_data.cpp into a python module usable by the python implementations
+#Usage: python vsop_data_to_py.py vsop_data.cpp ../cosmonium/astro/pyastro/vsop_data.py
+
+from __future__ import print_function
+
+import struct
+import re
+import sys
+
+header = '''#
+#This file is part of Cosmonium.
+#
+#Copyright (C) 2018-2020 Laurent Deru.
+#
+#Cosmonium is free software: you can redistribute it and/or modify
+#it under the terms of the GNU General Public License as published by
+#the Free Software Foundation, either version 3 of the License, or
+#(at your option) any later version.
+#
+#Cosmonium is distributed in the hope that it will be useful,
+#but WITHOUT ANY WARRANTY; without even the implied warranty of
+#MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#GNU General Public License for more details.
+#
+#You should have received a copy of the GNU General Public License
+#along with Cosmonium.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+#Generated from source/vsop_data.cpp by source/vsop_data_to_py.py, do not edit
+'''
+
+def read_blob(filename):
+    content = open(filename).read()
+    content = content[content.index('{'):content.rindex('}')]
+    return bytes(bytearray(int(value, 16) for value in re.findall(r'0x[0-9a-fA-F]+', content)))
+
+def write_list(out, name, comment, values):
+    out.write('\n#%s\n' % comment)
+    out.write('%s = [\n' % name)
+    for value in values:
+        out.write('    (%s),\n' % ', '.join(repr(x) for x in value))
+    out.write(']\n')
+
+#Offset of the first ELP82 table, as used by lunar_lon_and_dist() in elp82.cpp. The latitude terms and the
+#fundamentals follow the longitude and distance terms.
+elp82_offset = 59354
+nb_elp82_terms = 60
+vsop87_term = struct.Struct('<3d')
+elp82_lon_dist_term = struct.Struct('<4b2i')
+elp82_lat_term = struct.Struct('<4bi')
+elp82_fundamental = struct.Struct('<5d')
+
+def read_table(data, entry, offset, count):
+    return [entry.unpack_from(data, offset + i * entry.size) for i in range(count)]
+
+def convert(data, out):
+    nb_series = 8 * 18 + 1
+    index = struct.unpack_from('<%dh' % nb_series, data, 0)
+    #Same check as in vsop87.cpp
+    assert struct.unpack_from('<h', data, 0x10c)[0] == 0x93e, "Unexpected VSOP87 index"
+    terms_offset = nb_series * 2
+    terms = read_table(data, vsop87_term, terms_offset, index[-1])
+    lon_dist_offset = elp82_offset
+    lat_offset = lon_dist_offset + nb_elp82_terms * elp82_lon_dist_term.size
+    fundamentals_offset = lat_offset + nb_elp82_terms * elp82_lat_term.size
+    assert terms_offset + index[-1] * vsop87_term.size <= lon_dist_offset, "VSOP87 terms overlap the ELP82 tables"
+    assert fundamentals_offset + 5 * elp82_fundamental.size <= len(data), "Truncated ELP82 tables"
+    lon_dist_terms = read_table(data, elp82_lon_dist_term, lon_dist_offset, nb_elp82_terms)
+    lat_terms = read_table(data, elp82_lat_term, lat_offset, nb_elp82_terms)
+    fundamentals = read_table(data, elp82_fundamental, fundamentals_offset, 5)
+    #The first terms of the tables are the main terms of the Moon position (Meeus, Astronomical Algorithms, 47.A and 47.B)
+    assert lon_dist_terms[0] == (0, 0, 1, 0, 6288774, -20905335), "Unexpected ELP82 longitude and distance terms"
+    assert lat_terms[0] == (0, 0, 0, 1, 5128122), "Unexpected ELP82 latitude terms"
+    assert abs(fundamentals[0][0] - 218.3164591) < 1e-6 and abs(fundamentals[0][1] - 481267.88134236) < 1e-6, "Unexpected ELP82 fundamentals"
+    out.write(header)
+    out.write('\n#Index of the first term of each series, ordered by planet, coordinate and power of time\n')
+    out.write('vsop87_index = [%s]\n' % ', '.join(str(x) for x in index))
+    write_list(out, 'vsop87_terms', 'Amplitude (in 1e-8 unit), phase and frequency of the VSOP87 terms', terms)
+    write_list(out, 'elp82_fundamentals', 'Polynomials of the mean longitude, D, M, Mp and F of the Moon, in degrees', fundamentals)
+    write_list(out, 'elp82_lon_dist_terms', 'Multipliers of D, M, Mp and F and amplitudes of the longitude and distance terms', lon_dist_terms)
+    write_list(out, 'elp82_lat_terms', 'Multipliers of D, M, Mp and F and amplitude of the latitude terms', lat_terms)
+
+if __name__ == '__main__':
+    if len(sys.argv) != 3:
+        print("Usage: %s <vsop_data.cpp> <output.py>" % sys.argv[0])
+        sys.exit(1)
+    data = read_blob(sys.argv[1])
+    with open(sys.argv[2], 'w') as out:
+        convert(data, out)